@@ -200,6 +200,8 @@ class TestAudioClassification:
         self, mock_extractor, mock_model, mock_torch, mock_device
     ):
         """Test detection skips results below confidence threshold."""
+        import torch
+        
         mock_processor = MagicMock()
         mock_processor.return_value = {"input_values": MagicMock()}
         mock_extractor.from_pretrained.return_value = mock_processor
@@ -208,10 +210,8 @@ class TestAudioClassification:
         mock_model_instance.config.id2label = {0: "gunshot"}
         
         mock_outputs = MagicMock()
-        mock_logits = MagicMock()
-        mock_logits.argmax.return_value.item.return_value = 0
-        mock_logits.softmax.return_value.max.return_value.item.return_value = 0.3  # Below threshold
-        mock_outputs.logits = mock_logits
+        # Equal logits over three classes: softmax confidence 0.33
+        mock_outputs.logits = torch.tensor([[1.0, 1.0, 1.0]])
         mock_model_instance.return_value = mock_outputs
         mock_model.from_pretrained.return_value = mock_model_instance
         
@@ -236,6 +236,8 @@ class TestAudioClassification:
         self, mock_extractor, mock_model, mock_torch, mock_device
     ):
         """Test detection skips audio labels not in mapping."""
+        import torch
+        
         mock_processor = MagicMock()
         mock_processor.return_value = {"input_values": MagicMock()}
         mock_extractor.from_pretrained.return_value = mock_processor
@@ -244,10 +246,7 @@ class TestAudioClassification:
         mock_model_instance.config.id2label = {0: "unknown_sound"}  # Not in mapping
         
         mock_outputs = MagicMock()
-        mock_logits = MagicMock()
-        mock_logits.argmax.return_value.item.return_value = 0
-        mock_logits.softmax.return_value.max.return_value.item.return_value = 0.9
-        mock_outputs.logits = mock_logits
+        mock_outputs.logits = torch.tensor([[5.0, 0.0, 0.0]])
         mock_model_instance.return_value = mock_outputs
         mock_model.from_pretrained.return_value = mock_model_instance
         
@@ -271,6 +270,8 @@ class TestAudioClassification:
         self, mock_extractor, mock_model, mock_torch, mock_device
     ):
         """Test detection skips categories not in target list."""
+        import torch
+        
         mock_processor = MagicMock()
         mock_processor.return_value = {"input_values": MagicMock()}
         mock_extractor.from_pretrained.return_value = mock_processor
@@ -279,10 +280,7 @@ class TestAudioClassification:
         mock_model_instance.config.id2label = {0: "moan"}  # Maps to Sexual Theme
         
         mock_outputs = MagicMock()
-        mock_logits = MagicMock()
-        mock_logits.argmax.return_value.item.return_value = 0
-        mock_logits.softmax.return_value.max.return_value.item.return_value = 0.9
-        mock_outputs.logits = mock_logits
+        mock_outputs.logits = torch.tensor([[5.0, 0.0, 0.0]])
         mock_model_instance.return_value = mock_outputs
         mock_model.from_pretrained.return_value = mock_model_instance
         
@@ -325,6 +323,126 @@ class TestAudioClassification:
         assert results == []
 
 
+class TestBatchedClassification:
+    """Test batched window classification."""
+
+    @staticmethod
+    def _make_detector(mock_extractor, mock_model, config_overrides=None):
+        """Build a detector whose model flags windows with loud audio as gunshots."""
+        import torch
+
+        def process(chunks, sampling_rate, return_tensors):
+            return {"input_values": torch.from_numpy(np.asarray(chunks))}
+
+        def forward(input_values):
+            loud = input_values.abs().max(dim=-1).values > 0.5
+            logits = torch.zeros(len(input_values), 2)
+            logits[loud, 0] = 5.0
+            logits[~loud, 1] = 5.0
+            return MagicMock(logits=logits)
+
+        mock_processor = MagicMock(side_effect=process)
+        mock_extractor.from_pretrained.return_value = mock_processor
+
+        mock_model_instance = MagicMock(side_effect=forward)
+        mock_model_instance.config.id2label = {0: "gunshot", 1: "silence"}
+        mock_model_instance.to.return_value = mock_model_instance
+        mock_model.from_pretrained.return_value = mock_model_instance
+
+        config = {"name": "test-detector", "categories": ["Violence"]}
+        config.update(config_overrides or {})
+        return AudioClassificationDetector(config), mock_processor, mock_model_instance
+
+    @patch("video_censor_personal.audio_classification_detector.get_device", return_value="cpu")
+    @patch("transformers.AutoModelForAudioClassification")
+    @patch("transformers.AutoFeatureExtractor")
+    def test_default_batch_size(self, mock_extractor, mock_model, mock_device):
+        """Test windows are batched 32 at a time by default."""
+        detector, _, _ = self._make_detector(mock_extractor, mock_model)
+
+        assert detector.batch_size == 32
+
+    @patch("video_censor_personal.audio_classification_detector.get_device", return_value="cpu")
+    @patch("transformers.AutoModelForAudioClassification")
+    @patch("transformers.AutoFeatureExtractor")
+    def test_windows_classified_in_batches(self, mock_extractor, mock_model, mock_device):
+        """Test each forward pass receives up to batch_size windows."""
+        detector, mock_processor, mock_model_instance = self._make_detector(
+            mock_extractor, mock_model, {"batch_size": 4}
+        )
+
+        # 10s at 2s windows with 1s hop: 10 windows (the last is half length)
+        audio_data = np.zeros(16000 * 10, dtype=np.float32)
+        detector.analyze_full_audio(audio_data=audio_data, sample_rate=16000)
+
+        batch_shapes = [c.args[0].shape for c in mock_processor.call_args_list]
+        assert batch_shapes == [(4, 32000), (4, 32000), (2, 32000)]
+        assert mock_model_instance.call_count == 3
+
+    @patch("video_censor_personal.audio_classification_detector.get_device", return_value="cpu")
+    @patch("transformers.AutoModelForAudioClassification")
+    @patch("transformers.AutoFeatureExtractor")
+    def test_batched_detections_keep_window_times(
+        self, mock_extractor, mock_model, mock_device
+    ):
+        """Test detections from inside a batch carry their own window times."""
+        detector, _, _ = self._make_detector(
+            mock_extractor, mock_model, {"batch_size": 3}
+        )
+
+        audio_data = np.zeros(16000 * 10, dtype=np.float32)
+        audio_data[16000 * 7 + 100] = 1.0  # Inside windows starting at 6s and 7s
+        results = detector.analyze_full_audio(audio_data=audio_data, sample_rate=16000)
+
+        assert [(r.start_time, r.end_time) for r in results] == [(6.0, 8.0), (7.0, 9.0)]
+        assert all(r.label == "Violence" for r in results)
+
+    @patch("video_censor_personal.audio_classification_detector.get_device", return_value="cpu")
+    @patch("transformers.AutoModelForAudioClassification")
+    @patch("transformers.AutoFeatureExtractor")
+    def test_failed_batch_does_not_drop_others(
+        self, mock_extractor, mock_model, mock_device
+    ):
+        """Test a failing batch is skipped while later batches still run."""
+        detector, mock_processor, _ = self._make_detector(
+            mock_extractor, mock_model, {"batch_size": 2}
+        )
+        process = mock_processor.side_effect
+
+        def fail_first_batch(chunks, **kwargs):
+            if mock_processor.call_count == 1:
+                raise Exception("Processing error")
+            return process(chunks, **kwargs)
+
+        mock_processor.side_effect = fail_first_batch
+
+        audio_data = np.zeros(16000 * 6, dtype=np.float32)
+        audio_data[16000 * 4 + 100] = 1.0
+        results = detector.analyze_full_audio(audio_data=audio_data, sample_rate=16000)
+
+        assert [(r.start_time, r.end_time) for r in results] == [(3.0, 5.0), (4.0, 6.0)]
+
+
+    @patch("video_censor_personal.audio_classification_detector.get_device", return_value="cpu")
+    @patch("transformers.AutoModelForAudioClassification")
+    @patch("transformers.AutoFeatureExtractor")
+    def test_silent_windows_skipped_with_activity_index(
+        self, mock_extractor, mock_model, mock_device
+    ):
+        """Test windows the activity index marks silent are not classified."""
+        from video_censor_personal.voice_activity import AudioActivityIndex
+
+        detector, mock_processor, _ = self._make_detector(mock_extractor, mock_model)
+        audio_data = np.zeros(16000 * 10, dtype=np.float32)
+        audio_data[16000 * 7 + 100] = 1.0
+        detector.set_activity_index(AudioActivityIndex.compute(audio_data, 16000))
+
+        results = detector.analyze_full_audio(audio_data=audio_data, sample_rate=16000)
+
+        # Only the windows starting at 6s and 7s contain sound
+        assert mock_processor.call_args.args[0].shape == (2, 32000)
+        assert [(r.start_time, r.end_time) for r in results] == [(6.0, 8.0), (7.0, 9.0)]
+
 class TestCleanup:
     """Test resource cleanup."""
 
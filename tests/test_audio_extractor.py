@@ -8,9 +8,6 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
-# Skip all tests if librosa is not installed
-librosa = pytest.importorskip("librosa", reason="librosa not installed")
-
 from video_censor_personal.audio_extractor import AudioExtractor, TARGET_SAMPLE_RATE
 
 
@@ -39,8 +36,7 @@ class TestAudioExtraction:
     """Test audio extraction functionality."""
 
     @patch("video_censor_personal.audio_extractor.VideoExtractor")
-    @patch("video_censor_personal.audio_extractor.librosa")
-    def test_extract_returns_cached_audio(self, mock_librosa, mock_video_extractor):
+    def test_extract_returns_cached_audio(self, mock_video_extractor):
         """Test that extract() returns cached audio on subsequent calls."""
         mock_video_extractor.return_value = MagicMock()
         extractor = AudioExtractor("/fake/video.mp4")
@@ -53,83 +49,35 @@ class TestAudioExtraction:
 
         assert np.array_equal(audio, cached_audio)
         assert sr == TARGET_SAMPLE_RATE
-        # VideoExtractor.extract_audio should NOT be called (cached)
-        mock_video_extractor.return_value.extract_audio.assert_not_called()
+        # VideoExtractor should NOT decode audio again (cached)
+        mock_video_extractor.return_value.extract_detection_audio.assert_not_called()
 
-    @patch("soundfile.read")
     @patch("video_censor_personal.audio_extractor.VideoExtractor")
-    def test_extract_loads_audio_from_video(self, mock_video_extractor, mock_sf_read):
-        """Test extraction from video file."""
-        # Setup mock video extractor
+    def test_extract_uses_detection_track(self, mock_video_extractor):
+        """Test that the 16kHz mono detection track is used directly."""
         mock_extractor_instance = MagicMock()
         mock_audio_segment = MagicMock()
-        mock_audio_segment.data = b"fake wav bytes"
+        mock_audio_segment.data = np.array([0.1, 0.2, 0.3], dtype=np.float32)
         mock_audio_segment.duration.return_value = 1.0
-        mock_extractor_instance.extract_audio.return_value = mock_audio_segment
+        mock_extractor_instance.extract_detection_audio.return_value = mock_audio_segment
         mock_video_extractor.return_value = mock_extractor_instance
 
-        # Mock soundfile.read to return fake audio
-        fake_audio = np.array([0.1, 0.2, 0.3], dtype=np.float32)
-        mock_sf_read.return_value = (fake_audio, 16000)
-
         extractor = AudioExtractor("/fake/video.mp4")
         audio, sr = extractor.extract()
 
         assert sr == TARGET_SAMPLE_RATE
-        assert audio is not None
-        mock_extractor_instance.extract_audio.assert_called_once()
-
-    @patch("video_censor_personal.audio_extractor.librosa.resample")
-    @patch("video_censor_personal.audio_extractor.VideoExtractor")
-    def test_extract_resamples_to_16khz(
-        self, mock_video_extractor, mock_resample
-    ):
-        """Test that audio is resampled to 16kHz if different."""
-        mock_extractor_instance = MagicMock()
-        mock_audio_segment = MagicMock()
-        mock_audio_segment.data = b"fake wav bytes"
-        mock_audio_segment.duration.return_value = 1.0
-        mock_extractor_instance.extract_audio.return_value = mock_audio_segment
-        mock_video_extractor.return_value = mock_extractor_instance
-
-        # Return audio at 44100 Hz (needs resampling)
-        fake_audio = np.array([0.1, 0.2, 0.3], dtype=np.float32)
-        mock_resample.return_value = np.array([0.1, 0.2], dtype=np.float32)
-
-        with patch("soundfile.read", return_value=(fake_audio, 44100)):
-            extractor = AudioExtractor("/fake/video.mp4")
-            extractor.extract()
-
-            mock_resample.assert_called_once()
-            call_args = mock_resample.call_args
-            assert call_args.kwargs["orig_sr"] == 44100
-            assert call_args.kwargs["target_sr"] == TARGET_SAMPLE_RATE
-
-    @patch("video_censor_personal.audio_extractor.VideoExtractor")
-    def test_extract_converts_stereo_to_mono(self, mock_video_extractor):
-        """Test stereo to mono conversion."""
-        mock_extractor_instance = MagicMock()
-        mock_audio_segment = MagicMock()
-        mock_audio_segment.data = b"fake wav bytes"
-        mock_audio_segment.duration.return_value = 1.0
-        mock_extractor_instance.extract_audio.return_value = mock_audio_segment
-        mock_video_extractor.return_value = mock_extractor_instance
-
-        # Return stereo audio (2 channels)
-        stereo_audio = np.array([[0.1, 0.3], [0.2, 0.4], [0.3, 0.5]], dtype=np.float32)
-
-        with patch("soundfile.read", return_value=(stereo_audio, 16000)):
-            extractor = AudioExtractor("/fake/video.mp4")
-            audio, sr = extractor.extract()
-
-            # Should be mono now
-            assert len(audio.shape) == 1
+        assert audio is mock_audio_segment.data
+        mock_extractor_instance.extract_detection_audio.assert_called_once()
+        # The full-rate multichannel track is never decoded for detection
+        mock_extractor_instance.extract_audio.assert_not_called()
 
     @patch("video_censor_personal.audio_extractor.VideoExtractor")
     def test_extract_raises_on_failure(self, mock_video_extractor):
         """Test RuntimeError on extraction failure."""
         mock_extractor_instance = MagicMock()
-        mock_extractor_instance.extract_audio.side_effect = Exception("ffmpeg error")
+        mock_extractor_instance.extract_detection_audio.side_effect = Exception(
+            "ffmpeg error"
+        )
         mock_video_extractor.return_value = mock_extractor_instance
 
         extractor = AudioExtractor("/fake/video.mp4")
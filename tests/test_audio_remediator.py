@@ -7,7 +7,11 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
-from video_censor_personal.audio_remediator import AudioRemediator
+from video_censor_personal.audio_remediator import (
+    AudioRemediator,
+    _merge_ranges,
+    _SegmentAllowIndex,
+)
 from video_censor_personal.frame import DetectionResult
 
 
@@ -360,6 +364,184 @@ class TestEdgeCases:
         assert np.all(result == 1.0)
 
 
+class TestIntervalSweep:
+    """Test range merging and allow-override resolution."""
+
+    def test_merge_ranges(self):
+        """Test overlapping and touching ranges are unioned in order."""
+        ranges = [(50, 60), (0, 10), (5, 20), (20, 30), (55, 58)]
+
+        assert _merge_ranges(ranges) == [(0, 30), (50, 60)]
+
+    def test_overlapping_bleeps_form_one_continuous_tone(self):
+        """Test overlapping detections are bleeped as one unbroken tone."""
+        config = {"enabled": True, "mode": "bleep", "categories": ["Profanity"]}
+        remediator = AudioRemediator(config)
+        sample_rate = 16000
+        audio = np.ones(sample_rate, dtype=np.float32)
+        detections = [
+            DetectionResult(0.1, 0.3, "Profanity", 0.9, "test"),
+            DetectionResult(0.2, 0.4, "Profanity", 0.9, "test"),
+        ]
+
+        result = remediator.remediate(audio, sample_rate, detections)
+
+        expected = remediator._bleep_tone(0, int(0.4 * sample_rate) - 1600, sample_rate)
+        np.testing.assert_allclose(result[1600:6400], expected, atol=1e-6)
+        assert np.all(result[:1600] == 1.0) and np.all(result[6400:] == 1.0)
+
+    def test_allow_index_matches_first_overlapping_segment(self):
+        """Test lookups agree with a linear scan over the listed segments."""
+        rng = np.random.default_rng(0)
+        starts = rng.uniform(0, 100, 200)
+        segments = [
+            {
+                "start_time": float(start),
+                "end_time": float(start + rng.uniform(0.1, 5)),
+                "allow": bool(rng.random() < 0.5),
+            }
+            for start in starts
+        ]
+        index = _SegmentAllowIndex(segments)
+
+        for _ in range(500):
+            start = float(rng.uniform(0, 100))
+            end = start + float(rng.uniform(0.01, 3))
+            expected = next(
+                (
+                    seg["allow"]
+                    for seg in segments
+                    if start < seg["end_time"] and end > seg["start_time"]
+                ),
+                False,
+            )
+            assert index.is_allowed(start, end) == expected
+
+    def test_dense_detections_with_allowed_segment(self):
+        """Test many detections are remediated except under an allowed segment."""
+        config = {"enabled": True, "mode": "silence", "categories": ["Profanity"]}
+        remediator = AudioRemediator(config)
+        sample_rate = 100
+        audio = np.ones(100 * sample_rate, dtype=np.float32)
+        detections = [
+            DetectionResult(float(t), t + 0.5, "Profanity", 0.9, "test")
+            for t in range(100)
+        ]
+        segments = [
+            {"start_time": float(t), "end_time": t + 0.5, "allow": t == 42}
+            for t in range(100)
+        ]
+
+        result = remediator.remediate(audio, sample_rate, detections, segments=segments)
+
+        assert np.all(result[4200:4250] == 1.0)
+        assert np.all(result[4100:4150] == 0.0)
+        assert np.all(result[4150:4200] == 1.0)
+        assert np.count_nonzero(result == 0.0) == 99 * 50
+
+
+class TestStreamedRemediation:
+    """Test block-wise remediation via AudioRemediator.stream()."""
+
+    @pytest.mark.parametrize("mode", ["silence", "bleep"])
+    def test_blocks_match_in_memory_remediation(self, mode):
+        """Test concatenated blocks equal remediate() across block boundaries."""
+        remediator = AudioRemediator(
+            {"enabled": True, "mode": mode, "categories": ["Profanity"]}
+        )
+        sample_rate = 1000
+        rng = np.random.default_rng(0)
+        audio = rng.uniform(-1, 1, (5000, 2)).astype(np.float32)
+        detections = [
+            DetectionResult(0.1, 0.9, "Profanity", 0.9, "test"),
+            DetectionResult(0.5, 1.2, "Profanity", 0.9, "test"),
+            DetectionResult(2.95, 3.05, "Profanity", 0.9, "test"),
+            DetectionResult(4.0, 6.0, "Violence", 0.9, "test"),
+        ]
+
+        expected = remediator.remediate(audio, sample_rate, detections)
+        stream = remediator.stream(audio, sample_rate, detections)
+        blocks = list(stream.iter_blocks(block_samples=300))
+
+        assert stream.channels == 2 and stream.sample_rate == sample_rate
+        assert stream.ranges == [(100, 1200), (2950, 3050)]
+        np.testing.assert_array_equal(np.concatenate(blocks), expected)
+        assert all(len(block) <= 300 for block in blocks)
+
+    def test_stream_leaves_source_untouched(self):
+        """Test streaming never writes to the source audio."""
+        remediator = AudioRemediator(
+            {"enabled": True, "mode": "silence", "categories": ["Profanity"]}
+        )
+        audio = np.ones(1000, dtype=np.float32)
+        stream = remediator.stream(
+            audio, 1000, [DetectionResult(0.0, 0.5, "Profanity", 0.9, "test")]
+        )
+
+        blocks = list(stream.iter_blocks(block_samples=128))
+
+        assert np.all(audio == 1.0)
+        assert np.count_nonzero(np.concatenate(blocks) == 0.0) == 500
+
+    def test_stream_bleep_allocates_per_block(self):
+        """Test a long bleep is generated one block-sized slice at a time."""
+        remediator = AudioRemediator(
+            {"enabled": True, "mode": "bleep", "categories": ["Profanity"]}
+        )
+        sample_rate = 1000
+        audio = np.ones(10000, dtype=np.float32)
+        stream = remediator.stream(
+            audio, sample_rate, [DetectionResult(1.0, 9.5, "Profanity", 0.9, "test")]
+        )
+
+        with patch.object(
+            AudioRemediator, "_bleep_tone", autospec=True,
+            side_effect=AudioRemediator._bleep_tone,
+        ) as bleep_tone:
+            result = np.concatenate(list(stream.iter_blocks(block_samples=256)))
+
+        assert max(call.args[2] for call in bleep_tone.call_args_list) <= 256
+        expected = remediator._bleep_tone(0, 8500, sample_rate)
+        np.testing.assert_allclose(result[1000:9500], expected, atol=1e-6)
+
+    def test_bleep_tone_reuses_buffer_with_continuous_phase(self):
+        """Test bleeps read one precomputed buffer and match the exact sine."""
+        remediator = AudioRemediator(
+            {"enabled": True, "mode": "bleep", "categories": ["Profanity"]}
+        )
+        sample_rate = 8000
+        audio = np.ones(5 * sample_rate, dtype=np.float32)
+        detections = [
+            DetectionResult(start, start + 0.3, "Profanity", 0.9, "test")
+            for start in (0.5, 1.5, 2.5)
+        ] + [DetectionResult(3.0, 4.9, "Profanity", 0.9, "test")]
+
+        with patch("numpy.sin", wraps=np.sin) as sin:
+            result = np.concatenate(list(
+                remediator.stream(audio, sample_rate, detections).iter_blocks(
+                    block_samples=1000
+                )
+            ))
+
+        assert sin.call_count == 1
+        t = np.arange(int(1.9 * sample_rate)) / sample_rate
+        expected = 0.2 * np.sin(2 * np.pi * 1000 * t)
+        np.testing.assert_allclose(
+            result[3 * sample_rate:int(4.9 * sample_rate)], expected, atol=1e-4
+        )
+
+    def test_disabled_stream_passes_audio_through(self):
+        """Test a disabled remediator streams the audio unchanged."""
+        remediator = AudioRemediator({"enabled": False, "categories": ["Profanity"]})
+        audio = np.ones(1000, dtype=np.float32)
+        stream = remediator.stream(
+            audio, 1000, [DetectionResult(0.0, 0.5, "Profanity", 0.9, "test")]
+        )
+
+        assert stream.ranges == []
+        np.testing.assert_array_equal(np.concatenate(list(stream.iter_blocks())), audio)
+
+
 class TestStereoAudio:
     """Test multi-channel (stereo) audio handling."""
 
@@ -455,6 +637,66 @@ class TestStereoAudio:
             assert np.allclose(result[:end_sample, 0], result[:end_sample, ch])
 
 
+class TestMemoryMappedAudio:
+    """Test remediation of memory-mapped (read-only) audio."""
+
+    def _write_pcm(self, tmp_path, audio):
+        pcm_file = tmp_path / "track.f32"
+        pcm_file.write_bytes(audio.astype("<f4").tobytes())
+        return pcm_file, np.memmap(pcm_file, dtype="<f4", mode="r", shape=audio.shape)
+
+    def test_remediates_read_only_memmap(self, tmp_path):
+        """Test memmapped audio is remediated copy-on-write."""
+        remediator = AudioRemediator({
+            "enabled": True,
+            "mode": "silence",
+            "categories": ["Profanity"],
+        })
+        sample_rate = 16000
+        pcm_file, audio = self._write_pcm(
+            tmp_path, np.ones((sample_rate, 2), dtype=np.float32)
+        )
+        detections = [
+            DetectionResult(
+                start_time=0.5, end_time=1.0, label="Profanity",
+                confidence=0.95, reasoning="test",
+            )
+        ]
+
+        result = remediator.remediate(audio, sample_rate, detections)
+
+        assert isinstance(result, np.memmap)
+        assert np.all(result[8000:] == 0.0)
+        assert np.all(result[:8000] == 1.0)
+        # Neither the input mapping nor its backing file is modified
+        assert np.all(audio == 1.0)
+        on_disk = np.fromfile(pcm_file, dtype="<f4")
+        assert np.all(on_disk == 1.0)
+
+    def test_memmap_view_is_copied(self, tmp_path):
+        """Test a view into a mapping falls back to a full copy."""
+        remediator = AudioRemediator({
+            "enabled": True,
+            "mode": "silence",
+            "categories": ["Profanity"],
+        })
+        _, audio = self._write_pcm(tmp_path, np.ones(32000, dtype=np.float32))
+        view = audio[16000:]
+        detections = [
+            DetectionResult(
+                start_time=0.0, end_time=0.5, label="Profanity",
+                confidence=0.95, reasoning="test",
+            )
+        ]
+
+        result = remediator.remediate(view, 16000, detections)
+
+        assert result.shape == (16000,)
+        assert np.all(result[:8000] == 0.0)
+        assert np.all(result[8000:] == 1.0)
+        assert np.all(audio == 1.0)
+
+
 class TestAudioFileWriting:
     """Test audio file writing functionality."""
 
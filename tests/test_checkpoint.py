@@ -0,0 +1,78 @@
+"""Tests for append-only analysis checkpoints."""
+
+from video_censor_personal.checkpoint import AnalysisCheckpoint
+from video_censor_personal.frame import DetectionResult
+
+
+def _result(timecode: float, label: str = "Nudity") -> DetectionResult:
+    return DetectionResult(
+        start_time=timecode,
+        end_time=timecode + 0.033,
+        label=label,
+        confidence=0.7,
+        reasoning="test",
+    )
+
+
+class TestAnalysisCheckpoint:
+    """Test writing and recovering analysis checkpoints."""
+
+    def test_load_missing_returns_none(self, tmp_path):
+        """No checkpoint file means nothing to resume."""
+        checkpoint = AnalysisCheckpoint(str(tmp_path / "run.jsonl"), "abc")
+        assert checkpoint.load() is None
+
+    def test_round_trip(self, tmp_path):
+        """Recorded audio and frame results are recovered in order."""
+        path = str(tmp_path / "run.jsonl")
+        checkpoint = AnalysisCheckpoint(path, "abc")
+        checkpoint.start()
+        checkpoint.record_audio([_result(0.0, "Profanity")])
+        checkpoint.record_frames(1.0, [_result(1.0)])
+        checkpoint.record_frames(2.0, [])
+        checkpoint.close()
+
+        state = AnalysisCheckpoint(path, "abc").load()
+        assert state.audio_results == [_result(0.0, "Profanity")]
+        assert state.frame_results == [_result(1.0)]
+        assert state.last_timecode == 2.0
+
+    def test_fingerprint_mismatch_is_ignored(self, tmp_path):
+        """A checkpoint for other settings is not resumed."""
+        path = str(tmp_path / "run.jsonl")
+        checkpoint = AnalysisCheckpoint(path, "abc")
+        checkpoint.start()
+        checkpoint.record_frames(1.0, [_result(1.0)])
+        checkpoint.close()
+
+        assert AnalysisCheckpoint(path, "other").load() is None
+
+    def test_truncated_record_is_dropped_on_resume(self, tmp_path):
+        """A partial trailing record is ignored and overwritten on resume."""
+        path = tmp_path / "run.jsonl"
+        checkpoint = AnalysisCheckpoint(str(path), "abc")
+        checkpoint.start()
+        checkpoint.record_frames(1.0, [_result(1.0)])
+        checkpoint.close()
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"type": "frames", "timecode": 2.0, "resu')
+
+        resumed = AnalysisCheckpoint(str(path), "abc")
+        state = resumed.load()
+        assert state.last_timecode == 1.0
+
+        resumed.start(resume=True)
+        resumed.record_frames(3.0, [_result(3.0)])
+        resumed.close()
+
+        state = AnalysisCheckpoint(str(path), "abc").load()
+        assert state.frame_results == [_result(1.0), _result(3.0)]
+        assert state.last_timecode == 3.0
+
+    def test_remove_deletes_file(self, tmp_path):
+        """remove() deletes the checkpoint after a completed run."""
+        path = tmp_path / "run.jsonl"
+        checkpoint = AnalysisCheckpoint(str(path), "abc")
+        checkpoint.start()
+        checkpoint.remove()
+        assert not path.exists()
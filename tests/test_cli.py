@@ -184,6 +184,22 @@ class TestInputSegmentsArgument:
         assert args.output_video == "output.mp4"
 
 
+class TestResumeArgument:
+    """Test --resume argument parsing."""
+
+    def test_resume_defaults_to_false(self):
+        """--resume should be off unless given."""
+        parser = create_parser()
+        args = parser.parse_args(["--input", "video.mp4"])
+        assert args.resume is False
+
+    def test_resume_flag(self):
+        """--resume should set resume to True."""
+        parser = create_parser()
+        args = parser.parse_args(["--input", "video.mp4", "--resume"])
+        assert args.resume is True
+
+
 class TestParserHelpText:
     """Test that help text is clear and complete."""
 
@@ -245,6 +245,117 @@ class TestFrameAnalysis:
                 pass  # In real usage, error handling is done in the base pipeline
 
 
+class TestBatchInference:
+    """Test batched CLIP inference via detect_batch()."""
+
+    @staticmethod
+    def _mock_model(torch, image_embeddings):
+        """Build a mock CLIP model whose 10 prompt embeddings are one-hot."""
+        model = MagicMock()
+        model.get_text_features.return_value = torch.eye(10)
+        model.get_image_features.return_value = image_embeddings
+        model.logit_scale = torch.tensor(np.log(100.0))
+        return model
+
+    def test_detect_batch_runs_single_forward_pass(self, valid_config):
+        """Test detect_batch() scores all frames in one image encoder call."""
+        torch = pytest.importorskip("torch")
+
+        image_embeddings = torch.zeros((2, 10))
+        image_embeddings[0, 0] = 1.0  # Frame 0 -> "nude person" (Nudity)
+        image_embeddings[1, 4] = 1.0  # Frame 1 -> "blood" (Violence)
+        model = self._mock_model(torch, image_embeddings)
+        processor = MagicMock(
+            return_value={"input_ids": torch.zeros((10, 4)), "pixel_values": torch.zeros(2)}
+        )
+
+        with patch.object(CLIPDetector, "_load_model", return_value=(model, processor)):
+            detector = CLIPDetector(valid_config)
+            frames = [np.zeros((32, 32, 3), dtype=np.uint8) for _ in range(2)]
+
+            batch_results = detector.detect_batch(frames)
+
+        assert model.get_image_features.call_count == 1
+        assert len(processor.call_args.kwargs["images"]) == 2
+        assert [[r.label for r in results] for results in batch_results] == [
+            ["Nudity"],
+            ["Violence"],
+        ]
+
+    def test_text_embeddings_encoded_once(self, valid_config):
+        """Test prompt texts go through the text encoder only once."""
+        torch = pytest.importorskip("torch")
+
+        image_embeddings = torch.zeros((1, 10))
+        image_embeddings[0, 8] = 1.0  # "erotic content" (Sexual Theme)
+        model = self._mock_model(torch, image_embeddings)
+        processor = MagicMock(
+            return_value={"input_ids": torch.zeros((10, 4)), "pixel_values": torch.zeros(1)}
+        )
+
+        with patch.object(CLIPDetector, "_load_model", return_value=(model, processor)):
+            detector = CLIPDetector(valid_config)
+            frame = np.zeros((32, 32, 3), dtype=np.uint8)
+
+            for _ in range(3):
+                results = detector.detect(frame_data=frame)
+
+        assert model.get_text_features.call_count == 1
+        assert model.get_image_features.call_count == 3
+        assert [r.label for r in results] == ["Sexual Theme"]
+        assert detector._prompt_categories == ["Nudity", "Violence", "Sexual Theme"]
+        assert detector._prompt_category_starts.tolist() == [0, 3, 7]
+
+    def test_detect_batch_validates_every_frame(self, valid_config):
+        """Test detect_batch() rejects invalid frames."""
+        with patch.object(CLIPDetector, "_load_model", return_value=(Mock(), Mock())):
+            detector = CLIPDetector(valid_config)
+
+            with pytest.raises(ValueError, match="requires frame_data"):
+                detector.detect_batch([np.zeros((4, 4, 3), dtype=np.uint8), None])
+
+    def test_out_of_memory_batch_is_not_cached(self, valid_config, tmp_path):
+        """Test an OOM batch raises from detect_batch() and nothing is cached."""
+        torch = pytest.importorskip("torch")
+        from video_censor_personal.detection import DetectionPipeline
+        from video_censor_personal.detection_cache import (
+            DetectionCache,
+            detector_cache_key,
+        )
+        from video_censor_personal.frame import Frame
+
+        model = self._mock_model(torch, torch.zeros((2, 10)))
+        model.get_image_features.side_effect = RuntimeError("CUDA out of memory")
+        processor = MagicMock(
+            return_value={"input_ids": torch.zeros((10, 4)), "pixel_values": torch.zeros(2)}
+        )
+
+        with patch.object(CLIPDetector, "_load_model", return_value=(model, processor)):
+            detector = CLIPDetector(valid_config)
+        frames = [
+            Frame(index=i, timecode=float(i), data=np.zeros((32, 32, 3), dtype=np.uint8))
+            for i in range(2)
+        ]
+
+        with pytest.raises(RuntimeError, match="out of memory"):
+            detector.detect_batch([f.data for f in frames])
+        assert detector.detect(frame_data=frames[0].data) == []
+
+        with DetectionCache(str(tmp_path / "cache.sqlite")) as cache:
+            pipeline = DetectionPipeline({"detectors": []})
+            pipeline.detectors.append(detector)
+            pipeline.set_result_cache(cache, "video")
+            results, failed = pipeline.analyze_frames(frames)
+
+            cached = cache.get_frame_results(
+                "video", detector_cache_key(detector.config), [0.0, 1.0]
+            )
+
+        assert failed
+        assert results == [[], []]
+        assert cached == [None, None]
+
+
 # ============================================================================
 # Tests: Result Creation
 # ============================================================================
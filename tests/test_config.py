@@ -232,6 +232,74 @@ class TestSemanticValidation:
         with pytest.raises(ConfigError, match="invalid"):
             validate_config(valid_config)
 
+    def test_frame_source_ffmpeg(self, valid_config):
+        """Frame source 'ffmpeg' with a frame size should be allowed."""
+        valid_config["processing"]["frame_sampling"]["frame_source"] = "ffmpeg"
+        valid_config["processing"]["frame_sampling"]["frame_size"] = 224
+        validate_config(valid_config)  # Should not raise
+
+    def test_frame_source_invalid(self, valid_config):
+        """Unknown frame source should raise error."""
+        valid_config["processing"]["frame_sampling"]["frame_source"] = "gstreamer"
+        with pytest.raises(ConfigError, match="Frame source"):
+            validate_config(valid_config)
+
+    def test_frame_size_not_positive(self, valid_config):
+        """Non-positive frame size should raise error."""
+        valid_config["processing"]["frame_sampling"]["frame_size"] = 0
+        with pytest.raises(ConfigError, match="frame_size"):
+            validate_config(valid_config)
+
+    def test_parallel_analysis_not_boolean(self, valid_config):
+        """Non-boolean parallel_analysis should raise error."""
+        valid_config["processing"]["parallel_analysis"] = "yes"
+        with pytest.raises(ConfigError, match="parallel_analysis"):
+            validate_config(valid_config)
+
+    def test_detection_cache_valid(self, valid_config):
+        """Detection cache settings should be allowed."""
+        valid_config["processing"]["detection_cache"] = {
+            "enabled": True,
+            "path": "/tmp/cache.sqlite",
+        }
+        validate_config(valid_config)  # Should not raise
+
+    def test_detection_cache_enabled_not_boolean(self, valid_config):
+        """Non-boolean detection_cache.enabled should raise error."""
+        valid_config["processing"]["detection_cache"] = {"enabled": "yes"}
+        with pytest.raises(ConfigError, match="detection_cache.enabled"):
+            validate_config(valid_config)
+
+    def test_prefetch_frames_negative(self, valid_config):
+        """Negative prefetch queue size should raise error."""
+        valid_config["processing"]["frame_sampling"]["prefetch_frames"] = -1
+        with pytest.raises(ConfigError, match="prefetch_frames"):
+            validate_config(valid_config)
+
+    def test_prefetch_frames_zero_allowed(self, valid_config):
+        """Prefetch queue size of 0 disables prefetching and is allowed."""
+        valid_config["processing"]["frame_sampling"]["prefetch_frames"] = 0
+        validate_config(valid_config)  # Should not raise
+
+    def test_scene_sampling_settings_valid(self, valid_config):
+        """Scene threshold and max interval within range should be allowed."""
+        valid_config["processing"]["frame_sampling"]["strategy"] = "scene_based"
+        valid_config["processing"]["frame_sampling"]["scene_threshold"] = 0.4
+        valid_config["processing"]["frame_sampling"]["max_interval"] = 5
+        validate_config(valid_config)  # Should not raise
+
+    def test_scene_threshold_out_of_range(self, valid_config):
+        """Scene threshold outside (0, 1] should raise error."""
+        valid_config["processing"]["frame_sampling"]["scene_threshold"] = 1.5
+        with pytest.raises(ConfigError, match="scene_threshold"):
+            validate_config(valid_config)
+
+    def test_max_interval_not_positive(self, valid_config):
+        """Non-positive max interval should raise error."""
+        valid_config["processing"]["frame_sampling"]["max_interval"] = 0
+        with pytest.raises(ConfigError, match="max_interval"):
+            validate_config(valid_config)
+
     def test_max_workers_positive(self, valid_config):
         """Positive max_workers should be allowed."""
         valid_config["processing"]["max_workers"] = 1
@@ -166,3 +166,22 @@ class TestMultipleDetectors:
             }
         ]
         validate_config(base_config)  # Should not raise
+
+
+class TestDetectorBatchSize:
+    """Test optional detector batch_size validation."""
+
+    def test_detector_batch_size_valid(self, base_config):
+        """Positive integer batch_size is allowed."""
+        base_config["detectors"] = [
+            {"type": "clip", "name": "clip", "categories": ["Nudity"], "batch_size": 16}
+        ]
+        validate_config(base_config)  # Should not raise
+
+    def test_detector_batch_size_invalid_raises_error(self, base_config):
+        """Non-positive batch_size raises error."""
+        base_config["detectors"] = [
+            {"type": "clip", "name": "clip", "categories": ["Nudity"], "batch_size": 0}
+        ]
+        with pytest.raises(ConfigError, match="'batch_size' must be a positive integer"):
+            validate_config(base_config)
@@ -5,11 +5,18 @@ import pytest
 from video_censor_personal.config import (
     get_audio_remediation_config,
     get_config_value,
+    get_detection_cache_path,
+    get_frame_size_from_config,
+    get_max_workers_from_config,
+    get_prefetch_frames_from_config,
+    get_frame_source_from_config,
     get_sample_rate_from_config,
     get_video_remediation_blank_color,
     get_video_remediation_category_modes,
     get_video_remediation_mode,
     is_audio_remediation_enabled,
+    is_detection_cache_enabled,
+    is_parallel_analysis_enabled,
     is_skip_chapters_enabled,
 )
 
@@ -97,6 +104,61 @@ class TestGetSampleRateFromConfig:
         assert value == 0
 
 
+class TestGetFrameSourceFromConfig:
+    """Test frame source helper functions."""
+
+    def test_get_frame_source_default(self, base_config):
+        """Frame source defaults to opencv with native frame size."""
+        assert get_frame_source_from_config(base_config) == "opencv"
+        assert get_frame_size_from_config(base_config) is None
+
+    def test_get_frame_source_ffmpeg(self, base_config):
+        """Get configured ffmpeg frame source and size."""
+        base_config["processing"]["frame_sampling"]["frame_source"] = "ffmpeg"
+        base_config["processing"]["frame_sampling"]["frame_size"] = 224
+        assert get_frame_source_from_config(base_config) == "ffmpeg"
+        assert get_frame_size_from_config(base_config) == 224
+
+    def test_get_prefetch_frames(self, base_config):
+        """Prefetch queue size defaults to 4 and can be overridden."""
+        assert get_prefetch_frames_from_config(base_config) == 4
+        base_config["processing"]["frame_sampling"]["prefetch_frames"] = 0
+        assert get_prefetch_frames_from_config(base_config) == 0
+
+
+class TestParallelAnalysisConfig:
+    """Test parallel analysis helper functions."""
+
+    def test_parallel_analysis_disabled_by_default(self, base_config):
+        """Parallel analysis is opt-in."""
+        assert is_parallel_analysis_enabled(base_config) is False
+
+    def test_parallel_analysis_enabled(self, base_config):
+        """Get configured worker count and parallel flag."""
+        base_config["processing"]["max_workers"] = 8
+        base_config["processing"]["parallel_analysis"] = True
+        assert is_parallel_analysis_enabled(base_config) is True
+        assert get_max_workers_from_config(base_config) == 8
+
+
+class TestDetectionCacheConfig:
+    """Test detection cache helper functions."""
+
+    def test_detection_cache_defaults(self, base_config):
+        """Detection cache is disabled with no explicit path by default."""
+        assert is_detection_cache_enabled(base_config) is False
+        assert get_detection_cache_path(base_config) is None
+
+    def test_detection_cache_configured(self, base_config):
+        """Get configured detection cache settings."""
+        base_config["processing"]["detection_cache"] = {
+            "enabled": True,
+            "path": "cache.sqlite",
+        }
+        assert is_detection_cache_enabled(base_config) is True
+        assert get_detection_cache_path(base_config) == "cache.sqlite"
+
+
 class TestIsSkipChaptersEnabled:
     """Test is_skip_chapters_enabled helper function."""
 
@@ -88,6 +88,28 @@ class TestVideoRemediationValidation:
         with pytest.raises(ConfigError, match="'remediation.video.enabled' must be a boolean"):
             validate_config(base_config)
 
+    def test_smart_render_not_boolean_raises_error(self, base_config):
+        """smart_render field must be a boolean."""
+        base_config["remediation"] = {
+            "video": {
+                "enabled": True,
+                "smart_render": "yes",
+            }
+        }
+        with pytest.raises(ConfigError, match="'remediation.video.smart_render' must be a boolean"):
+            validate_config(base_config)
+
+    def test_max_workers_not_positive_raises_error(self, base_config):
+        """max_workers field must be a positive integer."""
+        base_config["remediation"] = {
+            "video": {
+                "enabled": True,
+                "max_workers": 0,
+            }
+        }
+        with pytest.raises(ConfigError, match="'remediation.video.max_workers' must be a positive integer"):
+            validate_config(base_config)
+
 
 class TestVideoRemediationModeValidation:
     """Test video remediation mode validation."""
@@ -2,6 +2,7 @@
 
 import logging
 from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
@@ -141,6 +142,27 @@ class TestDetectorInterface:
         # Should not raise
         detector.cleanup()
 
+    def test_detector_batch_size_defaults_to_one(self):
+        """Test that batch_size defaults to 1."""
+        detector = StubDetector({"name": "test", "categories": ["Test"]})
+        assert detector.batch_size == 1
+
+    def test_detector_batch_size_must_be_positive_int(self):
+        """Test that invalid batch_size is rejected."""
+        with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+            StubDetector({"name": "test", "categories": ["Test"], "batch_size": 0})
+
+    def test_detector_detect_batch_default_loops_over_detect(self):
+        """Test default detect_batch() calls detect() once per frame."""
+        detector = StubDetector({"name": "test", "categories": ["A", "B"]})
+        frames = [np.zeros((4, 4, 3), dtype=np.uint8) for _ in range(3)]
+
+        batch_results = detector.detect_batch(frames)
+
+        assert detector.detect_call_count == 3
+        assert len(batch_results) == 3
+        assert all([r.label for r in results] == ["A", "B"] for results in batch_results)
+
     def test_detector_detect_must_be_implemented_by_subclass(self):
         """Test that abstract detect() method must be implemented."""
 
@@ -477,6 +499,137 @@ class TestDetectionPipeline:
         assert "bad" in caplog.text
         assert "failed" in caplog.text.lower()
 
+    def test_pipeline_analyze_frames_chunks_by_detector_batch_size(self):
+        """Test analyze_frames() dispatches per-detector batches in order."""
+        config = {
+            "detectors": [
+                {"type": "stub", "name": "batched", "categories": ["A"], "batch_size": 2},
+                {"type": "stub", "name": "single", "categories": ["B"]},
+            ]
+        }
+        pipeline = DetectionPipeline(config)
+        frames = [
+            Frame(index=i, timecode=float(i), data=np.zeros((4, 4, 3), dtype=np.uint8))
+            for i in range(3)
+        ]
+        calls = []
+        batched = pipeline.detectors[0]
+        original = batched.detect_batch
+        batched.detect_batch = lambda data: calls.append(len(data)) or original(data)
+
+        assert pipeline.get_frame_batch_size() == 2
+        frame_results, failed = pipeline.analyze_frames(frames)
+
+        assert calls == [2, 1]
+        assert not failed
+        assert len(frame_results) == 3
+        for frame, results in zip(frames, frame_results):
+            assert sorted(r.label for r in results) == ["A", "B"]
+            assert all(r.start_time == frame.timecode for r in results)
+
+    def test_pipeline_analyze_frames_isolates_detector_failure(self):
+        """Test a failing detector batch does not drop other detectors' results."""
+        config = {
+            "detectors": [
+                {"type": "failing", "name": "bad", "categories": ["Test"], "batch_size": 4},
+                {"type": "stub", "name": "good", "categories": ["Success"]},
+            ]
+        }
+        pipeline = DetectionPipeline(config)
+        frames = [
+            Frame(index=i, timecode=float(i), data=np.zeros((4, 4, 3), dtype=np.uint8))
+            for i in range(2)
+        ]
+
+        frame_results, failed = pipeline.analyze_frames(frames)
+
+        assert failed
+        assert [[r.label for r in results] for results in frame_results] == [
+            ["Success"],
+            ["Success"],
+        ]
+
+    def test_pipeline_analyze_frames_uses_result_cache(self, tmp_path):
+        """Test cached frames skip inference and new frames are stored."""
+        from video_censor_personal.detection_cache import DetectionCache
+
+        config = {"detectors": [{"type": "stub", "name": "cached", "categories": ["A"]}]}
+        frames = [
+            Frame(index=i, timecode=float(i), data=np.zeros((4, 4, 3), dtype=np.uint8))
+            for i in range(3)
+        ]
+
+        with DetectionCache(str(tmp_path / "cache.sqlite")) as cache:
+            first = DetectionPipeline(config)
+            first.set_result_cache(cache, "video")
+            first_results, _ = first.analyze_frames(frames[:2])
+
+            second = DetectionPipeline(config)
+            second.set_result_cache(cache, "video")
+            calls = []
+            detector = second.detectors[0]
+            original = detector.detect_batch
+            detector.detect_batch = lambda data: calls.append(len(data)) or original(data)
+            second_results, _ = second.analyze_frames(frames)
+
+        assert calls == [1]
+        assert second_results[:2] == first_results
+        assert [r.start_time for r in second_results[2]] == [2.0]
+
+    def test_pipeline_analyze_full_audio_offers_cache(self, tmp_path):
+        """Test audio detectors receive the cache and an audio fingerprint."""
+        from video_censor_personal.detection_cache import (
+            DetectionCache,
+            compute_audio_fingerprint,
+        )
+
+        config = {"detectors": [{"type": "stub", "name": "cached", "categories": ["A"]}]}
+        audio = np.zeros(16000, dtype=np.float32)
+        audio_detector = MagicMock()
+        audio_detector.supports_full_audio_analysis.return_value = True
+        audio_detector.analyze_full_audio.return_value = []
+
+        with DetectionCache(str(tmp_path / "cache.sqlite")) as cache:
+            pipeline = DetectionPipeline(config)
+            pipeline.detectors.append(audio_detector)
+            pipeline.set_result_cache(cache, "video")
+            pipeline.analyze_full_audio(audio, sample_rate=16000)
+
+        audio_detector.set_audio_cache.assert_called_once_with(
+            cache, compute_audio_fingerprint(audio, 16000)
+        )
+
+    def test_pipeline_analyze_full_audio_shares_activity_index(self, tmp_path):
+        """Test one activity index is built, offered to audio detectors and cached."""
+        from video_censor_personal.detection_cache import DetectionCache
+        from video_censor_personal.voice_activity import AudioActivityIndex
+
+        config = {"detectors": [{"type": "stub", "name": "frames", "categories": ["A"]}]}
+        audio = np.zeros(16000 * 2, dtype=np.float32)
+        audio[16000:] = 0.1
+        audio_detectors = []
+        for _ in range(2):
+            detector = MagicMock()
+            detector.supports_full_audio_analysis.return_value = True
+            detector.analyze_full_audio.return_value = []
+            audio_detectors.append(detector)
+
+        with DetectionCache(str(tmp_path / "cache.sqlite")) as cache, patch.object(
+            AudioActivityIndex, "compute", wraps=AudioActivityIndex.compute
+        ) as compute:
+            # Second run reuses the cached index
+            for _ in range(2):
+                pipeline = DetectionPipeline(config)
+                pipeline.detectors.extend(audio_detectors)
+                pipeline.set_result_cache(cache, "video")
+                pipeline.analyze_full_audio(audio, sample_rate=16000)
+
+        assert compute.call_count == 1
+        for detector in audio_detectors:
+            index = detector.set_activity_index.call_args.args[0]
+            assert isinstance(index, AudioActivityIndex)
+            assert index.silent[:10].all() and not index.silent[10:].any()
+
     def test_pipeline_cleanup_calls_all_detectors(self):
         """Test that pipeline.cleanup() calls cleanup on all detectors."""
         config = {
@@ -0,0 +1,164 @@
+"""Tests for the persistent per-frame detection result cache."""
+
+import numpy as np
+import pytest
+
+from video_censor_personal.detection_cache import (
+    FINGERPRINT_CHUNK_BYTES,
+    DetectionCache,
+    compute_audio_fingerprint,
+    compute_video_fingerprint,
+    detector_cache_key,
+    frame_cache_namespace,
+)
+from video_censor_personal.frame import DetectionResult
+from video_censor_personal.voice_activity import AudioActivityIndex
+
+
+def _result(timecode: float, label: str = "Nudity") -> DetectionResult:
+    return DetectionResult(
+        start_time=timecode,
+        end_time=timecode + 0.033,
+        label=label,
+        confidence=0.8,
+        reasoning="test",
+        frame_data={"frame_index": 3},
+    )
+
+
+class TestDetectionCache:
+    """Test DetectionCache storage and lookup."""
+
+    def test_round_trip(self, tmp_path):
+        """Stored results are returned for the same key and timecode."""
+        with DetectionCache(str(tmp_path / "cache.sqlite")) as cache:
+            cache.put_frame_results("video", "clip", [(1.0, [_result(1.0)]), (2.0, [])])
+            cached = cache.get_frame_results("video", "clip", [1.0, 2.0, 3.0])
+
+        assert cached[0] == [_result(1.0)]
+        assert cached[1] == []
+        assert cached[2] is None
+
+    def test_keys_are_isolated(self, tmp_path):
+        """Results are not shared across videos or detectors."""
+        with DetectionCache(str(tmp_path / "cache.sqlite")) as cache:
+            cache.put_frame_results("video", "clip", [(1.0, [_result(1.0)])])
+            assert cache.get_frame_results("other", "clip", [1.0]) == [None]
+            assert cache.get_frame_results("video", "llava", [1.0]) == [None]
+
+    def test_persists_across_connections(self, tmp_path):
+        """Results survive closing and reopening the database."""
+        path = str(tmp_path / "cache.sqlite")
+        with DetectionCache(path) as cache:
+            cache.put_frame_results("video", "clip", [(0.5, [_result(0.5)])])
+        with DetectionCache(path) as cache:
+            assert cache.get_frame_results("video", "clip", [0.5]) == [[_result(0.5)]]
+
+
+class TestTranscriptCache:
+    """Test transcript storage and lookup."""
+
+    def test_transcript_round_trip(self, tmp_path):
+        """Stored transcripts are returned for the same audio and key."""
+        transcript = {
+            "text": "hello there",
+            "chunks": [{"text": "hello", "timestamp": [0.0, 0.4]}],
+        }
+        path = str(tmp_path / "cache.sqlite")
+        with DetectionCache(path) as cache:
+            cache.put_transcript("audio", "whisper-base:abc", transcript)
+        with DetectionCache(path) as cache:
+            assert cache.get_transcript("audio", "whisper-base:abc") == transcript
+            assert cache.get_transcript("audio", "whisper-small:abc") is None
+            assert cache.get_transcript("other", "whisper-base:abc") is None
+
+
+class TestActivityIndexCache:
+    """Test audio activity index storage and lookup."""
+
+    def test_activity_index_round_trip(self, tmp_path):
+        """Stored indexes are returned for the same audio and frame length."""
+        audio = np.zeros(16000 * 2, dtype=np.float32)
+        audio[16000:] = 0.25
+        index = AudioActivityIndex.compute(audio, 16000)
+        path = str(tmp_path / "cache.sqlite")
+        with DetectionCache(path) as cache:
+            cache.put_activity_index("audio", index)
+        with DetectionCache(path) as cache:
+            cached = cache.get_activity_index("audio", index.frame_seconds)
+            assert cache.get_activity_index("audio", 0.5) is None
+            assert cache.get_activity_index("other", index.frame_seconds) is None
+
+        np.testing.assert_array_equal(cached.rms, index.rms)
+        np.testing.assert_array_equal(cached.silent, index.silent)
+        assert cached.duration == index.duration
+
+
+class TestComputeAudioFingerprint:
+    """Test decoded audio fingerprinting."""
+
+    def test_fingerprint_tracks_samples_and_rate(self):
+        """Fingerprints change with the samples and the sample rate."""
+        audio = np.zeros(48000, dtype=np.float32)
+        changed = audio.copy()
+        changed[-1] = 0.5
+
+        base = compute_audio_fingerprint(audio, 16000)
+        assert compute_audio_fingerprint(audio.copy(), 16000) == base
+        assert compute_audio_fingerprint(changed, 16000) != base
+        assert compute_audio_fingerprint(audio, 48000) != base
+
+
+class TestDetectorCacheKey:
+    """Test detector cache key derivation."""
+
+    def test_key_ignores_name_and_batch_size(self):
+        """Settings that do not change results keep the same key."""
+        base = {"type": "clip", "model_name": "m", "categories": ["Nudity"]}
+        renamed = dict(base, name="vision", batch_size=8)
+        assert detector_cache_key(base) == detector_cache_key(renamed)
+
+    def test_key_changes_with_prompts(self):
+        """Result-affecting settings change the key."""
+        base = {"type": "clip", "model_name": "m", "prompts": [{"category": "A"}]}
+        changed = dict(base, prompts=[{"category": "B"}])
+        assert detector_cache_key(base) != detector_cache_key(changed)
+        assert detector_cache_key(base).startswith("clip:m:")
+
+
+class TestFrameCacheNamespace:
+    """Test namespacing frame results by decoding settings."""
+
+    def test_namespace_changes_with_frame_source_and_size(self):
+        """Frames decoded differently do not share cached results."""
+        opencv = frame_cache_namespace("video", "opencv", None)
+        ffmpeg = frame_cache_namespace("video", "ffmpeg", None)
+        scaled = frame_cache_namespace("video", "ffmpeg", 224)
+
+        assert len({opencv, ffmpeg, scaled}) == 3
+        assert frame_cache_namespace("other", "opencv", None) != opencv
+
+    def test_opencv_ignores_frame_size(self):
+        """frame_size only affects the ffmpeg frame source."""
+        assert frame_cache_namespace("video", "opencv", 224) == (
+            frame_cache_namespace("video", "opencv", None)
+        )
+
+
+class TestComputeVideoFingerprint:
+    """Test video fingerprinting."""
+
+    @pytest.mark.parametrize("size", [100, FINGERPRINT_CHUNK_BYTES * 3])
+    def test_fingerprint_tracks_content(self, tmp_path, size):
+        """Changing file content at either end changes the fingerprint."""
+        video = tmp_path / "video.mp4"
+        data = bytearray(size)
+        video.write_bytes(bytes(data))
+        original = compute_video_fingerprint(str(video))
+
+        data[-1] = 1
+        video.write_bytes(bytes(data))
+        assert compute_video_fingerprint(str(video)) != original
+        assert compute_video_fingerprint(str(video)) == compute_video_fingerprint(
+            str(video)
+        )
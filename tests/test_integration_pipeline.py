@@ -9,6 +9,7 @@ Tests the complete workflow:
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -122,6 +123,399 @@ class TestAnalysisPipelineExecution:
             # can return results per frame, but we can verify results are reasonable
             assert len(results) >= 0
 
+    def test_pipeline_scene_based_strategy_samples_fewer_frames(
+        self, sample_video_path, config_with_mock
+    ):
+        """Test scene_based strategy analyzes a subset of candidate frames."""
+        from video_censor_personal.video_extraction import VideoExtractor
+
+        config_with_mock["processing"]["frame_sampling"]["sample_rate"] = 0.1
+        config_with_mock["processing"]["frame_sampling"]["strategy"] = "scene_based"
+        pipeline = AnalysisPipeline(sample_video_path, config_with_mock)
+        pipeline.extractor = VideoExtractor(sample_video_path)
+        try:
+            scene_frames = list(pipeline._iter_frames(0.1))
+            uniform_frames = list(pipeline.extractor.extract_frames(sample_rate=0.1))
+        finally:
+            pipeline.cleanup()
+
+        assert 0 < len(scene_frames) <= len(uniform_frames)
+        assert scene_frames[0].timecode == 0.0
+        assert [f.index for f in scene_frames] == list(range(len(scene_frames)))
+
+    def test_pipeline_parallel_analysis_matches_serial(
+        self, sample_video_path, config_with_mock
+    ):
+        """Test process-pool analysis returns the same results as serial."""
+        with AnalysisPipeline(sample_video_path, config_with_mock) as pipeline:
+            serial = pipeline.analyze()
+
+        config_with_mock["processing"]["max_workers"] = 2
+        config_with_mock["processing"]["parallel_analysis"] = True
+        with AnalysisPipeline(sample_video_path, config_with_mock) as pipeline:
+            parallel = pipeline.analyze()
+
+        assert [(r.start_time, r.label, r.confidence) for r in parallel] == [
+            (r.start_time, r.label, r.confidence) for r in serial
+        ]
+
+    def test_pipeline_parallel_ffmpeg_source_keeps_sampling_grid(
+        self, sample_video_path, config_with_mock
+    ):
+        """Test worker ranges with the ffmpeg source keep global timecodes."""
+        from video_censor_personal.video_extraction import VideoExtractor
+
+        sample_rate = 0.3
+        config_with_mock["processing"]["frame_sampling"]["sample_rate"] = sample_rate
+        config_with_mock["processing"]["frame_sampling"]["frame_source"] = "ffmpeg"
+        with VideoExtractor(sample_video_path) as extractor:
+            duration = extractor.get_duration_seconds()
+            expected_frames = len(list(extractor.extract_frames_ffmpeg(sample_rate)))
+
+        with AnalysisPipeline(sample_video_path, config_with_mock) as pipeline:
+            # 2.0s split into thirds: no range starts on the 0.3s grid
+            results, frame_count = pipeline._analyze_frames_parallel(
+                sample_rate, duration, 3
+            )
+
+        assert frame_count == expected_frames
+        keys = [(r.start_time, r.label) for r in results]
+        assert len(keys) == len(set(keys))
+        start_times = [r.start_time for r in results]
+        assert start_times == sorted(start_times)
+        for start_time in start_times:
+            assert start_time / sample_rate == pytest.approx(round(start_time / sample_rate))
+
+    def test_pipeline_detection_cache_skips_inference(
+        self, sample_video_path, config_with_mock, tmp_path
+    ):
+        """Test a second run with the detection cache skips frame inference."""
+        from video_censor_personal.detectors.mock_detector import MockDetector
+
+        config_with_mock["processing"]["detection_cache"] = {
+            "enabled": True,
+            "path": str(tmp_path / "cache.sqlite"),
+        }
+        with AnalysisPipeline(sample_video_path, config_with_mock) as pipeline:
+            first = pipeline.analyze()
+
+        with patch.object(
+            MockDetector, "detect", side_effect=AssertionError("inference ran")
+        ):
+            with AnalysisPipeline(sample_video_path, config_with_mock) as pipeline:
+                second = pipeline.analyze()
+
+        assert (tmp_path / "cache.sqlite").exists()
+        assert second == first
+
+    def test_pipeline_detection_cache_misses_on_frame_size_change(
+        self, sample_video_path, config_with_mock, tmp_path
+    ):
+        """Test frames decoded at a different size are analyzed again."""
+        from video_censor_personal.detectors.mock_detector import MockDetector
+
+        config_with_mock["processing"]["detection_cache"] = {
+            "enabled": True,
+            "path": str(tmp_path / "cache.sqlite"),
+        }
+        frame_sampling = config_with_mock["processing"]["frame_sampling"]
+        frame_sampling["frame_source"] = "ffmpeg"
+        frame_sampling["frame_size"] = 224
+        with AnalysisPipeline(sample_video_path, config_with_mock) as pipeline:
+            pipeline.analyze()
+
+        frame_sampling["frame_size"] = 112
+        with patch.object(MockDetector, "detect", return_value=[]) as mock_detect:
+            with AnalysisPipeline(sample_video_path, config_with_mock) as pipeline:
+                pipeline.analyze()
+
+        assert mock_detect.called
+
+    def test_pipeline_resumes_from_checkpoint(
+        self, sample_video_path, config_with_mock, tmp_path
+    ):
+        """Test --resume restores checkpointed results and skips analyzed frames."""
+        from video_censor_personal.detection import DetectionPipeline
+
+        checkpoint_path = str(tmp_path / "results.checkpoint.jsonl")
+        with AnalysisPipeline(sample_video_path, config_with_mock) as pipeline:
+            expected = pipeline.analyze()
+
+        # Interrupt a checkpointed run after the second batch of frames
+        original = DetectionPipeline.analyze_frames
+        calls = []
+
+        def interrupted(self, frames):
+            if len(calls) == 2:
+                raise KeyboardInterrupt
+            calls.append(frames[-1].timecode)
+            return original(self, frames)
+
+        with patch.object(DetectionPipeline, "analyze_frames", interrupted):
+            with pytest.raises(KeyboardInterrupt):
+                with AnalysisPipeline(
+                    sample_video_path, config_with_mock, checkpoint_path=checkpoint_path
+                ) as pipeline:
+                    pipeline.analyze()
+        assert Path(checkpoint_path).exists()
+
+        analyzed = []
+
+        def tracking(self, frames):
+            analyzed.extend(f.timecode for f in frames)
+            return original(self, frames)
+
+        with patch.object(DetectionPipeline, "analyze_frames", tracking):
+            with AnalysisPipeline(
+                sample_video_path,
+                config_with_mock,
+                checkpoint_path=checkpoint_path,
+                resume=True,
+            ) as pipeline:
+                resumed = pipeline.analyze()
+
+        assert min(analyzed) > calls[-1]
+        assert resumed == expected
+        assert not Path(checkpoint_path).exists()
+
+    def test_pipeline_parallel_resumes_from_checkpoint(
+        self, sample_video_path, config_with_mock, tmp_path
+    ):
+        """Test parallel analysis restores checkpointed frames and skips them."""
+        from video_censor_personal import pipeline as pipeline_module
+        from video_censor_personal.detection import DetectionPipeline
+
+        checkpoint_path = str(tmp_path / "results.checkpoint.jsonl")
+        with AnalysisPipeline(sample_video_path, config_with_mock) as pipeline:
+            expected = pipeline.analyze()
+
+        original = DetectionPipeline.analyze_frames
+        calls = []
+
+        def interrupted(self, frames):
+            if len(calls) == 1:
+                raise KeyboardInterrupt
+            calls.append(frames[-1].timecode)
+            return original(self, frames)
+
+        with patch.object(DetectionPipeline, "analyze_frames", interrupted):
+            with pytest.raises(KeyboardInterrupt):
+                with AnalysisPipeline(
+                    sample_video_path, config_with_mock, checkpoint_path=checkpoint_path
+                ) as pipeline:
+                    pipeline.analyze()
+
+        config_with_mock["processing"]["max_workers"] = 2
+        config_with_mock["processing"]["parallel_analysis"] = True
+        with patch.object(
+            pipeline_module,
+            "_split_time_ranges",
+            wraps=pipeline_module._split_time_ranges,
+        ) as split:
+            with AnalysisPipeline(
+                sample_video_path,
+                config_with_mock,
+                checkpoint_path=checkpoint_path,
+                resume=True,
+            ) as pipeline:
+                resumed = pipeline.analyze()
+
+        duration = split.call_args[0][0]
+        assert duration < 2.0 - calls[-1] + 0.1
+        assert resumed == expected
+        assert not Path(checkpoint_path).exists()
+
+    def test_pipeline_parallel_writes_checkpoint(
+        self, sample_video_path, config_with_mock, tmp_path
+    ):
+        """Test parallel analysis checkpoints completed ranges in timeline order."""
+        from video_censor_personal.checkpoint import AnalysisCheckpoint
+
+        config_with_mock["processing"]["max_workers"] = 2
+        config_with_mock["processing"]["parallel_analysis"] = True
+        checkpoint_path = tmp_path / "results.checkpoint.jsonl"
+        with patch.object(AnalysisCheckpoint, "remove"):
+            with AnalysisPipeline(
+                sample_video_path, config_with_mock, checkpoint_path=str(checkpoint_path)
+            ) as pipeline:
+                results = pipeline.analyze()
+
+        records = [json.loads(line) for line in checkpoint_path.read_text().splitlines()]
+        frame_records = [r for r in records if r["type"] == "frames"]
+        assert len(frame_records) == 2
+        assert frame_records[0]["timecode"] < frame_records[1]["timecode"]
+        checkpointed = [r["start_time"] for rec in frame_records for r in rec["results"]]
+        assert checkpointed == [r.start_time for r in results]
+
+    def test_worker_skips_failing_batch(
+        self, sample_video_path, config_with_mock, caplog
+    ):
+        """Test a worker logs a failing batch and analyzes the rest of its range."""
+        from video_censor_personal.detection import DetectionPipeline
+        from video_censor_personal.pipeline import _analyze_time_range
+
+        pipeline_config = {"detectors": config_with_mock["detectors"]}
+        original = DetectionPipeline.analyze_frames
+
+        def failing(self, frames):
+            if any(1.0 <= frame.timecode < 1.5 for frame in frames):
+                raise RuntimeError("bad frame")
+            return original(self, frames)
+
+        with patch.object(DetectionPipeline, "get_frame_batch_size", return_value=1):
+            expected = _analyze_time_range(
+                sample_video_path, config_with_mock, pipeline_config, 0.5, 0.0, None, 1
+            )
+            with patch.object(DetectionPipeline, "analyze_frames", failing):
+                outcome = _analyze_time_range(
+                    sample_video_path, config_with_mock, pipeline_config, 0.5, 0.0, None, 1
+                )
+
+        assert expected.complete
+        assert outcome.frame_count == expected.frame_count
+        assert "Error analyzing frames" in caplog.text
+        results = outcome.results
+        assert results == [r for r in expected.results if not 1.0 <= r.start_time < 1.5]
+        assert any(r.start_time >= 1.5 for r in results)
+
+        # Only frames before the failed batch may be checkpointed
+        assert not outcome.complete
+        assert outcome.checkpoint_timecode < 1.0
+        prefix = results[:outcome.checkpoint_results]
+        assert prefix == [r for r in results if r.start_time < 1.0]
+
+    def test_pipeline_does_not_checkpoint_failed_batch(
+        self, sample_video_path, config_with_mock, tmp_path
+    ):
+        """Test frames from a failed batch onward stay out of the checkpoint."""
+        from video_censor_personal.checkpoint import AnalysisCheckpoint
+        from video_censor_personal.detection import DetectionPipeline
+
+        original = DetectionPipeline.analyze_frames
+
+        def failing(self, frames):
+            if any(1.0 <= frame.timecode < 1.5 for frame in frames):
+                raise RuntimeError("bad frame")
+            return original(self, frames)
+
+        checkpoint_path = tmp_path / "results.checkpoint.jsonl"
+        with patch.object(DetectionPipeline, "get_frame_batch_size", return_value=1), \
+                patch.object(DetectionPipeline, "analyze_frames", failing), \
+                patch.object(AnalysisCheckpoint, "remove"):
+            with AnalysisPipeline(
+                sample_video_path, config_with_mock, checkpoint_path=str(checkpoint_path)
+            ) as pipeline:
+                results = pipeline.analyze()
+
+        assert any(r.start_time >= 1.5 for r in results)
+        records = [json.loads(line) for line in checkpoint_path.read_text().splitlines()]
+        frame_records = [r for r in records if r["type"] == "frames"]
+        assert frame_records
+        assert all(r["timecode"] < 1.0 for r in frame_records)
+
+    def test_pipeline_resume_reanalyzes_frames_a_detector_failed_on(
+        self, sample_video_path, config_with_mock, tmp_path
+    ):
+        """Test frames whose detect_batch() raised are analyzed again on resume."""
+        from video_censor_personal.checkpoint import AnalysisCheckpoint
+        from video_censor_personal.detection import DetectionPipeline
+        from video_censor_personal.detectors.mock_detector import MockDetector
+
+        with AnalysisPipeline(sample_video_path, config_with_mock) as pipeline:
+            expected = pipeline.analyze()
+
+        original_analyze = DetectionPipeline.analyze_frames
+        original_detect = MockDetector.detect_batch
+        batches = []
+
+        def tracking(self, frames):
+            batches.append(frames[-1].timecode)
+            return original_analyze(self, frames)
+
+        def failing(self, frames_data):
+            if len(batches) == 3:
+                raise RuntimeError("CUDA out of memory")
+            return original_detect(self, frames_data)
+
+        checkpoint_path = str(tmp_path / "results.checkpoint.jsonl")
+        with patch.object(DetectionPipeline, "get_frame_batch_size", return_value=1), \
+                patch.object(DetectionPipeline, "analyze_frames", tracking), \
+                patch.object(MockDetector, "detect_batch", failing), \
+                patch.object(AnalysisCheckpoint, "remove"):
+            with AnalysisPipeline(
+                sample_video_path, config_with_mock, checkpoint_path=checkpoint_path
+            ) as pipeline:
+                pipeline.analyze()
+        failed_timecode = batches[2]
+
+        analyzed = []
+
+        def resumed_tracking(self, frames):
+            analyzed.extend(f.timecode for f in frames)
+            return original_analyze(self, frames)
+
+        with patch.object(DetectionPipeline, "analyze_frames", resumed_tracking):
+            with AnalysisPipeline(
+                sample_video_path,
+                config_with_mock,
+                checkpoint_path=checkpoint_path,
+                resume=True,
+            ) as pipeline:
+                resumed = pipeline.analyze()
+
+        assert failed_timecode in analyzed
+        assert batches[1] not in analyzed
+        assert resumed == expected
+
+    def test_pipeline_parallel_does_not_checkpoint_failed_batch(
+        self, sample_video_path, config_with_mock, tmp_path
+    ):
+        """Test parallel checkpointing stops at the first failed batch."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from video_censor_personal import pipeline as pipeline_module
+        from video_censor_personal.checkpoint import AnalysisCheckpoint
+        from video_censor_personal.detection import DetectionPipeline
+
+        original = DetectionPipeline.analyze_frames
+
+        def failing(self, frames):
+            if any(0.9 <= frame.timecode < 1.0 for frame in frames):
+                raise RuntimeError("bad frame")
+            return original(self, frames)
+
+        # Run workers in threads so the patched detector applies to them
+        def thread_pool(max_workers, mp_context=None):
+            return ThreadPoolExecutor(max_workers=max_workers)
+
+        config_with_mock["processing"]["max_workers"] = 2
+        config_with_mock["processing"]["parallel_analysis"] = True
+        checkpoint_path = tmp_path / "results.checkpoint.jsonl"
+        with patch.object(pipeline_module, "ProcessPoolExecutor", thread_pool), \
+                patch.object(DetectionPipeline, "get_frame_batch_size", return_value=1), \
+                patch.object(DetectionPipeline, "analyze_frames", failing), \
+                patch.object(AnalysisCheckpoint, "remove"):
+            with AnalysisPipeline(
+                sample_video_path, config_with_mock, checkpoint_path=str(checkpoint_path)
+            ) as pipeline:
+                results = pipeline.analyze()
+
+        # The second range analyzed fine but lies after the gap
+        assert any(r.start_time >= 1.0 for r in results)
+        records = [json.loads(line) for line in checkpoint_path.read_text().splitlines()]
+        frame_records = [r for r in records if r["type"] == "frames"]
+        assert len(frame_records) == 1
+        assert frame_records[0]["timecode"] < 0.9
+
+    def test_split_time_ranges(self):
+        """Test timeline is split into contiguous ranges ending at None."""
+        from video_censor_personal.pipeline import _split_time_ranges
+
+        assert _split_time_ranges(10.0, 4) == [
+            (0.0, 2.5), (2.5, 5.0), (5.0, 7.5), (7.5, None)
+        ]
+        assert _split_time_ranges(0.0, 4) == [(0.0, None)]
+
     def test_pipeline_handles_no_detections(self, sample_video_path):
         """Test pipeline handles video with no detections gracefully.
 
@@ -225,6 +619,48 @@ class TestAnalysisRunner:
                 assert "confidence" in detection
 
 
+class TestRemediationRunner:
+    """Test RemediationRunner for remediation-only CLI execution."""
+
+    def test_remediation_only_output_is_tagged(
+        self, sample_video_path, config_with_mock, temp_output_dir
+    ):
+        """Test remediation-only runs tag the output; analysis runs do not.
+
+        The tags (censored title, remediation metadata) are written by the
+        output's final pass.
+        """
+        from video_censor_personal.pipeline import RemediationRunner
+        from video_censor_personal.remediation import RemediationManager
+
+        config_with_mock.setdefault("video", {})["metadata_output"] = {
+            "skip_chapters": {"enabled": True}
+        }
+        config_path = Path(__file__).parent / "fixtures" / "config_with_mock.yaml"
+        segments_path = str(temp_output_dir / "output.json")
+        output_video = str(temp_output_dir / "output.mp4")
+
+        tags = {"title": "sample (Censored)"}
+        with patch.object(RemediationManager, "_write_output") as analysis_write, \
+                patch.object(RemediationManager, "_build_output_metadata", return_value=tags):
+            AnalysisRunner(
+                sample_video_path, config_with_mock, str(config_path), output_video
+            ).run(segments_path)
+        with patch.object(RemediationManager, "_write_output") as remediation_write, \
+                patch.object(RemediationManager, "_build_output_metadata", return_value=tags):
+            RemediationRunner(
+                sample_video_path,
+                segments_path,
+                config_with_mock,
+                output_video_path=output_video,
+                config_file=str(config_path),
+                segment_file=segments_path,
+            ).run()
+
+        assert analysis_write.call_args.args[0].tags == {}
+        assert remediation_write.call_args.args[0].tags == tags
+
+
 class TestSegmentMerging:
     """Test detection result merging into segments."""
 
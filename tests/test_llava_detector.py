@@ -248,6 +248,65 @@ class TestFrameAnalysis:
                         assert any(r.label == "Nudity" for r in results)
                         assert any(r.label == "Violence" for r in results)
 
+    def test_detect_batch_matches_detect(self, valid_config, frame_bgr):
+        """Test detect_batch() runs one generate() call and parses like detect()."""
+        responses = [
+            json.dumps({"nudity": {"detected": True, "confidence": 0.9}}),
+            "not json",
+            json.dumps({"violence": {"detected": True, "confidence": 0.7}}),
+        ]
+        with patch("video_censor_personal.detectors.llava_detector.Path.exists", return_value=True):
+            with patch("builtins.open", create=True):
+                with patch.object(LLaVADetector, "_load_model") as mock_load_model:
+                    mock_model = MagicMock()
+                    mock_processor = MagicMock()
+                    mock_processor.return_value = {"test": "input"}
+                    mock_processor.batch_decode.return_value = responses
+                    mock_load_model.return_value = (mock_model, mock_processor)
+
+                    detector = LLaVADetector(valid_config)
+                    batch_results = detector.detect_batch([frame_bgr] * 3)
+
+                    single_results = []
+                    for response in responses:
+                        mock_processor.decode.return_value = response
+                        single_results.append(detector.detect(frame_data=frame_bgr))
+
+        assert mock_model.generate.call_count == 4
+        assert mock_processor.call_args_list[0].kwargs["padding"] is True
+        assert [[r.label for r in results] for results in batch_results] == [
+            ["Nudity"],
+            [],
+            ["Violence"],
+        ]
+        assert batch_results == single_results
+
+    def test_detect_batch_oom_error_raises(self, valid_config, frame_bgr):
+        """Test that OOM errors fail the batch instead of returning empty results."""
+        with patch("video_censor_personal.detectors.llava_detector.Path.exists", return_value=True):
+            with patch("builtins.open", create=True):
+                with patch.object(LLaVADetector, "_load_model") as mock_load_model:
+                    mock_model = MagicMock()
+                    mock_processor = MagicMock()
+                    mock_processor.return_value = {"test": "input"}
+                    mock_model.generate.side_effect = RuntimeError("out of memory")
+                    mock_load_model.return_value = (mock_model, mock_processor)
+
+                    detector = LLaVADetector(valid_config)
+
+                    with pytest.raises(RuntimeError, match="out of memory"):
+                        detector.detect_batch([frame_bgr, frame_bgr])
+
+    def test_detect_batch_validates_every_frame(self, valid_config, frame_bgr):
+        """Test detect_batch() applies the same frame validation as detect()."""
+        with patch("video_censor_personal.detectors.llava_detector.Path.exists", return_value=True):
+            with patch("builtins.open", create=True):
+                with patch.object(LLaVADetector, "_load_model", return_value=(Mock(), Mock())):
+                    detector = LLaVADetector(valid_config)
+
+                    with pytest.raises(ValueError, match="shape.*height, width, 3"):
+                        detector.detect_batch([frame_bgr, np.zeros((4, 4), dtype=np.uint8)])
+
     def test_detect_with_none_frame_raises_error(self, valid_config):
         """Test that None frame data raises error."""
         with patch("video_censor_personal.detectors.llava_detector.Path.exists", return_value=True):
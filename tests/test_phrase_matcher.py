@@ -0,0 +1,99 @@
+"""Tests for keyword and phrase matching module."""
+
+from video_censor_personal.phrase_matcher import PhraseMatch, PhraseMatcher
+
+
+class TestPhraseMatcher:
+    """Test compiled keyword/phrase matching."""
+
+    def test_single_words(self):
+        """Test single-word entries match whole words only."""
+        matcher = PhraseMatcher({"en": {"damn", "hell"}})
+
+        matches = matcher.find(["oh", "damn", "hello", "hell"])
+
+        assert matches == [
+            PhraseMatch(1, 1, "damn", "en"),
+            PhraseMatch(3, 3, "hell", "en"),
+        ]
+
+    def test_multi_word_phrase_spans_all_words(self):
+        """Test a phrase match covers its first through last word."""
+        matcher = PhraseMatcher({"es": {"hijo de puta", "vete al carajo"}})
+
+        matches = matcher.find("eres un hijo de puta vete al carajo".split())
+
+        assert matches == [
+            PhraseMatch(2, 4, "hijo de puta", "es"),
+            PhraseMatch(5, 7, "vete al carajo", "es"),
+        ]
+
+    def test_partial_phrase_does_not_match(self):
+        """Test an incomplete phrase is not reported."""
+        matcher = PhraseMatcher({"es": {"hijo de puta"}})
+
+        assert matcher.find("hijo de mi vecino".split()) == []
+
+    def test_overlapping_prefix_restarts(self):
+        """Test a phrase is found after a false start on its first word."""
+        matcher = PhraseMatcher({"en": {"son of a bitch"}})
+
+        matches = matcher.find("son son of a bitch".split())
+
+        assert matches == [PhraseMatch(1, 4, "son of a bitch", "en")]
+
+    def test_contained_match_is_dropped(self):
+        """Test a keyword inside a longer matched phrase is not repeated."""
+        matcher = PhraseMatcher({"en": {"bitch", "son of a bitch"}})
+
+        matches = matcher.find("you son of a bitch".split())
+
+        assert matches == [PhraseMatch(1, 4, "son of a bitch", "en")]
+
+    def test_wildcard_stem(self):
+        """Test a trailing * matches any word starting with the stem."""
+        matcher = PhraseMatcher({"en": {"fuck*", "piss* off"}})
+
+        matches = matcher.find("fucking pissed off fuck".split())
+
+        assert matches == [
+            PhraseMatch(0, 0, "fuck*", "en"),
+            PhraseMatch(1, 2, "piss* off", "en"),
+            PhraseMatch(3, 3, "fuck*", "en"),
+        ]
+
+    def test_entries_are_normalized(self):
+        """Test entries are lowercased and stripped of punctuation."""
+        matcher = PhraseMatcher({"en": {"  Damn!  ", "Holy  Crap"}})
+
+        assert len(matcher) == 2
+        assert [m.phrase for m in matcher.find("holy crap damn".split())] == [
+            "holy crap", "damn"
+        ]
+
+    def test_invalid_entries_are_ignored(self):
+        """Test bare or mid-word wildcards are skipped."""
+        matcher = PhraseMatcher({"en": {"*", "f*ck", ""}})
+
+        assert len(matcher) == 0
+        assert matcher.find(["fuck"]) == []
+
+    def test_language_attribution(self):
+        """Test matches report the language of their list."""
+        matcher = PhraseMatcher({"en": {"damn"}, "es": {"mierda"}})
+
+        matches = matcher.find(["mierda", "damn"])
+
+        assert [m.language for m in matches] == ["es", "en"]
+
+    def test_large_lists(self):
+        """Test thousands of entries compile and match correctly."""
+        entries = {f"word{i}" for i in range(5000)}
+        entries |= {f"phrase {i} end" for i in range(5000)}
+        matcher = PhraseMatcher({"en": entries})
+        words = ["filler"] * 1000 + ["phrase", "4999", "end", "word42"]
+
+        matches = matcher.find(words)
+
+        assert len(matcher) == 10000
+        assert [m.phrase for m in matches] == ["phrase 4999 end", "word42"]
@@ -5,13 +5,15 @@ pipeline, ensuring audio + video remediation work correctly in both modes.
 """
 
 import logging
+import shutil
+import subprocess
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from video_censor_personal.remediation import RemediationManager
+from video_censor_personal.remediation import RemediationManager, RemediationPlan
 
 
 logger = logging.getLogger(__name__)
@@ -182,8 +184,8 @@ class TestRemediationManagerVideoSource:
 class TestCorrectRemediationSequence:
     """Test that the correct remediation sequence is maintained."""
     
-    def test_audio_remediation_runs_before_mux(self, tmp_path):
-        """Audio remediation must run before muxing to create the remediated audio."""
+    @staticmethod
+    def _run_tracked(tmp_path, video_mode):
         video_file = tmp_path / "test.mp4"
         video_file.write_bytes(b"fake video")
         output_file = tmp_path / "output.mp4"
@@ -191,7 +193,7 @@ class TestCorrectRemediationSequence:
         config = {
             "remediation": {
                 "audio": {"enabled": True, "mode": "silence"},
-                "video": {"enabled": True, "mode": "blank"},
+                "video": {"enabled": True, "mode": video_mode},
             }
         }
         
@@ -200,10 +202,6 @@ class TestCorrectRemediationSequence:
         # Track which methods are called
         call_sequence = []
         
-        original_apply_audio = manager._apply_audio_remediation
-        original_mux = manager._mux_remediated_audio
-        original_apply_video = manager._apply_video_remediation
-        
         def track_audio(*args, **kwargs):
             call_sequence.append('audio')
             # Simulate audio remediation by setting the path
@@ -233,6 +231,11 @@ class TestCorrectRemediationSequence:
             video_duration=10.0,
             merged_segments=merged_segments,
         )
+        return call_sequence
+    
+    def test_audio_muxed_before_cuts(self, tmp_path):
+        """Audio must be muxed before video remediation cuts it."""
+        call_sequence = self._run_tracked(tmp_path, "cut")
         
         # Verify sequence: audio -> mux -> video
         assert call_sequence == ['audio', 'mux', 'video'], (
@@ -240,6 +243,255 @@ class TestCorrectRemediationSequence:
             "This is critical: audio and video must be muxed BEFORE video remediation "
             "to ensure audio/video sync when video has cuts."
         )
+    
+    def test_audio_muxed_in_final_pass_without_cuts(self, tmp_path):
+        """Blanking keeps the timeline, so audio is muxed into its output."""
+        assert self._run_tracked(tmp_path, "blank") == ['audio', 'video', 'mux']
+
+
+class TestRemediationPlan:
+    """Test how requested operations are fused into ffmpeg passes."""
+    
+    SEGMENTS = [{"start_time": 1.0, "end_time": 2.0}]
+    
+    def test_audio_only_is_one_pass(self):
+        """Test remediated audio alone is muxed straight into the output."""
+        assert RemediationPlan(audio=True).steps == ["finalize"]
+    
+    def test_tags_and_chapters_share_the_audio_pass(self):
+        """Test tags and chapters do not add passes."""
+        plan = RemediationPlan(audio=True, tags={"title": "x"}, chapters=[])
+        
+        assert plan.steps == ["finalize"]
+    
+    def test_video_alone_writes_output_directly(self):
+        """Test video remediation without extras is the only pass."""
+        assert RemediationPlan(video_segments=self.SEGMENTS).steps == ["video"]
+    
+    def test_blank_with_audio(self):
+        """Test audio follows blanking, with tags and chapters, in one pass."""
+        plan = RemediationPlan(video_segments=self.SEGMENTS, audio=True, tags={"title": "x"})
+        
+        assert not plan.mux_first
+        assert plan.steps == ["video", "finalize"]
+    
+    def test_cut_with_audio(self):
+        """Test audio is muxed ahead of cuts and needs no final pass."""
+        plan = RemediationPlan(video_segments=self.SEGMENTS, video_cuts=True, audio=True)
+        
+        assert plan.mux_first
+        assert plan.steps == ["mux", "video"]
+    
+    def test_cut_with_audio_and_chapters(self):
+        """Test chapters after cuts get a final stream-copy pass."""
+        plan = RemediationPlan(
+            video_segments=self.SEGMENTS, video_cuts=True, audio=True, chapters=[]
+        )
+        
+        assert plan.steps == ["mux", "video", "finalize"]
+    
+    def test_nothing_to_change_copies(self):
+        """Test an output without changes is a plain copy."""
+        assert RemediationPlan().steps == ["copy"]
+
+
+class TestPlanOutput:
+    """Test RemediationManager.plan_output gathering operations."""
+    
+    @staticmethod
+    def _manager(tmp_path, video=None, skip_chapters=False, output=True, **kwargs):
+        video_file = tmp_path / "test.mp4"
+        video_file.write_bytes(b"fake video")
+        config = {
+            "remediation": {
+                "audio": {"enabled": False},
+                "video": video or {"enabled": False},
+            },
+            "video": {"metadata_output": {"skip_chapters": {"enabled": skip_chapters}}},
+        }
+        return RemediationManager(
+            str(video_file),
+            config,
+            output_video_path=str(tmp_path / "output.mp4") if output else None,
+            **kwargs,
+        )
+    
+    def test_no_output_path(self, tmp_path):
+        """Test nothing is planned without an output path."""
+        manager = self._manager(tmp_path, skip_chapters=True, output=False)
+        
+        assert manager.plan_output([]) is None
+    
+    def test_nothing_requested(self, tmp_path):
+        """Test no output video when no remediation or chapters are enabled."""
+        manager = self._manager(tmp_path, write_metadata=True)
+        
+        assert manager.plan_output([]) is None
+    
+    def test_cut_segments_detected(self, tmp_path):
+        """Test segments resolving to cut mode mark the plan as cutting."""
+        manager = self._manager(
+            tmp_path,
+            video={"enabled": True, "mode": "blank", "category_modes": {"Violence": "cut"}},
+        )
+        segments = [
+            {"start_time": 1.0, "end_time": 2.0, "labels": ["Nudity"]},
+            {"start_time": 5.0, "end_time": 6.0, "labels": ["Violence"]},
+        ]
+        
+        plan = manager.plan_output(segments, 640, 480, 10.0)
+        
+        assert len(plan.video_segments) == 2
+        assert plan.video_cuts
+        assert plan.steps == ["video"]
+    
+    def test_allowed_segments_need_no_video_pass(self, tmp_path):
+        """Test all-allowed segments leave the video untouched."""
+        manager = self._manager(tmp_path, video={"enabled": True, "mode": "blank"})
+        segments = [{"start_time": 1.0, "end_time": 2.0, "labels": ["Nudity"], "allow": True}]
+        
+        plan = manager.plan_output(segments, 640, 480, 10.0)
+        
+        assert plan.steps == ["copy"]
+    
+    def test_skip_chapters_planned(self, tmp_path):
+        """Test skip chapters are built from the chapter segments."""
+        manager = self._manager(tmp_path, skip_chapters=True)
+        chapters = [{"start": 1.0, "end": 2.0, "title": "skip: Nudity [90%]"}]
+        
+        with patch(
+            "video_censor_personal.video_metadata_writer.build_output_chapters",
+            return_value=chapters,
+        ) as mock_build:
+            plan = manager.plan_output([], chapter_segments=["segment"])
+        
+        assert mock_build.call_args[0][2] == ["segment"]
+        assert plan.chapters == chapters
+        assert plan.steps == ["finalize"]
+    
+    def test_metadata_tags_planned(self, tmp_path):
+        """Test tags are only built when write_metadata is set."""
+        manager = self._manager(tmp_path, skip_chapters=True, write_metadata=True)
+        
+        with patch.object(
+            manager, "_build_output_metadata", return_value={"title": "Test (Censored)"}
+        ), patch(
+            "video_censor_personal.video_metadata_writer.build_output_chapters",
+            return_value=[],
+        ):
+            plan = manager.plan_output([])
+        
+        assert plan.tags == {"title": "Test (Censored)"}
+        assert plan.chapters is None
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+class TestFusedOutput:
+    """Test the planned passes produce the output end to end."""
+    
+    def test_blank_audio_tags_and_chapters(self, tmp_path):
+        """Test one video pass and one final pass write everything."""
+        input_video = tmp_path / "input.mp4"
+        audio_file = tmp_path / "remediated.wav"
+        output_video = tmp_path / "output.mp4"
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error",
+                "-f", "lavfi", "-i", "testsrc=size=160x120:rate=10:duration=4",
+                "-f", "lavfi", "-i", "sine=frequency=440:duration=4",
+                "-c:v", "libx264", "-pix_fmt", "yuv420p", "-c:a", "aac",
+                str(input_video),
+            ],
+            check=True,
+        )
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error",
+                "-f", "lavfi", "-i", "anullsrc=r=44100:cl=mono", "-t", "4",
+                str(audio_file),
+            ],
+            check=True,
+        )
+        config = {
+            "remediation": {
+                "audio": {"enabled": True},
+                "video": {"enabled": True, "mode": "blank", "smart_render": False},
+            },
+            "video": {"metadata_output": {"skip_chapters": {"enabled": True}}},
+        }
+        manager = RemediationManager(
+            str(input_video), config, output_video_path=str(output_video)
+        )
+        manager.remediated_audio_path = str(audio_file)
+        segments = [
+            {"start_time": 1.0, "end_time": 2.0, "labels": ["Nudity"], "confidence": 0.9}
+        ]
+        
+        with patch.object(
+            manager, "_build_output_metadata", return_value={"title": "Test (Censored)"}
+        ):
+            manager.write_metadata = True
+            manager.apply_remediation(
+                [],
+                video_width=160,
+                video_height=120,
+                video_duration=4.0,
+                merged_segments=segments,
+            )
+        
+        metadata = subprocess.run(
+            ["ffmpeg", "-v", "error", "-i", str(output_video), "-f", "ffmetadata", "-"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert "title=Test (Censored)" in metadata
+        assert "title=skip: Nudity [90%]" in metadata
+        volume = subprocess.run(
+            [
+                "ffmpeg", "-i", str(output_video), "-map", "0:a",
+                "-af", "volumedetect", "-f", "null", "-",
+            ],
+            capture_output=True,
+            text=True,
+        ).stderr
+        assert "max_volume: -91.0 dB" in volume
+        # No intermediate files are left next to the output
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "input.mp4", "output.mp4", "remediated.wav"
+        ]
+    
+    def test_output_overwriting_input(self, tmp_path):
+        """Test writing the output over the input goes through a temp file."""
+        video = tmp_path / "video.mp4"
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error",
+                "-f", "lavfi", "-i", "testsrc=size=160x120:rate=10:duration=2",
+                "-c:v", "libx264", "-pix_fmt", "yuv420p",
+                str(video),
+            ],
+            check=True,
+        )
+        config = {
+            "remediation": {"audio": {"enabled": False}, "video": {"enabled": False}},
+            "video": {"metadata_output": {"skip_chapters": {"enabled": True}}},
+        }
+        manager = RemediationManager(str(video), config, output_video_path=str(video))
+        segments = [
+            {"start_time": 0.5, "end_time": 1.0, "labels": ["Nudity"], "confidence": 0.8}
+        ]
+        
+        manager.apply_remediation([], merged_segments=segments)
+        
+        metadata = subprocess.run(
+            ["ffmpeg", "-v", "error", "-i", str(video), "-f", "ffmetadata", "-"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert "title=skip: Nudity [80%]" in metadata
+        assert [p.name for p in tmp_path.iterdir()] == ["video.mp4"]
 
 
 class TestRemediationManagerCleanup:
@@ -265,3 +517,76 @@ class TestRemediationManagerCleanup:
         assert not Path(audio_path).exists()
     
 
+
+
+class TestStreamedAudioRemediation:
+    """Test remediated audio is streamed into the muxer instead of a WAV."""
+
+    @staticmethod
+    def _config(**audio_options):
+        audio = {"enabled": True, "mode": "silence", "categories": ["Profanity"]}
+        audio.update(audio_options)
+        return {"remediation": {"audio": audio, "video": {"enabled": False}}}
+
+    @staticmethod
+    def _detections():
+        from video_censor_personal.frame import DetectionResult
+
+        return [DetectionResult(0.0, 0.5, "Profanity", 0.9, "test")]
+
+    def test_audio_streamed_into_muxer(self, tmp_path):
+        """Test no WAV is written and the muxer receives the stream."""
+        import numpy as np
+
+        video_file = tmp_path / "test.mp4"
+        video_file.write_bytes(b"fake video")
+        output_file = tmp_path / "output.mp4"
+        manager = RemediationManager(
+            str(video_file), self._config(), output_video_path=str(output_file)
+        )
+
+        def fake_mux(output_path, audio_stream):
+            Path(output_path).write_bytes(b"muxed")
+            fake_mux.blocks = list(audio_stream.iter_blocks())
+
+        with patch(
+            "video_censor_personal.video_muxer.VideoMuxer.mux_audio_stream",
+            side_effect=fake_mux,
+        ), patch(
+            "video_censor_personal.audio_remediator.AudioRemediator.write_audio"
+        ) as mock_write:
+            manager.apply_remediation(
+                self._detections(),
+                audio_data=np.ones(16000, dtype=np.float32),
+                audio_sample_rate=16000,
+            )
+
+        mock_write.assert_not_called()
+        assert manager.remediated_audio_path is None
+        assert output_file.read_bytes() == b"muxed"
+        assert np.count_nonzero(np.concatenate(fake_mux.blocks) == 0.0) == 8000
+
+    def test_wav_written_when_output_path_configured(self, tmp_path):
+        """Test an explicit remediation.audio.output_path still gets a WAV."""
+        import numpy as np
+
+        video_file = tmp_path / "test.mp4"
+        video_file.write_bytes(b"fake video")
+        wav_file = tmp_path / "remediated.wav"
+        manager = RemediationManager(
+            str(video_file),
+            self._config(output_path=str(wav_file)),
+            output_video_path=str(tmp_path / "output.mp4"),
+        )
+
+        with patch.object(manager, "_mux_remediated_audio") as mock_mux:
+            manager.apply_remediation(
+                self._detections(),
+                audio_data=np.ones(16000, dtype=np.float32),
+                audio_sample_rate=16000,
+            )
+
+        mock_mux.assert_called_once()
+        assert manager.remediated_audio_stream is None
+        assert manager.remediated_audio_path == str(wav_file)
+        assert wav_file.exists()
@@ -0,0 +1,86 @@
+"""Tests for scene-change frame sampling."""
+
+import numpy as np
+import pytest
+
+from video_censor_personal.frame import Frame
+from video_censor_personal.scene_sampling import (
+    SIGNATURE_BINS,
+    frame_signature,
+    sample_scene_changes,
+    signature_distance,
+)
+
+
+def _frames(levels, interval=1.0):
+    """Build solid-gray candidate frames, one per luma level."""
+    return [
+        Frame(
+            index=i,
+            timecode=i * interval,
+            data=np.full((90, 160, 3), level, dtype=np.uint8),
+        )
+        for i, level in enumerate(levels)
+    ]
+
+
+class TestFrameSignature:
+    """Test frame signature computation."""
+
+    def test_signature_is_normalized_histogram(self):
+        """Signature has one bin per luma bucket and sums to 1."""
+        data = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+        signature = frame_signature(data)
+
+        assert signature.shape == (SIGNATURE_BINS,)
+        assert signature.sum() == pytest.approx(1.0)
+
+    def test_distance_identical_and_disjoint(self):
+        """Identical frames have distance 0, disjoint histograms distance 1."""
+        black = frame_signature(np.zeros((48, 64, 3), dtype=np.uint8))
+        white = frame_signature(np.full((48, 64, 3), 255, dtype=np.uint8))
+
+        assert signature_distance(black, black) == 0.0
+        assert signature_distance(black, white) == pytest.approx(1.0)
+
+
+class TestSampleSceneChanges:
+    """Test representative frame selection."""
+
+    def test_one_frame_per_shot(self):
+        """Only the first frame of each shot is emitted."""
+        frames = _frames([0, 0, 0, 200, 200, 200, 0, 0])
+        result = list(sample_scene_changes(frames, threshold=0.3, max_interval=None))
+
+        assert [f.timecode for f in result] == [0.0, 3.0, 6.0]
+        assert [f.index for f in result] == [0, 1, 2]
+
+    def test_max_interval_forces_frame_within_static_shot(self):
+        """A long static shot still gets a frame every max_interval seconds."""
+        frames = _frames([50] * 10)
+        result = list(sample_scene_changes(frames, threshold=0.3, max_interval=4.0))
+
+        assert [f.timecode for f in result] == [0.0, 4.0, 8.0]
+
+    def test_gradual_change_is_detected(self):
+        """Slow fades trigger once drift from the last emitted frame is large."""
+        gradient = np.tile(np.linspace(0, 127, 160, dtype=np.uint8), (90, 1))
+        frames = [
+            Frame(
+                index=i,
+                timecode=float(i),
+                data=np.repeat((gradient + i * 8)[..., None], 3, axis=2),
+            )
+            for i in range(16)
+        ]
+        result = list(sample_scene_changes(frames, threshold=0.3, max_interval=None))
+
+        # Each step differs only slightly from the previous frame
+        assert signature_distance(
+            frame_signature(frames[0].data), frame_signature(frames[1].data)
+        ) < 0.3
+        assert 1 < len(result) < len(frames)
+
+    def test_empty_input(self):
+        """No candidates yields no frames."""
+        assert list(sample_scene_changes([])) == []
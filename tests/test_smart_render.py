@@ -0,0 +1,317 @@
+"""Tests for smart-render keyframe indexing and GOP planning."""
+
+import json
+import subprocess
+from unittest.mock import patch
+
+from video_censor_personal.smart_render import (
+    GopPiece,
+    VideoStreamInfo,
+    encoder_args,
+    plan_cut_pieces,
+    plan_gop_pieces,
+    plan_render_pieces,
+    probe_has_audio,
+    probe_keyframes,
+    probe_video_stream,
+    shift_intervals,
+)
+
+KEYFRAMES = [0.0, 2.0, 4.0, 6.0, 8.0]
+
+
+def _completed(stdout: str, returncode: int = 0) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess([], returncode, stdout=stdout, stderr="")
+
+
+class TestPlanGopPieces:
+    """Test splitting the timeline into copied and re-encoded pieces."""
+
+    def test_only_overlapping_gops_are_reencoded(self):
+        """Test a segment inside one GOP re-encodes just that GOP."""
+        pieces = plan_gop_pieces(KEYFRAMES, [(4.5, 5.0)], 10.0)
+
+        assert pieces == [
+            GopPiece(0.0, 4.0, False),
+            GopPiece(4.0, 6.0, True),
+            GopPiece(6.0, 10.0, False),
+        ]
+
+    def test_segment_spanning_gops(self):
+        """Test consecutive affected GOPs form one piece."""
+        pieces = plan_gop_pieces(KEYFRAMES, [(3.0, 6.5)], 10.0)
+
+        assert pieces == [
+            GopPiece(0.0, 2.0, False),
+            GopPiece(2.0, 8.0, True),
+            GopPiece(8.0, 10.0, False),
+        ]
+
+    def test_segment_ending_on_keyframe(self):
+        """Test the GOP starting at a segment's end is re-encoded too."""
+        pieces = plan_gop_pieces(KEYFRAMES, [(3.0, 4.0)], 10.0)
+
+        assert pieces[1] == GopPiece(2.0, 6.0, True)
+
+    def test_segment_starting_on_keyframe(self):
+        """Test a segment starting on a keyframe leaves the previous GOP."""
+        pieces = plan_gop_pieces(KEYFRAMES, [(4.0, 5.0)], 10.0)
+
+        assert pieces[0] == GopPiece(0.0, 4.0, False)
+        assert pieces[1] == GopPiece(4.0, 6.0, True)
+
+    def test_multiple_segments_and_last_gop(self):
+        """Test separate segments and a segment in the final GOP."""
+        pieces = plan_gop_pieces(KEYFRAMES, [(0.5, 1.0), (9.0, 9.5)], 10.0)
+
+        assert pieces == [
+            GopPiece(0.0, 2.0, True),
+            GopPiece(2.0, 8.0, False),
+            GopPiece(8.0, 10.0, True),
+        ]
+
+    def test_dense_intervals_over_many_gops(self):
+        """Test each interval marks only the GOPs it overlaps."""
+        keyframes = [float(k) for k in range(0, 7200, 2)]
+        intervals = [(k + 0.5, k + 0.6) for k in range(0, 7200, 8)]
+
+        pieces = plan_gop_pieces(keyframes, intervals, 7200.0)
+
+        assert len(pieces) == 1800
+        assert pieces[:2] == [GopPiece(0.0, 2.0, True), GopPiece(2.0, 8.0, False)]
+        assert pieces[-1] == GopPiece(7194.0, 7200.0, False)
+
+    def test_no_keyframes(self):
+        """Test without a keyframe index the whole video is one piece."""
+        assert plan_gop_pieces([], [(1.0, 2.0)], 10.0) == [GopPiece(0.0, 10.0, True)]
+
+    def test_keyframes_past_duration_are_ignored(self):
+        """Test keyframes at or after the duration do not create pieces."""
+        pieces = plan_gop_pieces([0.0, 5.0, 10.0], [(1.0, 2.0)], 10.0)
+
+        assert pieces == [GopPiece(0.0, 5.0, True), GopPiece(5.0, 10.0, False)]
+
+
+class TestPlanCutPieces:
+    """Test splitting kept ranges into copied GOPs and re-encoded edges."""
+
+    def test_edges_reencoded_whole_gops_copied(self):
+        """Test only partial GOPs at cut points are re-encoded."""
+        pieces = plan_cut_pieces(KEYFRAMES, [(0.0, 3.0), (5.5, 10.0)], 10.0)
+
+        assert pieces == [
+            GopPiece(0.0, 2.0, False),
+            GopPiece(2.0, 3.0, True),
+            GopPiece(5.5, 6.0, True),
+            GopPiece(6.0, 10.0, False),
+        ]
+
+    def test_range_on_keyframes_is_copied(self):
+        """Test a range between two keyframes needs no re-encoding."""
+        assert plan_cut_pieces(KEYFRAMES, [(2.0, 6.0)], 10.0) == [GopPiece(2.0, 6.0, False)]
+
+    def test_range_inside_one_gop(self):
+        """Test a range without a whole GOP is re-encoded entirely."""
+        assert plan_cut_pieces(KEYFRAMES, [(4.5, 5.5)], 10.0) == [GopPiece(4.5, 5.5, True)]
+
+    def test_range_to_end_copies_last_gop(self):
+        """Test a range ending at the video end copies its final GOP."""
+        assert plan_cut_pieces(KEYFRAMES, [(8.5, 10.0)], 10.0) == [
+            GopPiece(8.5, 10.0, True)
+        ]
+        assert plan_cut_pieces(KEYFRAMES, [(7.0, 10.0)], 10.0) == [
+            GopPiece(7.0, 8.0, True),
+            GopPiece(8.0, 10.0, False),
+        ]
+
+
+class TestPlanRenderPieces:
+    """Test planning cuts and blanking together."""
+
+    def test_blanked_gop_inside_kept_range(self):
+        """Test a blanked GOP splits a copied range and merges with an edge."""
+        pieces = plan_render_pieces(KEYFRAMES, [(1.0, 10.0)], [(2.5, 3.0), (8.5, 9.0)], 10.0)
+
+        assert pieces == [
+            GopPiece(1.0, 4.0, True),
+            GopPiece(4.0, 8.0, False),
+            GopPiece(8.0, 10.0, True),
+        ]
+
+    def test_blank_outside_kept_ranges_is_ignored(self):
+        """Test blank intervals in cut regions do not force re-encoding."""
+        pieces = plan_render_pieces(KEYFRAMES, [(0.0, 4.0), (6.0, 10.0)], [(4.5, 5.5)], 10.0)
+
+        assert pieces == [GopPiece(0.0, 4.0, False), GopPiece(6.0, 10.0, False)]
+
+    def test_without_cuts_matches_gop_plan(self):
+        """Test keeping everything plans like blank mode alone."""
+        intervals = [(4.5, 5.0)]
+
+        assert plan_render_pieces(KEYFRAMES, [(0.0, 10.0)], intervals, 10.0) == (
+            plan_gop_pieces(KEYFRAMES, intervals, 10.0)
+        )
+
+
+class TestShiftIntervals:
+    """Test mapping blank intervals into a piece's own timeline."""
+
+    def test_clips_and_shifts(self):
+        """Test overlapping intervals are clipped and shifted to the piece."""
+        piece = GopPiece(2.0, 8.0, True)
+
+        shifted = shift_intervals([(1.0, 3.0), (5.0, 6.0), (7.5, 9.0), (9.5, 9.9)], piece)
+
+        assert shifted == [(0.0, 1.0), (3.0, 4.0), (5.5, 6.0)]
+
+    def test_rounds_float_error(self):
+        """Test subtraction error cannot push a start past a frame time."""
+        shifted = shift_intervals([(3.2, 4.5)], GopPiece(3.0, 5.0, True))
+
+        assert shifted == [(0.2, 1.5)]
+
+    def test_many_intervals_match_linear_scan(self):
+        """Test the bisected lookup finds exactly the overlapping intervals."""
+        intervals = [(i * 0.1, i * 0.1 + 0.05) for i in range(5000)]
+        piece = GopPiece(123.42, 130.05, True)
+
+        expected = [
+            (
+                round(max(start, piece.start) - piece.start, 6),
+                round(min(end, piece.end) - piece.start, 6),
+            )
+            for start, end in intervals
+            if start <= piece.end and end >= piece.start
+        ]
+        assert shift_intervals(intervals, piece) == expected
+
+
+class TestEncoderArgs:
+    """Test encoder selection matching the source stream."""
+
+    def test_h264_matches_profile_and_pix_fmt(self):
+        """Test H.264 sources re-encode with libx264 and the same profile."""
+        args = encoder_args(VideoStreamInfo("h264", "High", "yuv420p", 0.0, 10.0))
+
+        assert args[:2] == ["-c:v", "libx264"]
+        assert args[args.index("-profile:v") + 1] == "high"
+        assert args[args.index("-pix_fmt") + 1] == "yuv420p"
+        assert args[args.index("-x264-params") + 1] == "repeat-headers=1"
+
+    def test_hevc(self):
+        """Test HEVC sources re-encode with libx265."""
+        args = encoder_args(VideoStreamInfo("hevc", "Main 10", "yuv420p10le", 0.0, 10.0))
+
+        assert args[:2] == ["-c:v", "libx265"]
+        assert args[args.index("-profile:v") + 1] == "main10"
+
+    def test_unknown_profile_is_omitted(self):
+        """Test profiles without an encoder equivalent are left to the encoder."""
+        args = encoder_args(VideoStreamInfo("h264", None, None, 0.0, 10.0))
+
+        assert "-profile:v" not in args
+        assert "-pix_fmt" not in args
+
+    def test_unsupported_codec(self):
+        """Test codecs without a smart-render encoder are rejected."""
+        assert encoder_args(VideoStreamInfo("vp9", None, "yuv420p", 0.0, 10.0)) is None
+
+
+class TestProbing:
+    """Test ffprobe-based stream and keyframe probing."""
+
+    def test_probe_keyframes(self):
+        """Test keyframe packets are kept, sorted and offset by start time."""
+        output = "1.500000,K__\n1.540000,___\nN/A,K__\n0.500000,K__\n3.500000,K_\n"
+
+        with patch("shutil.which", return_value="/usr/bin/ffprobe"), patch(
+            "subprocess.run", return_value=_completed(output)
+        ):
+            keyframes = probe_keyframes("video.mp4", start_time=0.5)
+
+        assert keyframes == [0.0, 1.0, 3.0]
+
+    def test_probe_keyframes_skips_open_gops(self):
+        """Test keyframes followed in decode order by earlier frames are left out."""
+        # Decode order: the keyframe at 2.0 is followed by its leading
+        # frames at 1.92 and 1.96; the one at 4.0 is not
+        output = (
+            "0.000000,K__\n0.080000,___\n0.040000,___\n1.880000,___\n"
+            "2.000000,K__\n1.920000,___\n1.960000,___\n2.080000,___\n"
+            "3.960000,___\n4.000000,K__\n4.080000,___\n4.040000,___\n"
+        )
+
+        with patch("shutil.which", return_value="/usr/bin/ffprobe"), patch(
+            "subprocess.run", return_value=_completed(output)
+        ):
+            keyframes = probe_keyframes("video.mp4")
+
+        assert keyframes == [0.0, 4.0]
+
+    def test_probe_keyframes_without_ffprobe(self):
+        """Test an empty index when ffprobe is not installed."""
+        with patch("shutil.which", return_value=None):
+            assert probe_keyframes("video.mp4") == []
+
+    def test_probe_keyframes_failure(self):
+        """Test an empty index when ffprobe fails."""
+        with patch("shutil.which", return_value="/usr/bin/ffprobe"), patch(
+            "subprocess.run", return_value=_completed("", returncode=1)
+        ):
+            assert probe_keyframes("video.mp4") == []
+
+    def test_probe_video_stream(self):
+        """Test codec parameters and container timing are read."""
+        output = json.dumps({
+            "streams": [
+                {"codec_type": "video", "codec_name": "h264", "profile": "High",
+                 "pix_fmt": "yuv420p"},
+                {"codec_type": "audio", "codec_name": "aac", "profile": "LC"},
+            ],
+            "format": {"start_time": "0.023", "duration": "5400.5"},
+        })
+
+        with patch("shutil.which", return_value="/usr/bin/ffprobe"), patch(
+            "subprocess.run", return_value=_completed(output)
+        ):
+            info = probe_video_stream("video.mp4")
+
+        assert info == VideoStreamInfo("h264", "High", "yuv420p", 0.023, 5400.5, True)
+
+    def test_probe_video_stream_without_video(self):
+        """Test None when the file has no video stream."""
+        with patch("shutil.which", return_value="/usr/bin/ffprobe"), patch(
+            "subprocess.run",
+            return_value=_completed(json.dumps({"streams": [{"codec_type": "audio"}]})),
+        ):
+            assert probe_video_stream("audio.m4a") is None
+
+    def test_probe_video_stream_without_ffprobe(self):
+        """Test None when ffprobe is not installed."""
+        with patch("shutil.which", return_value=None):
+            assert probe_video_stream("video.mp4") is None
+
+    def test_probe_has_audio_reads_ffmpeg_summary(self):
+        """Test audio streams are found in ffmpeg's input summary."""
+        summary = (
+            "Input #0, mov,mp4,m4a,3gp,3g2,mj2, from 'video.mp4':\n"
+            "  Stream #0:0[0x1](und): Video: h264 (High), yuv420p, 320x240\n"
+            "  Stream #0:1[0x2](und): Audio: aac (LC), 44100 Hz, mono, fltp\n"
+            "At least one output file must be specified\n"
+        )
+        completed = subprocess.CompletedProcess([], 1, stdout="", stderr=summary)
+
+        with patch("shutil.which", return_value="/usr/bin/ffmpeg"), patch(
+            "subprocess.run", return_value=completed
+        ):
+            assert probe_has_audio("video.mp4")
+
+    def test_probe_has_audio_without_audio_stream(self):
+        """Test False for a file with only a video stream."""
+        summary = "  Stream #0:0: Video: mpeg4 (Simple Profile), yuv420p, 64x48\n"
+        completed = subprocess.CompletedProcess([], 1, stdout="", stderr=summary)
+
+        with patch("shutil.which", return_value="/usr/bin/ffmpeg"), patch(
+            "subprocess.run", return_value=completed
+        ):
+            assert not probe_has_audio("video.mp4")
@@ -1,5 +1,6 @@
 """Tests for speech profanity detection module."""
 
+from concurrent.futures import Future
 from pathlib import Path
 from unittest.mock import MagicMock, patch, mock_open
 
@@ -9,7 +10,13 @@ import pytest
 # Skip all tests if transformers is not installed
 pytest.importorskip("transformers", reason="transformers not installed")
 
-from video_censor_personal.speech_profanity_detector import SpeechProfanityDetector
+from video_censor_personal.detection_cache import DetectionCache
+from video_censor_personal.speech_profanity_detector import (
+    _VAD_SPAN_GAP_SECONDS,
+    SpeechProfanityDetector,
+    _split_windows,
+)
+from video_censor_personal.voice_activity import AudioActivityIndex, find_speech_spans
 
 
 class TestSpeechProfanityDetectorInitialization:
@@ -309,6 +316,354 @@ class TestProfanityDetection:
         assert results == []
 
 
+class TestPhraseMatching:
+    """Test multi-word phrase detection in the word stream."""
+
+    @patch("video_censor_personal.speech_profanity_detector.get_device", return_value="cpu")
+    @patch("transformers.pipeline")
+    def test_phrase_spans_all_words(self, mock_pipeline, mock_device):
+        """Test a phrase match spans from its first to its last word."""
+        mock_pipe = MagicMock(return_value={
+            "text": "eres un hijo de puta",
+            "chunks": [
+                {"text": " eres", "timestamp": (0.0, 0.3)},
+                {"text": " un", "timestamp": (0.3, 0.4)},
+                {"text": " hijo", "timestamp": (0.4, 0.7)},
+                {"text": " de", "timestamp": (0.7, 0.8)},
+                {"text": " puta.", "timestamp": (0.8, 1.2)},
+            ],
+        })
+        mock_pipeline.return_value = mock_pipe
+        detector = SpeechProfanityDetector({
+            "name": "test-detector",
+            "categories": ["Profanity"],
+            "languages": ["es"],
+        })
+        detector.keywords = {"es": {"hijo de puta", "puta"}}
+
+        results = detector.analyze_full_audio(np.random.randn(16000).astype(np.float32))
+
+        assert len(results) == 1
+        assert results[0].start_time == 0.4
+        assert results[0].end_time == 1.2
+        assert "hijo de puta" in results[0].reasoning
+
+    @patch("video_censor_personal.speech_profanity_detector.get_device", return_value="cpu")
+    @patch("transformers.pipeline")
+    def test_find_profanity_in_text(self, mock_pipeline, mock_device):
+        """Test text matching returns unique entries in order of appearance."""
+        mock_pipeline.return_value = MagicMock()
+        detector = SpeechProfanityDetector({
+            "name": "test-detector",
+            "categories": ["Profanity"],
+        })
+        detector.keywords = {"en": {"damn", "holy crap", "shit*"}}
+
+        matches = detector._find_profanity("holy crap, damn it. shitty damn")
+
+        assert matches == ["holy crap", "damn", "shit*"]
+
+
+class TestVoiceActivityGating:
+    """Test voice-activity gating before transcription."""
+
+    @staticmethod
+    def _track_with_speech(duration, speech_starts):
+        """Quiet noise floor with 3 s speech-band bursts."""
+        sample_rate = 16000
+        rng = np.random.default_rng(0)
+        audio = (0.001 * rng.standard_normal(int(duration * sample_rate))).astype(
+            np.float32
+        )
+        t = np.arange(3 * sample_rate) / sample_rate
+        burst = 0.05 * sum(np.sin(2 * np.pi * f * t) for f in (500, 900, 1500, 2200))
+        for start in speech_starts:
+            audio[start * sample_rate:(start + 3) * sample_rate] += burst
+        return audio
+
+    @patch("video_censor_personal.speech_profanity_detector.get_device", return_value="cpu")
+    @patch("transformers.pipeline")
+    def test_transcribes_only_speech_and_remaps_timestamps(
+        self, mock_pipeline, mock_device
+    ):
+        """Test only speech spans are transcribed, on the original timeline."""
+        mock_pipe = MagicMock()
+        mock_pipeline.return_value = mock_pipe
+        detector = SpeechProfanityDetector({
+            "name": "test-detector",
+            "categories": ["Profanity"],
+            "vad_padding": 0.5,
+        })
+        detector.keywords = {"en": {"damn"}}
+        audio = self._track_with_speech(120.0, [30, 80])
+
+        spans = find_speech_spans(audio, 16000, padding=0.5)
+        second_span = spans[0][1] - spans[0][0] + _VAD_SPAN_GAP_SECONDS
+        # Word 1 s into the second span of the concatenated audio
+        mock_pipe.return_value = {
+            "text": "oh damn",
+            "chunks": [
+                {"text": "damn", "timestamp": (second_span + 1.0, second_span + 1.4)},
+            ],
+        }
+
+        results = detector.analyze_full_audio(audio, sample_rate=16000)
+
+        transcribed = mock_pipe.call_args.args[0]
+        assert len(transcribed) < len(audio) / 10
+        assert len(results) == 1
+        assert results[0].start_time == pytest.approx(spans[1][0] + 1.0)
+        assert results[0].end_time == pytest.approx(spans[1][0] + 1.4)
+
+    @patch("video_censor_personal.speech_profanity_detector.get_device", return_value="cpu")
+    @patch("transformers.pipeline")
+    def test_skips_transcription_without_speech(self, mock_pipeline, mock_device):
+        """Test a long track without speech activity is not transcribed."""
+        mock_pipe = MagicMock()
+        mock_pipeline.return_value = mock_pipe
+        detector = SpeechProfanityDetector({
+            "name": "test-detector",
+            "categories": ["Profanity"],
+        })
+
+        results = detector.analyze_full_audio(
+            np.zeros(16000 * 90, dtype=np.float32), sample_rate=16000
+        )
+
+        assert results == []
+        mock_pipe.assert_not_called()
+
+    @patch("video_censor_personal.speech_profanity_detector.get_device", return_value="cpu")
+    @patch("transformers.pipeline")
+    def test_vad_disabled_transcribes_full_track(self, mock_pipeline, mock_device):
+        """Test vad: false sends the whole track to Whisper."""
+        mock_pipe = MagicMock()
+        mock_pipe.return_value = {"text": "", "chunks": []}
+        mock_pipeline.return_value = mock_pipe
+        detector = SpeechProfanityDetector({
+            "name": "test-detector",
+            "categories": ["Profanity"],
+            "vad": False,
+        })
+        audio = np.zeros(16000 * 90, dtype=np.float32)
+
+        detector.analyze_full_audio(audio, sample_rate=16000)
+
+        assert mock_pipe.call_args.args[0] is audio
+
+    @patch("video_censor_personal.speech_profanity_detector.get_device", return_value="cpu")
+    @patch("transformers.pipeline")
+    def test_silent_activity_index_skips_transcription(self, mock_pipeline, mock_device):
+        """Test a track the activity index marks silent is not transcribed."""
+        mock_pipe = MagicMock()
+        mock_pipeline.return_value = mock_pipe
+        detector = SpeechProfanityDetector({
+            "name": "test-detector",
+            "categories": ["Profanity"],
+            "vad": False,
+        })
+        audio = np.zeros(16000 * 5, dtype=np.float32)
+        detector.set_activity_index(AudioActivityIndex.compute(audio, 16000))
+
+        assert detector.analyze_full_audio(audio, sample_rate=16000) == []
+        mock_pipe.assert_not_called()
+
+    @patch("video_censor_personal.speech_profanity_detector.get_device", return_value="cpu")
+    @patch("transformers.pipeline")
+    def test_vad_disabled_skips_silence_from_activity_index(
+        self, mock_pipeline, mock_device
+    ):
+        """Test vad: false still drops silent stretches flagged by the index."""
+        mock_pipe = MagicMock()
+        mock_pipeline.return_value = mock_pipe
+        detector = SpeechProfanityDetector({
+            "name": "test-detector",
+            "categories": ["Profanity"],
+            "vad": False,
+            "vad_padding": 0.0,
+        })
+        detector.keywords = {"en": {"damn"}}
+        audio = np.zeros(16000 * 120, dtype=np.float32)
+        audio[16000 * 50:16000 * 60] = 0.1
+        detector.set_activity_index(AudioActivityIndex.compute(audio, 16000))
+        mock_pipe.return_value = {
+            "text": "damn",
+            "chunks": [{"text": "damn", "timestamp": (2.0, 2.5)}],
+        }
+
+        results = detector.analyze_full_audio(audio, sample_rate=16000)
+
+        assert len(mock_pipe.call_args.args[0]) == 16000 * 10
+        assert results[0].start_time == pytest.approx(52.0)
+        assert results[0].end_time == pytest.approx(52.5)
+
+    @patch("video_censor_personal.speech_profanity_detector.get_device", return_value="cpu")
+    @patch("transformers.pipeline")
+    def test_invalid_vad_padding(self, mock_pipeline, mock_device):
+        """Test negative vad_padding is rejected."""
+        mock_pipeline.return_value = MagicMock()
+
+        with pytest.raises(ValueError, match="vad_padding"):
+            SpeechProfanityDetector({
+                "name": "test-detector",
+                "categories": ["Profanity"],
+                "vad_padding": -1,
+            })
+
+
+class _InlineExecutor:
+    """Synchronous stand-in for ProcessPoolExecutor."""
+
+    def __init__(self, max_workers, mp_context, initializer, initargs):
+        initializer(*initargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+class TestWhisperThroughput:
+    """Test Whisper batching and parallel window transcription."""
+
+    @patch("video_censor_personal.speech_profanity_detector.get_device", return_value="cpu")
+    @patch("transformers.pipeline")
+    def test_batch_size_passed_to_pipeline(self, mock_pipeline, mock_device):
+        """Test batch_size is forwarded to the ASR pipeline call."""
+        mock_pipe = MagicMock(return_value={"text": "", "chunks": []})
+        mock_pipeline.return_value = mock_pipe
+        detector = SpeechProfanityDetector({
+            "name": "test-detector",
+            "categories": ["Profanity"],
+            "batch_size": 8,
+        })
+
+        detector.analyze_full_audio(np.zeros(16000, dtype=np.float32))
+
+        assert mock_pipe.call_args.kwargs["batch_size"] == 8
+
+    @pytest.mark.parametrize(
+        "key,value",
+        [("batch_size", 0), ("num_threads", 0), ("parallel_windows", 1.5),
+         ("window_seconds", 5)],
+    )
+    @patch("video_censor_personal.speech_profanity_detector.get_device", return_value="cpu")
+    @patch("transformers.pipeline")
+    def test_invalid_throughput_settings(self, mock_pipeline, mock_device, key, value):
+        """Test invalid batching/threading settings are rejected."""
+        mock_pipeline.return_value = MagicMock()
+
+        with pytest.raises(ValueError, match=key):
+            SpeechProfanityDetector({
+                "name": "test-detector",
+                "categories": ["Profanity"],
+                key: value,
+            })
+
+    def test_split_windows_partitions_track(self):
+        """Test keep ranges cover every sample exactly once."""
+        windows = _split_windows(700, window_samples=300, overlap_samples=100)
+
+        assert [(start, end) for start, end, _, _ in windows] == [
+            (0, 300), (200, 500), (400, 700)
+        ]
+        bounds = [(keep_from, keep_until) for _, _, keep_from, keep_until in windows]
+        assert bounds == [(0.0, 250.0), (250.0, 450.0), (450.0, float("inf"))]
+
+    @patch(
+        "video_censor_personal.speech_profanity_detector.ProcessPoolExecutor",
+        _InlineExecutor,
+    )
+    @patch("video_censor_personal.speech_profanity_detector.get_device", return_value="cpu")
+    @patch("transformers.pipeline")
+    def test_parallel_windows_stitch_without_duplicates(
+        self, mock_pipeline, mock_device
+    ):
+        """Test windowed words are offset and boundary words kept once."""
+        # Every window "hears" a word every 2 s at odd window-relative times
+        mock_pipe = MagicMock(return_value={
+            "text": "",
+            "chunks": [
+                {"text": "word", "timestamp": (float(t), t + 0.5)}
+                for t in range(1, 30, 2)
+            ],
+        })
+        mock_pipeline.return_value = mock_pipe
+        detector = SpeechProfanityDetector({
+            "name": "test-detector",
+            "categories": ["Profanity"],
+            "vad": False,
+            "parallel_windows": 2,
+            "window_seconds": 30,
+        })
+
+        chunks, _ = detector._transcribe(
+            np.zeros(16000 * 70, dtype=np.float32), sample_rate=16000
+        )
+
+        assert mock_pipe.call_count == 3
+        starts = [chunk["timestamp"][0] for chunk in chunks]
+        assert starts == [float(t) for t in range(1, 70, 2)]
+        assert chunks[-1]["timestamp"] == (69.0, 69.5)
+
+
+class TestTranscriptCache:
+    """Test reuse of cached transcripts."""
+
+    @patch("video_censor_personal.speech_profanity_detector.get_device", return_value="cpu")
+    @patch("transformers.pipeline")
+    def test_cached_transcript_skips_whisper(self, mock_pipeline, mock_device, tmp_path):
+        """Test keyword changes re-match a cached transcript without Whisper."""
+        mock_pipe = MagicMock(return_value={
+            "text": "well damn it",
+            "chunks": [
+                {"text": "well", "timestamp": (0.0, 0.3)},
+                {"text": "damn", "timestamp": (0.3, 0.7)},
+                {"text": "it", "timestamp": (0.7, 0.9)},
+            ],
+        })
+        mock_pipeline.return_value = mock_pipe
+        config = {"name": "test-detector", "categories": ["Profanity"]}
+        audio = np.random.randn(16000).astype(np.float32)
+
+        with DetectionCache(str(tmp_path / "cache.sqlite")) as cache:
+            first = SpeechProfanityDetector(config)
+            first.keywords = {"en": {"damn"}}
+            first.set_audio_cache(cache, "audio")
+            first_results = first.analyze_full_audio(audio)
+
+            second = SpeechProfanityDetector(config)
+            second.keywords = {"en": {"damn", "well"}}
+            second.set_audio_cache(cache, "audio")
+            second_results = second.analyze_full_audio(audio)
+
+        assert mock_pipe.call_count == 1
+        assert [r.start_time for r in first_results] == [0.3]
+        assert [r.start_time for r in second_results] == [0.0, 0.3]
+        assert second_results[1].end_time == 0.7
+
+    @patch("video_censor_personal.speech_profanity_detector.get_device", return_value="cpu")
+    @patch("transformers.pipeline")
+    def test_cache_key_tracks_model_and_settings(self, mock_pipeline, mock_device):
+        """Test the transcript key changes with the model and VAD settings."""
+        mock_pipeline.return_value = MagicMock()
+        base = {"name": "test-detector", "categories": ["Profanity"]}
+
+        def key(**overrides):
+            return SpeechProfanityDetector({**base, **overrides})._transcript_cache_key(16000)
+
+        assert key() == key(languages=["es"], confidence_threshold=0.5)
+        assert key() != key(model="small")
+        assert key() != key(vad=False)
+        assert key() != key(vad_padding=1.0)
+
+
 class TestMultiLanguageSupport:
     """Test multi-language profanity detection."""
 
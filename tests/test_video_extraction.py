@@ -1,6 +1,9 @@
 """Tests for video extraction module."""
 
+import os
+import subprocess
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -10,8 +13,11 @@ import pytest
 
 from video_censor_personal.frame import AudioSegment, Frame
 from video_censor_personal.video_extraction import (
+    DETECTION_SAMPLE_RATE,
     VideoExtractor,
     _check_ffmpeg_available,
+    _open_pcm_file,
+    prefetch_frames,
 )
 
 
@@ -219,6 +225,226 @@ class TestExtractFrames:
         extractor.close()
 
 
+class TestSparseFrameSampling:
+    """Test grab/seek sparse frame sampling modes."""
+
+    @staticmethod
+    def _make_video(video_file, num_frames=90, fps=30.0):
+        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+        out = cv2.VideoWriter(str(video_file), fourcc, fps, (64, 48))
+        for i in range(num_frames):
+            frame = np.full((48, 64, 3), i * 2, dtype=np.uint8)
+            out.write(frame)
+        out.release()
+
+    def test_seek_and_grab_modes_yield_same_timecodes(self, tmp_path):
+        """Test seek mode samples the same timestamps as grab mode."""
+        video_file = tmp_path / "test.mp4"
+        self._make_video(video_file)
+
+        with VideoExtractor(str(video_file)) as extractor:
+            grabbed = list(extractor.extract_frames(sample_rate=1.0, mode="grab"))
+            seeked = list(extractor.extract_frames(sample_rate=1.0, mode="seek"))
+
+        assert [f.timecode for f in grabbed] == pytest.approx([0.0, 1.0, 2.0])
+        assert [f.timecode for f in seeked] == [f.timecode for f in grabbed]
+        assert [f.index for f in seeked] == [0, 1, 2]
+        for g, s in zip(grabbed, seeked):
+            assert np.abs(g.data.astype(int) - s.data.astype(int)).mean() < 5
+
+    @pytest.mark.parametrize("mode", ["grab", "seek"])
+    def test_time_ranges_partition_full_pass(self, tmp_path, mode):
+        """Test adjacent time ranges together yield the full-pass frames."""
+        video_file = tmp_path / "test.mp4"
+        self._make_video(video_file)
+
+        with VideoExtractor(str(video_file)) as extractor:
+            full = list(extractor.extract_frames(sample_rate=0.5, mode=mode))
+            first = list(
+                extractor.extract_frames(sample_rate=0.5, mode=mode, end_time=1.2)
+            )
+            second = list(
+                extractor.extract_frames(sample_rate=0.5, mode=mode, start_time=1.2)
+            )
+
+        assert [f.timecode for f in first] == pytest.approx([0.0, 0.5, 1.0])
+        assert [f.index for f in first + second] == [f.index for f in full]
+        assert [f.timecode for f in first + second] == [f.timecode for f in full]
+
+    def test_invalid_mode_raises(self, tmp_path):
+        """Test unknown sampling mode is rejected."""
+        video_file = tmp_path / "test.mp4"
+        self._make_video(video_file, num_frames=5)
+
+        with VideoExtractor(str(video_file)) as extractor:
+            with pytest.raises(ValueError, match="Invalid frame sampling mode"):
+                list(extractor.extract_frames(sample_rate=1.0, mode="bogus"))
+
+    def test_auto_mode_seeks_when_interval_exceeds_gop(self, tmp_path):
+        """Test auto mode seeks when GOPs are shorter than the interval."""
+        video_file = tmp_path / "test.mp4"
+        self._make_video(video_file, num_frames=5)
+
+        with VideoExtractor(str(video_file)) as extractor:
+            with patch.object(extractor, "_estimate_gop_length", return_value=12.0):
+                assert extractor._choose_sampling_mode(30) == "seek"
+                assert extractor._choose_sampling_mode(6) == "grab"
+
+    def test_auto_mode_falls_back_to_grab_without_gop(self, tmp_path):
+        """Test auto mode grabs when GOP length cannot be probed."""
+        video_file = tmp_path / "test.mp4"
+        self._make_video(video_file, num_frames=5)
+
+        with VideoExtractor(str(video_file)) as extractor:
+            with patch.object(extractor, "_estimate_gop_length", return_value=None):
+                assert extractor._choose_sampling_mode(30) == "grab"
+
+    @patch("video_censor_personal.video_extraction.shutil.which")
+    @patch("video_censor_personal.video_extraction.subprocess.run")
+    def test_estimate_gop_length_from_packet_flags(
+        self, mock_run, mock_which, tmp_path
+    ):
+        """Test GOP length is derived from ffprobe keyframe flags."""
+        video_file = tmp_path / "test.mp4"
+        self._make_video(video_file, num_frames=5)
+        mock_which.return_value = "/usr/bin/ffprobe"
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout="K__\n___\n___\n___\nK__\n___\n___\n___\n"
+        )
+
+        with VideoExtractor(str(video_file)) as extractor:
+            assert extractor._estimate_gop_length() == 4.0
+            # Cached on subsequent calls
+            assert extractor._estimate_gop_length() == 4.0
+        assert mock_run.call_count == 1
+
+
+class TestExtractFramesFfmpeg:
+    """Test ffmpeg rawvideo pipe frame source."""
+
+    @pytest.fixture
+    def video_file(self, tmp_path):
+        video_file = tmp_path / "test.mp4"
+        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+        out = cv2.VideoWriter(str(video_file), fourcc, 30.0, (640, 480))
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        frame[..., 2] = 200  # Red in BGR
+        for _ in range(90):
+            out.write(frame)
+        out.release()
+        return video_file
+
+    def test_scaled_frame_dimensions(self, video_file):
+        """Test shorter side is scaled and aspect ratio preserved."""
+        with VideoExtractor(str(video_file)) as extractor:
+            assert extractor._scaled_frame_dimensions(None) == (640, 480)
+            assert extractor._scaled_frame_dimensions(224) == (298, 224)
+
+    @pytest.mark.skipif(
+        not _check_ffmpeg_available(), reason="ffmpeg not installed"
+    )
+    def test_extract_frames_ffmpeg_decimates_and_scales(self, video_file):
+        """Test ffmpeg source yields downscaled BGR frames at sample rate."""
+        with VideoExtractor(str(video_file)) as extractor:
+            frames = list(
+                extractor.extract_frames_ffmpeg(sample_rate=1.0, frame_size=224)
+            )
+
+        assert [f.index for f in frames] == [0, 1, 2]
+        assert [f.timecode for f in frames] == pytest.approx([0.0, 1.0, 2.0])
+        assert frames[0].data.shape == (224, 298, 3)
+        assert frames[0].data.dtype == np.uint8
+        # Channel order matches OpenCV (BGR)
+        assert frames[0].data[..., 2].mean() > frames[0].data[..., 0].mean()
+
+    @pytest.mark.skipif(
+        not _check_ffmpeg_available(), reason="ffmpeg not installed"
+    )
+    def test_extract_frames_ffmpeg_ranges_match_full_extraction(self, tmp_path):
+        """Test ranges split off the sampling grid neither shift nor repeat frames."""
+        video_file = tmp_path / "ramp.mp4"
+        out = cv2.VideoWriter(str(video_file), cv2.VideoWriter_fourcc(*"mp4v"), 30.0, (64, 64))
+        for i in range(90):
+            out.write(np.full((64, 64, 3), i * 2, dtype=np.uint8))
+        out.release()
+
+        with VideoExtractor(str(video_file)) as extractor:
+            full = list(extractor.extract_frames_ffmpeg(sample_rate=0.3))
+            split = [
+                frame
+                for start, end in [(0.0, 0.8), (0.8, 1.7), (1.7, None)]
+                for frame in extractor.extract_frames_ffmpeg(
+                    sample_rate=0.3, start_time=start, end_time=end
+                )
+            ]
+
+        assert [f.index for f in full] == list(range(10))
+        assert [f.index for f in split] == [f.index for f in full]
+        assert [f.timecode for f in split] == pytest.approx([f.timecode for f in full])
+        assert [f.data.mean() for f in split] == pytest.approx(
+            [f.data.mean() for f in full], abs=1.0
+        )
+
+    @pytest.mark.skipif(
+        not _check_ffmpeg_available(), reason="ffmpeg not installed"
+    )
+    @pytest.mark.parametrize("sample_rate, start_time, end_time", [
+        (1.0, 0.0, None),
+        (2.0, 0.0, None),
+        (0.4, 1.3, 3.1),
+        (0.2, 0.0, None),
+    ])
+    def test_extract_frames_ffmpeg_matches_opencv_pixels(
+        self, tmp_path, sample_rate, start_time, end_time
+    ):
+        """Test each ffmpeg frame holds the same picture as OpenCV at its timecode."""
+        video_file = tmp_path / "ramp.mp4"
+        out = cv2.VideoWriter(str(video_file), cv2.VideoWriter_fourcc(*"mp4v"), 25.0, (64, 64))
+        for i in range(100):
+            out.write(np.full((64, 64, 3), i * 2, dtype=np.uint8))
+        out.release()
+
+        with VideoExtractor(str(video_file)) as extractor:
+            ffmpeg_frames = list(extractor.extract_frames_ffmpeg(
+                sample_rate=sample_rate, start_time=start_time, end_time=end_time
+            ))
+            opencv_frames = list(extractor.extract_frames(
+                sample_rate=sample_rate, start_time=start_time, end_time=end_time
+            ))
+
+        assert len(ffmpeg_frames) == len(opencv_frames) > 1
+        assert [f.timecode for f in ffmpeg_frames] == pytest.approx(
+            [f.timecode for f in opencv_frames]
+        )
+        # Neighbouring frames differ by 2 levels
+        assert [f.data.mean() for f in ffmpeg_frames] == pytest.approx(
+            [f.data.mean() for f in opencv_frames], abs=0.5
+        )
+
+    @patch("video_censor_personal.video_extraction._check_ffmpeg_available")
+    def test_extract_frames_ffmpeg_not_available(self, mock_ffmpeg, video_file):
+        """Test ffmpeg source raises when ffmpeg is missing."""
+        mock_ffmpeg.return_value = False
+        with VideoExtractor(str(video_file)) as extractor:
+            with pytest.raises(RuntimeError, match="ffmpeg is not available"):
+                list(extractor.extract_frames_ffmpeg())
+
+
+def _make_tone_video(tmp_path):
+    """Create a 1-second video with a 44.1 kHz stereo sine tone."""
+    video_file = tmp_path / "tone.mp4"
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error", "-y",
+            "-f", "lavfi", "-i", "sine=frequency=440:sample_rate=44100:duration=1",
+            "-f", "lavfi", "-i", "testsrc=size=64x48:rate=10:duration=1",
+            "-ac", "2", "-shortest", str(video_file),
+        ],
+        check=True,
+    )
+    return video_file
+
+
 class TestAudioExtraction:
     """Test audio extraction."""
 
@@ -241,6 +467,113 @@ class TestAudioExtraction:
             extractor.extract_audio()
         extractor.close()
 
+    @pytest.mark.parametrize("channels", [1, 2])
+    def test_open_pcm_file_layout(self, channels, tmp_path):
+        """Test PCM files are mapped read-only as (samples, channels)."""
+        samples = np.arange(10 * channels, dtype="<f4")
+        pcm_file = tmp_path / "track.f32"
+        pcm_file.write_bytes(samples.tobytes())
+
+        data = _open_pcm_file(pcm_file, channels)
+
+        assert isinstance(data, np.memmap)
+        assert data.dtype == np.float32
+        assert not data.flags.writeable
+        expected = samples.reshape(10, channels) if channels > 1 else samples
+        np.testing.assert_array_equal(data, expected)
+
+    def test_open_pcm_file_empty(self, tmp_path):
+        """Test an empty PCM file yields an empty array."""
+        pcm_file = tmp_path / "track.f32"
+        pcm_file.write_bytes(b"")
+
+        data = _open_pcm_file(pcm_file, 2)
+
+        assert data.shape == (0, 2)
+
+    @pytest.mark.skipif(
+        not _check_ffmpeg_available(), reason="ffmpeg not installed"
+    )
+    def test_extract_audio_returns_pcm_array(self, tmp_path):
+        """Test extract_audio decodes PCM into a cached NumPy array."""
+        video_file = _make_tone_video(tmp_path)
+
+        with VideoExtractor(str(video_file)) as extractor:
+            with patch.object(
+                extractor, "_probe_audio_stream", return_value=(44100, 2)
+            ):
+                segment = extractor.extract_audio()
+                assert extractor.extract_audio() is segment
+
+        assert segment.sample_rate == 44100
+        assert segment.data.dtype == np.float32
+        assert segment.data.ndim == 2 and segment.data.shape[1] == 2
+        assert abs(segment.data.shape[0] - 44100) < 4410
+        assert 0.05 < np.abs(segment.data).max() <= 1.0
+        assert isinstance(segment.data, np.memmap)
+
+    @pytest.mark.skipif(
+        not _check_ffmpeg_available(), reason="ffmpeg not installed"
+    )
+    @pytest.mark.parametrize("include_detection_track", [True, False])
+    def test_extract_detection_audio_is_16khz_mono(
+        self, tmp_path, include_detection_track
+    ):
+        """Test the detection track is decoded as 16 kHz mono by ffmpeg."""
+        video_file = _make_tone_video(tmp_path)
+
+        with VideoExtractor(str(video_file)) as extractor:
+            with patch.object(
+                extractor, "_probe_audio_stream", return_value=(44100, 2)
+            ):
+                full = extractor.extract_audio(
+                    include_detection_track=include_detection_track
+                )
+                detection = extractor.extract_detection_audio()
+                assert extractor.extract_detection_audio() is detection
+
+        assert full.sample_rate == 44100
+        assert detection.sample_rate == DETECTION_SAMPLE_RATE
+        assert detection.data.dtype == np.float32
+        assert detection.data.ndim == 1
+        assert abs(detection.data.shape[0] - DETECTION_SAMPLE_RATE) < 1600
+        assert 0.05 < np.abs(detection.data).max() <= 1.0
+
+
+    @pytest.mark.skipif(
+        not _check_ffmpeg_available(), reason="ffmpeg not installed"
+    )
+    def test_decode_audio_error_includes_ffmpeg_stderr(self, tmp_path):
+        """Test decoding failures report ffmpeg's own diagnostics."""
+        video_file = tmp_path / "silent.mp4"
+        out = cv2.VideoWriter(str(video_file), cv2.VideoWriter_fourcc(*"mp4v"), 30.0, (64, 48))
+        out.write(np.zeros((48, 64, 3), dtype=np.uint8))
+        out.release()
+
+        with VideoExtractor(str(video_file)) as extractor:
+            with pytest.raises(RuntimeError, match="matches no streams"):
+                extractor._decode_audio([(44100, 2), (DETECTION_SAMPLE_RATE, 1)])
+
+    @pytest.mark.skipif(
+        not os.path.isdir("/proc/self/fd"), reason="needs /proc/self/fd"
+    )
+    def test_decode_audio_closes_pipes_when_spawn_fails(self, tmp_path):
+        """Test no pipe descriptors leak when ffmpeg cannot be started."""
+        video_file = tmp_path / "test.mp4"
+        out = cv2.VideoWriter(str(video_file), cv2.VideoWriter_fourcc(*"mp4v"), 30.0, (64, 48))
+        out.write(np.zeros((48, 64, 3), dtype=np.uint8))
+        out.release()
+
+        with VideoExtractor(str(video_file)) as extractor:
+            open_fds = len(os.listdir("/proc/self/fd"))
+            with patch(
+                "video_censor_personal.video_extraction.subprocess.Popen",
+                side_effect=PermissionError("ffmpeg"),
+            ):
+                with pytest.raises(PermissionError):
+                    extractor._decode_audio([(44100, 2), (DETECTION_SAMPLE_RATE, 1)])
+            assert len(os.listdir("/proc/self/fd")) == open_fds
+
 
 class TestContextManager:
     """Test context manager functionality."""
@@ -280,3 +613,73 @@ class TestResourceCleanup:
 
         # Should not raise error when closing twice
         extractor.close()
+
+
+class TestPrefetchFrames:
+    """Test background frame prefetching."""
+
+    @staticmethod
+    def _frames(count):
+        for i in range(count):
+            yield Frame(index=i, timecode=float(i), data=np.zeros((2, 2, 3), dtype=np.uint8))
+
+    def test_preserves_order(self):
+        """Prefetched frames arrive in source order."""
+        frames = list(prefetch_frames(self._frames(50), max_queued=3))
+        assert [f.index for f in frames] == list(range(50))
+
+    def test_zero_queue_passes_through(self):
+        """A queue size of 0 iterates the source on the calling thread."""
+        threads = []
+
+        def source():
+            threads.append(threading.current_thread())
+            yield from self._frames(2)
+
+        assert len(list(prefetch_frames(source(), max_queued=0))) == 2
+        assert threads == [threading.current_thread()]
+
+    def test_decodes_in_background_thread(self):
+        """With a positive queue size the source runs on another thread."""
+        threads = []
+
+        def source():
+            threads.append(threading.current_thread())
+            yield from self._frames(2)
+
+        assert len(list(prefetch_frames(source(), max_queued=2))) == 2
+        assert threads[0] is not threading.current_thread()
+
+    def test_producer_error_is_raised(self):
+        """Exceptions from the source are re-raised after queued frames."""
+
+        def source():
+            yield from self._frames(2)
+            raise RuntimeError("decode failed")
+
+        received = []
+        with pytest.raises(RuntimeError, match="decode failed"):
+            for frame in prefetch_frames(source(), max_queued=4):
+                received.append(frame.index)
+        assert received == [0, 1]
+
+    def test_close_stops_producer(self):
+        """Closing the consumer stops decoding and closes the source."""
+        closed = threading.Event()
+        produced = []
+
+        def source():
+            try:
+                for frame in self._frames(1000):
+                    produced.append(frame.index)
+                    yield frame
+            finally:
+                closed.set()
+
+        frames = prefetch_frames(source(), max_queued=2)
+        assert next(frames).index == 0
+        frames.close()
+
+        assert closed.is_set()
+        # Backpressure bounds read-ahead to roughly the queue size
+        assert len(produced) <= 5
@@ -1,6 +1,7 @@
 """Tests for video metadata writing functionality."""
 
 import argparse
+import subprocess
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -17,6 +18,7 @@ from video_censor_personal.video_metadata_writer import (
     _build_skip_chapters,
     _merge_chapters,
     _generate_ffmetadata,
+    get_ffmpeg_version,
 )
 
 
@@ -286,6 +288,35 @@ class TestTimestampParsing:
             _parse_timestamp_to_seconds("invalid")
 
 
+class TestFFmpegVersion:
+    """Test parsing of the installed ffmpeg version."""
+
+    @pytest.mark.parametrize("output, expected", [
+        ("ffmpeg version 6.1.1-3ubuntu5 Copyright (c) 2000-2023", (6, 1, 1)),
+        ("ffmpeg version 7.0 Copyright (c) 2000-2024", (7, 0, 0)),
+    ])
+    def test_parses_release_versions(self, output, expected):
+        """Release version strings are parsed into (major, minor, patch)."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess([], 0, output, "")
+            assert get_ffmpeg_version() == expected
+
+    def test_unparsable_version_raises(self):
+        """Git builds without a release number raise VideoMetadataError."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess(
+                [], 0, "ffmpeg version N-113007-g8d24a28d06 Copyright", ""
+            )
+            with pytest.raises(VideoMetadataError, match="Could not parse"):
+                get_ffmpeg_version()
+
+    def test_missing_ffmpeg_raises(self):
+        """A missing ffmpeg binary raises VideoMetadataError."""
+        with patch("subprocess.run", side_effect=FileNotFoundError):
+            with pytest.raises(VideoMetadataError, match="ffmpeg not found"):
+                get_ffmpeg_version()
+
+
 class TestChapterParsing:
     """Test FFMETADATA chapter parsing."""
 
@@ -432,7 +463,7 @@ class TestFFMetadataGeneration:
         result = _generate_ffmetadata(chapters)
         
         assert ";FFMETADATA1" in result
-        assert "[CHAPTER01]" in result
+        assert "[CHAPTER]" in result
         assert "START=10000" in result
         assert "END=15000" in result
         assert "title=skip: Nudity [92%]" in result
@@ -443,8 +474,7 @@ class TestFFMetadataGeneration:
         result = _generate_ffmetadata(chapters)
         
         assert ";FFMETADATA1" in result
-        assert "[CHAPTER01]" in result
-        assert "[CHAPTER02]" in result
+        assert result.count("[CHAPTER]") == 2
         assert "START=10000" in result  # 10.0 seconds
         assert "START=30000" in result  # 30.0 seconds
 
@@ -1,5 +1,7 @@
 """Tests for video muxing module."""
 
+import shutil
+import subprocess
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -7,6 +9,8 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 import pytest
 
+from video_censor_personal.audio_remediator import AudioRemediator
+from video_censor_personal.frame import DetectionResult
 from video_censor_personal.video_muxer import VideoMuxer
 
 
@@ -174,3 +178,173 @@ class TestMuxVideoMapFlags:
         # Verify audio map (1:a:0 - first audio stream from second input)
         audio_map_idx = map_indices[1]
         assert call_args[audio_map_idx + 1] == "1:a:0"
+
+
+class TestChapterMuxing:
+    """Test chapters and remuxing in the muxer's ffmpeg command."""
+
+    @patch("subprocess.run")
+    @patch.object(VideoMuxer, "_check_ffmpeg", return_value=True)
+    def test_chapters_input_mapped(self, mock_check, mock_run, tmp_path):
+        """Test an FFMETADATA file is added as the chapter source."""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"fake video")
+        audio_file = tmp_path / "audio.wav"
+        audio_file.write_bytes(b"fake audio")
+        chapters_file = tmp_path / "chapters.txt"
+        
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        
+        muxer = VideoMuxer(str(video_file), str(audio_file), chapters_path=str(chapters_file))
+        muxer.mux_video(str(tmp_path / "output.mp4"))
+        
+        call_args = mock_run.call_args[0][0]
+        chapters_idx = call_args.index(str(chapters_file))
+        assert call_args[chapters_idx - 3:chapters_idx] == ["-f", "ffmetadata", "-i"]
+        assert call_args[call_args.index("-map_chapters") + 1] == "2"
+
+    @patch("subprocess.run")
+    @patch.object(VideoMuxer, "_check_ffmpeg", return_value=True)
+    def test_remux_copies_streams(self, mock_check, mock_run, tmp_path):
+        """Test remuxing without audio copies every stream of the video."""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"fake video")
+        chapters_file = tmp_path / "chapters.txt"
+        
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        
+        muxer = VideoMuxer(
+            str(video_file), chapters_path=str(chapters_file), metadata={"title": "T"}
+        )
+        muxer.remux(str(tmp_path / "output.mp4"))
+        
+        call_args = mock_run.call_args[0][0]
+        assert call_args[call_args.index("-c") + 1] == "copy"
+        assert call_args[call_args.index("-map") + 1] == "0"
+        assert call_args[call_args.index("-map_metadata") + 1] == "0"
+        assert call_args[call_args.index("-map_chapters") + 1] == "1"
+        assert "title=T" in call_args
+
+    @pytest.mark.skipif(
+        shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None,
+        reason="ffmpeg/ffprobe not installed",
+    )
+    def test_remux_keeps_every_audio_stream(self, tmp_path):
+        """Test remuxing keeps a second audio track of the video."""
+        video_file = tmp_path / "video.mkv"
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error", "-y",
+                "-f", "lavfi", "-i", "testsrc=size=64x48:rate=10:duration=1",
+                "-f", "lavfi", "-i", "sine=frequency=440:duration=1",
+                "-f", "lavfi", "-i", "sine=frequency=880:duration=1",
+                "-map", "0", "-map", "1", "-map", "2",
+                str(video_file),
+            ],
+            check=True,
+        )
+        output_file = tmp_path / "output.mkv"
+
+        VideoMuxer(str(video_file), metadata={"title": "T"}).remux(str(output_file))
+
+        streams = subprocess.run(
+            [
+                "ffprobe", "-v", "error", "-show_entries", "stream=codec_type",
+                "-of", "csv=p=0", str(output_file),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        assert streams == ["video", "audio", "audio"]
+
+
+class TestStreamedAudioMuxing:
+    """Test muxing remediated audio streamed through ffmpeg's stdin."""
+
+    def test_init_without_audio_file(self, tmp_path):
+        """Test the audio file may be omitted when streaming."""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"fake video")
+
+        muxer = VideoMuxer(str(video_file))
+
+        assert muxer.remediated_audio_path is None
+        with pytest.raises(RuntimeError, match="No remediated audio file"):
+            muxer.mux_video(str(tmp_path / "output.mp4"))
+
+    @patch.object(VideoMuxer, "_check_ffmpeg", return_value=True)
+    def test_stream_command_reads_pcm_from_stdin(self, mock_check, tmp_path):
+        """Test the audio input is raw float32 PCM on pipe:0."""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"fake video")
+        audio_stream = MagicMock(sample_rate=48000, channels=6)
+        audio_stream.iter_blocks.return_value = iter([np.zeros((4, 6), np.float32)])
+
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.return_value.wait.return_value = 0
+            VideoMuxer(str(video_file)).mux_audio_stream(
+                str(tmp_path / "output.mp4"), audio_stream
+            )
+
+        cmd = mock_popen.call_args.args[0]
+        audio_input = cmd[cmd.index(str(video_file)) + 1:cmd.index("pipe:0") + 1]
+        assert audio_input == ["-f", "f32le", "-ar", "48000", "-ac", "6", "-i", "pipe:0"]
+        mock_popen.return_value.stdin.write.assert_called_once_with(
+            np.zeros((4, 6), np.float32).tobytes()
+        )
+
+    @patch.object(VideoMuxer, "_check_ffmpeg", return_value=True)
+    def test_stream_raises_on_ffmpeg_failure(self, mock_check, tmp_path):
+        """Test a failing ffmpeg surfaces as RuntimeError, even mid-stream."""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"fake video")
+        audio_stream = MagicMock(sample_rate=16000, channels=1)
+        audio_stream.iter_blocks.return_value = iter([np.zeros(4, np.float32)])
+
+        with patch("subprocess.Popen") as mock_popen:
+            mock_popen.return_value.stdin.write.side_effect = BrokenPipeError
+            mock_popen.return_value.wait.return_value = 1
+            with pytest.raises(RuntimeError, match="exit code 1"):
+                VideoMuxer(str(video_file)).mux_audio_stream(
+                    str(tmp_path / "output.mp4"), audio_stream
+                )
+
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+    def test_streamed_remediation_end_to_end(self, tmp_path):
+        """Test a silenced range is silent in the muxed output audio."""
+        video_file = tmp_path / "video.mp4"
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error", "-y",
+                "-f", "lavfi", "-i", "testsrc=size=64x48:rate=10:duration=2",
+                str(video_file),
+            ],
+            check=True,
+        )
+        sample_rate = 16000
+        t = np.arange(2 * sample_rate) / sample_rate
+        audio = np.stack([0.5 * np.sin(2 * np.pi * 440 * t)] * 2, axis=1).astype(
+            np.float32
+        )
+        remediator = AudioRemediator(
+            {"enabled": True, "mode": "silence", "categories": ["Profanity"]}
+        )
+        audio_stream = remediator.stream(
+            audio, sample_rate, [DetectionResult(0.5, 1.5, "Profanity", 0.9, "test")]
+        )
+        output_file = tmp_path / "output.mp4"
+
+        VideoMuxer(str(video_file)).mux_audio_stream(str(output_file), audio_stream)
+
+        decoded = subprocess.run(
+            [
+                "ffmpeg", "-v", "error", "-i", str(output_file),
+                "-f", "f32le", "-ac", "1", "-ar", str(sample_rate), "pipe:1",
+            ],
+            check=True,
+            capture_output=True,
+        ).stdout
+        result = np.frombuffer(decoded, dtype=np.float32)
+        assert np.abs(result[int(0.7 * sample_rate):int(1.3 * sample_rate)]).max() < 0.01
+        assert np.abs(result[int(0.1 * sample_rate):int(0.4 * sample_rate)]).max() > 0.3
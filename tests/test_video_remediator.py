@@ -1,7 +1,14 @@
 """Tests for video remediation functionality."""
 
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
 import pytest
 
+from video_censor_personal.smart_render import VideoStreamInfo, probe_video_stream
 from video_censor_personal.video_remediator import VideoRemediator
 
 
@@ -16,6 +23,8 @@ class TestVideoRemediatorInit:
         assert remediator.mode == "blank"
         assert remediator.blank_color == "#000000"
         assert remediator.category_modes == {}
+        assert remediator.smart_render is True
+        assert remediator.max_workers == 4
     
     def test_init_custom_values(self):
         """Test initialization with custom values."""
@@ -88,6 +97,17 @@ class TestVideoRemediatorInit:
         remediator = VideoRemediator(config)
         
         assert remediator.blank_color == "#F00"
+    
+    @pytest.mark.parametrize("max_workers", [0, -1, 2.5, True, "4"])
+    def test_init_invalid_max_workers(self, max_workers):
+        """Test initialization with a non-positive or non-integer max_workers."""
+        with pytest.raises(ValueError, match="max_workers must be a positive integer"):
+            VideoRemediator({"max_workers": max_workers})
+    
+    def test_init_invalid_smart_render(self):
+        """Test initialization with non-boolean smart_render."""
+        with pytest.raises(ValueError, match="smart_render must be a boolean"):
+            VideoRemediator({"smart_render": "yes"})
 
 
 class TestHexColorConversion:
@@ -181,7 +201,7 @@ class TestBlankFilterChain:
         assert "drawbox=x=0:y=0:w=1920:h=1080" in result
         assert "color=0x000000" in result
         assert "t=fill" in result
-        assert "enable='between(t,10.0,15.0)'" in result
+        assert "enable='between(t,10.000,15.000)'" in result
     
     def test_build_blank_filter_chain_multiple_segments(self):
         """Test filter chain with multiple segments."""
@@ -193,11 +213,146 @@ class TestBlankFilterChain:
         ]
         result = remediator.build_blank_filter_chain(segments, 1920, 1080)
         
-        # Should have two drawbox filters chained together
-        assert result.count("drawbox") == 2
-        assert "enable='between(t,10.0,15.0)'" in result
-        assert "enable='between(t,30.0,35.0)'" in result
-        assert "," in result  # Filters should be separated by comma
+        # One drawbox binary-searches the segments
+        assert result.count("drawbox") == 1
+        assert (
+            "enable='if(lt(t,30.000),between(t,10.000,15.000),between(t,30.000,35.000))'"
+            in result
+        )
+    
+    def test_build_blank_filter_chain_coalesces_segments(self):
+        """Test overlapping, touching and unsorted segments are merged."""
+        remediator = VideoRemediator({"mode": "blank"})
+        
+        segments = [
+            {"start_time": "12", "end_time": "15"},
+            {"start_time": "10", "end_time": "13"},
+            {"start_time": "15", "end_time": "16"},
+            {"start_time": "11", "end_time": "12"},
+        ]
+        result = remediator.build_blank_filter_chain(segments, 1920, 1080)
+        
+        assert result.endswith("enable='between(t,10.000,16.000)'")
+    
+    def test_build_blank_filter_chain_search_depth(self):
+        """Test thousands of segments nest only logarithmically deep."""
+        remediator = VideoRemediator({"mode": "blank"})
+        
+        segments = [
+            {"start_time": str(i), "end_time": str(i + 0.5)} for i in range(4096)
+        ]
+        result = remediator.build_blank_filter_chain(segments, 1920, 1080)
+        
+        assert result.count("drawbox") == 1
+        assert result.count("between(") == 4096
+        depth = max_depth = 0
+        for char in result:
+            depth += {"(": 1, ")": -1}.get(char, 0)
+            max_depth = max(max_depth, depth)
+        # log2(4096) nested if() levels plus the between() leaf
+        assert max_depth == 12 + 1
+    
+    def test_build_blank_filter_chain_fixed_precision(self):
+        """Test times are widened to whole milliseconds and printed as such."""
+        remediator = VideoRemediator({"mode": "blank"})
+        
+        segments = [{"start_time": 1 / 3, "end_time": 2 / 3}]
+        result = remediator.build_blank_filter_chain(segments, 1920, 1080)
+        
+        assert result.endswith("enable='between(t,0.333,0.667)'")
+    
+    @pytest.mark.parametrize("option, version, expected", [
+        ("filter_complex", (4, 4, 2), "-filter_complex_script"),
+        ("filter_complex", (6, 1, 1), "-filter_complex_script"),
+        ("filter_complex", (7, 0, 0), "-/filter_complex"),
+        ("filter_complex", None, "-/filter_complex"),
+        ("filter:v", (4, 4, 2), "-filter_script:v"),
+        ("filter:v", (6, 1, 1), "-filter_script:v"),
+        ("filter:v", (7, 0, 0), "-/filter:v"),
+    ])
+    def test_filter_graph_args_match_ffmpeg_version(
+        self, tmp_path, option, version, expected
+    ):
+        """Test long graphs use the script option the installed ffmpeg knows."""
+        script_path = tmp_path / "filter.txt"
+        long_graph = "null," * (32 * 1024)
+        
+        with patch(
+            "video_censor_personal.video_remediator._ffmpeg_version", return_value=version
+        ):
+            short_args = VideoRemediator._filter_graph_args(option, "null", script_path)
+            assert not script_path.exists()
+            long_args = VideoRemediator._filter_graph_args(option, long_graph, script_path)
+        
+        assert short_args == [f"-{option}", "null"]
+        assert long_args == [expected, str(script_path)]
+        assert script_path.read_text() == long_graph
+    
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+    @pytest.mark.parametrize("version", [None, (6, 1, 1)])
+    def test_blank_mode_with_thousands_of_segments(self, tmp_path, version):
+        """Test a graph longer than one command-line argument allows still runs."""
+        input_video = str(tmp_path / "input.mp4")
+        output_video = str(tmp_path / "output.mp4")
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error",
+                "-f", "lavfi", "-i", "testsrc=size=160x120:rate=10:duration=3",
+                "-c:v", "libx264", "-pix_fmt", "yuv420p",
+                input_video,
+            ],
+            check=True,
+        )
+        remediator = VideoRemediator({"mode": "blank", "smart_render": False})
+        segments = [{"start_time": "1.0", "end_time": "2.0"}] + [
+            {"start_time": str(1000 + i), "end_time": str(1000.5 + i)} for i in range(3000)
+        ]
+        # Linux rejects single arguments over MAX_ARG_STRLEN (128 KiB)
+        assert len(remediator.build_blank_filter_chain(segments, 160, 120)) > 128 * 1024
+        
+        # The pre-7.0 script option is still accepted by current releases
+        with patch(
+            "video_censor_personal.video_remediator._ffmpeg_version", return_value=version
+        ):
+            remediator._apply_blank_mode_impl(input_video, output_video, segments, 160, 120)
+        
+        blanked = np.flatnonzero(_frame_means(output_video, 160, 120) < 1).tolist()
+        assert blanked == list(range(10, 21))
+    
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+    def test_build_blank_filter_chain_blanks_every_segment(self, tmp_path):
+        """Test the search expression blanks exactly the frames in segments."""
+        input_video = str(tmp_path / "input.mp4")
+        output_video = str(tmp_path / "output.mp4")
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error",
+                "-f", "lavfi", "-i", "testsrc=size=160x120:rate=10:duration=10",
+                "-c:v", "libx264", "-pix_fmt", "yuv420p",
+                input_video,
+            ],
+            check=True,
+        )
+        remediator = VideoRemediator({"mode": "blank"})
+        intervals = [(i * 0.7 + 0.05, i * 0.7 + 0.25) for i in range(14)]
+        segments = [{"start_time": str(s), "end_time": str(e)} for s, e in intervals]
+        
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error",
+                "-i", input_video,
+                "-vf", remediator.build_blank_filter_chain(segments, 160, 120),
+                "-c:v", "libx264", "-preset", "ultrafast",
+                output_video,
+            ],
+            check=True,
+        )
+        
+        expected = [
+            frame for frame in range(100)
+            if any(s <= frame / 10 <= e for s, e in intervals)
+        ]
+        assert np.flatnonzero(_frame_means(output_video, 160, 120) < 1).tolist() == expected
     
     def test_build_blank_filter_chain_custom_color(self):
         """Test filter chain with custom color."""
@@ -210,7 +365,7 @@ class TestBlankFilterChain:
         
         assert "drawbox=x=0:y=0:w=1280:h=720" in result
         assert "color=0xFF0000" in result
-        assert "enable='between(t,10.5,15.5)'" in result
+        assert "enable='between(t,10.500,15.500)'" in result
     
     def test_build_blank_filter_chain_short_color(self):
         """Test filter chain with short-form hex color."""
@@ -1092,3 +1247,439 @@ class TestErrorHandling:
         # Should raise ValueError due to invalid timecode
         with pytest.raises(ValueError, match="Invalid timecode format"):
             remediator.extract_non_censored_segments(segments, 100.0)
+
+
+def _frame_means(video_path: str, width: int, height: int) -> np.ndarray:
+    """Decode a video to grayscale and return each frame's mean brightness."""
+    result = subprocess.run(
+        ["ffmpeg", "-v", "error", "-i", video_path, "-f", "rawvideo", "-pix_fmt", "gray", "-"],
+        capture_output=True,
+        check=True,
+    )
+    frames = np.frombuffer(result.stdout, np.uint8).reshape(-1, height * width)
+    return frames.mean(axis=1)
+
+
+def _capture_filter_graphs(graphs):
+    """subprocess.run stand-in that records filtergraphs, inline or scripted."""
+    def run(cmd, *args, **kwargs):
+        for option, value in zip(cmd, cmd[1:]):
+            if option in ("-filter_complex", "-filter:v"):
+                graphs.append(value)
+            elif option.startswith("-/") or option.endswith(("_script", "_script:v")):
+                graphs.append(Path(value).read_text())
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+    return run
+
+
+class TestSmartRenderBlankMode:
+    """Test blank mode re-encoding only the GOPs that need it."""
+    
+    STREAM = VideoStreamInfo("h264", "High", "yuv420p", 0.0, 10.0)
+    
+    def test_falls_back_without_probe(self):
+        """Test a full re-encode when the input cannot be probed."""
+        remediator = VideoRemediator({"enabled": True, "mode": "blank"})
+        
+        with patch(
+            "video_censor_personal.video_remediator.probe_video_stream", return_value=None
+        ), patch("subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess([], 0, "", "")
+            remediator._apply_blank_mode_impl(
+                "in.mp4", "out.mp4", [{"start_time": "1", "end_time": "2"}], 320, 240
+            )
+        
+        cmd = mock_run.call_args[0][0]
+        assert "-filter_complex" in cmd
+        assert "ultrafast" in cmd
+    
+    def test_falls_back_on_failure(self):
+        """Test a failed smart render step falls back to a full re-encode."""
+        remediator = VideoRemediator({"enabled": True, "mode": "blank"})
+        
+        with patch(
+            "video_censor_personal.video_remediator.probe_video_stream",
+            return_value=self.STREAM,
+        ), patch(
+            "video_censor_personal.video_remediator.probe_keyframes",
+            return_value=[0.0, 5.0],
+        ), patch("subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                subprocess.CompletedProcess([], 1, "", "split failed"),
+                subprocess.CompletedProcess([], 0, "", ""),
+            ]
+            remediator._apply_blank_mode_impl(
+                "in.mp4", "out.mp4", [{"start_time": "1", "end_time": "2"}], 320, 240
+            )
+        
+        assert "-f" in mock_run.call_args_list[0][0][0]
+        assert "-filter_complex" in mock_run.call_args_list[1][0][0]
+    
+    def test_disabled_skips_probing(self):
+        """Test smart_render: false always re-encodes the whole video."""
+        remediator = VideoRemediator({"enabled": True, "smart_render": False})
+        
+        with patch(
+            "video_censor_personal.video_remediator.probe_video_stream"
+        ) as mock_probe, patch("subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess([], 0, "", "")
+            remediator._apply_blank_mode_impl(
+                "in.mp4", "out.mp4", [{"start_time": "1", "end_time": "2"}], 320, 240
+            )
+        
+        mock_probe.assert_not_called()
+        assert "-filter_complex" in mock_run.call_args[0][0]
+    
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+    def test_blanks_and_copies_gops(self, tmp_path):
+        """Test blanked frames are black and untouched GOPs are bit-exact."""
+        input_video = str(tmp_path / "input.mp4")
+        output_video = str(tmp_path / "output.mp4")
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error",
+                "-f", "lavfi", "-i", "testsrc=size=160x120:rate=10:duration=10",
+                "-c:v", "libx264", "-g", "10", "-sc_threshold", "0",
+                "-pix_fmt", "yuv420p",
+                input_video,
+            ],
+            check=True,
+        )
+        remediator = VideoRemediator({"enabled": True, "mode": "blank"})
+        
+        with patch(
+            "video_censor_personal.video_remediator.probe_video_stream",
+            return_value=self.STREAM,
+        ), patch(
+            "video_censor_personal.video_remediator.probe_keyframes",
+            return_value=[float(second) for second in range(10)],
+        ):
+            remediator.apply(
+                input_video,
+                output_video,
+                [{"start_time": "3.2", "end_time": "4.5"}],
+                10.0, 160, 120,
+            )
+        
+        before = _frame_means(input_video, 160, 120)
+        after = _frame_means(output_video, 160, 120)
+        assert len(after) == len(before) == 100
+        assert np.flatnonzero(after < 1).tolist() == list(range(32, 46))
+        # GOPs outside 3-5s are stream-copied
+        copied = np.r_[0:30, 50:100]
+        np.testing.assert_array_equal(after[copied], before[copied])
+    
+    @pytest.mark.skipif(
+        shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None,
+        reason="ffmpeg/ffprobe not installed",
+    )
+    def test_open_gop_keeps_leading_frames(self, tmp_path):
+        """Test no leading frames of an open-GOP keyframe are lost at a split."""
+        input_video = str(tmp_path / "input.mp4")
+        output_video = str(tmp_path / "output.mp4")
+        # x265 opens GOPs by default: leading frames follow the keyframe
+        # in decode order
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error",
+                "-f", "lavfi", "-i", "testsrc=size=160x120:rate=25:duration=20",
+                "-c:v", "libx265", "-x265-params", "keyint=50:min-keyint=50:log-level=error",
+                "-pix_fmt", "yuv420p",
+                input_video,
+            ],
+            check=True,
+        )
+        remediator = VideoRemediator({"enabled": True, "mode": "blank"})
+        
+        remediator.apply(
+            input_video,
+            output_video,
+            [{"start_time": "5.0", "end_time": "5.5"}],
+            20.0, 160, 120,
+        )
+        
+        # Smart rendered (the full re-encode fallback writes H.264)
+        assert probe_video_stream(output_video).codec_name == "hevc"
+        # Counted without decoding to a constant rate, which would pad gaps
+        frame_count = subprocess.run(
+            [
+                "ffprobe", "-v", "error", "-count_frames", "-select_streams", "v:0",
+                "-show_entries", "stream=nb_read_frames", "-of", "csv=p=0",
+                output_video,
+            ],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        assert int(frame_count) == 500
+        after = _frame_means(output_video, 160, 120)
+        assert np.flatnonzero(after < 1).tolist() == list(range(125, 138))
+
+
+class TestSmartRenderCutMode:
+    """Test cut and mixed remediation with GOP copying or one filtergraph."""
+    
+    STREAM = VideoStreamInfo("h264", "High", "yuv420p", 0.0, 10.0, True)
+    
+    def test_fallback_runs_single_filtergraph(self, tmp_path):
+        """Test cut mode without smart render decodes and encodes once."""
+        remediator = VideoRemediator({"enabled": True, "mode": "cut"})
+        
+        with patch(
+            "video_censor_personal.video_remediator._ffmpeg_version", return_value=None
+        ), patch(
+            "video_censor_personal.video_remediator.probe_video_stream", return_value=None
+        ), patch(
+            "video_censor_personal.video_remediator.probe_has_audio", return_value=True
+        ), patch("subprocess.run") as mock_run:
+            scripts = []
+            mock_run.side_effect = _capture_filter_graphs(scripts)
+            remediator.apply_cut_mode(
+                "in.mp4", "out.mp4",
+                [{"start_time": "10", "end_time": "20"}, {"start_time": "50", "end_time": "60"}],
+                100.0,
+                work_dir=str(tmp_path),
+            )
+        
+        assert mock_run.call_count == 1
+        cmd = mock_run.call_args[0][0]
+        (graph,) = scripts
+        assert "concat=n=3:v=1:a=1[outv][outa]" in graph
+        assert cmd[cmd.index("-map") + 1] == "[outv]"
+        assert "[outa]" in cmd
+    
+    def test_fallback_without_probe_or_audio(self, tmp_path):
+        """Test an audio-less input is cut as video only when probing fails."""
+        remediator = VideoRemediator({"enabled": True, "mode": "cut"})
+        
+        with patch(
+            "video_censor_personal.video_remediator._ffmpeg_version", return_value=None
+        ), patch(
+            "video_censor_personal.video_remediator.probe_video_stream", return_value=None
+        ), patch(
+            "video_censor_personal.video_remediator.probe_has_audio", return_value=False
+        ), patch("subprocess.run") as mock_run:
+            scripts = []
+            mock_run.side_effect = _capture_filter_graphs(scripts)
+            remediator.apply_cut_mode(
+                "in.mp4", "out.mp4", [{"start_time": "10", "end_time": "20"}], 100.0,
+                work_dir=str(tmp_path),
+            )
+        
+        cmd = mock_run.call_args[0][0]
+        (graph,) = scripts
+        assert "[0:a]" not in graph
+        assert graph.endswith("concat=n=2:v=1:a=0[outv]")
+        assert "[outa]" not in cmd
+    
+    @pytest.mark.parametrize("version, expected", [
+        ((4, 4, 2), ["-vsync", "passthrough"]),
+        ((5, 0, 3), ["-vsync", "passthrough"]),
+        ((5, 1, 0), ["-fps_mode", "passthrough"]),
+        ((7, 0, 2), ["-fps_mode", "passthrough"]),
+        (None, ["-fps_mode", "passthrough"]),
+    ])
+    def test_fallback_fps_option_matches_ffmpeg_version(self, tmp_path, version, expected):
+        """Test -fps_mode is only passed to ffmpeg 5.1 and newer."""
+        remediator = VideoRemediator({"enabled": True, "mode": "cut"})
+        
+        with patch(
+            "video_censor_personal.video_remediator._ffmpeg_version", return_value=version
+        ), patch(
+            "video_censor_personal.video_remediator.probe_video_stream", return_value=None
+        ), patch(
+            "video_censor_personal.video_remediator.probe_has_audio", return_value=True
+        ), patch("subprocess.run") as mock_run:
+            mock_run.side_effect = _capture_filter_graphs([])
+            remediator.apply_cut_mode(
+                "in.mp4", "out.mp4", [{"start_time": "10", "end_time": "20"}], 100.0,
+                work_dir=str(tmp_path),
+            )
+        
+        cmd = mock_run.call_args[0][0]
+        index = cmd.index(expected[0])
+        assert cmd[index:index + 2] == expected
+        assert ({"-vsync", "-fps_mode"} & set(cmd)) == {expected[0]}
+    
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+    def test_unprobed_video_without_audio_is_cut(self, tmp_path):
+        """Test cutting an audio-less video succeeds when ffprobe is unavailable."""
+        input_video = tmp_path / "input.mp4"
+        output_video = tmp_path / "output.mp4"
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error",
+                "-f", "lavfi", "-i", "testsrc=size=160x120:rate=10:duration=4",
+                "-c:v", "libx264", "-pix_fmt", "yuv420p",
+                str(input_video),
+            ],
+            check=True,
+        )
+        remediator = VideoRemediator({"enabled": True, "mode": "cut"})
+        
+        with patch(
+            "video_censor_personal.video_remediator.probe_video_stream", return_value=None
+        ):
+            remediator.apply_cut_mode(
+                str(input_video), str(output_video),
+                [{"start_time": "1", "end_time": "2"}], 4.0,
+                work_dir=str(tmp_path / "work"),
+            )
+        
+        assert output_video.exists()
+    
+    def test_failed_cut_raises(self, tmp_path):
+        """Test a failed ffmpeg run surfaces as RuntimeError."""
+        remediator = VideoRemediator({"enabled": True, "mode": "cut", "smart_render": False})
+        
+        with patch(
+            "video_censor_personal.video_remediator._ffmpeg_version", return_value=None
+        ), patch("subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess([], 1, "", "bad input")
+            with pytest.raises(RuntimeError, match="bad input"):
+                remediator.apply_cut_mode(
+                    "in.mp4", "out.mp4", [{"start_time": "10", "end_time": "20"}], 100.0,
+                    work_dir=str(tmp_path),
+                )
+    
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+    def test_copies_whole_gops_and_reencodes_edges(self, tmp_path):
+        """Test the output holds exactly the kept frames, GOPs copied bit-exact."""
+        input_video = str(tmp_path / "input.mp4")
+        output_video = str(tmp_path / "output.mp4")
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error",
+                "-f", "lavfi", "-i", "testsrc=size=160x120:rate=10:duration=10",
+                "-f", "lavfi", "-i", "sine=frequency=440:duration=10",
+                "-c:v", "libx264", "-g", "10", "-sc_threshold", "0",
+                "-pix_fmt", "yuv420p", "-c:a", "aac",
+                input_video,
+            ],
+            check=True,
+        )
+        remediator = VideoRemediator({"enabled": True, "mode": "cut"})
+        
+        with patch(
+            "video_censor_personal.video_remediator.probe_video_stream",
+            return_value=self.STREAM,
+        ), patch(
+            "video_censor_personal.video_remediator.probe_keyframes",
+            return_value=[float(second) for second in range(10)],
+        ):
+            remediator.apply(
+                input_video,
+                output_video,
+                [
+                    {"start_time": "2.35", "end_time": "3.6"},
+                    {"start_time": "6.0", "end_time": "6.5"},
+                ],
+                10.0, 160, 120,
+            )
+        
+        before = _frame_means(input_video, 160, 120)
+        after = _frame_means(output_video, 160, 120)
+        kept = np.r_[0:24, 36:60, 65:100]
+        assert len(after) == len(kept)
+        # Whole GOPs (0-2s, 4-6s, 7-10s) are stream-copied
+        copied = np.r_[0:20, 28:48, 48 + 5:83]
+        np.testing.assert_array_equal(after[copied], before[kept][copied])
+        np.testing.assert_allclose(after, before[kept], atol=2)
+    
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+    @pytest.mark.parametrize("smart_render", [True, False])
+    def test_mixed_blank_and_cut(self, tmp_path, smart_render):
+        """Test blank and cut segments are applied together on input times."""
+        input_video = str(tmp_path / "input.mp4")
+        # Matroska keeps the final frame of a filtergraph cut exactly
+        output_video = str(tmp_path / "output.mkv")
+        subprocess.run(
+            [
+                "ffmpeg", "-v", "error",
+                "-f", "lavfi", "-i", "testsrc=size=160x120:rate=10:duration=10",
+                "-f", "lavfi", "-i", "sine=frequency=440:duration=10",
+                "-c:v", "libx264", "-g", "10", "-sc_threshold", "0",
+                "-pix_fmt", "yuv420p", "-c:a", "aac",
+                input_video,
+            ],
+            check=True,
+        )
+        remediator = VideoRemediator({
+            "enabled": True, "mode": "blank", "smart_render": smart_render,
+        })
+        
+        with patch(
+            "video_censor_personal.video_remediator.probe_video_stream",
+            return_value=self.STREAM,
+        ), patch(
+            "video_censor_personal.video_remediator.probe_keyframes",
+            return_value=[float(second) for second in range(10)],
+        ):
+            remediator.apply(
+                input_video,
+                output_video,
+                [
+                    {"start_time": "0.5", "end_time": "0.8"},
+                    {"start_time": "2.35", "end_time": "3.6", "video_remediation": "cut"},
+                    {"start_time": "4.5", "end_time": "5.2"},
+                    {"start_time": "6.0", "end_time": "6.5", "video_remediation": "cut"},
+                ],
+                10.0, 160, 120,
+            )
+        
+        before = _frame_means(input_video, 160, 120)
+        after = _frame_means(output_video, 160, 120)
+        kept = np.r_[0:24, 36:60, 65:100]
+        assert len(after) == len(kept)
+        blanked = np.flatnonzero(after < 1)
+        # Input frames 5-8 and 45-52, at their positions after the cuts
+        assert blanked.tolist() == list(range(5, 9)) + list(range(33, 41))
+        visible = np.setdiff1d(np.arange(len(kept)), blanked)
+        np.testing.assert_allclose(after[visible], before[kept][visible], atol=2)
+
+
+class TestCutFilterGraph:
+    """Test the single-pass cut filtergraph."""
+    
+    def test_trims_and_concatenates_kept_segments(self):
+        """Test each kept segment is trimmed from a split and joined with audio."""
+        remediator = VideoRemediator({"mode": "cut"})
+        
+        graph = remediator.build_cut_filter_graph(
+            [{"start": 0.0, "end": 10.0}, {"start": 20.0, "end": 30.0}], [], 640, 480
+        )
+        
+        assert graph.split(";") == [
+            "[0:v]split=2[v0][v1]",
+            "[0:a]asplit=2[a0][a1]",
+            "[v0]trim=start=0.0:end=10.0,setpts=PTS-STARTPTS[cv0]",
+            "[a0]atrim=start=0.0:end=10.0,asetpts=PTS-STARTPTS[ca0]",
+            "[v1]trim=start=20.0:end=30.0,setpts=PTS-STARTPTS[cv1]",
+            "[a1]atrim=start=20.0:end=30.0,asetpts=PTS-STARTPTS[ca1]",
+            "[cv0][ca0][cv1][ca1]concat=n=2:v=1:a=1[outv][outa]",
+        ]
+    
+    def test_blanks_before_trimming(self):
+        """Test blank segments are drawn on the input timeline."""
+        remediator = VideoRemediator({"mode": "cut"})
+        
+        graph = remediator.build_cut_filter_graph(
+            [{"start": 0.0, "end": 10.0}],
+            [{"start_time": "5", "end_time": "6"}],
+            640, 480,
+        )
+        
+        assert graph.startswith(
+            "[0:v]drawbox=x=0:y=0:w=640:h=480:color=0x000000:t=fill:"
+            "enable='between(t,5.000,6.000)',split=1[v0]"
+        )
+    
+    def test_video_only(self):
+        """Test inputs without audio concatenate video alone."""
+        remediator = VideoRemediator({"mode": "cut"})
+        
+        graph = remediator.build_cut_filter_graph(
+            [{"start": 0.0, "end": 10.0}], [], 640, 480, has_audio=False
+        )
+        
+        assert "asplit" not in graph
+        assert graph.endswith("[cv0]concat=n=1:v=1:a=0[outv]")
+
@@ -0,0 +1,214 @@
+"""Tests for voice activity detection module."""
+
+import numpy as np
+import pytest
+
+from video_censor_personal.voice_activity import (
+    ACTIVITY_FRAME_SECONDS,
+    VAD_FRAME_SECONDS,
+    AudioActivityIndex,
+    SpanTimeline,
+    activity_to_spans,
+    compute_speech_activity,
+    find_speech_spans,
+)
+
+SAMPLE_RATE = 16000
+
+
+def _speech_like(duration: float) -> np.ndarray:
+    """Amplitude-modulated tones inside the speech band."""
+    t = np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE
+    tones = sum(np.sin(2 * np.pi * f * t) for f in (500, 900, 1500, 2200))
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)
+    return (0.05 * tones * envelope).astype(np.float32)
+
+
+def _noise_floor(duration: float) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return (0.001 * rng.standard_normal(int(duration * SAMPLE_RATE))).astype(
+        np.float32
+    )
+
+
+class TestComputeSpeechActivity:
+    """Test per-frame speech classification."""
+
+    def test_silence_has_no_activity(self):
+        """Test silent audio yields no speech frames."""
+        activity = compute_speech_activity(np.zeros(SAMPLE_RATE * 5, np.float32), SAMPLE_RATE)
+
+        assert activity.dtype == bool
+        assert len(activity) == int(5 / VAD_FRAME_SECONDS)
+        assert not activity.any()
+
+    def test_speech_band_signal_is_active(self):
+        """Test loud speech-band audio over a quiet floor is detected."""
+        audio = _noise_floor(10.0)
+        audio[SAMPLE_RATE * 4:SAMPLE_RATE * 6] += _speech_like(2.0)
+
+        activity = compute_speech_activity(audio, SAMPLE_RATE)
+        times = np.flatnonzero(activity) * VAD_FRAME_SECONDS
+
+        assert times.min() >= 3.9
+        assert times.max() <= 6.1
+
+    def test_low_frequency_rumble_is_not_speech(self):
+        """Test loud energy outside the speech band is ignored."""
+        audio = _noise_floor(10.0)
+        t = np.arange(SAMPLE_RATE * 2) / SAMPLE_RATE
+        audio[SAMPLE_RATE * 4:SAMPLE_RATE * 6] += 0.5 * np.sin(2 * np.pi * 60 * t)
+
+        assert not compute_speech_activity(audio, SAMPLE_RATE).any()
+
+    def test_short_audio(self):
+        """Test audio shorter than one frame yields no frames."""
+        assert len(compute_speech_activity(np.zeros(10, np.float32), SAMPLE_RATE)) == 0
+
+
+class TestActivityToSpans:
+    """Test grouping of active frames into spans."""
+
+    def test_merges_short_gaps_and_pads(self):
+        """Test runs closer than min_gap merge and spans are padded."""
+        activity = np.zeros(100, dtype=bool)
+        activity[10:20] = True
+        activity[25:30] = True
+        activity[80:90] = True
+
+        spans = activity_to_spans(
+            activity, 0.1, duration=10.0, padding=0.5, min_gap=1.0
+        )
+
+        assert spans == [pytest.approx((0.5, 3.5)), pytest.approx((7.5, 9.5))]
+
+    def test_drops_short_runs_and_clamps(self):
+        """Test isolated short runs are dropped and spans clamp to duration."""
+        activity = np.zeros(100, dtype=bool)
+        activity[0:10] = True
+        activity[50] = True
+
+        spans = activity_to_spans(
+            activity, 0.1, duration=10.0, padding=0.5, min_speech=0.15
+        )
+
+        assert spans == [pytest.approx((0.0, 1.5))]
+
+    def test_no_activity(self):
+        """Test no active frames yields no spans."""
+        assert activity_to_spans(np.zeros(10, dtype=bool), 0.1, 1.0) == []
+
+
+class TestFindSpeechSpans:
+    """Test end-to-end span detection."""
+
+    def test_finds_padded_speech_spans(self):
+        """Test spans cover speech with padding and skip the rest."""
+        audio = _noise_floor(120.0)
+        audio[SAMPLE_RATE * 30:SAMPLE_RATE * 33] += _speech_like(3.0)
+        audio[SAMPLE_RATE * 80:SAMPLE_RATE * 83] += _speech_like(3.0)
+
+        spans = find_speech_spans(audio, SAMPLE_RATE, padding=0.5)
+
+        assert len(spans) == 2
+        assert spans[0][0] <= 30.0 and spans[0][1] >= 33.0
+        assert spans[1][0] <= 80.0 and spans[1][1] >= 83.0
+        assert sum(end - start for start, end in spans) < 10.0
+
+    def test_activity_index_gates_scan(self):
+        """Test only audio the activity index marks non-silent is analyzed."""
+        audio = np.zeros(SAMPLE_RATE * 120, dtype=np.float32)
+        audio[SAMPLE_RATE * 30:SAMPLE_RATE * 33] = _speech_like(3.0)
+        index = AudioActivityIndex.compute(audio, SAMPLE_RATE)
+        # Speech where the index saw silence must not be read
+        scanned = audio.copy()
+        scanned[SAMPLE_RATE * 80:SAMPLE_RATE * 83] = _speech_like(3.0)
+
+        gated = find_speech_spans(
+            scanned, SAMPLE_RATE, padding=0.5, activity_index=index
+        )
+
+        assert gated == find_speech_spans(audio, SAMPLE_RATE, padding=0.5)
+        assert len(gated) == 1
+        assert gated[0][0] <= 30.0 and gated[0][1] >= 33.0
+
+
+class TestSpanTimeline:
+    """Test mapping between concatenated span audio and the original track."""
+
+    def test_maps_times_within_spans(self):
+        """Test compact times map to the same offset in their span."""
+        timeline = SpanTimeline([(10.0, 12.0), (50.0, 53.0)], gap=0.5)
+
+        assert timeline.to_original(0.0) == pytest.approx(10.0)
+        assert timeline.to_original(1.5) == pytest.approx(11.5)
+        assert timeline.to_original(2.5) == pytest.approx(50.0)
+        assert timeline.to_original(4.0) == pytest.approx(51.5)
+
+    def test_gap_times_clamp_to_span_end(self):
+        """Test times inside a gap map to the end of the preceding span."""
+        timeline = SpanTimeline([(10.0, 12.0), (50.0, 53.0)], gap=0.5)
+
+        assert timeline.to_original(2.2) == pytest.approx(12.0)
+
+    def test_range_does_not_cross_spans(self):
+        """Test a range ending in the next span is clamped to its own span."""
+        timeline = SpanTimeline([(10.0, 12.0), (50.0, 53.0)], gap=0.5)
+
+        start, end = timeline.range_to_original(1.8, 2.7)
+
+        assert start == pytest.approx(11.8)
+        assert end == pytest.approx(12.0)
+
+    def test_concatenate(self):
+        """Test span audio is joined with silent gaps."""
+        audio = np.arange(100, dtype=np.float32)
+        timeline = SpanTimeline([(0.01, 0.02), (0.05, 0.06)], gap=0.005)
+
+        compact = timeline.concatenate(audio, sample_rate=1000)
+
+        np.testing.assert_array_equal(
+            compact, [10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 0, 0, 0, 0, 0,
+                      50, 51, 52, 53, 54, 55, 56, 57, 58, 59]
+        )
+
+
+class TestAudioActivityIndex:
+    """Test the shared per-frame loudness index."""
+
+    def test_frames_and_silence_flag(self):
+        """Test one frame per 100 ms, with digital silence flagged."""
+        audio = np.zeros(SAMPLE_RATE * 4, dtype=np.float32)
+        audio[SAMPLE_RATE:SAMPLE_RATE * 2] = _speech_like(1.0)
+
+        index = AudioActivityIndex.compute(audio, SAMPLE_RATE)
+
+        assert len(index) == int(4 / ACTIVITY_FRAME_SECONDS)
+        assert index.duration == pytest.approx(4.0)
+        assert np.flatnonzero(~index.silent).tolist() == list(range(10, 20))
+        assert index.active_fraction() == pytest.approx(0.25)
+
+    def test_partial_trailing_frame(self):
+        """Test a trailing partial frame is measured over its own samples."""
+        audio = np.full(SAMPLE_RATE // 10 + 400, 0.5, dtype=np.float32)
+
+        index = AudioActivityIndex.compute(audio, SAMPLE_RATE)
+
+        assert len(index) == 2
+        np.testing.assert_allclose(index.rms, [0.5, 0.5], rtol=1e-5)
+
+    def test_is_active_and_spans(self):
+        """Test range queries and span grouping over non-silent frames."""
+        audio = np.zeros(SAMPLE_RATE * 10, dtype=np.float32)
+        audio[SAMPLE_RATE * 2:SAMPLE_RATE * 3] = 0.1
+        audio[int(SAMPLE_RATE * 3.5):SAMPLE_RATE * 4] = 0.1
+
+        index = AudioActivityIndex.compute(audio, SAMPLE_RATE)
+
+        assert index.is_active(1.5, 2.5)
+        assert not index.is_active(5.0, 9.0)
+        assert index.active_spans() == [pytest.approx((2.0, 4.0))]
+        assert index.active_spans(padding=0.1, min_gap=0.2) == [
+            pytest.approx((1.9, 3.1)),
+            pytest.approx((3.4, 4.1)),
+        ]
@@ -7,11 +7,10 @@ import time
 from pathlib import Path
 
 from video_censor_personal.cli import parse_args, setup_logging, validate_cli_args
-from video_censor_personal.config import ConfigError, load_config, Config, is_skip_chapters_enabled
+from video_censor_personal.config import ConfigError, load_config, Config
 from video_censor_personal.model_manager import ModelManager, ModelDownloadError
 from video_censor_personal.pipeline import AnalysisRunner, RemediationRunner
 from video_censor_personal.segments_loader import load_segments_from_json, SegmentsLoadError
-from video_censor_personal.video_metadata_writer import write_skip_chapters, VideoMetadataError
 
 logger = logging.getLogger(__name__)
 
@@ -129,12 +128,8 @@ def main() -> int:
                         "Edit the segments JSON file to set 'allow: true' on segments."
                     )
                 
-                # Pre-create output video if skip chapters enabled
-                if args.output_video and is_skip_chapters_enabled(config_dict):
-                    logger.info(f"Pre-creating output video file from input: {args.output_video}")
-                    import shutil
-                    shutil.copy2(args.input, args.output_video)
-                
+                # Skip chapters are written by the same pass that produces
+                # the output video
                 runner = RemediationRunner(
                     args.input,
                     input_segments_path,
@@ -144,24 +139,7 @@ def main() -> int:
                     config_file=args.config,
                     segment_file=input_segments_path,
                 )
-                output_dict = runner.run()
-                
-                # Write skip chapters to video if enabled
-                if is_skip_chapters_enabled(config_dict) and args.output_video:
-                    try:
-                        merged_segments = output_dict.get("_raw_merged_segments", [])
-                        logger.info(f"Writing skip chapters to: {args.output_video}")
-                        
-                        write_skip_chapters(
-                            args.output_video,
-                            args.output_video,
-                            merged_segments,
-                        )
-                    except VideoMetadataError as e:
-                        logger.error(f"Failed to write skip chapters: {e}")
-                        logger.warning(
-                            "Continuing despite chapter writing failure"
-                        )
+                runner.run()
                 
                 elapsed_time = time.perf_counter() - start_time
                 minutes, seconds = divmod(elapsed_time, 60)
@@ -180,16 +158,8 @@ def main() -> int:
         
         # Standard analysis mode
         try:
-            # If output video is requested with skip chapters enabled, pre-create it
-            # This ensures both audio remediation and skip chapters operate on the same file.
-            # This avoids the issue where audio remediation creates a new file that gets
-            # overwritten when skip chapters are applied.
-            if args.output_video and is_skip_chapters_enabled(config_dict):
-                logger.info(f"Pre-creating output video file from input: {args.output_video}")
-                import shutil
-                shutil.copy2(args.input, args.output_video)
-                logger.debug(f"Output video copied to: {args.output_video}")
-            
+            # Skip chapters are written during post-processing, by the same
+            # pass that produces the output video
             runner = AnalysisRunner(
                 args.input,
                 config_dict,
@@ -198,31 +168,9 @@ def main() -> int:
                 log_level=args.log_level,
                 allow_all_segments=args.allow_all_segments,
                 config_file=args.config,
+                resume=args.resume,
             )
-            output_dict = runner.run(args.output)
-            
-            # Write skip chapters to video if enabled
-            if is_skip_chapters_enabled(config_dict) and args.output_video:
-                try:
-                    # Use raw merged segments (with numeric timestamps) instead of JSON formatted ones
-                    merged_segments = output_dict.get("_raw_merged_segments", [])
-                    
-                    # The output video file was pre-created before the pipeline ran
-                    # (and potentially modified by audio remediation).
-                    # Now add skip chapters to it.
-                    logger.info(f"Writing skip chapters to: {args.output_video}")
-                    
-                    write_skip_chapters(
-                        args.output_video,
-                        args.output_video,
-                        merged_segments,
-                    )
-                except VideoMetadataError as e:
-                    logger.error(f"Failed to write skip chapters: {e}")
-                    # Don't fail the entire pipeline, just log the warning
-                    logger.warning(
-                        "Continuing with JSON output despite chapter writing failure"
-                    )
+            runner.run(args.output)
             
             elapsed_time = time.perf_counter() - start_time
             minutes, seconds = divmod(elapsed_time, 60)
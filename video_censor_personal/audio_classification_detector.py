@@ -7,7 +7,7 @@ content categories (Violence, Sexual Theme, etc.).
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import torch
@@ -46,6 +46,8 @@ class AudioClassificationDetector(Detector):
                 - model: HuggingFace model name (default: "MIT/ast-finetuned-audioset-10-10-0.4593")
                 - confidence_threshold: Min confidence (default: 0.6)
                 - chunk_duration: Audio chunk size in seconds (default: 2.0)
+                - batch_size: Chunks classified per model forward pass
+                  (default: 32)
                 - device: Optional device override ("cuda", "mps", "cpu")
         
         Raises:
@@ -58,6 +60,10 @@ class AudioClassificationDetector(Detector):
         self.target_categories = set(self.categories)
         self.confidence_threshold = config.get("confidence_threshold", 0.6)
         self.chunk_duration = config.get("chunk_duration", 2.0)  # seconds per chunk
+        # Windows are classified in batches; the base class validates an
+        # explicit batch_size
+        if "batch_size" not in config:
+            self.batch_size = 32
         
         # Detect or override device
         device_override = config.get("device")
@@ -124,8 +130,9 @@ class AudioClassificationDetector(Detector):
     ) -> List[DetectionResult]:
         """Classify full audio in chunks and return timestamped detections.
         
-        Processes audio in overlapping windows, classifying each segment
-        and returning detections with accurate timestamps.
+        Processes audio in overlapping windows, classifying batch_size
+        windows per model forward pass and returning detections with
+        accurate timestamps.
         
         Args:
             audio_data: Complete audio as numpy array (mono, float32).
@@ -145,30 +152,50 @@ class AudioClassificationDetector(Detector):
         
         audio_duration = len(audio_data) / sample_rate
         logger.info(
-            f"Classifying {audio_duration:.1f}s of audio in {chunk_duration}s chunks..."
+            f"Classifying {audio_duration:.1f}s of audio in {chunk_duration}s chunks "
+            f"({self.batch_size} per batch)..."
         )
         
+        # Window start positions; a trailing window shorter than half a chunk
+        # is skipped, as are windows the activity index marks silent
+        positions = [
+            position
+            for position in range(0, len(audio_data), hop_samples)
+            if len(audio_data) - position >= chunk_samples // 2
+        ]
+        if self.activity_index is not None:
+            active = [
+                position
+                for position in positions
+                if self.activity_index.is_active(
+                    position / sample_rate,
+                    min(position + chunk_samples, len(audio_data)) / sample_rate,
+                )
+            ]
+            if len(active) < len(positions):
+                logger.info(
+                    f"Skipping {len(positions) - len(active)} of {len(positions)} "
+                    f"silent chunks"
+                )
+            positions = active
+        
         results = []
-        position = 0
-        chunk_count = 0
         
         try:
-            while position < len(audio_data):
-                chunk_end = min(position + chunk_samples, len(audio_data))
-                chunk = audio_data[position:chunk_end]
-                
-                if len(chunk) < chunk_samples // 2:
-                    break
-                
-                start_time = position / sample_rate
-                end_time = chunk_end / sample_rate
+            for batch_start in range(0, len(positions), self.batch_size):
+                batch_positions = positions[batch_start:batch_start + self.batch_size]
+                chunks = self._stack_windows(audio_data, batch_positions, chunk_samples)
+                times = [
+                    (
+                        position / sample_rate,
+                        min(position + chunk_samples, len(audio_data)) / sample_rate,
+                    )
+                    for position in batch_positions
+                ]
                 
-                detection = self._classify_chunk(chunk, start_time, end_time)
-                if detection:
-                    results.append(detection)
-                
-                position += hop_samples
-                chunk_count += 1
+                for detection in self._classify_batch(chunks, times):
+                    if detection:
+                        results.append(detection)
             
             if results:
                 logger.info(f"Audio classification found {len(results)} detections")
@@ -181,6 +208,31 @@ class AudioClassificationDetector(Detector):
             logger.error(f"Audio classification failed: {e}", exc_info=True)
             return []
 
+    @staticmethod
+    def _stack_windows(
+        audio_data: np.ndarray,
+        positions: List[int],
+        chunk_samples: int,
+    ) -> np.ndarray:
+        """Copy audio windows into one (windows, samples) array.
+        
+        A window running past the end of the audio is zero-padded so the
+        whole batch shares one shape.
+        
+        Args:
+            audio_data: Complete mono audio.
+            positions: Start sample of each window.
+            chunk_samples: Window length in samples.
+        
+        Returns:
+            float32 array of shape (len(positions), chunk_samples).
+        """
+        chunks = np.zeros((len(positions), chunk_samples), dtype=np.float32)
+        for row, position in enumerate(positions):
+            window = audio_data[position:position + chunk_samples]
+            chunks[row, :len(window)] = window
+        return chunks
+
     def _classify_chunk(
         self,
         chunk: np.ndarray,
@@ -197,9 +249,29 @@ class AudioClassificationDetector(Detector):
         Returns:
             DetectionResult if target category detected, None otherwise.
         """
+        return self._classify_batch(
+            np.asarray(chunk, dtype=np.float32)[np.newaxis, :],
+            [(start_time, end_time)],
+        )[0]
+
+    def _classify_batch(
+        self,
+        chunks: np.ndarray,
+        times: List[Tuple[float, float]],
+    ) -> List[Optional[DetectionResult]]:
+        """Classify a batch of equal-length audio chunks in one forward pass.
+        
+        Args:
+            chunks: Audio chunks as a (batch, samples) array.
+            times: (start_time, end_time) in seconds for each chunk.
+        
+        Returns:
+            One entry per chunk: a DetectionResult if a target category was
+            detected, None otherwise. All entries are None if the batch fails.
+        """
         try:
             inputs = self.processor(
-                chunk,
+                chunks,
                 sampling_rate=16000,
                 return_tensors="pt"
             )
@@ -209,35 +281,63 @@ class AudioClassificationDetector(Detector):
             with torch.no_grad():
                 outputs = self.model(**inputs)
             
-            logits = outputs.logits
-            predicted_class_idx = logits.argmax(-1).item()
-            predicted_label = self.model.config.id2label[predicted_class_idx]
-            confidence = logits.softmax(-1).max().item()
-            
-            if confidence < self.confidence_threshold:
-                return None
-            
-            content_category = self.category_mapping.get(predicted_label)
-            
-            if not content_category or content_category not in self.target_categories:
-                return None
-            
-            logger.debug(
-                f"Detected '{predicted_label}' ({content_category}) at "
-                f"{start_time:.2f}s-{end_time:.2f}s (confidence: {confidence:.3f})"
-            )
-            
-            return DetectionResult(
-                start_time=start_time,
-                end_time=end_time,
-                label=content_category,
-                confidence=confidence,
-                reasoning=f"Audio contains: {predicted_label}",
-            )
+            confidences, class_indices = outputs.logits.softmax(-1).max(-1)
+            confidences = confidences.cpu().tolist()
+            class_indices = class_indices.cpu().tolist()
         
         except Exception as e:
-            logger.debug(f"Chunk classification failed: {e}")
+            logger.debug(f"Batch classification failed: {e}")
+            return [None] * len(times)
+        
+        detections: List[Optional[DetectionResult]] = []
+        for (start_time, end_time), confidence, class_idx in zip(
+            times, confidences, class_indices
+        ):
+            detections.append(
+                self._to_detection(class_idx, confidence, start_time, end_time)
+            )
+        return detections
+
+    def _to_detection(
+        self,
+        class_idx: int,
+        confidence: float,
+        start_time: float,
+        end_time: float,
+    ) -> Optional[DetectionResult]:
+        """Turn one chunk's top prediction into a detection, if it qualifies.
+        
+        Args:
+            class_idx: Index of the most probable class.
+            confidence: Softmax probability of that class.
+            start_time: Chunk start time in seconds.
+            end_time: Chunk end time in seconds.
+        
+        Returns:
+            DetectionResult if the prediction maps to a target category with
+            sufficient confidence, None otherwise.
+        """
+        if confidence < self.confidence_threshold:
             return None
+        
+        predicted_label = self.model.config.id2label.get(class_idx)
+        content_category = self.category_mapping.get(predicted_label)
+        
+        if not content_category or content_category not in self.target_categories:
+            return None
+        
+        logger.debug(
+            f"Detected '{predicted_label}' ({content_category}) at "
+            f"{start_time:.2f}s-{end_time:.2f}s (confidence: {confidence:.3f})"
+        )
+        
+        return DetectionResult(
+            start_time=start_time,
+            end_time=end_time,
+            label=content_category,
+            confidence=confidence,
+            reasoning=f"Audio contains: {predicted_label}",
+        )
     
     def _build_category_mapping(self) -> Dict[str, str]:
         """Build mapping from audio classification labels to content categories.
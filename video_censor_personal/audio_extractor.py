@@ -1,21 +1,20 @@
 """Audio extraction and caching for detector reuse.
 
-Provides cached audio extraction from video files with resampling to 16kHz,
+Provides cached audio extraction from video files as a 16kHz mono track,
 enabling efficient audio-based detection across multiple detectors.
 """
 
 import logging
 from typing import Optional, Tuple
 
-import librosa
 import numpy as np
 
-from video_censor_personal.video_extraction import VideoExtractor
+from video_censor_personal.video_extraction import DETECTION_SAMPLE_RATE, VideoExtractor
 
 logger = logging.getLogger(__name__)
 
 # Target sample rate for audio processing (16kHz for Whisper compatibility)
-TARGET_SAMPLE_RATE = 16000
+TARGET_SAMPLE_RATE = DETECTION_SAMPLE_RATE
 
 
 class AudioExtractor:
@@ -23,7 +22,7 @@ class AudioExtractor:
     
     Handles:
     - Single extraction from video (cached in memory as numpy array)
-    - Automatic resampling to 16kHz
+    - 16kHz mono decoding (downmixed and resampled by ffmpeg)
     - Per-frame audio segment slicing by timecode
     - Memory cleanup when done
     
@@ -50,9 +49,10 @@ class AudioExtractor:
     def extract(self) -> Tuple[np.ndarray, int]:
         """Extract audio once and cache result.
         
-        Extracts audio from video using ffmpeg (via VideoExtractor),
-        loads as numpy array, and resamples to 16kHz. Subsequent calls
-        return cached result without re-extraction.
+        Decodes the 16kHz mono detection track with ffmpeg (via
+        VideoExtractor), which downmixes and resamples while streaming so
+        the full-rate multichannel audio is never materialized. Subsequent
+        calls return cached result without re-extraction.
         
         Returns:
             Tuple of (audio_data, sample_rate) where:
@@ -69,36 +69,11 @@ class AudioExtractor:
         logger.debug(f"Extracting audio from {self.video_path}")
         
         try:
-            import io
-            import soundfile as sf
-            
-            # Extract audio segment (full duration)
-            audio_segment = self._extractor.extract_audio()
+            audio_segment = self._extractor.extract_detection_audio()
             self._duration = audio_segment.duration()
-            
-            # Load audio bytes using soundfile
-            # audio_segment.data contains WAV bytes from ffmpeg extraction
-            audio_data, sr = sf.read(
-                io.BytesIO(audio_segment.data),
-                dtype='float32'
-            )
-            
-            # Ensure mono
-            if len(audio_data.shape) > 1:
-                audio_data = audio_data.mean(axis=1)
-            
-            # Resample to 16kHz if needed
-            if sr != TARGET_SAMPLE_RATE:
-                logger.debug(f"Resampling audio from {sr} Hz to {TARGET_SAMPLE_RATE} Hz")
-                audio_data = librosa.resample(
-                    audio_data,
-                    orig_sr=sr,
-                    target_sr=TARGET_SAMPLE_RATE
-                )
-            
-            self._audio_data = audio_data
+            self._audio_data = audio_segment.data
             logger.debug(
-                f"Extracted audio: {len(audio_data)} samples, "
+                f"Extracted audio: {len(self._audio_data)} samples, "
                 f"{self._duration:.2f}s duration"
             )
             
@@ -1,7 +1,9 @@
 """Audio remediation engine for silencing or bleeping detected content."""
 
+import bisect
 import logging
-from typing import Any, Dict, List, Optional
+import mmap
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -9,6 +11,116 @@ from video_censor_personal.frame import DetectionResult
 
 logger = logging.getLogger(__name__)
 
+# Samples per block when streaming remediated audio
+STREAM_BLOCK_SAMPLES = 256 * 1024
+
+
+def _copy_on_write(audio_data: np.ndarray) -> np.ndarray:
+    """Return a writable array that leaves audio_data unchanged.
+
+    A memory-mapped track is re-mapped from its backing file
+    copy-on-write: only pages that are actually modified get private
+    copies, and the rest stay shared with the page cache. Other arrays are
+    copied in full.
+
+    Args:
+        audio_data: Audio array, possibly an np.memmap.
+
+    Returns:
+        Writable array with the same contents and shape.
+    """
+    # Only a top-level mapping (not a view into one) has the shape and
+    # offset needed to re-map it
+    if isinstance(audio_data, np.memmap) and isinstance(audio_data.base, mmap.mmap):
+        try:
+            return np.memmap(
+                audio_data.filename,
+                dtype=audio_data.dtype,
+                mode="c",
+                shape=audio_data.shape,
+                offset=audio_data.offset,
+            )
+        except (OSError, ValueError) as e:
+            logger.debug(f"Cannot re-map audio copy-on-write ({e}); copying")
+    return audio_data.copy()
+
+
+def _merge_ranges(ranges: Sequence[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Union sample ranges into sorted, non-overlapping ranges.
+
+    Args:
+        ranges: (start, end) sample ranges, end exclusive, in any order.
+
+    Returns:
+        Sorted ranges with overlapping or touching ranges merged.
+    """
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class _SegmentAllowIndex:
+    """Resolves segment 'allow' overrides for detection time ranges.
+
+    A detection takes the allow flag of the first listed segment it
+    overlaps. Segments are sorted by start time with a running maximum of
+    their end times, so a lookup only inspects segments that can overlap.
+    """
+
+    def __init__(self, segments: List[Dict[str, Any]]) -> None:
+        """Index segments by time.
+
+        Args:
+            segments: Segment dicts with start_time, end_time and optional
+                allow. Segments with identical times keep the position of
+                the first and the allow flag of the last.
+        """
+        by_range: Dict[Tuple[float, float], bool] = {}
+        for segment in segments:
+            by_range[(segment["start_time"], segment["end_time"])] = segment.get(
+                "allow", False
+            )
+
+        ordered = sorted(
+            enumerate(by_range.items()), key=lambda item: item[1][0][0]
+        )
+        self._ranks = np.array([rank for rank, _ in ordered], dtype=np.int64)
+        self._starts = np.array([rng[0] for _, (rng, _) in ordered], dtype=np.float64)
+        self._ends = np.array([rng[1] for _, (rng, _) in ordered], dtype=np.float64)
+        self._allow = np.array([allow for _, (_, allow) in ordered], dtype=bool)
+        self._max_ends = (
+            np.maximum.accumulate(self._ends) if len(self._ends) else self._ends
+        )
+
+    def is_allowed(self, start_time: float, end_time: float) -> bool:
+        """Whether a time range falls under an allowed segment.
+
+        Args:
+            start_time: Range start in seconds.
+            end_time: Range end in seconds.
+
+        Returns:
+            The allow flag of the first listed overlapping segment, or
+            False if no segment overlaps.
+        """
+        # Segments before lo end at or before start_time; from hi on they
+        # start at or after end_time
+        lo = int(np.searchsorted(self._max_ends, start_time, side="right"))
+        hi = int(np.searchsorted(self._starts, end_time, side="left"))
+        if lo >= hi:
+            return False
+
+        overlapping = lo + np.flatnonzero(self._ends[lo:hi] > start_time)
+        if len(overlapping) == 0:
+            return False
+        first = overlapping[np.argmin(self._ranks[overlapping])]
+        return bool(self._allow[first])
+
 
 class AudioRemediator:
     """Applies remediation (silence or bleep) to detected audio segments.
@@ -53,6 +165,9 @@ class AudioRemediator:
         if self.bleep_frequency <= 0:
             raise ValueError(f"Bleep frequency must be positive, got {self.bleep_frequency}")
         
+        # Precomputed bleep tone per sample rate (see _tone_buffer)
+        self._tone_buffers: Dict[int, np.ndarray] = {}
+        
         logger.debug(
             f"Initialized AudioRemediator: enabled={self.enabled}, "
             f"mode={self.mode}, categories={self.categories}"
@@ -67,12 +182,13 @@ class AudioRemediator:
     ) -> np.ndarray:
         """Apply remediation to audio based on detections.
         
-        Modifies audio in-place for specified detection categories.
+        Leaves audio_data unchanged: memory-mapped audio is re-mapped
+        copy-on-write so only the remediated sample ranges are copied.
         Handles overlapping detections and respects sample rate.
         Respects the 'allow' flag in segments to skip remediation of allowed segments.
         
         Args:
-            audio_data: Audio array (mono, float32).
+            audio_data: Audio array (mono or multichannel, float32).
             sample_rate: Sample rate in Hz (typically 16000).
             detections: List of DetectionResult with timecodes.
             segments: Optional list of segment dicts with 'allow' property to override detection processing.
@@ -88,26 +204,61 @@ class AudioRemediator:
             logger.debug("No detections provided; returning original audio")
             return audio_data
         
-        remediated = audio_data.copy()
+        remediated = _copy_on_write(audio_data)
+        ranges = self.plan_ranges(detections, sample_rate, len(remediated), segments)
+        self._apply_ranges(remediated, 0, ranges, sample_rate)
+        return remediated
+    
+    def stream(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int,
+        detections: List[DetectionResult],
+        segments: Optional[List[Dict[str, Any]]] = None,
+    ) -> "RemediatedAudioStream":
+        """Prepare block-wise remediation of audio without copying it.
+        
+        Remediation ranges are resolved up front; the returned stream
+        applies them to one block at a time as it is read, so memory use
+        does not grow with the length of the track.
         
-        # Determine number of channels (mono = 1D, stereo/multi = 2D)
-        if remediated.ndim == 1:
-            num_channels = 1
-            num_samples = len(remediated)
-        else:
-            num_samples, num_channels = remediated.shape
-        
-        # Build a map of time ranges to segment allow status if segments provided
-        segment_allow_map: Dict[tuple, bool] = {}
-        if segments:
-            for segment in segments:
-                start = segment["start_time"]
-                end = segment["end_time"]
-                allow = segment.get("allow", False)
-                segment_allow_map[(start, end)] = allow
-        
-        # Filter and apply remediation per detection
-        remediated_count = 0
+        Args:
+            audio_data: Audio array (mono or multichannel, float32), typically
+                memory-mapped.
+            sample_rate: Sample rate in Hz.
+            detections: List of DetectionResult with timecodes.
+            segments: Optional list of segment dicts with 'allow' property to override detection processing.
+        
+        Returns:
+            RemediatedAudioStream over the remediated audio.
+        """
+        ranges: List[Tuple[int, int]] = []
+        if self.enabled and detections:
+            ranges = self.plan_ranges(detections, sample_rate, len(audio_data), segments)
+        return RemediatedAudioStream(self, audio_data, sample_rate, ranges)
+    
+    def plan_ranges(
+        self,
+        detections: List[DetectionResult],
+        sample_rate: int,
+        num_samples: int,
+        segments: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[Tuple[int, int]]:
+        """Resolve detections into the sample ranges to remediate.
+        
+        Args:
+            detections: List of DetectionResult with timecodes.
+            sample_rate: Sample rate in Hz.
+            num_samples: Length of the audio in samples (ranges are clamped).
+            segments: Optional list of segment dicts with 'allow' property to override detection processing.
+        
+        Returns:
+            Sorted, non-overlapping (start, end) sample ranges, end exclusive.
+        """
+        allow_index = _SegmentAllowIndex(segments) if segments else None
+        
+        # Collect the sample ranges to remediate, then take their union
+        ranges: List[Tuple[int, int]] = []
         for detection in detections:
             if detection.label not in self.categories:
                 logger.debug(
@@ -116,15 +267,9 @@ class AudioRemediator:
                 continue
             
             # Check if detection is in an allowed segment
-            is_allowed = False
-            if segment_allow_map:
-                for (seg_start, seg_end), allow in segment_allow_map.items():
-                    # Check if detection overlaps with segment
-                    if detection.start_time < seg_end and detection.end_time > seg_start:
-                        is_allowed = allow
-                        break
-            
-            if is_allowed:
+            if allow_index is not None and allow_index.is_allowed(
+                detection.start_time, detection.end_time
+            ):
                 logger.debug(
                     f"Skipping '{detection.label}' at {detection.start_time:.2f}s (marked as allowed)"
                 )
@@ -145,33 +290,96 @@ class AudioRemediator:
                 )
                 continue
             
-            # Apply remediation mode
-            if self.mode == "silence":
-                remediated[start_sample:end_sample] = 0.0
-                logger.debug(
-                    f"Silenced {detection.label} at {detection.start_time:.2f}s "
-                    f"({end_sample - start_sample} samples)"
-                )
-            elif self.mode == "bleep":
-                # Generate sine wave tone
-                duration_samples = end_sample - start_sample
-                t = np.arange(duration_samples, dtype=np.float32) / sample_rate
-                tone = 0.2 * np.sin(2 * np.pi * self.bleep_frequency * t)
-                
-                # Expand tone to match number of channels
-                if num_channels > 1:
-                    tone = np.tile(tone[:, np.newaxis], (1, num_channels))
-                
-                remediated[start_sample:end_sample] = tone
-                logger.debug(
-                    f"Beeped {detection.label} at {detection.start_time:.2f}s "
-                    f"({duration_samples} samples, {self.bleep_frequency}Hz)"
-                )
-            
-            remediated_count += 1
+            ranges.append((start_sample, end_sample))
         
-        logger.info(f"Remediated {remediated_count} detection(s)")
-        return remediated
+        merged = _merge_ranges(ranges)
+        logger.debug(
+            f"Applying {self.mode} to {len(merged)} range(s) totalling "
+            f"{sum(end - start for start, end in merged) / sample_rate:.2f}s"
+        )
+        logger.info(f"Remediated {len(ranges)} detection(s)")
+        return merged
+    
+    def _apply_ranges(
+        self,
+        block: np.ndarray,
+        block_start: int,
+        ranges: List[Tuple[int, int]],
+        sample_rate: int,
+    ) -> None:
+        """Remediate the part of each range that falls inside a block.
+        
+        Each bleep starts at zero phase at its range start and stays
+        continuous across block boundaries.
+        
+        Args:
+            block: Writable audio block (modified in place).
+            block_start: Sample index of the block's first sample.
+            ranges: Sorted, non-overlapping sample ranges from plan_ranges().
+            sample_rate: Sample rate in Hz.
+        """
+        block_end = block_start + len(block)
+        first = bisect.bisect_right(ranges, (block_start, float("inf"))) - 1
+        for start, end in ranges[max(first, 0):]:
+            if start >= block_end:
+                break
+            lo = max(start, block_start)
+            hi = min(end, block_end)
+            if lo >= hi:
+                continue
+            if self.mode != "bleep":
+                block[lo - block_start:hi - block_start] = 0.0
+            else:
+                segment_tone = self._bleep_tone(lo - start, hi - lo, sample_rate)
+                if block.ndim > 1:
+                    segment_tone = segment_tone[:, np.newaxis]
+                block[lo - block_start:hi - block_start] = segment_tone
+    
+    def _bleep_tone(
+        self, offset: int, num_samples: int, sample_rate: int
+    ) -> np.ndarray:
+        """Generate a slice of the bleep tone.
+        
+        Slices are read from the precomputed, periodic tone buffer, so
+        phase stays continuous for any offset.
+        
+        Args:
+            offset: Sample offset of the slice from the start of the bleep.
+            num_samples: Slice length in samples.
+            sample_rate: Sample rate in Hz.
+        
+        Returns:
+            Mono float32 sine tone at bleep_frequency, zero phase at offset 0.
+        """
+        tone = self._tone_buffer(sample_rate)
+        if tone is None:
+            t = np.arange(offset, offset + num_samples, dtype=np.float64) / sample_rate
+            return (0.2 * np.sin(2 * np.pi * self.bleep_frequency * t)).astype(np.float32)
+        return np.take(tone, np.arange(offset, offset + num_samples), mode="wrap")
+    
+    def _tone_buffer(self, sample_rate: int) -> Optional[np.ndarray]:
+        """Get one second of the bleep tone, computing it on first use.
+        
+        For a whole-number frequency one second holds a whole number of
+        periods, so the buffer repeats seamlessly and any slice of the tone
+        can be read from it.
+        
+        Args:
+            sample_rate: Sample rate in Hz.
+        
+        Returns:
+            Mono float32 tone buffer of sample_rate samples, or None if
+            bleep_frequency is fractional (the tone is then computed per
+            slice).
+        """
+        if not float(self.bleep_frequency).is_integer():
+            return None
+        tone = self._tone_buffers.get(sample_rate)
+        if tone is None:
+            t = np.arange(sample_rate, dtype=np.float64) / sample_rate
+            tone = (0.2 * np.sin(2 * np.pi * self.bleep_frequency * t)).astype(np.float32)
+            self._tone_buffers[sample_rate] = tone
+        return tone
     
     def write_audio(
         self,
@@ -201,3 +409,62 @@ class AudioRemediator:
             )
         except Exception as e:
             raise RuntimeError(f"Failed to write audio to {output_path}: {e}") from e
+
+
+class RemediatedAudioStream:
+    """Remediated audio produced one block at a time.
+    
+    Reads blocks from the source audio (usually memory-mapped), applies
+    the remediation ranges that fall inside each block and yields the
+    result, so a full-length remediated copy never exists in memory or
+    on disk.
+    
+    Attributes:
+        sample_rate: Sample rate in Hz.
+        channels: Number of audio channels.
+        num_samples: Length of the audio in samples.
+        ranges: Sorted sample ranges being remediated.
+    """
+    
+    def __init__(
+        self,
+        remediator: AudioRemediator,
+        audio_data: np.ndarray,
+        sample_rate: int,
+        ranges: List[Tuple[int, int]],
+    ) -> None:
+        """Initialize the stream.
+        
+        Args:
+            remediator: AudioRemediator whose mode and tone are applied.
+            audio_data: Source audio (mono 1D or (samples, channels)).
+            sample_rate: Sample rate in Hz.
+            ranges: Sorted, non-overlapping ranges from plan_ranges().
+        """
+        self._remediator = remediator
+        self._audio_data = audio_data
+        self.sample_rate = sample_rate
+        self.channels = 1 if audio_data.ndim == 1 else audio_data.shape[1]
+        self.num_samples = len(audio_data)
+        self.ranges = ranges
+    
+    def iter_blocks(
+        self, block_samples: int = STREAM_BLOCK_SAMPLES
+    ) -> Iterator[np.ndarray]:
+        """Yield remediated float32 blocks in order.
+        
+        Args:
+            block_samples: Samples per block (the last block may be shorter).
+        
+        Yields:
+            Blocks shaped like the source audio's rows.
+        """
+        for block_start in range(0, self.num_samples, block_samples):
+            block = np.array(
+                self._audio_data[block_start:block_start + block_samples],
+                dtype=np.float32,
+            )
+            self._remediator._apply_ranges(
+                block, block_start, self.ranges, self.sample_rate
+            )
+            yield block
@@ -0,0 +1,181 @@
+"""Append-only analysis checkpoints for resumable runs.
+
+During analysis, accumulated detection results are appended to a JSON
+Lines file after each batch of frames, together with the timecode of the
+last analyzed frame. If the process dies, a later run with --resume reads
+the checkpoint back and continues frame extraction from that timecode.
+
+The first line of the file identifies the video and analysis settings so a
+stale checkpoint (different video, detectors or sampling) is ignored.
+"""
+
+import json
+import logging
+import os
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from video_censor_personal.frame import DetectionResult
+
+logger = logging.getLogger(__name__)
+
+# Seconds between flushes of buffered checkpoint records to disk
+CHECKPOINT_FLUSH_INTERVAL = 10.0
+
+
+class CheckpointState:
+    """Analysis state recovered from a checkpoint file.
+
+    Attributes:
+        audio_results: Full-audio detection results, or None if audio
+            analysis had not completed.
+        frame_results: Frame detection results in timecode order.
+        last_timecode: Timecode of the last analyzed frame, or None if no
+            frames were checkpointed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty checkpoint state."""
+        self.audio_results: Optional[List[DetectionResult]] = None
+        self.frame_results: List[DetectionResult] = []
+        self.last_timecode: Optional[float] = None
+
+
+class AnalysisCheckpoint:
+    """Append-only writer and reader for analysis checkpoints.
+
+    Attributes:
+        checkpoint_path: Path to the JSON Lines checkpoint file.
+        fingerprint: Identifier of the video and analysis settings.
+    """
+
+    def __init__(self, checkpoint_path: str, fingerprint: str) -> None:
+        """Initialize checkpoint for a given analysis run.
+
+        Args:
+            checkpoint_path: Path to the JSON Lines checkpoint file.
+            fingerprint: Identifier of the video and analysis settings;
+                checkpoints written with a different fingerprint are ignored.
+        """
+        self.checkpoint_path = Path(checkpoint_path)
+        self.fingerprint = fingerprint
+        self._file = None
+        self._last_flush = 0.0
+        self._valid_size: Optional[int] = None
+
+    def load(self) -> Optional[CheckpointState]:
+        """Read analysis state from an existing checkpoint file.
+
+        A truncated final line (from a crash mid-write) is ignored.
+
+        Returns:
+            Recovered CheckpointState, or None if no usable checkpoint exists.
+        """
+        if not self.checkpoint_path.exists():
+            return None
+
+        state = CheckpointState()
+        valid_size = 0
+        with open(self.checkpoint_path, "rb") as f:
+            for line_number, line in enumerate(f):
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("unterminated record")
+                    record = json.loads(line)
+                except ValueError:
+                    logger.debug(
+                        f"Ignoring incomplete checkpoint record at line {line_number + 1}"
+                    )
+                    break
+                valid_size += len(line)
+
+                if line_number == 0:
+                    if record.get("fingerprint") != self.fingerprint:
+                        logger.warning(
+                            f"Checkpoint {self.checkpoint_path} was written for a "
+                            "different video or settings; ignoring it"
+                        )
+                        return None
+                    continue
+
+                results = [DetectionResult(**item) for item in record["results"]]
+                if record["type"] == "audio":
+                    state.audio_results = results
+                else:
+                    state.frame_results.extend(results)
+                    state.last_timecode = record["timecode"]
+
+        self._valid_size = valid_size
+        return state
+
+    def start(self, resume: bool = False) -> None:
+        """Open the checkpoint file for appending.
+
+        Args:
+            resume: If True, keep the records read by a successful load()
+                (dropping any incomplete trailing record); otherwise start a
+                fresh checkpoint.
+        """
+        if resume and self._valid_size and self.checkpoint_path.exists():
+            os.truncate(self.checkpoint_path, self._valid_size)
+            self._file = open(self.checkpoint_path, "a", encoding="utf-8")
+        else:
+            self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.checkpoint_path, "w", encoding="utf-8")
+            self._write({"type": "header", "fingerprint": self.fingerprint})
+            self._file.flush()
+        self._last_flush = time.monotonic()
+
+    def record_audio(self, results: List[DetectionResult]) -> None:
+        """Append full-audio detection results and flush immediately.
+
+        Args:
+            results: Results from full-audio detectors.
+        """
+        self._write({"type": "audio", "results": [asdict(r) for r in results]})
+        self.flush()
+
+    def record_frames(self, timecode: float, results: List[DetectionResult]) -> None:
+        """Append results for a batch of analyzed frames.
+
+        Records are buffered and flushed at most every
+        CHECKPOINT_FLUSH_INTERVAL seconds to keep the analysis loop cheap.
+
+        Args:
+            timecode: Timecode of the last frame in the batch.
+            results: Detection results for the batch.
+        """
+        self._write(
+            {
+                "type": "frames",
+                "timecode": timecode,
+                "results": [asdict(r) for r in results],
+            }
+        )
+        if time.monotonic() - self._last_flush >= CHECKPOINT_FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Flush buffered records to disk."""
+        if self._file is not None:
+            self._file.flush()
+            self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush and close the checkpoint file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self) -> None:
+        """Close and delete the checkpoint file (after a completed run)."""
+        self.close()
+        self.checkpoint_path.unlink(missing_ok=True)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        """Append one JSON record as a line."""
+        if self._file is None:
+            return
+        self._file.write(json.dumps(record, default=str) + "\n")
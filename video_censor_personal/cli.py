@@ -128,6 +128,17 @@ def create_parser() -> argparse.ArgumentParser:
         metavar="PATH",
     )
 
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Resume an interrupted analysis from its checkpoint file "
+            "(<output>.checkpoint.jsonl, written next to the output JSON). "
+            "Frame extraction restarts after the last checkpointed timecode. "
+            "Starts from the beginning if no matching checkpoint exists."
+        ),
+    )
+
     parser.add_argument(
         "--edit",
         action="store_true",
@@ -215,14 +215,88 @@ def _validate_frame_sampling_strategy(config: Dict[str, Any]) -> None:
         )
 
 
+def _validate_frame_source(config: Dict[str, Any]) -> None:
+    """Validate optional frame source, prefetch and frame size settings.
+
+    Args:
+        config: Configuration dictionary.
+
+    Raises:
+        ConfigError: If frame_source is not in ('opencv', 'ffmpeg'),
+            prefetch_frames is negative, or frame_size is not a positive
+            integer.
+    """
+    processing = config.get("processing", {})
+    frame_sampling = processing.get("frame_sampling", {})
+
+    frame_source = frame_sampling.get("frame_source", "opencv")
+    allowed_sources = {"opencv", "ffmpeg"}
+    if frame_source not in allowed_sources:
+        raise ConfigError(
+            f"Frame source '{frame_source}' is invalid. "
+            f"Allowed values: {', '.join(sorted(allowed_sources))}"
+        )
+
+    prefetch = frame_sampling.get("prefetch_frames")
+    if prefetch is not None:
+        if not isinstance(prefetch, int) or isinstance(prefetch, bool) or prefetch < 0:
+            raise ConfigError(
+                f"'processing.frame_sampling.prefetch_frames' must be a "
+                f"non-negative integer, got {prefetch}"
+            )
+
+    frame_size = frame_sampling.get("frame_size")
+    if frame_size is not None:
+        if (
+            not isinstance(frame_size, int)
+            or isinstance(frame_size, bool)
+            or frame_size <= 0
+        ):
+            raise ConfigError(
+                f"'processing.frame_sampling.frame_size' must be a positive "
+                f"integer, got {frame_size}"
+            )
+
+
+def _validate_scene_sampling(config: Dict[str, Any]) -> None:
+    """Validate optional scene-based sampling settings.
+
+    Args:
+        config: Configuration dictionary.
+
+    Raises:
+        ConfigError: If scene_threshold is not in (0.0, 1.0] or max_interval
+            is not a positive number.
+    """
+    processing = config.get("processing", {})
+    frame_sampling = processing.get("frame_sampling", {})
+
+    threshold = frame_sampling.get("scene_threshold")
+    if threshold is not None:
+        if not isinstance(threshold, (int, float)) or not (0.0 < threshold <= 1.0):
+            raise ConfigError(
+                f"'processing.frame_sampling.scene_threshold' must be in range "
+                f"(0.0, 1.0], got {threshold}"
+            )
+
+    max_interval = frame_sampling.get("max_interval")
+    if max_interval is not None:
+        if not isinstance(max_interval, (int, float)) or max_interval <= 0:
+            raise ConfigError(
+                f"'processing.frame_sampling.max_interval' must be a positive "
+                f"number, got {max_interval}"
+            )
+
+
 def _validate_max_workers(config: Dict[str, Any]) -> None:
-    """Validate max_workers is a positive integer.
+    """Validate max_workers and the optional parallel_analysis flag.
 
     Args:
         config: Configuration dictionary.
 
     Raises:
-        ConfigError: If max_workers is not > 0.
+        ConfigError: If max_workers is not > 0 or parallel_analysis is not
+            a boolean.
     """
     processing = config.get("processing", {})
     max_workers = processing.get("max_workers")
@@ -233,6 +307,43 @@ def _validate_max_workers(config: Dict[str, Any]) -> None:
             f"got {max_workers}"
         )
 
+    parallel_analysis = processing.get("parallel_analysis")
+    if parallel_analysis is not None and not isinstance(parallel_analysis, bool):
+        raise ConfigError(
+            f"'processing.parallel_analysis' must be a boolean, "
+            f"got {parallel_analysis}"
+        )
+
+
+def _validate_detection_cache(config: Dict[str, Any]) -> None:
+    """Validate optional detection result cache settings.
+
+    Args:
+        config: Configuration dictionary.
+
+    Raises:
+        ConfigError: If detection_cache is not a dict, enabled is not a
+            boolean, or path is not a string.
+    """
+    detection_cache = config.get("processing", {}).get("detection_cache")
+    if detection_cache is None:
+        return
+
+    if not isinstance(detection_cache, dict):
+        raise ConfigError("'processing.detection_cache' must be a dictionary")
+
+    enabled = detection_cache.get("enabled")
+    if enabled is not None and not isinstance(enabled, bool):
+        raise ConfigError(
+            f"'processing.detection_cache.enabled' must be a boolean, got {enabled}"
+        )
+
+    path = detection_cache.get("path")
+    if path is not None and not isinstance(path, str):
+        raise ConfigError(
+            f"'processing.detection_cache.path' must be a string, got {path}"
+        )
+
 
 def _validate_merge_threshold(config: Dict[str, Any]) -> None:
     """Validate merge_threshold is non-negative.
@@ -447,6 +558,18 @@ def _validate_detectors_section(config: Dict[str, Any]) -> None:
         if not categories:
             raise ConfigError(f"Detector {idx} must declare at least one category")
 
+        if "batch_size" in detector_config:
+            batch_size = detector_config["batch_size"]
+            if (
+                not isinstance(batch_size, int)
+                or isinstance(batch_size, bool)
+                or batch_size <= 0
+            ):
+                raise ConfigError(
+                    f"Detector {idx} 'batch_size' must be a positive integer, "
+                    f"got {batch_size}"
+                )
+
 
 def _validate_video_section(config: Dict[str, Any]) -> None:
     """Validate optional video section if present.
@@ -604,6 +727,21 @@ def _validate_remediation_section(config: Dict[str, Any]) -> None:
                     f"'remediation.video.blank_color' must be a valid hex color, got '{color}'"
                 )
 
+        # Validate smart_render field if present
+        if "smart_render" in video:
+            if not isinstance(video["smart_render"], bool):
+                raise ConfigError(
+                    "'remediation.video.smart_render' must be a boolean"
+                )
+
+        # Validate max_workers field if present
+        if "max_workers" in video:
+            workers = video["max_workers"]
+            if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+                raise ConfigError(
+                    f"'remediation.video.max_workers' must be a positive integer, got {workers}"
+                )
+
         # Validate category_modes field if present
         if "category_modes" in video:
             category_modes = video["category_modes"]
@@ -691,7 +829,10 @@ def validate_config(config: Dict[str, Any]) -> None:
     _validate_at_least_one_detection_enabled(config)
     _validate_output_format(config)
     _validate_frame_sampling_strategy(config)
+    _validate_frame_source(config)
+    _validate_scene_sampling(config)
     _validate_max_workers(config)
+    _validate_detection_cache(config)
     _validate_merge_threshold(config)
 
     logger.debug("Configuration validation passed")
@@ -735,6 +876,143 @@ def get_sample_rate_from_config(config: Dict[str, Any]) -> float:
     return get_config_value(config, "processing.frame_sampling.sample_rate", 1.0)
 
 
+def get_frame_sampling_strategy_from_config(config: Dict[str, Any]) -> str:
+    """Get frame sampling strategy from configuration.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Sampling strategy ("uniform", "scene_based", or "all"). Default is
+        "uniform".
+    """
+    return get_config_value(
+        config, "processing.frame_sampling.strategy", "uniform"
+    )
+
+
+def get_scene_sampling_settings(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Get scene-based sampling settings from configuration.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Dict with keys "threshold" (histogram distance marking a shot change,
+        default 0.3) and "max_interval" (maximum seconds between analyzed
+        frames within a shot, default 10.0).
+    """
+    return {
+        "threshold": get_config_value(
+            config, "processing.frame_sampling.scene_threshold", 0.3
+        ),
+        "max_interval": get_config_value(
+            config, "processing.frame_sampling.max_interval", 10.0
+        ),
+    }
+
+
+def get_frame_source_from_config(config: Dict[str, Any]) -> str:
+    """Get frame source from configuration.
+
+    Reads the processing.frame_sampling.frame_source value from config,
+    defaulting to "opencv" if not specified.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Frame source ("opencv" or "ffmpeg"). Default is "opencv".
+    """
+    return get_config_value(
+        config, "processing.frame_sampling.frame_source", "opencv"
+    )
+
+
+def get_prefetch_frames_from_config(config: Dict[str, Any]) -> int:
+    """Get the frame prefetch queue size from configuration.
+
+    Reads the processing.frame_sampling.prefetch_frames value from config.
+    Frames are decoded this many frames ahead of inference in a background
+    thread; 0 disables prefetching.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Maximum number of decoded frames queued ahead of inference. Default
+        is 4.
+    """
+    return get_config_value(config, "processing.frame_sampling.prefetch_frames", 4)
+
+
+def get_frame_size_from_config(config: Dict[str, Any]) -> Optional[int]:
+    """Get decoder-side frame size from configuration.
+
+    Reads the processing.frame_sampling.frame_size value from config. Only
+    used by the ffmpeg frame source.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Target length of the frame's shorter side in pixels, or None to keep
+        the native resolution.
+    """
+    return get_config_value(config, "processing.frame_sampling.frame_size", None)
+
+
+def get_max_workers_from_config(config: Dict[str, Any]) -> int:
+    """Get number of parallel analysis workers from configuration.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Maximum number of worker processes. Default is 1.
+    """
+    return get_config_value(config, "processing.max_workers", 1)
+
+
+def is_parallel_analysis_enabled(config: Dict[str, Any]) -> bool:
+    """Check if process-pool frame analysis is enabled in configuration.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        True if frame analysis should be split across max_workers processes,
+        False otherwise (default).
+    """
+    return get_config_value(config, "processing.parallel_analysis", False)
+
+
+def is_detection_cache_enabled(config: Dict[str, Any]) -> bool:
+    """Check if the persistent detection result cache is enabled.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        True if per-frame detection results should be cached, False
+        otherwise (default).
+    """
+    return get_config_value(config, "processing.detection_cache.enabled", False)
+
+
+def get_detection_cache_path(config: Dict[str, Any]) -> Optional[str]:
+    """Get the configured detection cache database path.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        Path to the SQLite cache file, or None to use the default location
+        next to the output JSON.
+    """
+    return get_config_value(config, "processing.detection_cache.path", None)
+
+
 def is_skip_chapters_enabled(config: Dict[str, Any]) -> bool:
     """Check if skip chapters feature is enabled in configuration.
 
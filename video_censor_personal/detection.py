@@ -2,14 +2,40 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
 import numpy as np
 
+from video_censor_personal.detection_cache import (
+    DetectionCache,
+    compute_audio_fingerprint,
+    detector_cache_key,
+)
 from video_censor_personal.frame import DetectionResult, Frame
+from video_censor_personal.voice_activity import (
+    ACTIVITY_FRAME_SECONDS,
+    AudioActivityIndex,
+)
 
 logger = logging.getLogger(__name__)
 
+# Detector types that analyze the full audio track instead of frames
+AUDIO_DETECTOR_TYPES = {"speech-profanity", "audio-classification"}
+
+
+class FrameBatchResults(NamedTuple):
+    """Outcome of DetectionPipeline.analyze_frames().
+
+    Attributes:
+        results: One list of DetectionResult objects per input frame.
+        failed: Whether any detector failed on some of the frames, in which
+            case their results are incomplete and must not be treated as
+            analyzed (e.g. checkpointed).
+    """
+
+    results: List[List[DetectionResult]]
+    failed: bool
+
 
 class Detector(ABC):
     """Abstract base class for all detectors.
@@ -41,6 +67,19 @@ class Detector(ABC):
             raise ValueError(f"Detector '{self.name}' must declare at least one category")
 
         self.categories = categories
+
+        # Number of frames dispatched to detect_batch() at once
+        batch_size = config.get("batch_size", 1)
+        if not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size <= 0:
+            raise ValueError(
+                f"Detector '{self.name}' batch_size must be a positive integer, "
+                f"got {batch_size}"
+            )
+        self.batch_size = batch_size
+
+        # Shared loudness summary of the audio, offered before full-audio analysis
+        self.activity_index: Optional[AudioActivityIndex] = None
+
         logger.debug(
             f"Initialized detector '{self.name}' for categories: {', '.join(categories)}"
         )
@@ -66,6 +105,28 @@ class Detector(ABC):
         """
         pass
 
+    def detect_batch(
+        self,
+        frames_data: List[np.ndarray],
+    ) -> List[List[DetectionResult]]:
+        """Analyze a batch of frames, returning detections for each frame.
+
+        The default implementation calls detect() once per frame. Detectors
+        backed by models that benefit from batched forward passes should
+        override this.
+
+        Implementations should raise if inference fails rather than return
+        empty lists, so the pipeline doesn't cache the frames as analyzed.
+
+        Args:
+            frames_data: List of frame pixel arrays (BGR, uint8).
+
+        Returns:
+            List with one list of DetectionResult objects per input frame,
+            in the same order as frames_data.
+        """
+        return [self.detect(frame_data=frame_data) for frame_data in frames_data]
+
     def supports_full_audio_analysis(self) -> bool:
         """Check if detector supports full audio analysis mode.
 
@@ -101,6 +162,33 @@ class Detector(ABC):
             f"Detector '{self.name}' does not support full audio analysis"
         )
 
+    def set_audio_cache(
+        self, cache: Optional[DetectionCache], audio_fingerprint: Optional[str]
+    ) -> None:
+        """Attach a persistent cache for full-audio analysis.
+
+        Override in detectors with expensive intermediate results (such as
+        speech transcripts) that can be reused across runs.
+
+        Args:
+            cache: DetectionCache instance, or None to disable caching.
+            audio_fingerprint: Fingerprint of the audio passed to
+                analyze_full_audio().
+        """
+        pass
+
+    def set_activity_index(self, index: Optional[AudioActivityIndex]) -> None:
+        """Attach the shared activity index of the audio to be analyzed.
+
+        Full-audio detectors can consult it to skip silent stretches
+        instead of scanning every sample.
+
+        Args:
+            index: AudioActivityIndex of the audio passed to
+                analyze_full_audio(), or None if unavailable.
+        """
+        self.activity_index = index
+
     def cleanup(self) -> None:
         """Clean up detector resources (models, temp files, etc.).
 
@@ -224,6 +312,8 @@ class DetectionPipeline:
         self._detector_configs: List[Dict[str, Any]] = []
         self._audio_detectors_initialized = False
         self._frame_detectors_initialized = False
+        self._result_cache: Optional[DetectionCache] = None
+        self._video_fingerprint: Optional[str] = None
 
         # Parse and validate configs
         self._parse_detector_configs()
@@ -333,12 +423,9 @@ class DetectionPipeline:
         if self._audio_detectors_initialized:
             return
 
-        # Audio detector types
-        audio_types = {"speech-profanity", "audio-classification"}
-
         for detector_config in self._detector_configs:
             detector_type = detector_config.get("type")
-            if detector_type in audio_types:
+            if detector_type in AUDIO_DETECTOR_TYPES:
                 self._create_detector(detector_config)
 
         self._audio_detectors_initialized = True
@@ -351,16 +438,23 @@ class DetectionPipeline:
         if self._frame_detectors_initialized:
             return
 
-        # Audio detector types to exclude
-        audio_types = {"speech-profanity", "audio-classification"}
-
-        for detector_config in self._detector_configs:
-            detector_type = detector_config.get("type")
-            if detector_type not in audio_types:
-                self._create_detector(detector_config)
+        for detector_config in self.get_frame_detector_configs():
+            self._create_detector(detector_config)
 
         self._frame_detectors_initialized = True
 
+    def get_frame_detector_configs(self) -> List[Dict[str, Any]]:
+        """Get configurations of frame-based detectors without initializing them.
+
+        Returns:
+            List of detector config dicts for non-audio detectors.
+        """
+        return [
+            detector_config
+            for detector_config in self._detector_configs
+            if detector_config.get("type") not in AUDIO_DETECTOR_TYPES
+        ]
+
     def cleanup_audio_detectors(self) -> None:
         """Clean up and release audio detectors to free GPU memory."""
         audio_detectors = [d for d in self.detectors if d.supports_full_audio_analysis()]
@@ -393,11 +487,24 @@ class DetectionPipeline:
         """
         all_results: List[DetectionResult] = []
 
-        for detector in self.detectors:
-            if not detector.supports_full_audio_analysis():
-                continue
+        audio_detectors = [
+            d for d in self.detectors if d.supports_full_audio_analysis()
+        ]
+        if not audio_detectors:
+            return all_results
+
+        audio_fingerprint = None
+        if self._result_cache is not None:
+            audio_fingerprint = compute_audio_fingerprint(audio_data, sample_rate)
+
+        activity_index = self._build_activity_index(
+            audio_data, sample_rate, audio_fingerprint
+        )
 
+        for detector in audio_detectors:
             try:
+                detector.set_audio_cache(self._result_cache, audio_fingerprint)
+                detector.set_activity_index(activity_index)
                 logger.info(f"Running full audio analysis with '{detector.name}'...")
                 results = detector.analyze_full_audio(audio_data, sample_rate)
                 all_results.extend(results)
@@ -413,6 +520,47 @@ class DetectionPipeline:
 
         return all_results
 
+    def _build_activity_index(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int,
+        audio_fingerprint: Optional[str],
+    ) -> Optional[AudioActivityIndex]:
+        """Build (or load from the cache) the shared audio activity index.
+
+        Args:
+            audio_data: Complete audio as numpy array (mono, float32).
+            sample_rate: Audio sample rate in Hz.
+            audio_fingerprint: Fingerprint of audio_data, or None without
+                a result cache.
+
+        Returns:
+            AudioActivityIndex, or None if it could not be built.
+        """
+        if audio_data is None or len(audio_data) == 0:
+            return None
+
+        cache = self._result_cache
+        if cache is not None and audio_fingerprint is not None:
+            index = cache.get_activity_index(audio_fingerprint, ACTIVITY_FRAME_SECONDS)
+            if index is not None:
+                logger.debug("Using cached audio activity index")
+                return index
+
+        try:
+            index = AudioActivityIndex.compute(audio_data, sample_rate)
+        except Exception as e:
+            logger.warning(f"Failed to build audio activity index: {e}")
+            return None
+
+        logger.info(
+            f"Audio activity: {index.active_fraction():.0%} of "
+            f"{index.duration:.1f}s is not silent"
+        )
+        if cache is not None and audio_fingerprint is not None:
+            cache.put_activity_index(audio_fingerprint, index)
+        return index
+
     def get_frame_detectors(self) -> List[Detector]:
         """Get detectors that process frames (not full-audio-only).
 
@@ -465,6 +613,114 @@ class DetectionPipeline:
 
         return all_results
 
+    def get_frame_batch_size(self) -> int:
+        """Get the number of frames to accumulate before calling analyze_frames().
+
+        Returns:
+            Largest batch_size among initialized frame detectors (minimum 1).
+        """
+        return max(
+            (d.batch_size for d in self.get_frame_detectors()),
+            default=1,
+        )
+
+    def set_result_cache(
+        self, cache: Optional[DetectionCache], video_fingerprint: Optional[str]
+    ) -> None:
+        """Attach a persistent per-frame result cache.
+
+        When set, analyze_frames() returns cached results for frames a
+        detector has already analyzed and stores results for new frames,
+        and analyze_full_audio() offers the cache to audio detectors (see
+        Detector.set_audio_cache()).
+
+        Args:
+            cache: DetectionCache instance, or None to disable caching.
+            video_fingerprint: Frame cache namespace of the video being
+                analyzed (see frame_cache_namespace()).
+        """
+        self._result_cache = cache
+        self._video_fingerprint = video_fingerprint
+
+    def analyze_frames(
+        self,
+        frames: List[Frame],
+    ) -> FrameBatchResults:
+        """Run frame-based detectors on a batch of frames.
+
+        Each detector receives the frames in chunks of its own batch_size via
+        detect_batch(). A detector failure only drops that detector's results
+        for the failing chunk, which is not cached, and marks the batch as
+        failed. If a result cache is attached, only frames missing from the
+        cache for a detector are sent to it.
+
+        Args:
+            frames: Frame objects in timecode order.
+
+        Returns:
+            FrameBatchResults with one list of DetectionResult objects per
+            input frame (timecodes assigned) and whether any chunk failed.
+        """
+        frame_results: List[List[DetectionResult]] = [[] for _ in frames]
+        failed = False
+
+        for detector in self.get_frame_detectors():
+            batch_size = detector.batch_size
+            pending = list(range(len(frames)))
+
+            cache_key = None
+            if self._result_cache is not None:
+                cache_key = detector_cache_key(detector.config)
+                cached = self._result_cache.get_frame_results(
+                    self._video_fingerprint,
+                    cache_key,
+                    [f.timecode for f in frames],
+                )
+                pending = [i for i, results in enumerate(cached) if results is None]
+                for i, results in enumerate(cached):
+                    if results is not None:
+                        frame_results[i].extend(results)
+                if len(pending) < len(frames):
+                    logger.debug(
+                        f"Detector '{detector.name}': "
+                        f"{len(frames) - len(pending)} frame(s) served from cache"
+                    )
+
+            for start in range(0, len(pending), batch_size):
+                chunk_indices = pending[start:start + batch_size]
+                chunk = [frames[i] for i in chunk_indices]
+                try:
+                    chunk_results = detector.detect_batch([f.data for f in chunk])
+                except Exception as e:
+                    logger.error(
+                        f"Detector '{detector.name}' failed during batch analysis "
+                        f"of {len(chunk)} frame(s): {e}",
+                        exc_info=True,
+                    )
+                    failed = True
+                    continue
+
+                for i, frame, results in zip(chunk_indices, chunk, chunk_results):
+                    for result in results:
+                        result.start_time = frame.timecode
+                        result.end_time = frame.timecode + 0.033
+                    frame_results[i].extend(results)
+
+                if cache_key is not None:
+                    self._result_cache.put_frame_results(
+                        self._video_fingerprint,
+                        cache_key,
+                        [(f.timecode, r) for f, r in zip(chunk, chunk_results)],
+                    )
+
+                logger.debug(
+                    f"Detector '{detector.name}' found "
+                    f"{sum(len(r) for r in chunk_results)} detections "
+                    f"in batch of {len(chunk)} frame(s)"
+                )
+
+        return FrameBatchResults(frame_results, failed)
+
     def cleanup(self) -> None:
         """Clean up all detectors and release resources.
 
@@ -0,0 +1,352 @@
+"""Persistent per-frame detection result cache.
+
+Stores raw per-frame DetectionResults in a SQLite database so re-running
+analysis on the same video (for example after changing only merge or
+remediation settings) skips inference for frames already analyzed.
+
+Entries are keyed by (frame namespace, detector key, frame timecode).
+The frame namespace covers the video fingerprint and the frame decoding
+settings, and the detector key covers the detector type, model and a hash
+of its result-affecting configuration, so changing the frame source or
+size, or editing prompts or thresholds, invalidates the affected entries
+automatically.
+
+Speech transcripts are stored as well, keyed by a fingerprint of the
+decoded audio and the transcription settings, so keyword lists can be
+re-matched without running speech recognition again. The audio activity
+index shared by audio detectors is stored under the same fingerprint.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from video_censor_personal.frame import DetectionResult
+from video_censor_personal.voice_activity import AudioActivityIndex
+
+logger = logging.getLogger(__name__)
+
+# Bytes hashed from each end of the video file for its fingerprint
+FINGERPRINT_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Samples hashed per update when fingerprinting decoded audio
+_AUDIO_HASH_CHUNK = 1024 * 1024
+
+# Detector config keys that do not affect detection results
+_NON_RESULT_CONFIG_KEYS = {"name", "batch_size"}
+
+# Maximum timecodes per lookup query (below SQLite's bound-parameter limit)
+_LOOKUP_CHUNK = 500
+
+
+def compute_video_fingerprint(video_path: str) -> str:
+    """Compute a content fingerprint for a video file.
+
+    Hashes the file size together with its first and last
+    FINGERPRINT_CHUNK_BYTES, which identifies a video without reading
+    multi-gigabyte files in full.
+
+    Args:
+        video_path: Path to the video file.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    path = Path(video_path)
+    size = path.stat().st_size
+    digest = hashlib.sha256(str(size).encode())
+
+    with open(path, "rb") as f:
+        digest.update(f.read(FINGERPRINT_CHUNK_BYTES))
+        if size > FINGERPRINT_CHUNK_BYTES:
+            f.seek(max(size - FINGERPRINT_CHUNK_BYTES, FINGERPRINT_CHUNK_BYTES))
+            digest.update(f.read(FINGERPRINT_CHUNK_BYTES))
+
+    return digest.hexdigest()
+
+
+def compute_audio_fingerprint(audio_data: np.ndarray, sample_rate: int) -> str:
+    """Compute a content fingerprint for decoded audio.
+
+    Args:
+        audio_data: Decoded audio samples (may be memory-mapped).
+        sample_rate: Sample rate in Hz.
+
+    Returns:
+        Hex SHA-256 digest of the sample rate, layout and samples.
+    """
+    digest = hashlib.sha256(
+        f"{sample_rate}:{audio_data.dtype.str}:{audio_data.shape}".encode()
+    )
+    flat = np.ascontiguousarray(audio_data).reshape(-1)
+    for start in range(0, flat.size, _AUDIO_HASH_CHUNK):
+        digest.update(memoryview(flat[start:start + _AUDIO_HASH_CHUNK]))
+    return digest.hexdigest()
+
+
+def frame_cache_namespace(
+    video_fingerprint: str, frame_source: str, frame_size: Optional[int]
+) -> str:
+    """Build the namespace of a video's frame results.
+
+    Detectors see different pixels at the same timecode when the frame
+    source or size changes (the ffmpeg source scales while decoding,
+    OpenCV yields full-resolution frames), so both are part of the
+    namespace.
+
+    Args:
+        video_fingerprint: Fingerprint from compute_video_fingerprint().
+        frame_source: Frame source ("opencv" or "ffmpeg").
+        frame_size: Decoder-side frame size, or None for native resolution.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    if frame_source != "ffmpeg":
+        frame_size = None  # Only the ffmpeg source scales frames
+    return hashlib.sha256(
+        f"{video_fingerprint}:{frame_source}:{frame_size}".encode()
+    ).hexdigest()
+
+
+def detector_cache_key(detector_config: Dict[str, Any]) -> str:
+    """Build the cache key identifying a detector's results.
+
+    Args:
+        detector_config: Detector configuration dictionary.
+
+    Returns:
+        Key of the form "<type>:<model_name>:<config hash>".
+    """
+    relevant = {
+        key: value
+        for key, value in detector_config.items()
+        if key not in _NON_RESULT_CONFIG_KEYS
+    }
+    config_hash = hashlib.sha256(
+        json.dumps(relevant, sort_keys=True, default=str).encode()
+    ).hexdigest()[:16]
+    return (
+        f"{detector_config.get('type', '')}:"
+        f"{detector_config.get('model_name', '')}:{config_hash}"
+    )
+
+
+def _timecode_key(timecode: float) -> int:
+    """Convert a frame timecode to its integer millisecond cache key."""
+    return int(round(timecode * 1000))
+
+
+class DetectionCache:
+    """SQLite-backed store of per-frame detection results and transcripts.
+
+    Safe to share between processes: the database uses WAL journaling and
+    a busy timeout so concurrent analysis workers can write to it.
+
+    Attributes:
+        cache_path: Path to the SQLite database file.
+    """
+
+    def __init__(self, cache_path: str) -> None:
+        """Open (and create if needed) the cache database.
+
+        Args:
+            cache_path: Path to the SQLite database file.
+        """
+        self.cache_path = Path(cache_path)
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.cache_path), timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS frame_results ("
+            " video_fingerprint TEXT NOT NULL,"
+            " detector_key TEXT NOT NULL,"
+            " timecode_ms INTEGER NOT NULL,"
+            " results TEXT NOT NULL,"
+            " PRIMARY KEY (video_fingerprint, detector_key, timecode_ms))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS transcripts ("
+            " audio_fingerprint TEXT NOT NULL,"
+            " transcriber_key TEXT NOT NULL,"
+            " transcript TEXT NOT NULL,"
+            " PRIMARY KEY (audio_fingerprint, transcriber_key))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS activity_levels ("
+            " audio_fingerprint TEXT NOT NULL,"
+            " frame_ms INTEGER NOT NULL,"
+            " duration REAL NOT NULL,"
+            " rms BLOB NOT NULL,"
+            " PRIMARY KEY (audio_fingerprint, frame_ms))"
+        )
+        self._conn.commit()
+        logger.debug(f"Opened detection cache: {self.cache_path}")
+
+    def get_frame_results(
+        self,
+        video_fingerprint: str,
+        detector_key: str,
+        timecodes: Sequence[float],
+    ) -> List[Optional[List[DetectionResult]]]:
+        """Look up cached results for frames.
+
+        Args:
+            video_fingerprint: Namespace from frame_cache_namespace().
+            detector_key: Key from detector_cache_key().
+            timecodes: Frame timecodes in seconds.
+
+        Returns:
+            One entry per timecode: the cached DetectionResult list, or None
+            if the frame has not been analyzed by this detector.
+        """
+        keys = [_timecode_key(t) for t in timecodes]
+        found: Dict[int, str] = {}
+
+        for start in range(0, len(keys), _LOOKUP_CHUNK):
+            chunk = keys[start:start + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                "SELECT timecode_ms, results FROM frame_results "
+                "WHERE video_fingerprint = ? AND detector_key = ? "
+                f"AND timecode_ms IN ({placeholders})",
+                (video_fingerprint, detector_key, *chunk),
+            )
+            found.update(rows)
+
+        return [
+            [DetectionResult(**item) for item in json.loads(found[key])]
+            if key in found
+            else None
+            for key in keys
+        ]
+
+    def put_frame_results(
+        self,
+        video_fingerprint: str,
+        detector_key: str,
+        frame_results: Sequence[Tuple[float, List[DetectionResult]]],
+    ) -> None:
+        """Store results for analyzed frames.
+
+        Args:
+            video_fingerprint: Namespace from frame_cache_namespace().
+            detector_key: Key from detector_cache_key().
+            frame_results: (timecode, results) pairs; frames with no
+                detections are stored too so they are not re-analyzed.
+        """
+        rows = [
+            (
+                video_fingerprint,
+                detector_key,
+                _timecode_key(timecode),
+                json.dumps([asdict(r) for r in results], default=str),
+            )
+            for timecode, results in frame_results
+        ]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO frame_results VALUES (?, ?, ?, ?)", rows
+            )
+
+    def get_transcript(
+        self, audio_fingerprint: str, transcriber_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a cached transcript.
+
+        Args:
+            audio_fingerprint: Fingerprint from compute_audio_fingerprint().
+            transcriber_key: Identifier of the model and transcription settings.
+
+        Returns:
+            The stored transcript, or None if not cached.
+        """
+        row = self._conn.execute(
+            "SELECT transcript FROM transcripts "
+            "WHERE audio_fingerprint = ? AND transcriber_key = ?",
+            (audio_fingerprint, transcriber_key),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_transcript(
+        self,
+        audio_fingerprint: str,
+        transcriber_key: str,
+        transcript: Dict[str, Any],
+    ) -> None:
+        """Store a transcript.
+
+        Args:
+            audio_fingerprint: Fingerprint from compute_audio_fingerprint().
+            transcriber_key: Identifier of the model and transcription settings.
+            transcript: JSON-serializable transcript (text and word chunks).
+        """
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?)",
+                (audio_fingerprint, transcriber_key, json.dumps(transcript, default=str)),
+            )
+
+    def get_activity_index(
+        self, audio_fingerprint: str, frame_seconds: float
+    ) -> Optional[AudioActivityIndex]:
+        """Look up a cached audio activity index.
+
+        Args:
+            audio_fingerprint: Fingerprint from compute_audio_fingerprint().
+            frame_seconds: Frame length the index was built with.
+
+        Returns:
+            The stored index, or None if not cached.
+        """
+        row = self._conn.execute(
+            "SELECT duration, rms FROM activity_levels "
+            "WHERE audio_fingerprint = ? AND frame_ms = ?",
+            (audio_fingerprint, _timecode_key(frame_seconds)),
+        ).fetchone()
+        if row is None:
+            return None
+
+        duration, rms = row
+        return AudioActivityIndex(
+            np.frombuffer(rms, dtype="<f4"), duration, frame_seconds
+        )
+
+    def put_activity_index(
+        self, audio_fingerprint: str, index: AudioActivityIndex
+    ) -> None:
+        """Store an audio activity index.
+
+        Args:
+            audio_fingerprint: Fingerprint from compute_audio_fingerprint().
+            index: Index built from that audio.
+        """
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO activity_levels VALUES (?, ?, ?, ?)",
+                (
+                    audio_fingerprint,
+                    _timecode_key(index.frame_seconds),
+                    index.duration,
+                    index.rms.astype("<f4").tobytes(),
+                ),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "DetectionCache":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
@@ -16,6 +16,22 @@ logger = logging.getLogger(__name__)
 TRACE_LEVEL = 5
 
 
+def _pooled_features(output: Any) -> Any:
+    """Return projected embeddings from a CLIP get_*_features() call.
+
+    Newer transformers releases return a model output whose pooler_output
+    holds the projected embeddings; older releases return the tensor itself.
+
+    Args:
+        output: Return value of get_text_features() or get_image_features().
+
+    Returns:
+        Embedding tensor of shape (batch, embed_dim).
+    """
+    pooled = getattr(output, "pooler_output", None)
+    return pooled if pooled is not None else output
+
+
 class CLIPDetector(Detector):
     """CLIP-based detector using OpenAI's Contrastive Language-Image Pre-training.
 
@@ -37,6 +53,7 @@ class CLIPDetector(Detector):
               - confidence_threshold: Minimum confidence to report detection (default: 0.5, range: 0.0-1.0)
               - prompts: List of dicts with 'category' and 'text' (list of strings)
               - device: Optional device override ("cuda", "mps", "cpu")
+              - batch_size: Frames per forward pass in detect_batch() (default: 1)
 
         Raises:
             ValueError: If model not found, dependencies missing, or config invalid.
@@ -67,6 +84,13 @@ class CLIPDetector(Detector):
         self.processor = None
         self.model, self.processor = self._load_model()
 
+        # Cached prompt embeddings and prompt→category layout (see
+        # _get_text_embeddings)
+        self._text_embeddings = None
+        self._logit_scale = 1.0
+        self._prompt_categories: List[str] = []
+        self._prompt_category_starts = np.zeros(0, dtype=np.intp)
+
         logger.info(
             f"Initialized CLIP detector '{self.name}' with model '{self.model_name}' "
             f"on device '{self.device}' (threshold={self.confidence_threshold}) "
@@ -216,127 +240,205 @@ class CLIPDetector(Detector):
         Raises:
             ValueError: If frame_data is None or invalid.
         """
-        if frame_data is None:
-            raise ValueError("CLIP detector requires frame_data (numpy array)")
+        try:
+            return self.detect_batch([frame_data])[0]
+        except RuntimeError as e:
+            logger.error(f"{e}. Detector '{self.name}' skipped for this frame.")
+            return []
 
-        if not isinstance(frame_data, np.ndarray):
-            raise ValueError(
-                f"frame_data must be numpy array, got {type(frame_data)}"
-            )
+    def detect_batch(
+        self,
+        frames_data: List[np.ndarray],
+    ) -> List[List[DetectionResult]]:
+        """Analyze a batch of frames with a single CLIP forward pass.
 
-        if len(frame_data.shape) != 3 or frame_data.shape[2] != 3:
-            raise ValueError(
-                f"frame_data must have shape (height, width, 3), got {frame_data.shape}"
-            )
+        Args:
+            frames_data: List of frame pixel arrays (BGR format).
 
-        try:
-            # Convert BGR to RGB
-            height, width = frame_data.shape[:2]
-            logger.log(
-                TRACE_LEVEL,
-                f"[{self.name}] Converting frame BGR→RGB ({width}x{height}, "
-                f"{frame_data.nbytes / 1024:.1f}KB)"
-            )
-            rgb_frame = cv2.cvtColor(frame_data, cv2.COLOR_BGR2RGB)
+        Returns:
+            List with one list of DetectionResult per frame (may be empty).
 
-            # Convert to PIL Image
+        Raises:
+            ValueError: If any frame is None or invalid.
+            RuntimeError: If inference fails (e.g. out of memory). No results
+                are returned, so a failed batch is never mistaken for frames
+                without detections.
+        """
+        for frame_data in frames_data:
+            self._validate_frame(frame_data)
+
+        try:
             from PIL import Image
+            import torch
 
-            pil_image = Image.fromarray(rgb_frame)
-            logger.log(
-                TRACE_LEVEL,
-                f"[{self.name}] Converted to PIL Image mode={pil_image.mode} "
-                f"size={pil_image.size}"
-            )
+            pil_images = []
+            for frame_data in frames_data:
+                height, width = frame_data.shape[:2]
+                logger.log(
+                    TRACE_LEVEL,
+                    f"[{self.name}] Converting frame BGR→RGB ({width}x{height}, "
+                    f"{frame_data.nbytes / 1024:.1f}KB)"
+                )
+                rgb_frame = cv2.cvtColor(frame_data, cv2.COLOR_BGR2RGB)
+                pil_images.append(Image.fromarray(rgb_frame))
 
-            # Prepare all candidate prompts
-            all_prompts = []
-            prompt_to_category = {}  # Map prompt text to category
-            for category, candidate_texts in self.prompts_dict.items():
-                for text in candidate_texts:
-                    all_prompts.append(text)
-                    prompt_to_category[text] = category
+            # Prompt embeddings are computed once and reused for every frame
+            text_embeddings = self._get_text_embeddings()
 
             logger.log(
                 TRACE_LEVEL,
-                f"[{self.name}] Prepared {len(all_prompts)} prompt candidates "
-                f"across {len(self.prompts_dict)} categories"
-            )
-
-            # Process image and text with CLIP
-            logger.log(TRACE_LEVEL, f"[{self.name}] Processing with CLIP processor...")
-            inputs = self.processor(
-                text=all_prompts,
-                images=pil_image,
-                return_tensors="pt",
-                padding=True,
+                f"[{self.name}] Processing batch of {len(pil_images)} frame(s) "
+                f"with CLIP processor..."
             )
+            inputs = self.processor(images=pil_images, return_tensors="pt")
 
             # Move inputs to device
             logger.log(TRACE_LEVEL, f"[{self.name}] Moving inputs to {self.device}...")
             inputs = {k: v.to(self.device) if hasattr(v, "to") else v for k, v in inputs.items()}
 
-            # Run inference
+            # Run image encoder only; similarity is a single matmul against
+            # the cached, L2-normalized prompt matrix
             logger.log(
                 TRACE_LEVEL,
-                f"[{self.name}] Running inference on {self.model_name} ({self.device})..."
+                f"[{self.name}] Running image encoder on {self.model_name} ({self.device})..."
             )
             try:
-                with __import__("torch").no_grad():
-                    outputs = self.model(**inputs)
+                with torch.no_grad():
+                    image_embeddings = _pooled_features(
+                        self.model.get_image_features(pixel_values=inputs["pixel_values"])
+                    )
+                    image_embeddings = image_embeddings / image_embeddings.norm(
+                        dim=-1, keepdim=True
+                    )
+                    logits_per_image = self._logit_scale * (
+                        image_embeddings @ text_embeddings.T
+                    )
             except RuntimeError as e:
                 if "out of memory" in str(e).lower():
-                    logger.error(
-                        f"CLIP inference failed (out of memory): {e}. "
-                        f"Detector '{self.name}' skipped for this frame."
-                    )
-                    return []
+                    raise RuntimeError(
+                        f"CLIP inference failed (out of memory): {e}"
+                    ) from e
                 raise
 
-            # Extract logits and compute similarities
-            logits_per_image = outputs.logits_per_image
             logger.log(
                 TRACE_LEVEL,
-                f"[{self.name}] Got logits shape: {logits_per_image.shape}"
+                f"[{self.name}] Got logits shape: {tuple(logits_per_image.shape)}"
             )
 
             # Convert logits to probabilities via softmax
-            import torch
             probs = torch.nn.functional.softmax(logits_per_image, dim=-1)
+            probs = probs.float().cpu().numpy()
+
+            # Aggregate by category (max similarity per category). Prompts are
+            # stored contiguously per category, so a segmented max suffices.
+            scores = np.maximum.reduceat(probs, self._prompt_category_starts, axis=1)
+
+            batch_results = []
+            for image_scores in scores:
+                category_scores = {
+                    category: float(score)
+                    for category, score in zip(self._prompt_categories, image_scores)
+                }
+
+                logger.log(
+                    TRACE_LEVEL,
+                    f"[{self.name}] Category scores: {category_scores}"
+                )
 
-            # Aggregate by category (max similarity per category)
-            category_scores = {}
-            for i, prompt_text in enumerate(all_prompts):
-                category = prompt_to_category[prompt_text]
-                score = float(probs[0, i].cpu().item())
+                # Create DetectionResult for each category with non-zero confidence
+                results = self._create_detection_results(category_scores)
 
-                # Keep max score per category
-                if category not in category_scores:
-                    category_scores[category] = score
-                else:
-                    category_scores[category] = max(category_scores[category], score)
+                if results:
+                    logger.debug(
+                        f"CLIP detected {len(results)} categories: "
+                        f"{[r.label for r in results]}"
+                    )
+                batch_results.append(results)
 
-            logger.log(
-                TRACE_LEVEL,
-                f"[{self.name}] Category scores: {category_scores}"
-            )
+            return batch_results
+
+        except Exception as e:
+            if isinstance(e, (ValueError, RuntimeError)):
+                raise
+            raise RuntimeError(f"Unexpected error during CLIP inference: {e}") from e
 
-            # Create DetectionResult for each category with non-zero confidence
-            results = self._create_detection_results(category_scores)
+    def _get_text_embeddings(self) -> Any:
+        """Get L2-normalized prompt embeddings, encoding them on first use.
 
-            if results:
-                logger.debug(
-                    f"CLIP detected {len(results)} categories: "
-                    f"{[r.label for r in results]}"
+        All prompt texts are run through the text encoder once per detector.
+        Also builds the prompt→category layout used to aggregate scores.
+
+        Returns:
+            Tensor of shape (num_prompts, embed_dim) on the detector device.
+        """
+        if self._text_embeddings is not None:
+            return self._text_embeddings
+
+        import torch
+
+        all_prompts: List[str] = []
+        categories: List[str] = []
+        starts: List[int] = []
+        for category, candidate_texts in self.prompts_dict.items():
+            if not candidate_texts:
+                continue
+            categories.append(category)
+            starts.append(len(all_prompts))
+            all_prompts.extend(candidate_texts)
+
+        logger.log(
+            TRACE_LEVEL,
+            f"[{self.name}] Encoding {len(all_prompts)} prompt candidates "
+            f"across {len(categories)} categories"
+        )
+
+        text_inputs = self.processor(
+            text=all_prompts,
+            return_tensors="pt",
+            padding=True,
+        )
+        text_inputs = {
+            k: v.to(self.device) if hasattr(v, "to") else v
+            for k, v in text_inputs.items()
+        }
+        with torch.no_grad():
+            text_embeddings = _pooled_features(
+                self.model.get_text_features(
+                    input_ids=text_inputs["input_ids"],
+                    attention_mask=text_inputs.get("attention_mask"),
                 )
+            )
+            text_embeddings = text_embeddings / text_embeddings.norm(
+                dim=-1, keepdim=True
+            )
+            self._logit_scale = float(self.model.logit_scale.exp().item())
 
-            return results
+        self._prompt_categories = categories
+        self._prompt_category_starts = np.array(starts, dtype=np.intp)
+        self._text_embeddings = text_embeddings
+        return self._text_embeddings
 
-        except Exception as e:
-            if isinstance(e, ValueError):
-                raise
-            logger.error(f"Unexpected error during CLIP inference: {e}")
-            return []
+    def _validate_frame(self, frame_data: Optional[np.ndarray]) -> None:
+        """Validate a frame passed to detect() or detect_batch().
+
+        Args:
+            frame_data: Frame pixel data to validate.
+
+        Raises:
+            ValueError: If frame_data is None or invalid.
+        """
+        if frame_data is None:
+            raise ValueError("CLIP detector requires frame_data (numpy array)")
+
+        if not isinstance(frame_data, np.ndarray):
+            raise ValueError(
+                f"frame_data must be numpy array, got {type(frame_data)}"
+            )
+
+        if len(frame_data.shape) != 3 or frame_data.shape[2] != 3:
+            raise ValueError(
+                f"frame_data must have shape (height, width, 3), got {frame_data.shape}"
+            )
 
     def _create_detection_results(self, category_scores: Dict[str, float]) -> List[DetectionResult]:
         """Convert category scores to DetectionResult objects.
@@ -380,6 +482,7 @@ class CLIPDetector(Detector):
                 self.model = None
 
             self.processor = None
+            self._text_embeddings = None
 
             # Clear CUDA cache if available
             try:
@@ -38,6 +38,7 @@ class LLaVADetector(Detector):
               - model_path: Optional custom model cache path (default: HF cache)
               - prompt_file: Path to prompt template file (default: "./prompts/llava-detector.txt")
               - device: Optional device override ("cuda", "mps", "cpu")
+              - batch_size: Frames per generate() call in detect_batch() (default: 1)
 
         Raises:
             ValueError: If model not found, dependencies missing, or prompt file invalid.
@@ -173,6 +174,69 @@ class LLaVADetector(Detector):
         Returns:
             List of DetectionResult for detected categories (may be empty).
 
+        Raises:
+            ValueError: If frame_data is None or invalid.
+        """
+        self._validate_frame(frame_data)
+
+        try:
+            return self._run_inference([frame_data])[0]
+        except RuntimeError as e:
+            if "out of memory" in str(e).lower():
+                logger.error(
+                    f"LLaVA inference failed (out of memory): {e}. "
+                    f"Detector '{self.name}' skipped for this frame."
+                )
+                return []
+            raise
+        except Exception as e:
+            if isinstance(e, ValueError):
+                raise
+            logger.error(f"Unexpected error during LLaVA inference: {e}")
+            return []
+
+    def detect_batch(
+        self,
+        frames_data: List[np.ndarray],
+    ) -> List[List[DetectionResult]]:
+        """Analyze a batch of frames with a single batched generate() call.
+
+        Args:
+            frames_data: List of frame pixel arrays (BGR format).
+
+        Returns:
+            List with one list of DetectionResult per frame (may be empty).
+
+        Raises:
+            ValueError: If any frame is None or invalid.
+            RuntimeError: If inference fails (e.g. out of memory). No results
+                are returned, so a failed batch is never mistaken for frames
+                without detections.
+        """
+        for frame_data in frames_data:
+            self._validate_frame(frame_data)
+
+        try:
+            return self._run_inference(frames_data)
+        except RuntimeError as e:
+            if "out of memory" in str(e).lower():
+                raise RuntimeError(
+                    f"LLaVA inference failed (out of memory): {e}"
+                ) from e
+            raise
+        except Exception as e:
+            if isinstance(e, ValueError):
+                raise
+            raise RuntimeError(
+                f"Unexpected error during LLaVA batch inference: {e}"
+            ) from e
+
+    def _validate_frame(self, frame_data: Optional[np.ndarray]) -> None:
+        """Validate a frame passed to detect() or detect_batch().
+
+        Args:
+            frame_data: Frame pixel data to validate.
+
         Raises:
             ValueError: If frame_data is None or invalid.
         """
@@ -189,8 +253,29 @@ class LLaVADetector(Detector):
                 f"frame_data must have shape (height, width, 3), got {frame_data.shape}"
             )
 
-        try:
-            # Convert BGR to RGB
+    def _run_inference(
+        self,
+        frames_data: List[np.ndarray],
+    ) -> List[List[DetectionResult]]:
+        """Run LLaVA on validated frames and parse one response per frame.
+
+        Shared by detect() and detect_batch(). A single frame is tokenized
+        and decoded unpadded; larger batches use one left-padded generate()
+        call.
+
+        Args:
+            frames_data: Validated frame pixel arrays (BGR format).
+
+        Returns:
+            List with one list of DetectionResult per frame (may be empty).
+
+        Raises:
+            RuntimeError: If generation fails (including out of memory).
+        """
+        from PIL import Image
+
+        pil_images = []
+        for frame_data in frames_data:
             height, width = frame_data.shape[:2]
             logger.log(
                 TRACE_LEVEL,
@@ -198,22 +283,17 @@ class LLaVADetector(Detector):
                 f"{frame_data.nbytes / 1024:.1f}KB)"
             )
             rgb_frame = cv2.cvtColor(frame_data, cv2.COLOR_BGR2RGB)
+            pil_images.append(Image.fromarray(rgb_frame))
 
-            # Convert to PIL Image
-            from PIL import Image
-
-            pil_image = Image.fromarray(rgb_frame)
-            logger.log(
-                TRACE_LEVEL,
-                f"[{self.name}] Converted to PIL Image mode={pil_image.mode} "
-                f"size={pil_image.size}"
-            )
-
-            # Prepare inputs for LLaVA
-            logger.log(TRACE_LEVEL, f"[{self.name}] Tokenizing input with processor...")
+        # Prepare inputs for LLaVA
+        logger.log(
+            TRACE_LEVEL,
+            f"[{self.name}] Tokenizing {len(pil_images)} frame(s) with processor..."
+        )
+        if len(pil_images) == 1:
             inputs = self.processor(
                 text=self.prompt_template,
-                images=pil_image,
+                images=pil_images[0],
                 return_tensors="pt",
             )
             input_tokens = inputs.get("input_ids", [[]])[0]
@@ -221,71 +301,80 @@ class LLaVADetector(Detector):
                 TRACE_LEVEL,
                 f"[{self.name}] Tokenized: {len(input_tokens)} tokens"
             )
+        else:
+            # Decoder-only generation requires left padding for batched prompts
+            tokenizer = getattr(self.processor, "tokenizer", None)
+            if tokenizer is not None:
+                tokenizer.padding_side = "left"
+            inputs = self.processor(
+                text=[self.prompt_template] * len(pil_images),
+                images=pil_images,
+                return_tensors="pt",
+                padding=True,
+            )
 
-            # Move inputs to device
-            logger.log(TRACE_LEVEL, f"[{self.name}] Moving inputs to {self.device}...")
-            inputs = {k: v.to(self.device) if hasattr(v, "to") else v for k, v in inputs.items()}
+        # Move inputs to device
+        logger.log(TRACE_LEVEL, f"[{self.name}] Moving inputs to {self.device}...")
+        inputs = {k: v.to(self.device) if hasattr(v, "to") else v for k, v in inputs.items()}
 
-            # Run inference
-            logger.log(
-                TRACE_LEVEL,
-                f"[{self.name}] Running inference on {self.model_name} ({self.device})..."
-            )
-            try:
-                outputs = self.model.generate(
-                    **inputs,
-                    max_new_tokens=512,
-                    temperature=0.7,
-                )
-            except RuntimeError as e:
-                if "out of memory" in str(e).lower():
-                    logger.error(
-                        f"LLaVA inference failed (out of memory): {e}. "
-                        f"Detector '{self.name}' skipped for this frame."
-                    )
-                    return []
-                raise
+        # Run inference
+        logger.log(
+            TRACE_LEVEL,
+            f"[{self.name}] Running inference on {self.model_name} ({self.device})..."
+        )
+        outputs = self.model.generate(
+            **inputs,
+            max_new_tokens=512,
+            temperature=0.7,
+        )
 
+        # Decode responses
+        if len(pil_images) == 1:
             output_tokens = len(outputs[0])
             logger.log(
                 TRACE_LEVEL,
                 f"[{self.name}] Inference complete: generated {output_tokens} tokens"
             )
-
-            # Decode response
-            response = self.processor.decode(outputs[0], skip_special_tokens=True)
+            responses = [self.processor.decode(outputs[0], skip_special_tokens=True)]
             logger.log(
                 TRACE_LEVEL,
-                f"[{self.name}] Decoded response ({len(response)} chars)"
+                f"[{self.name}] Decoded response ({len(responses[0])} chars)"
             )
+        else:
+            responses = self.processor.batch_decode(outputs, skip_special_tokens=True)
 
-            # Parse JSON response
-            try:
-                result_dict = self._parse_response(response)
-            except json.JSONDecodeError:
-                logger.warning(
-                    f"LLaVA response not valid JSON. Raw response:\n{response}\n"
-                    f"Detector '{self.name}' returned no results for this frame."
-                )
-                return []
-
-            # Convert to DetectionResult objects
-            results = self._create_detection_results(result_dict)
+        return [self._results_from_response(response) for response in responses]
 
-            if results:
-                logger.debug(
-                    f"LLaVA detected {len(results)} categories: "
-                    f"{[r.label for r in results]}"
-                )
+    def _results_from_response(self, response: str) -> List[DetectionResult]:
+        """Parse a decoded LLaVA response into detection results.
 
-            return results
+        Args:
+            response: Decoded response string from LLaVA model.
 
-        except Exception as e:
-            if isinstance(e, (ValueError, RuntimeError)):
-                raise
-            logger.error(f"Unexpected error during LLaVA inference: {e}")
+        Returns:
+            List of DetectionResult (empty if the response is not valid JSON).
+        """
+        # Parse JSON response
+        try:
+            result_dict = self._parse_response(response)
+        except json.JSONDecodeError:
+            logger.warning(
+                f"LLaVA response not valid JSON. Raw response:\n{response}\n"
+                f"Detector '{self.name}' returned no results for this frame."
+            )
             return []
 
+        # Convert to DetectionResult objects
+        results = self._create_detection_results(result_dict)
+
+        if results:
+            logger.debug(
+                f"LLaVA detected {len(results)} categories: "
+                f"{[r.label for r in results]}"
+            )
+
+        return results
+
     def _parse_response(self, response: str) -> Dict[str, Any]:
         """Parse LLaVA response and extract JSON.
 
@@ -0,0 +1,161 @@
+"""Single-pass keyword and phrase matching over a transcribed word stream.
+
+Keyword lists are compiled once into a word-level trie. Each entry is one
+or more words; a word ending in "*" is a stem that matches any word
+starting with it (e.g. "fuck*" matches "fucking"). Scanning a transcript
+touches each word once per in-progress phrase, so the cost grows with the
+transcript length and the longest phrase, not with the number of entries.
+"""
+
+import logging
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Characters removed from keyword entries (as from transcribed words),
+# keeping the "*" stem marker
+_ENTRY_STRIP_PATTERN = re.compile(r"[^\w\s*]")
+
+STEM_MARKER = "*"
+
+
+class PhraseMatch(NamedTuple):
+    """A keyword entry found in a word sequence.
+
+    Attributes:
+        start_index: Index of the first matched word.
+        end_index: Index of the last matched word (inclusive).
+        phrase: The keyword entry as listed (normalized).
+        language: Language of the list the entry came from.
+    """
+
+    start_index: int
+    end_index: int
+    phrase: str
+    language: str
+
+
+class _TrieNode:
+    """Trie node keyed by whole words, with optional stem edges."""
+
+    __slots__ = ("words", "stems", "stem_lengths", "phrase", "language")
+
+    def __init__(self) -> None:
+        self.words: Dict[str, "_TrieNode"] = {}
+        self.stems: Dict[str, "_TrieNode"] = {}
+        self.stem_lengths: List[int] = []
+        self.phrase: Optional[str] = None
+        self.language: Optional[str] = None
+
+    def next_nodes(self, word: str) -> List["_TrieNode"]:
+        """Children reached by a word through exact and stem edges."""
+        nodes = []
+        child = self.words.get(word)
+        if child is not None:
+            nodes.append(child)
+        for length in self.stem_lengths:
+            if len(word) >= length:
+                child = self.stems.get(word[:length])
+                if child is not None:
+                    nodes.append(child)
+        return nodes
+
+
+class PhraseMatcher:
+    """Compiled matcher for per-language keyword and phrase lists.
+
+    Attributes:
+        phrase_count: Number of distinct entries compiled.
+    """
+
+    def __init__(self, phrases_by_language: Dict[str, Iterable[str]]) -> None:
+        """Compile keyword lists.
+
+        Args:
+            phrases_by_language: Mapping of language code to entries. An
+                entry present in several languages is attributed to the
+                first one.
+        """
+        self._root = _TrieNode()
+        self.phrase_count = 0
+        for language, phrases in phrases_by_language.items():
+            for phrase in phrases:
+                self._add(phrase, language)
+
+    def __len__(self) -> int:
+        """Number of distinct entries compiled."""
+        return self.phrase_count
+
+    def _add(self, phrase: str, language: str) -> None:
+        """Insert one entry into the trie."""
+        tokens = _ENTRY_STRIP_PATTERN.sub("", phrase.lower()).split()
+        if not tokens:
+            return
+
+        node = self._root
+        for token in tokens:
+            if token.endswith(STEM_MARKER):
+                stem = token.rstrip(STEM_MARKER)
+                if not stem or STEM_MARKER in stem:
+                    logger.warning(f"Ignoring invalid keyword entry '{phrase}'")
+                    return
+                if stem not in node.stems:
+                    node.stems[stem] = _TrieNode()
+                    if len(stem) not in node.stem_lengths:
+                        node.stem_lengths.append(len(stem))
+                node = node.stems[stem]
+            else:
+                if STEM_MARKER in token:
+                    logger.warning(f"Ignoring invalid keyword entry '{phrase}'")
+                    return
+                node = node.words.setdefault(token, _TrieNode())
+
+        if node.phrase is None:
+            node.phrase = " ".join(tokens)
+            node.language = language
+            self.phrase_count += 1
+
+    def find(self, words: Sequence[str]) -> List[PhraseMatch]:
+        """Find all entries in a sequence of cleaned, lowercase words.
+
+        Matches lying entirely inside a longer match (e.g. "bitch" within
+        "son of a bitch") are dropped.
+
+        Args:
+            words: Words in spoken order.
+
+        Returns:
+            Matches ordered by start index.
+        """
+        matches: List[PhraseMatch] = []
+        # (trie node, index of the phrase's first word) per partial match
+        active: List[tuple] = []
+
+        for index, word in enumerate(words):
+            advanced = []
+            for node, start in active + [(self._root, index)]:
+                for child in node.next_nodes(word):
+                    if child.phrase is not None:
+                        matches.append(
+                            PhraseMatch(start, index, child.phrase, child.language)
+                        )
+                    if child.words or child.stems:
+                        advanced.append((child, start))
+            active = advanced
+
+        return _drop_contained(matches)
+
+
+def _drop_contained(matches: List[PhraseMatch]) -> List[PhraseMatch]:
+    """Remove matches whose word range lies inside another match."""
+    # Longest first among matches starting at the same word
+    ordered = sorted(matches, key=lambda m: (m.start_index, -m.end_index))
+    kept: List[PhraseMatch] = []
+    furthest_end = -1
+    for match in ordered:
+        if match.end_index <= furthest_end:
+            continue
+        kept.append(match)
+        furthest_end = match.end_index
+    return kept
@@ -4,14 +4,26 @@ Orchestrates video extraction, frame sampling, detection pipeline execution,
 and result aggregation.
 """
 
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
 import subprocess
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import closing
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Generator, List, NamedTuple, Optional, Tuple
 
+from video_censor_personal.checkpoint import AnalysisCheckpoint, CheckpointState
 from video_censor_personal.detection import DetectionPipeline, get_detector_registry
-from video_censor_personal.frame import DetectionResult
+from video_censor_personal.detection_cache import (
+    DetectionCache,
+    compute_video_fingerprint,
+    frame_cache_namespace,
+)
+from video_censor_personal.frame import DetectionResult, Frame
 from video_censor_personal.model_manager import ModelManager, ModelDownloadError
 from video_censor_personal.output import generate_json_output, merge_segments
 from video_censor_personal.progress import DebugOutput, VideoProgressBar
@@ -20,7 +32,7 @@ from video_censor_personal.segments_loader import (
     segments_to_detections,
     SegmentsLoadError,
 )
-from video_censor_personal.video_extraction import VideoExtractor
+from video_censor_personal.video_extraction import VideoExtractor, prefetch_frames
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +63,10 @@ class AnalysisPipeline:
         log_level: str = "INFO",
         config_file: Optional[str] = None,
         segment_file: Optional[str] = None,
+        detection_cache_path: Optional[str] = None,
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False,
+        allow_all_segments: bool = False,
     ) -> None:
         """Initialize the analysis pipeline.
 
@@ -63,6 +79,13 @@ class AnalysisPipeline:
             log_level: Logging level (INFO, DEBUG, TRACE).
             config_file: Optional path to the config file being used (for metadata tracking).
             segment_file: Optional path to the segment file being used (for metadata tracking).
+            detection_cache_path: Default detection cache location, used when
+                the cache is enabled without processing.detection_cache.path.
+            checkpoint_path: Optional path of an append-only checkpoint file.
+                If set, analysis progress is checkpointed there.
+            resume: If True, continue from the checkpoint at checkpoint_path.
+            allow_all_segments: If True, detected segments are marked as
+                allowed in the output, so no skip chapters are written for them.
 
         Raises:
             FileNotFoundError: If video file does not exist.
@@ -85,6 +108,18 @@ class AnalysisPipeline:
         # Metadata tracking for remediation
         self.config_file = config_file
         self.segment_file = segment_file
+        self.allow_all_segments = allow_all_segments
+
+        # Persistent per-frame detection cache (opened during analyze())
+        self.detection_cache_path = detection_cache_path
+        self._detection_cache: Optional[DetectionCache] = None
+        self._video_fingerprint: Optional[str] = None
+
+        # Resumable analysis checkpoint (opened during analyze())
+        self.checkpoint_path = checkpoint_path
+        self.resume = resume
+        self._checkpoint: Optional[AnalysisCheckpoint] = None
+        self._frame_checkpoints_stopped = False
 
         # Prepare detector configuration
         detector_configs = detector_list or config.get("detectors")
@@ -324,8 +359,14 @@ class AnalysisPipeline:
             self.debug_output.detail("Sample rate", f"{sample_rate} seconds")
             self.debug_output.detail("Estimated frames to analyze", estimated_frames)
 
+            # Open checkpoint and recover state from an interrupted run
+            resume_state = self._start_checkpoint()
+            resume_from = (
+                resume_state.last_timecode if resume_state is not None else None
+            )
+
             # Extract audio once for all detectors
-            # Keep original audio for remediation; use downsampled copy for detection
+            # Keep original audio for remediation; use the 16kHz mono track for detection
             audio_data_original = None
             audio_sample_rate_original = None
             audio_data_for_detection = None
@@ -335,78 +376,37 @@ class AnalysisPipeline:
             
             if has_detectors:
                 try:
-                    audio_segment = self.extractor.extract_audio()
+                    audio_segment = self.extractor.extract_audio(
+                        include_detection_track=True
+                    )
                     audio_data_original = audio_segment.data
                     audio_sample_rate_original = audio_segment.sample_rate
                     logger.debug(
                         f"Extracted audio: {audio_segment.duration():.2f} seconds, "
                         f"sample rate: {audio_sample_rate_original} Hz"
                     )
-                except Exception as e:
-                    logger.warning(f"Failed to extract audio (continuing without it): {e}")
 
-            # Convert audio to numpy array if needed
-            if audio_data_original is not None:
-                try:
-                    import numpy as np
-                    import soundfile as sf
-                    import io
-                    import librosa
-                    
-                    # If audio_data is bytes (from WAV file), convert to numpy
-                    if isinstance(audio_data_original, bytes):
-                        audio_np, sr = sf.read(
-                            io.BytesIO(audio_data_original),
-                            dtype='float32'
-                        )
-                        audio_sample_rate_original = sr
-                        
-                        # Log channel count
-                        if len(audio_np.shape) > 1:
-                            num_channels = audio_np.shape[1]
-                            logger.debug(f"Audio has {num_channels} channels")
-                        else:
-                            logger.debug("Audio is mono")
-                    else:
-                        audio_np = audio_data_original
-                    
-                    # Keep original multi-channel audio for remediation
-                    audio_data_original = audio_np
-                    
-                    # For detection: downsample to 16kHz and convert to mono
-                    # Whisper and audio classification models expect 16kHz mono
-                    audio_for_detection = audio_np
-                    
-                    # Convert to mono if needed
-                    if len(audio_for_detection.shape) > 1:
-                        logger.debug(
-                            f"Converting {audio_for_detection.shape[1]}-channel audio "
-                            f"to mono for detection"
-                        )
-                        audio_for_detection = audio_for_detection.mean(axis=1)
-                    
-                    # Resample to 16kHz if needed
-                    if audio_sample_rate_original and audio_sample_rate_original != 16000:
-                        logger.debug(
-                            f"Downsampling audio from {audio_sample_rate_original} Hz "
-                            f"to 16000 Hz for detection"
-                        )
-                        audio_data_for_detection = librosa.resample(
-                            audio_for_detection,
-                            orig_sr=audio_sample_rate_original,
-                            target_sr=16000
-                        )
-                    else:
-                        audio_data_for_detection = audio_for_detection
-                        
+                    # Whisper and audio classification models expect 16kHz
+                    # mono; ffmpeg downmixes and resamples it while decoding
+                    detection_segment = self.extractor.extract_detection_audio()
+                    audio_data_for_detection = detection_segment.data
                 except Exception as e:
-                    logger.warning(f"Failed to convert audio to numpy: {e}")
+                    logger.warning(f"Failed to extract audio (continuing without it): {e}")
                     audio_data_original = None
                     audio_data_for_detection = None
 
+            # Frame results and speech transcripts from earlier runs
+            self._open_detection_cache()
+
             # Run full-audio detectors once (e.g., speech-profanity)
             # Initialize audio detectors first (lazy loading)
-            if audio_data_for_detection is not None:
+            if resume_state is not None and resume_state.audio_results is not None:
+                logger.info(
+                    f"Restored {len(resume_state.audio_results)} audio detections "
+                    f"from checkpoint"
+                )
+                all_results.extend(resume_state.audio_results)
+            elif audio_data_for_detection is not None:
                 self.debug_output.subsection("Full Audio Analysis")
                 self.detection_pipeline.initialize_audio_detectors()
                 audio_results = self.detection_pipeline.analyze_full_audio(
@@ -416,69 +416,77 @@ class AnalysisPipeline:
                 all_results.extend(audio_results)
                 if audio_results:
                     logger.info(f"Full audio analysis found {len(audio_results)} detections")
+                if self._checkpoint is not None:
+                    self._checkpoint.record_audio(audio_results)
 
                 # Clean up audio detectors to free GPU memory before loading video models
                 logger.debug("Cleaning up audio detectors to free GPU memory")
                 self.detection_pipeline.cleanup_audio_detectors()
 
-            # Initialize frame detectors (lazy loading - after audio cleanup)
-            self.detection_pipeline.initialize_frame_detectors()
-            frame_detectors = self.detection_pipeline.get_frame_detectors()
+            from video_censor_personal.config import (
+                get_max_workers_from_config,
+                is_parallel_analysis_enabled,
+            )
+            max_workers = get_max_workers_from_config(self.config)
+            parallel = is_parallel_analysis_enabled(self.config) and max_workers > 1
+
+            # Initialize frame detectors (lazy loading - after audio cleanup).
+            # In parallel mode each worker process loads its own detectors.
+            if not parallel:
+                self.detection_pipeline.initialize_frame_detectors()
+            has_frame_detectors = bool(
+                self.detection_pipeline.get_frame_detector_configs()
+            )
 
             self.debug_output.subsection("Frame Analysis")
             frame_count = 0
 
-            if not frame_detectors:
+            if not has_frame_detectors:
                 logger.info("No frame-based detectors configured; skipping frame analysis")
+            elif parallel:
+                if resume_from is not None:
+                    logger.info(f"Resuming frame analysis after {resume_from:.2f}s")
+                    all_results.extend(resume_state.frame_results)
+                frame_results, frame_count = self._analyze_frames_parallel(
+                    sample_rate, video_duration, max_workers, resume_from=resume_from
+                )
+                all_results.extend(frame_results)
             else:
+                # Frames are accumulated and dispatched to detectors in batches
+                batch_size = self.detection_pipeline.get_frame_batch_size()
+                logger.debug(f"Frame batch size: {batch_size}")
+                batch: List[Frame] = []
+
+                if resume_from is not None:
+                    logger.info(f"Resuming frame analysis after {resume_from:.2f}s")
+                    all_results.extend(resume_state.frame_results)
+
                 # Create progress bar (disable in TRACE mode to avoid cluttering output)
                 with VideoProgressBar(
                     total_duration=video_duration,
                     description="Analyzing video",
                     disable=self.trace_enabled,
-                ) as progress:
-                    for frame in self.extractor.extract_frames(sample_rate=sample_rate):
-                        try:
-                            frame_count += 1
-                            logger.debug(f"Analyzing frame {frame.index} at {frame.timestamp_str()}")
-                            
-                            # Update progress bar
-                            progress.update(frame.timecode)
-
-                            # Run detection pipeline on frame (using downsampled audio for detection)
-                            results = self.detection_pipeline.analyze_frame(
-                                frame,
-                                audio_data=audio_data_for_detection
-                            )
-                            all_results.extend(results)
-
-                            # Trace output for frame (only in TRACE mode)
-                            if self.trace_enabled:
-                                self.debug_output.frame_info(
-                                    frame.index,
-                                    frame.timecode,
-                                    len(results),
-                                )
-                                for result in results:
-                                    self.debug_output.detector_result(
-                                        getattr(result, 'detector_name', None) or "unknown",
-                                        result.label,
-                                        result.confidence,
-                                    )
-
-                            if results:
-                                logger.debug(
-                                    f"Frame {frame.index}: {len(results)} detection(s) found"
-                                )
-
-                        except Exception as e:
-                            logger.error(
-                                f"Error analyzing frame {frame.index}: {e}",
-                                exc_info=True,
-                            )
-                            self.debug_output.info(f"ERROR on frame {frame.index}: {e}")
-                            # Continue with next frame
+                ) as progress, closing(
+                    self._iter_frames(sample_rate, start_time=resume_from or 0.0)
+                ) as frames:
+                    if resume_from is not None:
+                        progress.update(resume_from)
+
+                    # Closing the iterator stops the prefetch thread before the
+                    # extractor is released, even if a batch raises
+                    for frame in frames:
+                        if resume_from is not None and frame.timecode <= resume_from:
                             continue
+                        frame_count += 1
+                        logger.debug(f"Analyzing frame {frame.index} at {frame.timestamp_str()}")
+                        batch.append(frame)
+
+                        if len(batch) >= batch_size:
+                            all_results.extend(self._analyze_and_checkpoint(batch, progress))
+                            batch = []
+
+                    if batch:
+                        all_results.extend(self._analyze_and_checkpoint(batch, progress))
 
             logger.info(
                 f"Analysis complete: {frame_count} frames analyzed, "
@@ -509,6 +517,9 @@ class AnalysisPipeline:
                     logger.debug("Cleaned up detection pipeline")
                 except Exception as e:
                     logger.error(f"Error cleaning up detection pipeline: {e}")
+            self._close_detection_cache()
+            if self._checkpoint is not None:
+                self._checkpoint.close()
         
         # Post-processing happens AFTER models are unloaded
         # Order is important: audio first (original timings), then video (may shift timings)
@@ -543,6 +554,8 @@ class AnalysisPipeline:
                     video_height=self.extractor.get_video_height() if self.extractor else None,
                     video_duration=self.extractor.get_duration_seconds() if self.extractor else None,
                     merged_segments=merged_segments,
+                    # Allowed segments get no skip chapters
+                    chapter_segments=[] if self.allow_all_segments else None,
                 )
             finally:
                 remediation_manager.cleanup()
@@ -560,8 +573,330 @@ class AnalysisPipeline:
                     logger.error(f"Error closing extractor: {e}")
                 self.extractor = None
 
+        # Analysis completed; the checkpoint is no longer needed
+        if self._checkpoint is not None:
+            self._checkpoint.remove()
+            self._checkpoint = None
+
         return all_results
 
+    def _start_checkpoint(self) -> Optional[CheckpointState]:
+        """Open the analysis checkpoint and load state when resuming.
+
+        Returns:
+            Recovered CheckpointState when resuming from a matching
+            checkpoint, otherwise None.
+        """
+        if self.checkpoint_path is None:
+            if self.resume:
+                logger.warning("--resume requested but no checkpoint path is set")
+            return None
+
+        # Checkpoints are only valid for the same video and analysis settings
+        settings = {
+            "frame_sampling": self.config.get("processing", {}).get("frame_sampling"),
+            "detectors": self._pipeline_config["detectors"],
+        }
+        fingerprint = hashlib.sha256(
+            (
+                compute_video_fingerprint(str(self.video_path))
+                + json.dumps(settings, sort_keys=True, default=str)
+            ).encode()
+        ).hexdigest()
+
+        self._checkpoint = AnalysisCheckpoint(self.checkpoint_path, fingerprint)
+        self._frame_checkpoints_stopped = False
+        state = self._checkpoint.load() if self.resume else None
+        if self.resume and state is None:
+            logger.info("No usable checkpoint found; starting analysis from the beginning")
+
+        self._checkpoint.start(resume=state is not None)
+        self.debug_output.detail("Checkpoint", self.checkpoint_path)
+        return state
+
+    def _analyze_and_checkpoint(
+        self,
+        batch: List[Frame],
+        progress: VideoProgressBar,
+    ) -> List[DetectionResult]:
+        """Analyze a batch of frames and append its results to the checkpoint.
+
+        A batch on which any detector failed ends frame checkpointing; the
+        results it did produce are still returned.
+
+        Args:
+            batch: Frames in timecode order.
+            progress: Progress bar to advance as frames complete.
+
+        Returns:
+            Detection results for all frames in the batch, in frame order.
+        """
+        batch_results, failed = self._analyze_frame_batch(batch, progress)
+        if failed:
+            self._stop_frame_checkpoints()
+        else:
+            self._checkpoint_frames(batch[-1].timecode, batch_results)
+        return batch_results
+
+    def _checkpoint_frames(
+        self, timecode: float, results: List[DetectionResult]
+    ) -> None:
+        """Append analyzed frames to the checkpoint, if one is open.
+
+        Nothing is recorded after _stop_frame_checkpoints(), so the
+        checkpoint always ends before the first frame that failed.
+
+        Args:
+            timecode: Timecode of the last analyzed frame.
+            results: Detection results for the frames since the last record.
+        """
+        if self._checkpoint is not None and not self._frame_checkpoints_stopped:
+            self._checkpoint.record_frames(timecode, results)
+
+    def _stop_frame_checkpoints(self) -> None:
+        """Stop checkpointing frames after a failed batch.
+
+        The checkpoint is a contiguous prefix of the timeline: recording
+        later frames would make --resume skip the failed ones.
+        """
+        if self._checkpoint is not None and not self._frame_checkpoints_stopped:
+            logger.warning(
+                "Frame analysis failed; later frames are left out of the "
+                "checkpoint so a resumed run analyzes them again"
+            )
+        self._frame_checkpoints_stopped = True
+
+    def _analyze_frame_batch(
+        self,
+        batch: List[Frame],
+        progress: VideoProgressBar,
+    ) -> Tuple[List[DetectionResult], bool]:
+        """Run frame detectors on a batch of frames and report per-frame output.
+
+        Args:
+            batch: Frames in timecode order.
+            progress: Progress bar to advance as frames complete.
+
+        Returns:
+            Tuple of (detection results for all frames in the batch in frame
+            order, whether the batch failed in whole or in part).
+        """
+        batch_results: List[DetectionResult] = []
+
+        try:
+            frame_results, failed = self.detection_pipeline.analyze_frames(batch)
+        except Exception as e:
+            logger.error(
+                f"Error analyzing frames {batch[0].index}-{batch[-1].index}: {e}",
+                exc_info=True,
+            )
+            self.debug_output.info(
+                f"ERROR on frames {batch[0].index}-{batch[-1].index}: {e}"
+            )
+            progress.update(batch[-1].timecode)
+            return [], True
+
+        for frame, results in zip(batch, frame_results):
+            progress.update(frame.timecode)
+            batch_results.extend(results)
+
+            # Trace output for frame (only in TRACE mode)
+            if self.trace_enabled:
+                self.debug_output.frame_info(
+                    frame.index,
+                    frame.timecode,
+                    len(results),
+                )
+                for result in results:
+                    self.debug_output.detector_result(
+                        getattr(result, 'detector_name', None) or "unknown",
+                        result.label,
+                        result.confidence,
+                    )
+
+            if results:
+                logger.debug(
+                    f"Frame {frame.index}: {len(results)} detection(s) found"
+                )
+
+        return batch_results, failed
+
+    def _open_detection_cache(self) -> None:
+        """Open the persistent detection cache if enabled in config.
+
+        The cache is attached to the detection pipeline so frames already
+        analyzed by a detector (in an earlier run) skip inference, and
+        audio detectors can reuse cached transcripts.
+        """
+        from video_censor_personal.config import (
+            get_detection_cache_path,
+            get_frame_size_from_config,
+            get_frame_source_from_config,
+            is_detection_cache_enabled,
+        )
+
+        if not is_detection_cache_enabled(self.config):
+            return
+
+        cache_path = (
+            get_detection_cache_path(self.config)
+            or self.detection_cache_path
+            or str(self.video_path.with_suffix(".detections.sqlite"))
+        )
+        self._video_fingerprint = frame_cache_namespace(
+            compute_video_fingerprint(str(self.video_path)),
+            get_frame_source_from_config(self.config),
+            get_frame_size_from_config(self.config),
+        )
+        self._detection_cache = DetectionCache(cache_path)
+        self.detection_pipeline.set_result_cache(
+            self._detection_cache, self._video_fingerprint
+        )
+        logger.info(f"Using detection cache: {cache_path}")
+        self.debug_output.detail("Detection cache", cache_path)
+
+    def _close_detection_cache(self) -> None:
+        """Detach and close the detection cache if open."""
+        if self._detection_cache is None:
+            return
+        if self.detection_pipeline is not None:
+            self.detection_pipeline.set_result_cache(None, None)
+        try:
+            self._detection_cache.close()
+        except Exception as e:
+            logger.error(f"Error closing detection cache: {e}")
+        self._detection_cache = None
+
+    def _iter_frames(
+        self, sample_rate: float, start_time: float = 0.0
+    ) -> Generator[Frame, None, None]:
+        """Iterate sampled frames from the configured frame source.
+
+        See _iter_sampled_frames() for sampling and prefetch behavior.
+
+        Args:
+            sample_rate: Seconds between extracted (candidate) frames.
+            start_time: Seconds to seek to before extracting frames.
+
+        Returns:
+            Generator of Frame objects in timecode order.
+        """
+        return _iter_sampled_frames(
+            self.extractor, self.config, sample_rate, start_time=start_time
+        )
+
+    def _analyze_frames_parallel(
+        self,
+        sample_rate: float,
+        video_duration: float,
+        max_workers: int,
+        resume_from: Optional[float] = None,
+    ) -> Tuple[List[DetectionResult], int]:
+        """Run frame analysis across a pool of worker processes.
+
+        The timeline is split into contiguous time ranges, one per worker.
+        Each worker opens its own VideoExtractor and frame detectors, so
+        model weights are loaded once per worker (memory-mapped safetensors
+        checkpoints share pages through the OS page cache). Results are
+        merged in timeline order, and each range is checkpointed once all
+        ranges before it have completed.
+
+        Args:
+            sample_rate: Seconds between extracted (candidate) frames.
+            video_duration: Video duration in seconds.
+            max_workers: Number of worker processes (time ranges).
+            resume_from: Timecode of the last frame analyzed by an
+                interrupted run; only later frames are analyzed.
+
+        Returns:
+            Tuple of (detection results in timeline order, frames analyzed).
+        """
+        start = resume_from or 0.0
+        ranges = [
+            (start + range_start, None if range_end is None else start + range_end)
+            for range_start, range_end in _split_time_ranges(
+                max(video_duration - start, 0.0), max_workers
+            )
+        ]
+        frame_pipeline_config = {
+            "detectors": self.detection_pipeline.get_frame_detector_configs()
+        }
+        cache_path = (
+            str(self._detection_cache.cache_path)
+            if self._detection_cache is not None
+            else None
+        )
+        # Divide CPU threads between workers to avoid oversubscription
+        num_threads = max(1, (os.cpu_count() or 1) // len(ranges))
+        logger.info(
+            f"Analyzing frames in {len(ranges)} worker process(es) "
+            f"({num_threads} thread(s) each)"
+        )
+
+        range_results: List[Optional[_TimeRangeResult]] = [None] * len(ranges)
+        checkpointed = 0
+        frame_count = 0
+        completed_seconds = start
+
+        with VideoProgressBar(
+            total_duration=video_duration,
+            description="Analyzing video",
+            disable=self.trace_enabled,
+        ) as progress, ProcessPoolExecutor(
+            max_workers=len(ranges),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            if resume_from is not None:
+                progress.update(resume_from)
+            futures = {
+                executor.submit(
+                    _analyze_time_range,
+                    str(self.video_path),
+                    self.config,
+                    frame_pipeline_config,
+                    sample_rate,
+                    start_time,
+                    end_time,
+                    num_threads,
+                    cache_path,
+                    self._video_fingerprint,
+                    resume_from,
+                ): range_index
+                for range_index, (start_time, end_time) in enumerate(ranges)
+            }
+            for future in as_completed(futures):
+                range_index = futures[future]
+                range_result = future.result()
+                range_results[range_index] = range_result
+                frame_count += range_result.frame_count
+
+                # The checkpoint holds a contiguous prefix of the timeline
+                while checkpointed < len(ranges) and range_results[checkpointed] is not None:
+                    done = range_results[checkpointed]
+                    if done.checkpoint_timecode is not None:
+                        self._checkpoint_frames(
+                            done.checkpoint_timecode,
+                            done.results[:done.checkpoint_results],
+                        )
+                    if not done.complete:
+                        self._stop_frame_checkpoints()
+                    checkpointed += 1
+
+                start_time, end_time = ranges[range_index]
+                end_time = video_duration if end_time is None else end_time
+                completed_seconds += end_time - start_time
+                progress.update(completed_seconds)
+                logger.debug(
+                    f"Worker finished {start_time:.2f}-{end_time:.2f}s: "
+                    f"{range_result.frame_count} frames, "
+                    f"{len(range_result.results)} detection(s)"
+                )
+
+        merged_results = [
+            result for range_result in range_results for result in range_result.results
+        ]
+        return merged_results, frame_count
+
     def cleanup(self) -> None:
         """Clean up pipeline resources (extractor, detectors).
 
@@ -615,6 +950,7 @@ class AnalysisRunner:
         log_level: str = "INFO",
         allow_all_segments: bool = False,
         config_file: Optional[str] = None,
+        resume: bool = False,
     ) -> None:
         """Initialize analysis runner.
 
@@ -626,6 +962,8 @@ class AnalysisRunner:
             log_level: Logging level (INFO, DEBUG, TRACE).
             allow_all_segments: If True, mark all detected segments with 'allow: true' in output.
             config_file: Path to config file being used (for metadata tracking).
+            resume: If True, resume analysis from the checkpoint of an
+                interrupted run with the same output path.
         """
         self.video_path = video_path
         self.config = config
@@ -634,6 +972,7 @@ class AnalysisRunner:
         self.log_level = log_level
         self.allow_all_segments = allow_all_segments
         self.config_file = config_file
+        self.resume = resume
         self.trace_enabled = log_level == "TRACE"
         self.debug_output = DebugOutput(enabled=self.trace_enabled)
 
@@ -666,6 +1005,12 @@ class AnalysisRunner:
             output_video_path=self.output_video_path,
             log_level=self.log_level,
             config_file=self.config_file,
+            detection_cache_path=str(
+                Path(output_path).with_suffix(".detections.sqlite")
+            ),
+            checkpoint_path=str(Path(output_path).with_suffix(".checkpoint.jsonl")),
+            resume=self.resume,
+            allow_all_segments=self.allow_all_segments,
         ) as pipeline:
             # Run analysis
             detections = pipeline.analyze()
@@ -698,11 +1043,7 @@ class AnalysisRunner:
                 self.config,
             )
 
-            # Store raw merged segments for skip chapter writing
-            # (before they get formatted as strings in JSON output)
-            output_dict["_raw_merged_segments"] = merged_segments
-
-            # Write output (excluding internal fields like _raw_merged_segments)
+            # Write output (excluding internal fields)
             from video_censor_personal.output import write_output
             output_to_write = {k: v for k, v in output_dict.items() if not k.startswith("_")}
             write_output(output_to_write, output_path, self.config)
@@ -801,22 +1142,24 @@ class RemediationRunner:
         audio_data_original = None
         audio_sample_rate_original = None
         
+        # The extractor stays open until remediation is done: the decoded
+        # audio is memory-mapped from a scratch file that close() removes
+        audio_extractor = None
         audio_remediation_config = self.config.get("remediation", {}).get("audio", {})
         if audio_remediation_config.get("enabled", False):
             try:
-                extractor = VideoExtractor(str(self.video_path))
-                try:
-                    audio_segment = extractor.extract_audio()
-                    audio_data_original = audio_segment.data
-                    audio_sample_rate_original = audio_segment.sample_rate
-                    logger.debug(
-                        f"Extracted audio: {audio_segment.duration():.2f} seconds, "
-                        f"sample rate: {audio_sample_rate_original} Hz"
-                    )
-                finally:
-                    extractor.close()
+                audio_extractor = VideoExtractor(str(self.video_path))
+                audio_segment = audio_extractor.extract_audio()
+                audio_data_original = audio_segment.data
+                audio_sample_rate_original = audio_segment.sample_rate
+                logger.debug(
+                    f"Extracted audio: {audio_segment.duration():.2f} seconds, "
+                    f"sample rate: {audio_sample_rate_original} Hz"
+                )
             except Exception as e:
                 logger.error(f"Failed to extract audio: {e}")
+                if audio_extractor is not None:
+                    audio_extractor.close()
                 raise
 
         # Use unified remediation manager for both audio and video
@@ -831,6 +1174,10 @@ class RemediationRunner:
             config_file=self.config_file,
             segment_file=self.segment_file,
             processed_timestamp=datetime.now(),
+            # Remediation-only output is tagged with its censored title and
+            # remediation metadata (by the plan's final pass); analysis runs
+            # leave the output's tags alone
+            write_metadata=True,
         )
         
         try:
@@ -844,14 +1191,241 @@ class RemediationRunner:
                 video_duration=video_duration,
                 merged_segments=segments,
             )
-            
-            # Apply final metadata after all remediation is complete
-            remediation_manager._apply_final_metadata()
         finally:
             remediation_manager.cleanup()
+            if audio_extractor is not None:
+                audio_extractor.close()
 
         return {
             "segments": segments,
             "metadata": metadata,
-            "_raw_merged_segments": segments,
         }
+
+
+def _iter_sampled_frames(
+    extractor: VideoExtractor,
+    config: Dict[str, Any],
+    sample_rate: float,
+    start_time: float = 0.0,
+    end_time: Optional[float] = None,
+) -> Generator[Frame, None, None]:
+    """Iterate sampled frames from the configured frame source.
+
+    With the "scene_based" strategy, frames at sample_rate are treated as
+    candidates and only one representative frame per shot is returned.
+
+    Frames are decoded ahead of inference in a background thread, up to
+    processing.frame_sampling.prefetch_frames frames; close the returned
+    generator to stop decoding early.
+
+    Args:
+        extractor: Open VideoExtractor for the input video.
+        config: Configuration dictionary.
+        sample_rate: Seconds between extracted (candidate) frames.
+        start_time: Start of the time range in seconds.
+        end_time: End of the time range in seconds, or None for end of video.
+
+    Returns:
+        Generator of Frame objects in timecode order.
+    """
+    from video_censor_personal.config import (
+        get_frame_sampling_strategy_from_config,
+        get_frame_size_from_config,
+        get_frame_source_from_config,
+        get_prefetch_frames_from_config,
+        get_scene_sampling_settings,
+    )
+
+    if get_frame_source_from_config(config) == "ffmpeg":
+        frame_size = get_frame_size_from_config(config)
+        logger.debug(f"Using ffmpeg frame source (frame_size={frame_size})")
+        frames = extractor.extract_frames_ffmpeg(
+            sample_rate=sample_rate,
+            frame_size=frame_size,
+            start_time=start_time,
+            end_time=end_time,
+        )
+    else:
+        frames = extractor.extract_frames(
+            sample_rate=sample_rate, start_time=start_time, end_time=end_time
+        )
+
+    if get_frame_sampling_strategy_from_config(config) == "scene_based":
+        from video_censor_personal.scene_sampling import sample_scene_changes
+
+        settings = get_scene_sampling_settings(config)
+        logger.debug(
+            f"Using scene-based sampling (threshold={settings['threshold']}, "
+            f"max_interval={settings['max_interval']}s)"
+        )
+        frames = sample_scene_changes(
+            frames,
+            threshold=settings["threshold"],
+            max_interval=settings["max_interval"],
+        )
+
+    # Decode (and scene-sample) ahead of inference in a background thread
+    prefetch = get_prefetch_frames_from_config(config)
+    logger.debug(f"Frame prefetch queue size: {prefetch}")
+    return prefetch_frames(frames, prefetch)
+
+
+def _split_time_ranges(
+    duration: float, count: int
+) -> List[Tuple[float, Optional[float]]]:
+    """Split a timeline into contiguous, equally sized time ranges.
+
+    Args:
+        duration: Total duration in seconds.
+        count: Maximum number of ranges.
+
+    Returns:
+        List of (start_time, end_time) tuples. The last range ends at None
+        (end of video) so no trailing frames are lost to duration rounding.
+    """
+    count = max(1, count) if duration > 0 else 1
+    step = duration / count
+    ranges: List[Tuple[float, Optional[float]]] = [
+        (i * step, (i + 1) * step) for i in range(count - 1)
+    ]
+    ranges.append(((count - 1) * step, None))
+    return ranges
+
+
+class _TimeRangeResult(NamedTuple):
+    """Outcome of analyzing one time range in a worker process.
+
+    Attributes:
+        results: Detection results in timecode order.
+        frame_count: Number of frames analyzed.
+        complete: Whether every batch in the range was analyzed.
+        checkpoint_timecode: Timecode of the last frame before the first
+            failed batch (the last frame if complete), or None if no frame
+            before it was analyzed.
+        checkpoint_results: Number of leading results from frames up to
+            checkpoint_timecode.
+    """
+
+    results: List[DetectionResult]
+    frame_count: int
+    complete: bool
+    checkpoint_timecode: Optional[float]
+    checkpoint_results: int
+
+
+def _analyze_worker_batch(
+    detection_pipeline: DetectionPipeline,
+    batch: List[Frame],
+) -> Tuple[List[DetectionResult], bool]:
+    """Analyze one batch of frames in a worker process.
+
+    Like AnalysisPipeline._analyze_frame_batch, a failing batch is logged
+    and skipped so the rest of the worker's time range is still analyzed.
+
+    Args:
+        detection_pipeline: The worker's frame detection pipeline.
+        batch: Frames in timecode order.
+
+    Returns:
+        Tuple of (detection results for the batch in frame order, whether
+        the batch failed in whole or in part).
+    """
+    try:
+        frame_results, failed = detection_pipeline.analyze_frames(batch)
+    except Exception as e:
+        logger.error(
+            f"Error analyzing frames {batch[0].index}-{batch[-1].index}: {e}",
+            exc_info=True,
+        )
+        return [], True
+    return [result for results in frame_results for result in results], failed
+
+
+def _analyze_time_range(
+    video_path: str,
+    config: Dict[str, Any],
+    pipeline_config: Dict[str, Any],
+    sample_rate: float,
+    start_time: float,
+    end_time: Optional[float],
+    num_threads: int,
+    cache_path: Optional[str] = None,
+    video_fingerprint: Optional[str] = None,
+    resume_from: Optional[float] = None,
+) -> "_TimeRangeResult":
+    """Analyze frames within one time range (process-pool worker entry point).
+
+    Args:
+        video_path: Path to the input video file.
+        config: Configuration dictionary with processing settings.
+        pipeline_config: DetectionPipeline config with frame detectors only.
+        sample_rate: Seconds between extracted (candidate) frames.
+        start_time: Start of the time range in seconds.
+        end_time: End of the time range in seconds, or None for end of video.
+        num_threads: Intra-op thread count for this worker's models.
+        cache_path: Detection cache database shared by all workers, or None.
+        video_fingerprint: Frame cache namespace of the video.
+        resume_from: Timecode of the last frame already analyzed by an
+            interrupted run; frames up to it are skipped.
+
+    Returns:
+        _TimeRangeResult with the range's detections and checkpoint prefix.
+    """
+    # Register built-in detectors in the freshly spawned interpreter
+    import video_censor_personal.detectors  # noqa: F401
+
+    try:
+        import torch
+
+        torch.set_num_threads(num_threads)
+    except ImportError:
+        pass
+
+    detection_pipeline = DetectionPipeline(pipeline_config, lazy_init=True)
+    extractor = VideoExtractor(video_path)
+    cache = DetectionCache(cache_path) if cache_path else None
+    results: List[DetectionResult] = []
+    frame_count = 0
+    complete = True
+    checkpoint_timecode: Optional[float] = None
+    checkpoint_results = 0
+
+    def analyze_batch(batch: List[Frame]) -> None:
+        nonlocal complete, checkpoint_timecode, checkpoint_results
+        batch_results, failed = _analyze_worker_batch(detection_pipeline, batch)
+        results.extend(batch_results)
+        if failed:
+            complete = False
+        elif complete:
+            checkpoint_timecode = batch[-1].timecode
+            checkpoint_results = len(results)
+
+    try:
+        detection_pipeline.set_result_cache(cache, video_fingerprint)
+        detection_pipeline.initialize_frame_detectors()
+        batch_size = detection_pipeline.get_frame_batch_size()
+        batch: List[Frame] = []
+
+        with closing(
+            _iter_sampled_frames(extractor, config, sample_rate, start_time, end_time)
+        ) as frames:
+            for frame in frames:
+                if resume_from is not None and frame.timecode <= resume_from:
+                    continue
+                frame_count += 1
+                batch.append(frame)
+                if len(batch) >= batch_size:
+                    analyze_batch(batch)
+                    batch = []
+
+        if batch:
+            analyze_batch(batch)
+    finally:
+        extractor.close()
+        detection_pipeline.cleanup()
+        if cache is not None:
+            cache.close()
+
+    return _TimeRangeResult(
+        results, frame_count, complete, checkpoint_timecode, checkpoint_results
+    )
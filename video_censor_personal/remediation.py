@@ -4,31 +4,92 @@ This module provides unified remediation (audio and video) logic that can be use
 1. AnalysisPipeline (analysis mode with detection)
 2. RemediationRunner (remediation-only mode with pre-loaded segments)
 
-The key design principle is that both modes follow the same remediation sequence:
-1. Apply audio remediation (using original timestamps)
-2. Apply video remediation (may shift timelines via cuts)
-3. Mux remediated audio back into video (with optional metadata tags)
+Both modes apply audio remediation first (using original timestamps), then
+plan the output video as a RemediationPlan: every requested operation
+(remediated audio, blank/cut video remediation, metadata tags, skip
+chapters) is folded into as few ffmpeg passes over the video as possible,
+usually one or two, with the last pass writing the output directly.
+
+When a video output is requested, remediated audio is streamed block by block
+into the muxing ffmpeg process instead of being written to a temporary WAV.
 
 This ensures consistent behavior regardless of whether segments came from detection or pre-loaded JSON.
 """
 
 import logging
-import subprocess
+import shutil
 import tempfile
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from video_censor_personal.audio_remediator import RemediatedAudioStream
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class RemediationPlan:
+    """The ffmpeg passes that produce the output video.
+    
+    Remediated audio, metadata tags and chapters are written together by a
+    single final pass ("finalize"), which is folded away when video
+    remediation can write the output by itself. Remediated audio is muxed
+    ahead of video remediation ("mux") only when cuts would otherwise leave
+    it out of sync.
+    
+    Attributes:
+        video_segments: Segments for video remediation (empty for none).
+        video_cuts: Whether video remediation removes segments.
+        audio: Whether remediated audio replaces the video's audio.
+        tags: Metadata tags for the output (empty to add none).
+        chapters: Chapters for the output, or None to keep the source's.
+        video_width: Video width in pixels.
+        video_height: Video height in pixels.
+        video_duration: Video duration in seconds.
+    """
+    
+    video_segments: List[Dict[str, Any]] = field(default_factory=list)
+    video_cuts: bool = False
+    audio: bool = False
+    tags: Dict[str, str] = field(default_factory=dict)
+    chapters: Optional[List[Dict[str, Any]]] = None
+    video_width: int = 0
+    video_height: int = 0
+    video_duration: float = 0.0
+    
+    @property
+    def mux_first(self) -> bool:
+        """Whether remediated audio is muxed before video remediation cuts it."""
+        return self.audio and self.video_cuts and bool(self.video_segments)
+    
+    @property
+    def steps(self) -> List[str]:
+        """Passes over the video, in order.
+        
+        Returns:
+            Step names: "mux", "video" and "finalize" as needed, or just
+            "copy" when the output is an unchanged copy of the input.
+        """
+        steps = []
+        if self.mux_first:
+            steps.append("mux")
+        if self.video_segments:
+            steps.append("video")
+        if (self.audio and not self.mux_first) or self.tags or self.chapters is not None:
+            steps.append("finalize")
+        return steps or ["copy"]
+
+
 class RemediationManager:
     """Manages audio and video remediation for both analysis and remediation-only modes.
     
     Handles:
     - Audio remediation with arbitrary detection results or segments
-    - Video remediation with tracking of output file states
-    - Audio/video muxing with proper file sequencing
+    - Planning the output video (RemediationPlan) and running its passes
+    - Video remediation, audio muxing, metadata tags and skip chapters
     - Temporary file management and cleanup
     """
     
@@ -41,6 +102,7 @@ class RemediationManager:
         config_file: Optional[str] = None,
         segment_file: Optional[str] = None,
         processed_timestamp: Optional[datetime] = None,
+        write_metadata: bool = False,
     ) -> None:
         """Initialize remediation manager.
         
@@ -53,6 +115,8 @@ class RemediationManager:
             config_file: Optional path to the config file used (for metadata).
             segment_file: Optional path to the segment file used (for metadata).
             processed_timestamp: Optional datetime when remediation started (for metadata).
+            write_metadata: Whether to tag the output video with its censored
+                title and remediation metadata.
         """
         self.input_video_path = Path(input_video_path)
         if not self.input_video_path.exists():
@@ -67,9 +131,12 @@ class RemediationManager:
         self.config_file = config_file
         self.segment_file = segment_file
         self.processed_timestamp = processed_timestamp or datetime.now()
+        self.write_metadata = write_metadata
         
         # Track intermediate file states
         self.remediated_audio_path: Optional[str] = None
+        # Remediated audio awaiting muxing, when streamed instead of written
+        self.remediated_audio_stream: Optional["RemediatedAudioStream"] = None
         
         # Import debug output here to avoid circular imports
         from video_censor_personal.progress import DebugOutput
@@ -88,17 +155,22 @@ class RemediationManager:
         video_height: Optional[int] = None,
         video_duration: Optional[float] = None,
         merged_segments: Optional[List[Dict[str, Any]]] = None,
+        chapter_segments: Optional[List[Dict[str, Any]]] = None,
     ) -> None:
         """Apply all remediation in the correct order.
         
         This is the main entry point for both analysis and remediation-only modes.
         It orchestrates:
-        1. Audio remediation (if enabled and audio data provided) → temp audio file
-        2. Mux remediated audio with original video → output_video_path
-        3. Video remediation on output_video_path (if enabled and output_video_path specified)
+        1. Audio remediation (if enabled and audio data provided) → remediated
+           audio stream (or a temp audio file when no video output is requested
+           or remediation.audio.output_path is set)
+        2. Planning the output video (see plan_output)
+        3. Running the plan's passes, the last of which writes output_video_path
         
-        This sequence ensures audio/video sync when video has cuts, since both tracks
-        are already combined before video remediation runs.
+        When video remediation cuts segments, remediated audio is muxed before
+        the cut so both tracks are cut together and stay in sync. Otherwise
+        it is muxed in the final pass, together with metadata tags and skip
+        chapters.
         
         Args:
             detections_or_segments: Either DetectionResult objects or segment dicts.
@@ -112,6 +184,9 @@ class RemediationManager:
             video_duration: Total video duration in seconds (required for video remediation).
             merged_segments: Merged/deduplicated segments for video remediation.
                             If None and detections_or_segments are dicts, will use those.
+            chapter_segments: Segments to write as skip chapters when
+                video.metadata_output.skip_chapters is enabled (default: the
+                video remediation segments).
         
         Raises:
             ValueError: If required parameters are missing for enabled remediation.
@@ -119,7 +194,7 @@ class RemediationManager:
         """
         logger.info("Starting remediation sequence")
         
-        # Step 1: Apply audio remediation (if enabled) → creates temp audio file
+        # Step 1: Apply audio remediation (if enabled) → remediated audio stream or file
         if audio_data is not None and audio_sample_rate is not None:
             self._apply_audio_remediation(
                 audio_data,
@@ -128,29 +203,210 @@ class RemediationManager:
                 segments_for_allow_check,
             )
         
-        # Step 2: Mux remediated audio into video (BEFORE video remediation)
-        # This must happen BEFORE video remediation so audio/video are combined before video cutting
-        if self.remediated_audio_path and self.output_video_path:
-            self._mux_remediated_audio()
-        
-        # Step 3: Apply video remediation on output file (if enabled)
-        # This operates on the output file that may already have muxed audio
-        if merged_segments is not None:
-            self._apply_video_remediation(
-                merged_segments,
-                video_width,
-                video_height,
-                video_duration,
-            )
-        elif isinstance(detections_or_segments, list) and len(detections_or_segments) > 0:
+        if merged_segments is None:
             # If detections_or_segments are dicts and no merged_segments provided, use them
-            if isinstance(detections_or_segments[0], dict):
-                self._apply_video_remediation(
-                    detections_or_segments,
-                    video_width,
-                    video_height,
-                    video_duration,
+            if (
+                isinstance(detections_or_segments, list)
+                and len(detections_or_segments) > 0
+                and isinstance(detections_or_segments[0], dict)
+            ):
+                merged_segments = detections_or_segments
+            else:
+                merged_segments = []
+        
+        # Steps 2-3: Plan the output video and run its passes
+        plan = self.plan_output(
+            merged_segments,
+            video_width,
+            video_height,
+            video_duration,
+            merged_segments if chapter_segments is None else chapter_segments,
+        )
+        if plan is not None:
+            self._write_output(plan)
+    
+    def plan_output(
+        self,
+        segments: List[Dict[str, Any]],
+        video_width: Optional[int] = None,
+        video_height: Optional[int] = None,
+        video_duration: Optional[float] = None,
+        chapter_segments: Optional[List[Dict[str, Any]]] = None,
+    ) -> Optional[RemediationPlan]:
+        """Gather every operation the output video needs into one plan.
+        
+        Call after audio remediation, since remediated audio is part of the
+        plan.
+        
+        Args:
+            segments: Segment dicts with start_time/end_time for video remediation.
+            video_width: Video width (required for video remediation).
+            video_height: Video height (required for video remediation).
+            video_duration: Video duration in seconds (required for video remediation).
+            chapter_segments: Segments to write as skip chapters, if enabled.
+        
+        Returns:
+            The plan, or None if no output video is produced (no output path,
+            or no remediation, skip chapters or metadata to write).
+        """
+        from video_censor_personal.config import is_skip_chapters_enabled
+        
+        if not self.output_video_path:
+            if self.config.get("remediation", {}).get("video", {}).get("enabled", False):
+                logger.warning(
+                    "Video remediation enabled but output video path not specified. Skipping."
+                )
+            logger.debug("No output video path; no output video planned")
+            return None
+        
+        video_requested, video_segments, video_cuts = self._plan_video_segments(
+            segments, video_width, video_height, video_duration
+        )
+        skip_chapters = is_skip_chapters_enabled(self.config)
+        audio = self._has_remediated_audio()
+        if not (audio or video_requested or skip_chapters):
+            logger.debug("Nothing to write to the output video")
+            return None
+        
+        plan = RemediationPlan(
+            video_segments=video_segments,
+            video_cuts=video_cuts,
+            audio=audio,
+            tags=self._build_output_metadata() if self.write_metadata else {},
+            chapters=self._plan_chapters(chapter_segments or []) if skip_chapters else None,
+            video_width=video_width or 0,
+            video_height=video_height or 0,
+            video_duration=video_duration or 0.0,
+        )
+        logger.info(f"Output video plan: {' -> '.join(plan.steps)}")
+        self.debug_output.detail("Output passes", " -> ".join(plan.steps))
+        return plan
+    
+    def _plan_video_segments(
+        self,
+        segments: List[Dict[str, Any]],
+        video_width: Optional[int],
+        video_height: Optional[int],
+        video_duration: Optional[float],
+    ) -> Tuple[bool, List[Dict[str, Any]], bool]:
+        """Select the segments video remediation will act on.
+        
+        Args:
+            segments: List of segment dicts with start_time/end_time.
+            video_width: Video width (required).
+            video_height: Video height (required).
+            video_duration: Video duration in seconds (required).
+        
+        Returns:
+            Tuple of (whether video remediation is requested, formatted
+            segments to remediate or [] if none would change the video,
+            whether any of them is cut).
+        """
+        video_config = self.config.get("remediation", {}).get("video", {})
+        if not video_config.get("enabled", False):
+            logger.debug("Video remediation disabled")
+            return False, [], False
+        
+        if not video_width or not video_height or not video_duration:
+            logger.warning(
+                "Video remediation enabled but missing video metadata "
+                f"(width={video_width}, height={video_height}, duration={video_duration}). Skipping."
+            )
+            return False, [], False
+        
+        from video_censor_personal.video_remediator import VideoRemediator
+        
+        logger.info(f"Using {len(segments)} segments for video remediation")
+        remediation_segments = self._format_segments_for_remediation(segments)
+        remediator = VideoRemediator(video_config)
+        grouped = remediator.group_segments_by_mode(
+            remediator.filter_allowed_segments(remediation_segments)
+        )
+        if not grouped["blank"] and not grouped["cut"]:
+            logger.info("No segments to remediate")
+            return True, [], False
+        return True, remediation_segments, bool(grouped["cut"])
+    
+    def _plan_chapters(
+        self,
+        chapter_segments: List[Dict[str, Any]],
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Build the output's chapters: existing chapters plus skip chapters.
+        
+        Args:
+            chapter_segments: Merged segments to write as skip chapters.
+        
+        Returns:
+            Chapter list, or None to keep the source's chapters (if there is
+            nothing to add or the existing chapters cannot be read).
+        """
+        from video_censor_personal.video_metadata_writer import (
+            VideoMetadataError,
+            build_output_chapters,
+        )
+        
+        try:
+            chapters = build_output_chapters(
+                str(self.input_video_path), self.output_video_path, chapter_segments
+            )
+        except VideoMetadataError as e:
+            logger.error(f"Failed to write skip chapters: {e}")
+            logger.warning("Continuing despite chapter writing failure")
+            return None
+        
+        logger.info(f"Writing {len(chapters)} chapters to: {self.output_video_path}")
+        return chapters or None
+    
+    def _write_output(self, plan: RemediationPlan) -> None:
+        """Run the plan's passes, writing the last one to output_video_path.
+        
+        Intermediate files live in a temporary directory next to the output.
+        When the output path is the input itself, the last pass is written
+        there too and moved into place afterwards.
+        
+        Args:
+            plan: Plan from plan_output.
+        """
+        output_path = Path(self.output_video_path)
+        overwrites_input = output_path.resolve() == self.input_video_path.resolve()
+        suffix = output_path.suffix or ".mp4"
+        steps = plan.steps
+        
+        with tempfile.TemporaryDirectory(
+            prefix="remediation_", dir=output_path.resolve().parent
+        ) as work_dir:
+            chapters_path = None
+            if plan.chapters is not None:
+                from video_censor_personal.video_metadata_writer import (
+                    write_ffmetadata_chapters,
                 )
+                chapters_path = str(Path(work_dir) / "chapters.txt")
+                write_ffmetadata_chapters(plan.chapters, chapters_path)
+            
+            source = str(self.input_video_path)
+            for i, step in enumerate(steps):
+                if i == len(steps) - 1 and not overwrites_input:
+                    target = str(output_path)
+                else:
+                    target = str(Path(work_dir) / f"{step}{suffix}")
+                
+                if step == "mux":
+                    self._mux_remediated_audio(source, target)
+                elif step == "video":
+                    self._apply_video_remediation(source, target, plan)
+                elif step == "finalize" and plan.audio and not plan.mux_first:
+                    self._mux_remediated_audio(source, target, plan.tags, chapters_path)
+                elif step == "finalize":
+                    self._remux_output(source, target, plan.tags, chapters_path)
+                else:
+                    logger.debug("Copying input to output")
+                    shutil.copy2(source, target)
+                source = target
+            
+            if overwrites_input:
+                shutil.move(source, str(output_path))
+        
+        logger.info(f"Output video written: {self.output_video_path}")
     
     def _apply_audio_remediation(
         self,
@@ -195,6 +451,23 @@ class RemediationManager:
             
             remediator = AudioRemediator(remediation_config)
             
+            # Stream straight into the muxer when the audio only feeds the
+            # output video (no WAV requested)
+            if (
+                self.output_video_path
+                and not remediation_config.get("output_path")
+                and isinstance(audio_np, np.ndarray)
+            ):
+                self.remediated_audio_stream = remediator.stream(
+                    audio_np,
+                    audio_sample_rate,
+                    detections_or_segments,
+                    segments=segments_for_allow_check,
+                )
+                logger.info("Remediated audio will be streamed into the muxer")
+                self.debug_output.step("Audio will be streamed into the muxer")
+                return
+            
             # For DetectionResult objects, convert to segments if needed
             if segments_for_allow_check:
                 # Using provided segments (remediation-only mode)
@@ -233,166 +506,116 @@ class RemediationManager:
     
     def _apply_video_remediation(
         self,
-        segments: List[Dict[str, Any]],
-        video_width: Optional[int] = None,
-        video_height: Optional[int] = None,
-        video_duration: Optional[float] = None,
+        video_input: str,
+        video_output: str,
+        plan: RemediationPlan,
     ) -> None:
-        """Apply video remediation if enabled.
-        
-        At this point in the sequence:
-        - If audio was remediated, it's already been muxed into output_video_path
-        - If audio wasn't remediated, output_video_path may not exist yet
-        
-        When audio is remediated: operates directly on output_video_path (which has muxed audio)
-        When audio isn't remediated: creates output_video_path by copying and remediating input
+        """Apply video remediation to the plan's segments.
         
         Args:
-            segments: List of segment dicts with start_time/end_time.
-            video_width: Video width (required).
-            video_height: Video height (required).
-            video_duration: Video duration in seconds (required).
+            video_input: Video to remediate (the original input, or the
+                input with remediated audio muxed in when cuts follow).
+            video_output: Path to write the remediated video to.
+            plan: Plan with the segments and video dimensions.
         """
         video_config = self.config.get("remediation", {}).get("video", {})
-        if not video_config.get("enabled", False):
-            logger.debug("Video remediation disabled")
-            return
-        
-        if not self.output_video_path:
-            logger.warning(
-                "Video remediation enabled but output video path not specified. Skipping."
-            )
-            return
-        
-        if not video_width or not video_height or not video_duration:
-            logger.warning(
-                "Video remediation enabled but missing video metadata "
-                f"(width={video_width}, height={video_height}, duration={video_duration}). Skipping."
-            )
-            return
         
         try:
             from video_censor_personal.video_remediator import VideoRemediator
-            import shutil
             
             self.debug_output.subsection("Video Remediation")
             self.debug_output.step("Applying video remediation...")
             self.debug_output.detail("Mode", video_config.get("mode", "blank"))
-            self.debug_output.detail("Segments", len(segments))
+            self.debug_output.detail("Segments", len(plan.video_segments))
             
-            logger.info(f"Using {len(segments)} segments for video remediation")
-            
-            # Format segments for remediation
-            remediation_segments = self._format_segments_for_remediation(segments)
-            
-            if not remediation_segments:
-                logger.info("No segments to remediate; ensuring output file exists")
-                if not Path(self.output_video_path).exists():
-                    logger.debug(f"Copying input to output")
-                    shutil.copy2(str(self.input_video_path), self.output_video_path)
-                self.debug_output.step("No segments to remediate")
-                return
-            
-            # Initialize VideoRemediator
             remediator = VideoRemediator(video_config)
-            
-            # Determine input file for video remediation
-            # At this point, if audio was remediated, it's already been muxed into output_video_path
-            if self.remediated_audio_path:
-                # Audio was remediated and already muxed into output_video_path
-                # So video remediation operates directly on output_video_path
-                # Must use a temp file since ffmpeg can't write to the same file it reads from
-                video_input = self.output_video_path
-                with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
-                    video_output = tmp.name
-                logger.debug(
-                    f"Audio remediation detected; applying video remediation to muxed file"
-                )
-            else:
-                # No audio remediation
-                # Always use the original input file
-                video_input = str(self.input_video_path)
-                video_output = self.output_video_path
-                logger.debug(f"No audio remediation; applying video remediation to original input")
-            
-            # Apply video remediation
             remediator.apply(
                 video_input,
                 video_output,
-                remediation_segments,
-                video_duration,
-                video_width,
-                video_height,
+                plan.video_segments,
+                plan.video_duration,
+                plan.video_width,
+                plan.video_height,
             )
             
-            # If we used a temp file, move it to the final output
-            if self.remediated_audio_path:
-                shutil.move(video_output, self.output_video_path)
-                logger.debug(f"Moved temp video remediation to output")
-            
-            logger.info(f"Video remediation saved to: {self.output_video_path}")
+            logger.info(f"Video remediation saved to: {video_output}")
             self.debug_output.step("Video remediation complete")
         
         except Exception as e:
             logger.error(f"Video remediation failed: {e}", exc_info=True)
             self.debug_output.info(f"ERROR: Video remediation failed: {e}")
             raise
-
     
-    def _mux_remediated_audio(self) -> None:
-        """Mux remediated audio into video (without metadata).
-        
-        This runs BEFORE video remediation, so it simply muxes the remediated audio
-        with the original video, creating the output file that will be used as input
-        for video remediation (if enabled).
+    def _mux_remediated_audio(
+        self,
+        video_source: str,
+        output_path: str,
+        metadata: Optional[Dict[str, str]] = None,
+        chapters_path: Optional[str] = None,
+    ) -> None:
+        """Mux remediated audio into a video, with any tags and chapters.
         
-        When video remediation is not enabled, _apply_final_metadata() adds metadata.
-        When video remediation is enabled, _apply_final_metadata() runs after video
-        remediation completes to add metadata to the final output.
+        Runs either before video remediation (when cuts follow, without
+        tags or chapters) or as the plan's final pass.
         
-        This separation ensures metadata is only added to the final output file,
-        after ALL remediation (audio and video) is complete.
+        Args:
+            video_source: Video whose video stream is kept.
+            output_path: Path to write the muxed video to.
+            metadata: Metadata tags for the output (including its title).
+            chapters_path: FFMETADATA file with the output's chapters.
         """
-        if not self.remediated_audio_path or not self.output_video_path:
-            logger.debug("No audio muxing needed (no remediated audio or no output path)")
-            return
-        
         self.debug_output.subsection("Video Muxing")
         self.debug_output.step("Muxing remediated audio into video...")
         
         try:
             from video_censor_personal.video_muxer import VideoMuxer
-            import shutil
             
-            # Mux remediated audio with the original video
-            # (or with pre-existing output if skip chapters already created it)
-            if Path(self.output_video_path).exists():
-                video_source = self.output_video_path
-                logger.debug("Muxing into pre-existing output file (e.g., from skip chapters)")
+            muxer = VideoMuxer(
+                video_source,
+                self.remediated_audio_path,
+                metadata=metadata,
+                chapters_path=chapters_path,
+            )
+            if self.remediated_audio_path:
+                muxer.mux_video(output_path)
             else:
-                video_source = str(self.input_video_path)
-                logger.debug("Muxing remediated audio with original video")
-            
-            muxer = VideoMuxer(video_source, self.remediated_audio_path)
-            
-            # Always use a temp file to avoid ffmpeg's limitation with moving files it's writing to
-            with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as tmp:
-                temp_output = tmp.name
-            
-            muxer.mux_video(temp_output)
-            
-            # Replace the output file with the muxed version
-            shutil.move(temp_output, self.output_video_path)
-            logger.debug(f"Moved temp muxed video to: {self.output_video_path}")
+                muxer.mux_audio_stream(output_path, self.remediated_audio_stream)
             
-            logger.info(f"Audio muxed into video: {self.output_video_path}")
-            self.debug_output.step(f"Audio muxed into video: {self.output_video_path}")
+            logger.info(f"Audio muxed into video: {output_path}")
+            self.debug_output.step(f"Audio muxed into video: {output_path}")
         
         except Exception as e:
             logger.error(f"Video muxing failed: {e}", exc_info=True)
             self.debug_output.info(f"ERROR: Video muxing failed: {e}")
             raise
     
+    def _remux_output(
+        self,
+        video_source: str,
+        output_path: str,
+        metadata: Optional[Dict[str, str]] = None,
+        chapters_path: Optional[str] = None,
+    ) -> None:
+        """Write tags and chapters with a stream-copy remux (the final pass).
+        
+        Args:
+            video_source: Video whose streams are kept.
+            output_path: Path to write the video to.
+            metadata: Metadata tags for the output (including its title).
+            chapters_path: FFMETADATA file with the output's chapters.
+        """
+        from video_censor_personal.video_muxer import VideoMuxer
+        
+        self.debug_output.step("Writing metadata and chapters...")
+        VideoMuxer(video_source, metadata=metadata, chapters_path=chapters_path).remux(
+            output_path
+        )
+        logger.info(f"Metadata and chapters written to: {output_path}")
+    
+    def _has_remediated_audio(self) -> bool:
+        """Whether remediated audio (file or stream) is waiting to be muxed."""
+        return bool(self.remediated_audio_path) or self.remediated_audio_stream is not None
+    
     def _format_segments_for_remediation(
         self,
         merged_segments: List[Dict[str, Any]],
@@ -425,42 +648,30 @@ class RemediationManager:
         
         return formatted
     
-    def _apply_final_metadata(self) -> None:
-        """Apply metadata to final output video AFTER all remediation is complete.
+    def _build_output_metadata(self) -> Dict[str, str]:
+        """Build the metadata tags for the output video.
         
-        This method:
-        1. Extracts existing metadata from the input video (to preserve chapters, etc.)
-        2. Adds remediation-specific metadata (config, segment file, timestamp, flags)
-        3. Updates title with "(Censored)" suffix
-        4. Writes all metadata to the output video using ffmpeg
+        Combines:
+        1. Existing metadata from the input video
+        2. Remediation-specific metadata (config, segment file, timestamp, flags)
+        3. The title with a "(Censored)" suffix
         
-        This runs AFTER both audio and video remediation are done, ensuring
-        metadata is applied to the final output file only.
-        """
-        if not self.output_video_path:
-            logger.debug("No output video path, skipping metadata")
-            return
-        
-        output_path = Path(self.output_video_path)
-        if not output_path.exists():
-            logger.debug(f"Output video doesn't exist: {self.output_video_path}")
-            return
-        
-        logger.info("Applying final metadata to output video")
-        self.debug_output.step("Applying final metadata...")
+        The tags are written by the plan's final pass, after all audio and
+        video remediation.
         
+        Returns:
+            Tags to write, or {} if they cannot be built (remediation
+            continues without metadata rather than failing).
+        """
         try:
             from video_censor_personal.video_metadata import (
                 extract_original_title,
                 create_censored_title,
                 build_remediation_metadata,
                 extract_existing_metadata,
-                log_metadata,
             )
-            import shutil
-            import subprocess
             
-            # Extract existing metadata from input video (to preserve chapters, subtitles, etc.)
+            # Extract existing metadata from input video
             existing_metadata = extract_existing_metadata(str(self.input_video_path))
             logger.debug(f"Extracted {len(existing_metadata)} existing metadata tags from input")
             
@@ -489,64 +700,22 @@ class RemediationManager:
                 logger.debug("Skipping remediation metadata (config_file or segment_file not provided)")
             
             # Merge: start with existing metadata, then override/add remediation metadata
-            # This preserves chapters, subtitles, etc. from input while adding new tags
             all_metadata = {**existing_metadata, **remediation_metadata}
             
             # Always set title to censored version (overrides any existing title)
             all_metadata["title"] = censored_title
             
             logger.debug(f"Total metadata to write: {len(all_metadata)} tags")
-            log_metadata(remediation_metadata, censored_title)
-            
-            # Build ffmpeg command to write metadata
-            # Use -c copy to avoid re-encoding, just update metadata container
-            temp_file = tempfile.NamedTemporaryFile(suffix='.mp4', delete=False).name
-            
-            cmd = [
-                "ffmpeg",
-                "-i", str(self.output_video_path),
-                "-c", "copy",  # Copy all streams without re-encoding
-            ]
-            
-            # Add all metadata tags
-            for key, value in all_metadata.items():
-                cmd.extend(["-metadata", f"{key}={value}"])
-            
-            # Enable metadata in MP4 container
-            cmd.extend(["-movflags", "+use_metadata_tags"])
-            
-            cmd.extend([
-                "-y",  # Overwrite temp file
-                temp_file,
-            ])
-            
-            logger.debug(f"Running metadata update with ffmpeg")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,
-                stdin=subprocess.DEVNULL,  # Prevent ffmpeg from waiting for input
-            )
-            
-            if result.returncode != 0:
-                error_msg = result.stderr if result.stderr else "Unknown error"
-                raise RuntimeError(f"ffmpeg metadata update failed: {error_msg}")
-            
-            # Replace output file with metadata-updated version
-            shutil.move(temp_file, self.output_video_path)
-            logger.debug(f"Replaced output file with metadata-updated version")
-            
-            logger.info(f"Metadata applied to final output: {self.output_video_path}")
-            self.debug_output.step("Metadata successfully applied")
-            
+            return all_metadata
+        
         except Exception as e:
-            logger.error(f"Failed to apply metadata: {e}", exc_info=True)
+            logger.error(f"Failed to build metadata: {e}", exc_info=True)
             self.debug_output.info(f"WARNING: Metadata application failed: {e}")
-            # Don't raise - continue without metadata rather than failing the whole remediation
+            return {}
     
     def cleanup(self) -> None:
         """Clean up temporary files created during remediation."""
+        self.remediated_audio_stream = None
         if self.remediated_audio_path:
             try:
                 Path(self.remediated_audio_path).unlink(missing_ok=True)
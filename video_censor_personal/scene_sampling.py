@@ -0,0 +1,119 @@
+"""Scene-change frame sampling.
+
+Reduces the number of frames sent to detectors by emitting one
+representative frame per shot instead of one frame per sample interval.
+Shot boundaries are found by comparing cheap luma-histogram signatures of
+candidate frames.
+"""
+
+import logging
+from typing import Generator, Iterable, Optional
+
+import cv2
+import numpy as np
+
+from video_censor_personal.frame import Frame
+
+logger = logging.getLogger(__name__)
+
+# Width in pixels frames are downscaled to before computing signatures
+SIGNATURE_WIDTH = 64
+
+# Number of luma histogram bins in a frame signature
+SIGNATURE_BINS = 32
+
+# Default histogram distance above which a candidate starts a new shot
+DEFAULT_SCENE_THRESHOLD = 0.3
+
+# Default maximum seconds between emitted frames within a single shot
+DEFAULT_MAX_INTERVAL = 10.0
+
+
+def frame_signature(frame_data: np.ndarray) -> np.ndarray:
+    """Compute a normalized luma histogram signature for a frame.
+
+    Args:
+        frame_data: Frame pixel data (BGR, uint8).
+
+    Returns:
+        1-D float32 array of SIGNATURE_BINS values summing to 1.0.
+    """
+    height, width = frame_data.shape[:2]
+    if width > SIGNATURE_WIDTH:
+        small_height = max(1, int(round(height * SIGNATURE_WIDTH / width)))
+        frame_data = cv2.resize(
+            frame_data, (SIGNATURE_WIDTH, small_height), interpolation=cv2.INTER_AREA
+        )
+
+    luma = cv2.cvtColor(frame_data, cv2.COLOR_BGR2GRAY)
+    hist = np.bincount(
+        luma.ravel() // (256 // SIGNATURE_BINS),
+        minlength=SIGNATURE_BINS,
+    ).astype(np.float32)
+    return hist / max(float(hist.sum()), 1.0)
+
+
+def signature_distance(a: np.ndarray, b: np.ndarray) -> float:
+    """Compute distance between two frame signatures.
+
+    Args:
+        a: First signature from frame_signature().
+        b: Second signature from frame_signature().
+
+    Returns:
+        Total variation distance in range [0.0, 1.0] (0 = identical).
+    """
+    return float(np.abs(a - b).sum() * 0.5)
+
+
+def sample_scene_changes(
+    frames: Iterable[Frame],
+    threshold: float = DEFAULT_SCENE_THRESHOLD,
+    max_interval: Optional[float] = DEFAULT_MAX_INTERVAL,
+) -> Generator[Frame, None, None]:
+    """Yield one representative frame per shot from candidate frames.
+
+    A candidate is emitted when its signature differs from the last emitted
+    frame by more than threshold (a shot change, including gradual ones), or
+    when max_interval seconds have passed since the last emitted frame.
+    Emitted frames are re-indexed sequentially.
+
+    Args:
+        frames: Candidate frames in timecode order.
+        threshold: Signature distance in (0.0, 1.0] that marks a shot change.
+        max_interval: Maximum seconds between emitted frames, or None for no
+            limit.
+
+    Yields:
+        Representative Frame objects.
+    """
+    last_signature: Optional[np.ndarray] = None
+    last_timecode = 0.0
+    emitted_count = 0
+    candidate_count = 0
+
+    for frame in frames:
+        candidate_count += 1
+        signature = frame_signature(frame.data)
+
+        if last_signature is None:
+            emit = True
+        elif signature_distance(signature, last_signature) > threshold:
+            emit = True
+        else:
+            emit = (
+                max_interval is not None
+                and frame.timecode - last_timecode >= max_interval
+            )
+
+        if not emit:
+            continue
+
+        last_signature = signature
+        last_timecode = frame.timecode
+        yield Frame(index=emitted_count, timecode=frame.timecode, data=frame.data)
+        emitted_count += 1
+
+    logger.debug(
+        f"Scene sampling kept {emitted_count} of {candidate_count} candidate frames"
+    )
@@ -0,0 +1,444 @@
+"""Keyframe indexing and GOP planning for smart-render video remediation.
+
+Smart rendering re-encodes only the groups of pictures (GOPs) that overlap
+remediated segments and stream-copies everything else. A closed GOP
+starts at a keyframe and needs no earlier frames, so the video can be
+split at such keyframes without decoding, the affected pieces re-encoded,
+and all pieces concatenated losslessly.
+"""
+
+import bisect
+import json
+import logging
+import re
+import shutil
+import subprocess
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+class SmartRenderCodec(NamedTuple):
+    """How pieces of one source codec are split and re-encoded.
+
+    Pieces carry their parameter sets (SPS/PPS) in-band, so copied and
+    re-encoded pieces each decode with their own after concatenation.
+
+    Attributes:
+        encoder: ffmpeg encoder matching the source codec.
+        annexb_filter: Bitstream filter that puts parameter sets in front
+            of every keyframe of copied pieces.
+        params_option: Encoder option that repeats parameter sets in
+            re-encoded pieces.
+    """
+
+    encoder: str
+    annexb_filter: str
+    params_option: str
+
+
+# Source codecs that smart rendering supports
+SMART_RENDER_CODECS = {
+    "h264": SmartRenderCodec("libx264", "h264_mp4toannexb", "-x264-params"),
+    "hevc": SmartRenderCodec("libx265", "hevc_mp4toannexb", "-x265-params"),
+}
+
+# ffprobe profile names mapped to encoder -profile:v values
+_ENCODER_PROFILES = {
+    "libx264": {
+        "Constrained Baseline": "baseline",
+        "Baseline": "baseline",
+        "Main": "main",
+        "High": "high",
+        "High 10": "high10",
+        "High 4:2:2": "high422",
+        "High 4:4:4 Predictive": "high444",
+    },
+    "libx265": {
+        "Main": "main",
+        "Main 10": "main10",
+        "Main Still Picture": "mainstillpicture",
+    },
+}
+
+
+class VideoStreamInfo(NamedTuple):
+    """Codec parameters of a video stream and timing of its container.
+
+    Attributes:
+        codec_name: ffmpeg codec name (e.g. "h264").
+        profile: Codec profile as reported by ffprobe, if any.
+        pix_fmt: Pixel format (e.g. "yuv420p").
+        start_time: Container start time in seconds. ffmpeg subtracts it
+            from input timestamps, so filter and segment times are
+            relative to it.
+        duration: Container duration in seconds, if known.
+        has_audio: Whether the container has an audio stream.
+    """
+
+    codec_name: str
+    profile: Optional[str]
+    pix_fmt: Optional[str]
+    start_time: float
+    duration: Optional[float]
+    has_audio: bool = False
+
+
+class GopPiece(NamedTuple):
+    """A span of the video that is either stream-copied or re-encoded.
+
+    Copied pieces always start and end on keyframes (or the video end).
+
+    Attributes:
+        start: Start time in seconds.
+        end: End time in seconds.
+        reencode: Whether the piece must be decoded and re-encoded.
+    """
+
+    start: float
+    end: float
+    reencode: bool
+
+
+def probe_video_stream(video_path: str) -> Optional[VideoStreamInfo]:
+    """Read the first video stream's codec parameters and container timing.
+
+    Args:
+        video_path: Path to the video file.
+
+    Returns:
+        VideoStreamInfo, or None if ffprobe is unavailable or fails.
+    """
+    if shutil.which("ffprobe") is None:
+        return None
+
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-show_entries",
+        "stream=codec_type,codec_name,profile,pix_fmt:format=start_time,duration",
+        "-of", "json",
+        video_path,
+    ]
+    try:
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            return None
+
+        data = json.loads(result.stdout)
+        streams = data.get("streams", [])
+        video_streams = [s for s in streams if s.get("codec_type") == "video"]
+        if not video_streams:
+            return None
+        stream = video_streams[0]
+        container = data.get("format", {})
+        duration = container.get("duration")
+        return VideoStreamInfo(
+            codec_name=stream.get("codec_name", ""),
+            profile=stream.get("profile"),
+            pix_fmt=stream.get("pix_fmt"),
+            start_time=float(container.get("start_time") or 0.0),
+            duration=float(duration) if duration not in (None, "N/A") else None,
+            has_audio=any(s.get("codec_type") == "audio" for s in streams),
+        )
+    except Exception as e:
+        logger.warning(f"Failed to probe video stream: {e}")
+        return None
+
+
+def probe_has_audio(video_path: str) -> bool:
+    """Check for an audio stream using ffmpeg's input summary.
+
+    Fallback for when probe_video_stream() is unavailable: ffmpeg lists
+    the streams of its input on stderr even when no output is given.
+
+    Args:
+        video_path: Path to the video file.
+
+    Returns:
+        True if the file has an audio stream; False if it has none or
+        ffmpeg is unavailable.
+    """
+    if shutil.which("ffmpeg") is None:
+        return False
+
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-i", video_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+        audio = re.search(r"^\s*Stream #0:\d+.*: Audio:", result.stderr, re.MULTILINE)
+        return audio is not None
+    except Exception as e:
+        logger.warning(f"Failed to probe audio stream: {e}")
+        return False
+
+
+def probe_keyframes(video_path: str, start_time: float = 0.0) -> List[float]:
+    """Build the keyframe index of the first video stream.
+
+    Reads packet flags and timestamps only (no decoding). Keyframes that
+    open an open GOP are left out: their leading frames display before
+    them but follow them in decode order, so splitting there would move
+    those frames into a piece that cannot decode them. A keyframe is open
+    when a later packet before the next keyframe has an earlier pts.
+
+    Args:
+        video_path: Path to the video file.
+        start_time: Container start time, subtracted so keyframe times
+            match the timeline ffmpeg filters and segment times use.
+
+    Returns:
+        Sorted times in seconds of keyframes starting a closed GOP (empty
+        if probing fails).
+    """
+    if shutil.which("ffprobe") is None:
+        return []
+
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,flags",
+        "-of", "csv=p=0",
+        video_path,
+    ]
+    try:
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            return []
+
+        keyframes = []
+        open_keyframes = set()
+        for line in result.stdout.splitlines():
+            pts_time, _, flags = line.partition(",")
+            try:
+                pts = float(pts_time) - start_time
+            except ValueError:
+                continue  # "N/A" timestamps
+            if "K" in flags:
+                keyframes.append(pts)
+            elif keyframes and pts < keyframes[-1]:
+                # Leading frame of the most recent keyframe (packets are
+                # listed in decode order)
+                open_keyframes.add(keyframes[-1])
+
+        if open_keyframes:
+            logger.debug(
+                f"Skipping {len(open_keyframes)} open-GOP keyframe(s) as split points"
+            )
+        return sorted(set(keyframes) - open_keyframes)
+    except Exception as e:
+        logger.warning(f"Failed to index keyframes: {e}")
+        return []
+
+
+def plan_gop_pieces(
+    keyframes: Sequence[float],
+    intervals: Sequence[Tuple[float, float]],
+    duration: float,
+) -> List[GopPiece]:
+    """Split the timeline at keyframes into copied and re-encoded pieces.
+
+    Every GOP overlapping an interval is re-encoded; consecutive affected
+    GOPs form one piece, as do consecutive unaffected ones. An interval
+    ending exactly on a keyframe also re-encodes that keyframe's GOP,
+    because the frame at the end time is remediated too.
+
+    Args:
+        keyframes: Sorted keyframe times in seconds.
+        intervals: (start, end) times in seconds to re-encode.
+        duration: Video duration in seconds.
+
+    Returns:
+        Contiguous pieces covering [first keyframe, duration).
+    """
+    if not keyframes:
+        return [GopPiece(0.0, duration, bool(intervals))]
+
+    # GOP i spans [bounds[i], bounds[i + 1])
+    bounds = [k for k in keyframes if k < duration] + [duration]
+    affected = [False] * (len(bounds) - 1)
+    for start, end in intervals:
+        # GOPs with bounds[i] <= end and bounds[i + 1] > start
+        first = max(bisect.bisect_right(bounds, start) - 1, 0)
+        last = min(bisect.bisect_right(bounds, end), len(affected))
+        for i in range(first, last):
+            affected[i] = True
+
+    pieces: List[GopPiece] = []
+    for i, reencode in enumerate(affected):
+        if pieces and pieces[-1].reencode == reencode:
+            pieces[-1] = pieces[-1]._replace(end=bounds[i + 1])
+        else:
+            pieces.append(GopPiece(bounds[i], bounds[i + 1], reencode))
+    return pieces
+
+
+def plan_cut_pieces(
+    keyframes: Sequence[float],
+    keep_ranges: Sequence[Tuple[float, float]],
+    duration: float,
+) -> List[GopPiece]:
+    """Split kept ranges into stream-copied GOPs and re-encoded edges.
+
+    Within each kept range, whole GOPs are copied. Only the partial GOPs
+    before the range's first keyframe and after its last keyframe are
+    re-encoded; a range with no whole GOP is re-encoded entirely. A range
+    running to the end of the video copies its final GOP.
+
+    Args:
+        keyframes: Sorted keyframe times in seconds.
+        keep_ranges: Sorted, non-overlapping (start, end) times to keep.
+        duration: Video duration in seconds.
+
+    Returns:
+        Pieces in output order.
+    """
+    pieces: List[GopPiece] = []
+    for start, end in keep_ranges:
+        first = bisect.bisect_left(keyframes, start)
+        copy_start = keyframes[first] if first < len(keyframes) else end
+        if end >= duration:
+            copy_end = end
+        else:
+            last = bisect.bisect_right(keyframes, end) - 1
+            copy_end = keyframes[last] if last >= 0 else start
+
+        if copy_start >= copy_end:
+            pieces.append(GopPiece(start, end, True))
+            continue
+        if start < copy_start:
+            pieces.append(GopPiece(start, copy_start, True))
+        pieces.append(GopPiece(copy_start, copy_end, False))
+        if copy_end < end:
+            pieces.append(GopPiece(copy_end, end, True))
+    return pieces
+
+
+def _overlapping_intervals(
+    intervals: Sequence[Tuple[float, float]],
+    start: float,
+    end: float,
+) -> Sequence[Tuple[float, float]]:
+    """Intervals that overlap [start, end], found by bisection.
+
+    Args:
+        intervals: Sorted, non-overlapping (start, end) times in seconds.
+        start: Start of the range in seconds.
+        end: End of the range in seconds.
+
+    Returns:
+        The overlapping intervals, in order.
+    """
+    # Disjoint sorted intervals also have sorted ends
+    first = bisect.bisect_left(intervals, start, key=lambda interval: interval[1])
+    last = bisect.bisect_right(intervals, end, key=lambda interval: interval[0])
+    return intervals[first:last]
+
+
+def plan_render_pieces(
+    keyframes: Sequence[float],
+    keep_ranges: Sequence[Tuple[float, float]],
+    blank_intervals: Sequence[Tuple[float, float]],
+    duration: float,
+) -> List[GopPiece]:
+    """Plan kept ranges with blanking as copied and re-encoded pieces.
+
+    Combines plan_cut_pieces and plan_gop_pieces: cut edges are
+    re-encoded, and so is every GOP inside a kept range that overlaps a
+    blank interval. Adjacent pieces of the same kind are merged.
+
+    Args:
+        keyframes: Sorted keyframe times in seconds.
+        keep_ranges: Sorted, non-overlapping (start, end) times to keep.
+        blank_intervals: Sorted, non-overlapping (start, end) times in
+            seconds to blank.
+        duration: Video duration in seconds.
+
+    Returns:
+        Pieces in output order.
+    """
+    pieces: List[GopPiece] = []
+    for piece in plan_cut_pieces(keyframes, keep_ranges, duration):
+        overlapping = _overlapping_intervals(blank_intervals, piece.start, piece.end)
+        if piece.reencode or not overlapping:
+            parts = [piece]
+        else:
+            # Copied pieces start on a keyframe, so their GOPs can be planned
+            # on their own
+            first = bisect.bisect_left(keyframes, piece.start)
+            last = bisect.bisect_left(keyframes, piece.end)
+            parts = plan_gop_pieces(keyframes[first:last], overlapping, piece.end)
+
+        for part in parts:
+            if pieces and pieces[-1].end == part.start and pieces[-1].reencode == part.reencode:
+                pieces[-1] = pieces[-1]._replace(end=part.end)
+            else:
+                pieces.append(part)
+    return pieces
+
+
+def encoder_args(stream: VideoStreamInfo) -> Optional[List[str]]:
+    """ffmpeg output arguments that re-encode to match a source stream.
+
+    Args:
+        stream: Codec parameters of the source stream.
+
+    Returns:
+        Encoder arguments, or None if the codec is not supported.
+    """
+    codec = SMART_RENDER_CODECS.get(stream.codec_name)
+    if codec is None:
+        return None
+
+    args = [
+        "-c:v", codec.encoder,
+        "-preset", "medium",
+        "-crf", "18",
+        codec.params_option, "repeat-headers=1",
+    ]
+    profile = _ENCODER_PROFILES[codec.encoder].get(stream.profile or "")
+    if profile:
+        args.extend(["-profile:v", profile])
+    if stream.pix_fmt:
+        args.extend(["-pix_fmt", stream.pix_fmt])
+    return args
+
+
+def shift_intervals(
+    intervals: Sequence[Tuple[float, float]],
+    piece: GopPiece,
+) -> List[Tuple[float, float]]:
+    """Intervals overlapping a piece, with times relative to its start.
+
+    Args:
+        intervals: Sorted, non-overlapping (start, end) times in seconds.
+        piece: The piece being re-encoded.
+
+    Returns:
+        Overlapping intervals, clipped to the piece and shifted so the
+        piece starts at 0. Times are rounded to microseconds so float error
+        from the subtraction cannot exclude a frame on a boundary.
+    """
+    return [
+        (
+            round(max(start, piece.start) - piece.start, 6),
+            round(min(end, piece.end) - piece.start, 6),
+        )
+        for start, end in _overlapping_intervals(intervals, piece.start, piece.end)
+    ]
@@ -1,25 +1,146 @@
 """Speech profanity detection using Whisper ASR and keyword matching."""
 
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
 from video_censor_personal.detection import Detector
+from video_censor_personal.detection_cache import DetectionCache
 from video_censor_personal.device_utils import get_device
 from video_censor_personal.frame import DetectionResult
 from video_censor_personal.loading_spinner import loading_spinner, task_spinner
 from video_censor_personal.model_size import get_whisper_model_size
+from video_censor_personal.phrase_matcher import PhraseMatcher
+from video_censor_personal.voice_activity import SpanTimeline, find_speech_spans
 
 logger = logging.getLogger(__name__)
 
+# Tracks shorter than this are transcribed whole (Whisper decodes 30 s
+# windows, so gating short clips saves nothing)
+_VAD_MIN_AUDIO_SECONDS = 60.0
+
+# Above this fraction of speech, the whole track is transcribed as-is
+_VAD_MAX_SPEECH_FRACTION = 0.9
+
+# Silence inserted between speech spans when they are concatenated
+_VAD_SPAN_GAP_SECONDS = 0.3
+
+# Audio shared by neighbouring parallel windows; words are assigned to the
+# window whose share of the overlap contains their start time
+_WINDOW_OVERLAP_SECONDS = 10.0
+
+# Whisper pipeline loaded once per parallel window worker process
+_worker_pipeline = None
+
+
+def _set_torch_threads(num_threads: Optional[int]) -> None:
+    """Set torch intra-op threads for this process, if configured."""
+    if not num_threads:
+        return
+    try:
+        import torch
+
+        torch.set_num_threads(num_threads)
+    except ImportError:
+        pass
+
+
+def _create_whisper_pipeline(model_size: str, device_param: Any) -> Any:
+    """Create the transformers Whisper speech recognition pipeline.
+
+    Args:
+        model_size: Whisper model size (tiny, base, small, medium, large).
+        device_param: Device parameter for transformers.pipeline().
+
+    Returns:
+        Automatic speech recognition pipeline.
+    """
+    from transformers import pipeline
+
+    return pipeline(
+        "automatic-speech-recognition",
+        model=f"openai/whisper-{model_size}",
+        device=device_param,
+    )
+
+
+def _run_whisper(
+    whisper_pipeline: Any, audio_data: np.ndarray, batch_size: int
+) -> Dict[str, Any]:
+    """Transcribe audio in 30 s chunks with word-level timestamps.
+
+    Args:
+        whisper_pipeline: Pipeline from _create_whisper_pipeline().
+        audio_data: Mono float32 audio at 16 kHz.
+        batch_size: Number of 30 s chunks decoded per batch.
+
+    Returns:
+        Pipeline output with "text" and word "chunks".
+    """
+    return whisper_pipeline(
+        audio_data,
+        chunk_length_s=30,
+        stride_length_s=(4, 2),
+        return_timestamps="word",
+        batch_size=batch_size,
+    )
+
+
+def _init_window_worker(model_size: str, num_threads: int) -> None:
+    """Load the Whisper pipeline in a parallel window worker (CPU only)."""
+    global _worker_pipeline
+    _set_torch_threads(num_threads)
+    _worker_pipeline = _create_whisper_pipeline(model_size, -1)
+
+
+def _transcribe_window(audio_window: np.ndarray, batch_size: int) -> Dict[str, Any]:
+    """Transcribe one window in a worker process."""
+    return _run_whisper(_worker_pipeline, audio_window, batch_size)
+
+
+def _split_windows(
+    num_samples: int, window_samples: int, overlap_samples: int
+) -> List[Tuple[int, int, float, float]]:
+    """Split a track into overlapping windows for parallel transcription.
+
+    Args:
+        num_samples: Track length in samples.
+        window_samples: Window length in samples.
+        overlap_samples: Samples shared by consecutive windows.
+
+    Returns:
+        List of (first sample, end sample, keep from, keep until) where the
+        keep bounds (in samples, relative to the track) partition the track
+        at the middle of each overlap.
+    """
+    step = max(window_samples - overlap_samples, 1)
+    windows: List[Tuple[int, int, float, float]] = []
+    start = 0
+    while True:
+        end = min(start + window_samples, num_samples)
+        last = end >= num_samples
+        keep_from = 0.0 if start == 0 else start + overlap_samples / 2
+        keep_until = float("inf") if last else start + step + overlap_samples / 2
+        windows.append((start, end, keep_from, keep_until))
+        if last:
+            return windows
+        start += step
+
 
 class SpeechProfanityDetector(Detector):
     """Detects profanity in speech using Whisper ASR and keyword matching.
     
     Transcribes audio to text using OpenAI Whisper, then matches against
-    configurable profanity keyword lists for specified languages.
+    configurable profanity keyword lists for specified languages. List
+    entries may be multi-word phrases and may use "*" stems (see
+    PhraseMatcher); they are compiled once whenever keywords is set.
     
     Attributes:
         whisper_model: Whisper model size (tiny, base, small, medium, large).
@@ -39,6 +160,16 @@ class SpeechProfanityDetector(Detector):
                 - languages: List of language codes (default: ["en"])
                 - confidence_threshold: Min confidence for detection (default: 0.8)
                 - device: Optional device override ("cuda", "mps", "cpu")
+                - vad: Transcribe only speech-like spans (default: True)
+                - vad_padding: Context kept around each speech span in
+                  seconds (default: 0.5)
+                - batch_size: 30 s chunks decoded per Whisper batch
+                  (default: 1)
+                - num_threads: torch intra-op threads (default: torch default)
+                - parallel_windows: Worker processes transcribing long
+                  tracks as independent windows on CPU (default: 1)
+                - window_seconds: Length of each parallel window in seconds
+                  (default: 600)
         
         Raises:
             ValueError: If config is invalid.
@@ -49,6 +180,14 @@ class SpeechProfanityDetector(Detector):
         self.model_size = config.get("model", "base")
         self.languages = config.get("languages", ["en"])
         self.confidence_threshold = config.get("confidence_threshold", 0.8)
+        self.vad_enabled = config.get("vad", True)
+        self.vad_padding = config.get("vad_padding", 0.5)
+        self.batch_size = config.get("batch_size", 1)
+        self.num_threads = config.get("num_threads")
+        self.parallel_windows = config.get("parallel_windows", 1)
+        self.window_seconds = config.get("window_seconds", 600.0)
+        self._transcript_cache: Optional[DetectionCache] = None
+        self._audio_fingerprint: Optional[str] = None
         
         # Detect or override device
         device_override = config.get("device")
@@ -59,13 +198,41 @@ class SpeechProfanityDetector(Detector):
             raise ValueError("SpeechProfanityDetector must include 'Profanity' in categories")
         if not self.languages:
             raise ValueError("At least one language must be specified")
+        if not isinstance(self.vad_enabled, bool):
+            raise ValueError("vad must be a boolean")
+        if (
+            not isinstance(self.vad_padding, (int, float))
+            or isinstance(self.vad_padding, bool)
+            or self.vad_padding < 0
+        ):
+            raise ValueError("vad_padding must be a non-negative number")
+        for key, value in (
+            ("batch_size", self.batch_size),
+            ("parallel_windows", self.parallel_windows),
+        ):
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                raise ValueError(f"{key} must be a positive integer")
+        if self.num_threads is not None and (
+            not isinstance(self.num_threads, int)
+            or isinstance(self.num_threads, bool)
+            or self.num_threads < 1
+        ):
+            raise ValueError("num_threads must be a positive integer")
+        if (
+            not isinstance(self.window_seconds, (int, float))
+            or isinstance(self.window_seconds, bool)
+            or self.window_seconds <= 2 * _WINDOW_OVERLAP_SECONDS
+        ):
+            raise ValueError(
+                f"window_seconds must be greater than {2 * _WINDOW_OVERLAP_SECONDS:g}"
+            )
         
         # Load profanity keywords
         self.keywords = self._load_profanity_keywords()
         
         # Load Whisper pipeline with device parameter
         try:
-            from transformers import pipeline
+            import transformers  # noqa: F401
             
             logger.info(f"Loading Whisper model '{self.model_size}' to {self.device}...")
             
@@ -76,16 +243,14 @@ class SpeechProfanityDetector(Detector):
             # Get actual model size from cache (or estimate if not cached)
             model_size_bytes = get_whisper_model_size(self.model_size)
             
+            _set_torch_threads(self.num_threads)
+            
             with loading_spinner(
                 f"openai/whisper-{self.model_size}",
                 model_size_bytes,
                 self.device,
             ):
-                self.pipeline = pipeline(
-                    "automatic-speech-recognition",
-                    model=f"openai/whisper-{self.model_size}",
-                    device=device_param,
-                )
+                self.pipeline = _create_whisper_pipeline(self.model_size, device_param)
             logger.info(f"Whisper model loaded successfully on {self.device}")
         except ImportError as e:
             raise ImportError(
@@ -93,6 +258,19 @@ class SpeechProfanityDetector(Detector):
                 "Install with: pip install transformers torch"
             ) from e
     
+    @property
+    def keywords(self) -> Dict[str, set]:
+        """Profanity keyword entries by language."""
+        return self._keywords
+
+    @keywords.setter
+    def keywords(self, keywords: Dict[str, set]) -> None:
+        """Set keyword entries and compile the phrase matcher."""
+        self._keywords = keywords
+        self._matcher = PhraseMatcher(
+            {lang: keywords.get(lang, set()) for lang in self.languages}
+        )
+
     def supports_full_audio_analysis(self) -> bool:
         """Return True - this detector supports efficient full-audio analysis."""
         return True
@@ -125,7 +303,8 @@ class SpeechProfanityDetector(Detector):
         
         Processes the entire audio track once, extracting word-level timestamps
         from Whisper, then matches profanity keywords to return accurately
-        timestamped detection results.
+        timestamped detection results. With voice-activity gating enabled,
+        only speech-like spans of long tracks are transcribed.
         
         Args:
             audio_data: Complete audio as numpy array (mono, float32).
@@ -139,25 +318,7 @@ class SpeechProfanityDetector(Detector):
             return []
         
         try:
-            audio_duration = len(audio_data) / sample_rate
-            logger.info(
-                f"Transcribing {audio_duration:.1f}s of audio with Whisper "
-                f"(word-level timestamps)..."
-            )
-            
-            with task_spinner(
-                "Transcribing audio with Whisper",
-                f"{audio_duration:.1f}s"
-            ):
-                result = self.pipeline(
-                    audio_data,
-                    chunk_length_s=30,
-                    stride_length_s=(4, 2),
-                    return_timestamps="word",
-                )
-            
-            chunks = result.get("chunks", [])
-            full_text = result.get("text", "").lower()
+            chunks, full_text = self._transcribe(audio_data, sample_rate)
             
             if not chunks:
                 logger.debug("No word chunks returned from Whisper")
@@ -168,40 +329,7 @@ class SpeechProfanityDetector(Detector):
             logger.info(f"Transcribed {len(chunks)} words")
             logger.debug(f"Full transcription: {full_text[:200]}...")
             
-            all_keywords = set()
-            for lang in self.languages:
-                all_keywords.update(self.keywords.get(lang, set()))
-            
-            results = []
-            for chunk in chunks:
-                word = chunk.get("text", "").strip().lower()
-                word_clean = self._clean_word(word)
-                
-                if word_clean in all_keywords:
-                    timestamp = chunk.get("timestamp", (0.0, 0.0))
-                    if isinstance(timestamp, tuple) and len(timestamp) == 2:
-                        start_time, end_time = timestamp
-                    else:
-                        start_time = 0.0
-                        end_time = 0.0
-                    
-                    if start_time is None:
-                        start_time = 0.0
-                    if end_time is None:
-                        end_time = start_time + 0.5
-                    
-                    results.append(
-                        DetectionResult(
-                            start_time=float(start_time),
-                            end_time=float(end_time),
-                            label="Profanity",
-                            confidence=0.95,
-                            reasoning=f"Speech contains profanity: '{word_clean}'",
-                        )
-                    )
-                    logger.debug(
-                        f"Found profanity '{word_clean}' at {start_time:.2f}s - {end_time:.2f}s"
-                    )
+            results = self._match_chunks(chunks)
             
             if results:
                 logger.info(f"Detected {len(results)} profanity instance(s)")
@@ -214,6 +342,312 @@ class SpeechProfanityDetector(Detector):
             logger.error(f"Speech profanity detection failed: {e}", exc_info=True)
             return []
 
+    def set_audio_cache(
+        self, cache: Optional[DetectionCache], audio_fingerprint: Optional[str]
+    ) -> None:
+        """Attach a persistent transcript cache.
+
+        Cached transcripts are reused when the same audio is analyzed with
+        the same Whisper model and transcription settings; keyword lists,
+        languages and confidence_threshold can change freely.
+
+        Args:
+            cache: DetectionCache instance, or None to disable caching.
+            audio_fingerprint: Fingerprint of the audio to be analyzed.
+        """
+        self._transcript_cache = cache
+        self._audio_fingerprint = audio_fingerprint
+
+    def _transcript_cache_key(self, sample_rate: int) -> str:
+        """Identify the model and settings that shape the transcript.
+
+        Args:
+            sample_rate: Audio sample rate in Hz.
+
+        Returns:
+            Key of the form "whisper-<model>:<settings hash>".
+        """
+        settings = {
+            "sample_rate": sample_rate,
+            "vad": self.vad_enabled,
+            "vad_padding": self.vad_padding,
+            "skip_silence": self.activity_index is not None,
+            "window_seconds": (
+                self.window_seconds if self.parallel_windows > 1 else None
+            ),
+        }
+        settings_hash = hashlib.sha256(
+            json.dumps(settings, sort_keys=True).encode()
+        ).hexdigest()[:16]
+        return f"whisper-{self.model_size}:{settings_hash}"
+
+    def _transcribe(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int,
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """Transcribe audio, reusing a cached transcript when available.
+
+        Args:
+            audio_data: Complete audio as numpy array (mono, float32).
+            sample_rate: Audio sample rate in Hz.
+
+        Returns:
+            Tuple of (word chunks, lowercase full text).
+        """
+        cache = self._transcript_cache
+        if cache is None or self._audio_fingerprint is None:
+            return self._transcribe_audio(audio_data, sample_rate)
+
+        cache_key = self._transcript_cache_key(sample_rate)
+        cached = cache.get_transcript(self._audio_fingerprint, cache_key)
+        if cached is not None:
+            logger.info("Using cached transcript (skipping Whisper)")
+            chunks = [
+                {**chunk, "timestamp": tuple(chunk["timestamp"])}
+                if isinstance(chunk.get("timestamp"), list)
+                else chunk
+                for chunk in cached["chunks"]
+            ]
+            return chunks, cached["text"]
+
+        chunks, full_text = self._transcribe_audio(audio_data, sample_rate)
+        cache.put_transcript(
+            self._audio_fingerprint,
+            cache_key,
+            {"text": full_text, "chunks": chunks},
+        )
+        return chunks, full_text
+
+    def _transcribe_audio(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int,
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """Transcribe audio with word timestamps on the original timeline.
+
+        With voice-activity gating, speech-like spans (padded with context)
+        are concatenated with short silent gaps and transcribed in a single
+        pass; word timestamps are then remapped to the original track. The
+        voice-activity scan only reads the non-silent stretches of the
+        activity index, if one was attached. Without gating, those
+        non-silent spans are used directly.
+
+        Args:
+            audio_data: Complete audio as numpy array (mono, float32).
+            sample_rate: Audio sample rate in Hz.
+
+        Returns:
+            Tuple of (word chunks, lowercase full text).
+        """
+        audio_duration = len(audio_data) / sample_rate
+        timeline = None
+
+        if self.activity_index is not None and self.activity_index.active_fraction() == 0:
+            logger.info("Audio is silent; skipping transcription")
+            return [], ""
+
+        spans = None
+        if audio_duration >= _VAD_MIN_AUDIO_SECONDS:
+            if self.vad_enabled:
+                spans = find_speech_spans(
+                    audio_data,
+                    sample_rate,
+                    padding=self.vad_padding,
+                    activity_index=self.activity_index,
+                )
+            elif self.activity_index is not None:
+                # Without VAD, still skip the silent stretches
+                spans = self.activity_index.active_spans(padding=self.vad_padding)
+
+        if spans is not None:
+            speech_duration = sum(end - start for start, end in spans)
+            if not spans:
+                logger.info("No speech activity detected; skipping transcription")
+                return [], ""
+            if speech_duration < _VAD_MAX_SPEECH_FRACTION * audio_duration:
+                logger.info(
+                    f"Voice activity: transcribing {speech_duration:.1f}s of "
+                    f"{audio_duration:.1f}s in {len(spans)} span(s)"
+                )
+                timeline = SpanTimeline(spans, _VAD_SPAN_GAP_SECONDS)
+                audio_data = timeline.concatenate(audio_data, sample_rate)
+
+        transcribe_duration = len(audio_data) / sample_rate
+        logger.info(
+            f"Transcribing {transcribe_duration:.1f}s of audio with Whisper "
+            f"(word-level timestamps)..."
+        )
+
+        with task_spinner(
+            "Transcribing audio with Whisper",
+            f"{transcribe_duration:.1f}s"
+        ):
+            if self._use_parallel_windows(transcribe_duration):
+                chunks, full_text = self._transcribe_windows(audio_data, sample_rate)
+            else:
+                result = _run_whisper(self.pipeline, audio_data, self.batch_size)
+                chunks = result.get("chunks", [])
+                full_text = result.get("text", "").lower()
+
+        if timeline is not None:
+            chunks = [self._remap_chunk(chunk, timeline) for chunk in chunks]
+
+        return chunks, full_text
+
+    def _use_parallel_windows(self, duration: float) -> bool:
+        """Whether to transcribe a track of this duration in parallel windows."""
+        if self.parallel_windows <= 1 or duration <= self.window_seconds:
+            return False
+        if self.device != "cpu":
+            logger.debug(
+                f"parallel_windows ignored on {self.device}; transcribing in one pass"
+            )
+            return False
+        return True
+
+    def _transcribe_windows(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int,
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """Transcribe overlapping windows concurrently and stitch the words.
+
+        Each worker process loads its own CPU Whisper pipeline. Words are
+        kept from the window owning their start time (windows split their
+        overlap at the midpoint), so words at boundaries are neither lost
+        nor duplicated.
+
+        Args:
+            audio_data: Mono float32 audio.
+            sample_rate: Audio sample rate in Hz.
+
+        Returns:
+            Tuple of (word chunks on the audio's timeline, lowercase text).
+        """
+        windows = _split_windows(
+            len(audio_data),
+            int(self.window_seconds * sample_rate),
+            int(_WINDOW_OVERLAP_SECONDS * sample_rate),
+        )
+        workers = min(self.parallel_windows, len(windows))
+        threads_per_worker = self.num_threads or max(1, (os.cpu_count() or 1) // workers)
+        logger.info(
+            f"Transcribing {len(windows)} window(s) in {workers} process(es) "
+            f"({threads_per_worker} thread(s) each)"
+        )
+
+        # Spawn: forking a process that holds torch state is unsafe
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_window_worker,
+            initargs=(self.model_size, threads_per_worker),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _transcribe_window,
+                    np.ascontiguousarray(audio_data[start:end]),
+                    self.batch_size,
+                )
+                for start, end, _, _ in windows
+            ]
+            results = [future.result() for future in futures]
+
+        chunks: List[Dict[str, Any]] = []
+        for (start, _, keep_from, keep_until), result in zip(windows, results):
+            offset = start / sample_rate
+            for chunk in result.get("chunks", []):
+                timestamp = chunk.get("timestamp")
+                if not isinstance(timestamp, tuple) or len(timestamp) != 2:
+                    continue
+                word_start, word_end = timestamp
+                if word_start is None:
+                    continue
+                if not keep_from <= (start + word_start * sample_rate) < keep_until:
+                    continue
+                chunks.append({
+                    **chunk,
+                    "timestamp": (
+                        word_start + offset,
+                        None if word_end is None else word_end + offset,
+                    ),
+                })
+
+        full_text = " ".join(chunk.get("text", "").strip() for chunk in chunks).lower()
+        return chunks, full_text
+
+    def _remap_chunk(
+        self, chunk: Dict[str, Any], timeline: SpanTimeline
+    ) -> Dict[str, Any]:
+        """Map a word chunk's timestamp from span audio to the original track.
+
+        Args:
+            chunk: Whisper word chunk with a (start, end) timestamp.
+            timeline: Timeline the span audio was built from.
+
+        Returns:
+            Copy of the chunk with its timestamp remapped.
+        """
+        timestamp = chunk.get("timestamp")
+        if not isinstance(timestamp, tuple) or len(timestamp) != 2:
+            return chunk
+
+        start_time, end_time = timestamp
+        if start_time is None:
+            return chunk
+        if end_time is None:
+            return {**chunk, "timestamp": (timeline.to_original(start_time), None)}
+        return {**chunk, "timestamp": timeline.range_to_original(start_time, end_time)}
+
+    def _match_chunks(self, chunks: List[Dict[str, Any]]) -> List[DetectionResult]:
+        """Match keyword entries against Whisper word chunks in one pass.
+
+        Args:
+            chunks: Word chunks with "text" and (start, end) "timestamp".
+
+        Returns:
+            One DetectionResult per match, spanning all of its words.
+        """
+        words: List[str] = []
+        spans: List[Tuple[float, float]] = []
+        for chunk in chunks:
+            timestamp = chunk.get("timestamp", (0.0, 0.0))
+            if isinstance(timestamp, tuple) and len(timestamp) == 2:
+                start_time, end_time = timestamp
+            else:
+                start_time = 0.0
+                end_time = 0.0
+            
+            if start_time is None:
+                start_time = 0.0
+            if end_time is None:
+                end_time = start_time + 0.5
+            
+            # A chunk occasionally holds several words; they share its span
+            for word in self._clean_word(chunk.get("text", "")).split():
+                words.append(word)
+                spans.append((float(start_time), float(end_time)))
+        
+        results = []
+        for match in self._matcher.find(words):
+            start_time = spans[match.start_index][0]
+            end_time = spans[match.end_index][1]
+            results.append(
+                DetectionResult(
+                    start_time=start_time,
+                    end_time=end_time,
+                    label="Profanity",
+                    confidence=0.95,
+                    reasoning=f"Speech contains profanity: '{match.phrase}'",
+                )
+            )
+            logger.debug(
+                f"Found profanity '{match.phrase}' ({match.language}) at "
+                f"{start_time:.2f}s - {end_time:.2f}s"
+            )
+        return results
+
     def _clean_word(self, word: str) -> str:
         """Remove punctuation from word for keyword matching.
         
@@ -262,36 +696,20 @@ class SpeechProfanityDetector(Detector):
     def _find_profanity(self, text: str) -> List[str]:
         """Match profanity keywords in text.
         
-        Performs case-insensitive word boundary matching.
+        Performs case-insensitive whole-word matching with the compiled
+        phrase matcher.
         
         Args:
             text: Transcribed text (already lowercase).
         
         Returns:
-            List of unique matched keywords (in lowercase).
+            List of unique matched entries (in lowercase), in order of
+            first appearance.
         """
-        import re
-        
         matches = []
-        matched_set = set()
-        
-        # Combine all keywords from enabled languages
-        all_keywords = set()
-        for lang in self.languages:
-            all_keywords.update(self.keywords.get(lang, set()))
-        
-        # Search for each keyword with word boundaries
-        for keyword in all_keywords:
-            # Escape special regex characters in keyword
-            escaped = re.escape(keyword)
-            # Use word boundaries for matching
-            pattern = rf"\b{escaped}\b"
-            
-            if re.search(pattern, text):
-                if keyword not in matched_set:
-                    matches.append(keyword)
-                    matched_set.add(keyword)
-        
+        for match in self._matcher.find(self._clean_word(text).split()):
+            if match.phrase not in matches:
+                matches.append(match.phrase)
         return matches
     
     def _get_pipeline_device_param(self):
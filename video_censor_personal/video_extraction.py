@@ -1,11 +1,16 @@
 """Video extraction module for frame and audio extraction using ffmpeg."""
 
+import json
 import logging
+import math
+import os
+import queue
 import shutil
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Generator, Iterable, List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -14,6 +19,25 @@ from video_censor_personal.frame import AudioSegment, Frame
 
 logger = logging.getLogger(__name__)
 
+# Sparse frame sampling strategies accepted by VideoExtractor.extract_frames
+_FRAME_SAMPLING_MODES = {"auto", "grab", "seek"}
+
+# Seconds of the video stream inspected when estimating GOP length
+_GOP_PROBE_SECONDS = 30
+
+# Sample rate of the mono audio track decoded for audio detectors
+DETECTION_SAMPLE_RATE = 16000
+
+# Extra ffmpeg output pipes (pipe:N with pass_fds) need POSIX fd inheritance
+_SUPPORTS_EXTRA_PIPES = os.name == "posix"
+
+# Bytes copied per read when spooling decoded PCM to scratch files
+_PCM_COPY_CHUNK = 1024 * 1024
+
+# Audio format assumed when the audio stream cannot be probed
+_DEFAULT_AUDIO_SAMPLE_RATE = 48000
+_DEFAULT_AUDIO_CHANNELS = 2
+
 
 def _check_ffmpeg_available() -> bool:
     """Check if ffmpeg is available in the system PATH.
@@ -24,6 +48,116 @@ def _check_ffmpeg_available() -> bool:
     return shutil.which("ffmpeg") is not None
 
 
+def _read_ffmpeg_stderr(stderr_file) -> str:
+    """Read back ffmpeg's diagnostics from a stderr spool file.
+
+    ffmpeg's stderr goes to a temporary file rather than a pipe, so a
+    chatty ffmpeg cannot block on a full pipe while its output is read.
+
+    Args:
+        stderr_file: Binary temporary file passed to Popen as stderr.
+
+    Returns:
+        The captured diagnostics, stripped.
+    """
+    stderr_file.seek(0)
+    return stderr_file.read().decode(errors="replace").strip()
+
+
+# Sentinel marking the end of a prefetched frame stream
+_PREFETCH_DONE = object()
+
+
+class _PrefetchError:
+    """Wraps an exception raised by the prefetch producer thread."""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def prefetch_frames(
+    frames: Iterable[Frame], max_queued: int
+) -> Generator[Frame, None, None]:
+    """Decode frames ahead of the consumer in a background thread.
+
+    A producer thread pulls frames from the source iterator into a bounded
+    queue while the caller processes earlier frames, overlapping decode with
+    inference. The queue size bounds memory use (backpressure). Frame order
+    is preserved and producer exceptions are re-raised in the caller.
+
+    Args:
+        frames: Source frame iterator (e.g. VideoExtractor.extract_frames()).
+        max_queued: Maximum number of decoded frames waiting in the queue.
+            If 0, frames are passed through without a background thread.
+
+    Yields:
+        Frame objects in source order.
+    """
+    if max_queued <= 0:
+        yield from frames
+        return
+
+    frame_queue: queue.Queue = queue.Queue(maxsize=max_queued)
+    stop = threading.Event()
+
+    def put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                frame_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for frame in frames:
+                if not put(frame):
+                    return
+            put(_PREFETCH_DONE)
+        except BaseException as e:
+            put(_PrefetchError(e))
+        finally:
+            close = getattr(frames, "close", None)
+            if close is not None:
+                close()
+
+    producer = threading.Thread(target=produce, name="frame-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = frame_queue.get()
+            if item is _PREFETCH_DONE:
+                break
+            if isinstance(item, _PrefetchError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def _open_pcm_file(path: Path, channels: int) -> np.ndarray:
+    """Map a raw interleaved float32 PCM file as a read-only array.
+
+    The samples stay on disk and are paged in on access, so long
+    multichannel tracks do not occupy resident memory.
+
+    Args:
+        path: File of little-endian float32 samples.
+        channels: Number of interleaved channels.
+
+    Returns:
+        float32 array shaped (samples,) for mono or (samples, channels);
+        memory-mapped unless the file holds no complete sample.
+    """
+    samples = path.stat().st_size // (np.dtype("<f4").itemsize * channels)
+    shape = (samples,) if channels == 1 else (samples, channels)
+    if samples == 0:
+        return np.zeros(shape, dtype=np.float32)
+    return np.memmap(path, dtype="<f4", mode="r", shape=shape)
+
+
 class VideoExtractor:
     """Extract frames and audio from video files.
 
@@ -34,6 +168,7 @@ class VideoExtractor:
         video_path: Path to the input video file.
         _capture: OpenCV VideoCapture object.
         _audio_cache: Cached audio segment (lazy extraction).
+        _gop_length_cache: Cached average keyframe interval (lazy probe).
         _temp_files: List of temporary files created (for cleanup).
     """
 
@@ -60,6 +195,8 @@ class VideoExtractor:
             )
 
         self._audio_cache: Optional[AudioSegment] = None
+        self._detection_audio_cache: Optional[AudioSegment] = None
+        self._gop_length_cache: Optional[float] = None
         self._temp_files: list[Path] = []
 
     def get_frame_count(self) -> int:
@@ -107,62 +244,326 @@ class VideoExtractor:
         return int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
     def extract_frames(
-        self, sample_rate: float = 1.0
+        self,
+        sample_rate: float = 1.0,
+        mode: str = "auto",
+        start_time: float = 0.0,
+        end_time: Optional[float] = None,
     ) -> Generator[Frame, None, None]:
         """Extract frames at specified sample rate.
 
         Yields frames from the video at the specified time interval.
         For example, sample_rate=1.0 yields one frame per second.
 
+        Sparse sampling avoids fully decoding frames that are thrown away.
+        In "grab" mode skipped frames are only grabbed (no color conversion
+        or copy); in "seek" mode the decoder seeks to the keyframe preceding
+        each target and decodes forward from there. "auto" picks whichever
+        is cheaper given the stream's GOP length and the sampling interval.
+
+        A time range restricts extraction to the sampling grid of the whole
+        video, so adjacent ranges sharing a boundary together yield exactly
+        the frames (with the same indices) of a single full pass.
+
         Args:
             sample_rate: Seconds between extracted frames. If 0, extracts
                 all frames.
+            mode: Sparse sampling strategy: "auto", "grab" or "seek".
+            start_time: Start of the time range in seconds (inclusive).
+            end_time: End of the time range in seconds (exclusive), or None
+                to extract until the end of the video.
 
         Yields:
             Frame objects with index, timecode, and pixel data.
+
+        Raises:
+            ValueError: If mode is not a recognized sampling mode.
         """
+        if mode not in _FRAME_SAMPLING_MODES:
+            raise ValueError(
+                f"Invalid frame sampling mode '{mode}'. "
+                f"Allowed values: {', '.join(sorted(_FRAME_SAMPLING_MODES))}"
+            )
+
         fps = self.get_fps()
         if fps <= 0:
             logger.warning("Invalid FPS detected; cannot extract frames")
             return
 
-        frame_interval = int(fps * sample_rate) if sample_rate > 0 else 1
-        frame_index = 0
-        extracted_count = 0
+        frame_interval = max(int(fps * sample_rate), 1) if sample_rate > 0 else 1
 
-        # Reset capture to beginning
-        self._capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        if frame_interval > 1 and mode == "auto":
+            mode = self._choose_sampling_mode(frame_interval)
+        logger.debug(
+            f"Extracting frames every {frame_interval} frame(s) using '{mode}' mode"
+        )
 
-        while True:
-            ret, frame_data = self._capture.read()
-            if not ret:
-                break
+        # First sampled frame at or after start_time on the global grid
+        start_frame = int(round(start_time * fps))
+        first_frame = -(-start_frame // frame_interval) * frame_interval
+        end_frame = int(round(end_time * fps)) if end_time is not None else None
+
+        if frame_interval > 1 and mode == "seek":
+            yield from self._extract_frames_seek(
+                fps, frame_interval, first_frame, end_frame
+            )
+            return
 
-            if sample_rate == 0 or frame_index % frame_interval == 0:
+        frame_index = first_frame
+
+        # Position capture at the first sampled frame
+        self._capture.set(cv2.CAP_PROP_POS_FRAMES, first_frame)
+
+        while end_frame is None or frame_index < end_frame:
+            if frame_index % frame_interval == 0:
+                ret, frame_data = self._capture.read()
+                if not ret:
+                    break
                 timecode = frame_index / fps
                 yield Frame(
-                    index=extracted_count, timecode=timecode, data=frame_data
+                    index=frame_index // frame_interval,
+                    timecode=timecode,
+                    data=frame_data,
                 )
-                extracted_count += 1
+            elif not self._capture.grab():
+                break
 
             frame_index += 1
 
-    def _get_audio_sample_rate(self) -> Optional[int]:
-        """Detect audio sample rate from video using ffprobe.
+    def extract_frames_ffmpeg(
+        self,
+        sample_rate: float = 1.0,
+        frame_size: Optional[int] = None,
+        start_time: float = 0.0,
+        end_time: Optional[float] = None,
+    ) -> Generator[Frame, None, None]:
+        """Extract frames through a single ffmpeg rawvideo pipe.
+
+        ffmpeg performs frame decimation and downscaling in its own threaded
+        decoder, so only the sampled frames at detector resolution ever cross
+        into Python. Each frame is read directly into a freshly allocated
+        NumPy buffer without intermediate copies.
+
+        Args:
+            sample_rate: Seconds between extracted frames. If 0, extracts
+                all frames.
+            frame_size: Target length in pixels of the frame's shorter side
+                (aspect ratio preserved). If None, frames keep their native
+                resolution.
+            start_time: Start of the time range in seconds (inclusive).
+                ffmpeg input-seeks to the first sampled frame at or after
+                it on the global sampling grid, so adjacent ranges yield
+                the same frames and timecodes as one unsplit extraction.
+            end_time: End of the time range in seconds (exclusive), or None
+                to extract until the end of the video.
+
+        Yields:
+            Frame objects with index, timecode, and pixel data (BGR, uint8).
+
+        Raises:
+            RuntimeError: If ffmpeg is not available or exits with an error.
+        """
+        if not _check_ffmpeg_available():
+            raise RuntimeError(
+                "ffmpeg is not available. Please install ffmpeg to use the "
+                "ffmpeg frame source. See installation instructions in README.md."
+            )
+
+        fps = self.get_fps()
+        if fps <= 0:
+            logger.warning("Invalid FPS detected; cannot extract frames")
+            return
+
+        width, height = self._scaled_frame_dimensions(frame_size)
+        interval = sample_rate if sample_rate > 0 else 1.0 / fps
+
+        # The fps filter restarts its sampling grid at the seek point, so
+        # seek to a grid point; the tolerance absorbs float error such as
+        # 0.9 / 0.3 > 3
+        first_index = math.ceil(start_time / interval - 1e-6)
+        seek_time = first_index * interval
+        max_frames = None
+        if end_time is not None:
+            max_frames = math.ceil(end_time / interval - 1e-6) - first_index
+            if max_frames <= 0:
+                return
+
+        filters = []
+        if sample_rate > 0:
+            # round=up emits the frame showing at each tick; the default
+            # (near) picks the one half an interval later
+            filters.append(f"fps=1/{sample_rate}:round=up")
+        filters.append(f"scale={width}:{height}")
+
+        cmd = ["ffmpeg", "-v", "error"]
+        if seek_time > 0:
+            cmd.extend(["-ss", str(seek_time)])
+        if max_frames is not None:
+            cmd.extend(["-t", str(max_frames * interval)])
+        cmd += [
+            "-i", str(self.video_path),
+            "-map", "0:v:0",
+            "-an",
+            "-sn",
+            "-vf", ",".join(filters),
+            "-f", "rawvideo",
+            "-pix_fmt", "bgr24",
+            "pipe:",
+        ]
+        logger.debug(f"Starting ffmpeg frame source: {' '.join(cmd)}")
+
+        frame_shape = (height, width, 3)
+        frame_bytes = height * width * 3
+
+        stderr_file = tempfile.TemporaryFile()
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                bufsize=frame_bytes,
+            )
+        except BaseException:
+            stderr_file.close()
+            raise
+        try:
+            extracted_count = 0
+            while max_frames is None or extracted_count < max_frames:
+                frame_data = np.empty(frame_shape, dtype=np.uint8)
+                buffer = memoryview(frame_data).cast("B")
+                read = 0
+                while read < frame_bytes:
+                    chunk = process.stdout.readinto(buffer[read:])
+                    if not chunk:
+                        break
+                    read += chunk
+                if read < frame_bytes:
+                    break
+
+                yield Frame(
+                    index=first_index + extracted_count,
+                    timecode=(first_index + extracted_count) * interval,
+                    data=frame_data,
+                )
+                extracted_count += 1
+
+            if extracted_count == max_frames:
+                # The range is complete; ffmpeg is stopped below
+                return
+            if process.wait() != 0:
+                raise RuntimeError(
+                    f"ffmpeg frame extraction failed for {self.video_path} "
+                    f"(exit code {process.returncode}): "
+                    f"{_read_ffmpeg_stderr(stderr_file)}"
+                )
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+            stderr_file.close()
+
+    def _scaled_frame_dimensions(
+        self, frame_size: Optional[int]
+    ) -> tuple[int, int]:
+        """Compute output dimensions for a shorter-side frame size.
+
+        Dimensions are rounded to even values as required by most ffmpeg
+        pixel format conversions.
+
+        Args:
+            frame_size: Target length of the shorter side, or None to keep
+                the native resolution.
+
+        Returns:
+            Tuple of (width, height) in pixels.
+        """
+        width = self.get_video_width()
+        height = self.get_video_height()
+        if not frame_size or width <= 0 or height <= 0:
+            return width, height
+
+        scale = frame_size / min(width, height)
+        scaled_width = max(2, int(round(width * scale / 2)) * 2)
+        scaled_height = max(2, int(round(height * scale / 2)) * 2)
+        return scaled_width, scaled_height
+
+    def _extract_frames_seek(
+        self,
+        fps: float,
+        frame_interval: int,
+        first_frame: int = 0,
+        end_frame: Optional[int] = None,
+    ) -> Generator[Frame, None, None]:
+        """Extract every Nth frame by seeking directly to each target.
+
+        Args:
+            fps: Frames per second of the video.
+            frame_interval: Number of source frames between extracted frames.
+            first_frame: Index of the first frame to extract.
+            end_frame: Frame index to stop before, or None for end of video.
+
+        Yields:
+            Frame objects with index, timecode, and pixel data.
+        """
+        frame_count = self.get_frame_count()
+        if end_frame is not None:
+            frame_count = min(frame_count, end_frame)
+
+        for frame_index in range(first_frame, frame_count, frame_interval):
+            self._capture.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+            ret, frame_data = self._capture.read()
+            if not ret:
+                break
+            yield Frame(
+                index=frame_index // frame_interval,
+                timecode=frame_index / fps,
+                data=frame_data,
+            )
+
+    def _choose_sampling_mode(self, frame_interval: int) -> str:
+        """Pick the cheaper sparse sampling mode for this video.
+
+        Seeking costs on average half a GOP of decoding plus the seek
+        itself, while grabbing costs one decode per skipped frame. Seeking
+        therefore wins once the sampling interval exceeds the GOP length.
+
+        Args:
+            frame_interval: Number of source frames between extracted frames.
+
+        Returns:
+            "seek" or "grab".
+        """
+        gop_length = self._estimate_gop_length()
+        if gop_length is None:
+            return "grab"
+        logger.debug(f"Estimated GOP length: {gop_length:.1f} frames")
+        return "seek" if frame_interval > gop_length else "grab"
+
+    def _estimate_gop_length(self) -> Optional[float]:
+        """Estimate the average keyframe interval of the video stream.
+
+        Reads packet flags (no decoding) for the first few seconds of the
+        video stream using ffprobe. The result is cached.
 
         Returns:
-            Sample rate in Hz, or None if detection fails.
+            Average number of frames per GOP, or None if it cannot be
+            determined.
         """
+        if self._gop_length_cache is not None:
+            return self._gop_length_cache
+
+        if shutil.which("ffprobe") is None:
+            return None
+
         try:
-            import json
-            import subprocess
-            
             cmd = [
                 "ffprobe",
                 "-v", "error",
-                "-select_streams", "a:0",
-                "-show_entries", "stream=sample_rate",
-                "-of", "json",
+                "-select_streams", "v:0",
+                "-read_intervals", f"%+{_GOP_PROBE_SECONDS}",
+                "-show_entries", "packet=flags",
+                "-of", "csv=p=0",
                 str(self.video_path),
             ]
             result = subprocess.run(
@@ -172,27 +573,77 @@ class VideoExtractor:
                 text=True,
                 check=False,
             )
-            
             if result.returncode != 0:
                 return None
-            
-            data = json.loads(result.stdout)
-            streams = data.get("streams", [])
-            if streams:
-                return int(streams[0].get("sample_rate", 0))
+
+            flags = [line for line in result.stdout.splitlines() if line.strip()]
+            keyframes = sum(1 for line in flags if "K" in line)
+            if not flags or keyframes == 0:
+                return None
+
+            self._gop_length_cache = len(flags) / keyframes
+            return self._gop_length_cache
+        except Exception as e:
+            logger.warning(f"Failed to estimate GOP length: {e}")
             return None
+
+    def _probe_audio_stream(self) -> Optional[Tuple[int, int]]:
+        """Detect sample rate and channel count of the first audio stream.
+
+        Returns:
+            Tuple of (sample_rate, channels), or None if detection fails.
+        """
+        cmd = [
+            "ffprobe",
+            "-v", "error",
+            "-select_streams", "a:0",
+            "-show_entries", "stream=sample_rate,channels",
+            "-of", "json",
+            str(self.video_path),
+        ]
+        try:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=False,
+            )
+            if result.returncode != 0:
+                return None
+
+            streams = json.loads(result.stdout).get("streams", [])
+            if not streams:
+                return None
+            sample_rate = int(streams[0].get("sample_rate", 0))
+            channels = int(streams[0].get("channels", 0))
+            if sample_rate <= 0 or channels <= 0:
+                return None
+            return sample_rate, channels
         except Exception as e:
-            logger.warning(f"Failed to detect audio sample rate: {e}")
+            logger.warning(f"Failed to probe audio stream: {e}")
             return None
 
-    def extract_audio(self) -> AudioSegment:
+    def extract_audio(self, include_detection_track: bool = False) -> AudioSegment:
         """Extract audio stream from video file.
 
-        Returns audio as a cached numpy array at original sample rate.
-        Subsequent calls return the cached result without re-invoking ffmpeg.
+        Decodes the first audio stream to float32 PCM at its original sample
+        rate and channel count. The PCM is written once to a scratch file
+        and exposed as a read-only memory-mapped array, so it is not held in
+        process memory while frames are analyzed. The result is cached;
+        subsequent calls return it without re-invoking ffmpeg. The mapping
+        stays valid after close() on POSIX; elsewhere keep the extractor
+        open while the audio is in use.
+
+        Args:
+            include_detection_track: If True, also decode the 16 kHz mono
+                detection track in the same ffmpeg pass (where the platform
+                supports extra output pipes) and cache it for
+                extract_detection_audio().
 
         Returns:
-            AudioSegment object with audio data and metadata.
+            AudioSegment whose data is a read-only float32 array shaped
+            (samples,) for mono or (samples, channels) for multichannel audio.
 
         Raises:
             RuntimeError: If ffmpeg is not available or audio extraction fails.
@@ -208,52 +659,181 @@ class VideoExtractor:
 
         duration = self.get_duration_seconds()
 
-        # Create temporary file for audio extraction
-        temp_audio = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-        temp_path = Path(temp_audio.name)
-        temp_audio.close()
-        self._temp_files.append(temp_path)
-
-        try:
-            # Extract audio using ffmpeg at original sample rate and channels
-            # We preserve all channels and sample rate for remediation fidelity.
-            # Detection pipelines can downmix/downsample as needed.
-            cmd = [
-                "ffmpeg",
-                "-i",
-                str(self.video_path),
-                "-q:a",
-                "9",
-                "-y",
-                str(temp_path),
-            ]
-            subprocess.run(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=True,
+        # Single probe for the stream layout; ffmpeg is told the format
+        # explicitly so the PCM layout is known even if probing fails
+        stream_info = self._probe_audio_stream()
+        if stream_info is None:
+            logger.warning(
+                f"Could not probe audio stream; decoding as "
+                f"{_DEFAULT_AUDIO_CHANNELS}-channel {_DEFAULT_AUDIO_SAMPLE_RATE} Hz"
             )
-
-            # Read audio file
-            with open(temp_path, "rb") as f:
-                audio_data = f.read()
-
-            # Get original sample rate from the video using ffprobe
-            # Default to 48000 if detection fails
-            sample_rate = self._get_audio_sample_rate() or 48000
-
-            self._audio_cache = AudioSegment(
+            stream_info = (_DEFAULT_AUDIO_SAMPLE_RATE, _DEFAULT_AUDIO_CHANNELS)
+        sample_rate, channels = stream_info
+
+        # Preserve all channels and sample rate for remediation fidelity.
+        # Detection uses its own downmixed, resampled track.
+        layouts = [(sample_rate, channels)]
+        with_detection = (
+            include_detection_track
+            and self._detection_audio_cache is None
+            and _SUPPORTS_EXTRA_PIPES
+        )
+        if with_detection:
+            layouts.append((DETECTION_SAMPLE_RATE, 1))
+
+        tracks = self._decode_audio(layouts)
+
+        self._audio_cache = AudioSegment(
+            start_time=0.0,
+            end_time=duration,
+            data=tracks[0],
+            sample_rate=sample_rate,
+        )
+        if with_detection:
+            self._detection_audio_cache = AudioSegment(
                 start_time=0.0,
                 end_time=duration,
-                data=audio_data,
-                sample_rate=sample_rate,
+                data=tracks[1],
+                sample_rate=DETECTION_SAMPLE_RATE,
             )
-            return self._audio_cache
+        return self._audio_cache
 
-        except subprocess.CalledProcessError as e:
+    def extract_detection_audio(self) -> AudioSegment:
+        """Extract the mono 16 kHz audio track used by audio detectors.
+
+        ffmpeg downmixes and resamples while streaming, so no full-rate
+        multichannel copy is ever materialized for detection. Returns the
+        track cached by extract_audio(include_detection_track=True) when
+        available; otherwise decodes it in a dedicated ffmpeg pass.
+
+        Returns:
+            AudioSegment with mono float32 data at DETECTION_SAMPLE_RATE.
+
+        Raises:
+            RuntimeError: If ffmpeg is not available or audio extraction fails.
+        """
+        if self._detection_audio_cache is not None:
+            return self._detection_audio_cache
+
+        if not _check_ffmpeg_available():
             raise RuntimeError(
-                f"Failed to extract audio from {self.video_path}: {e}"
-            ) from e
+                "ffmpeg is not available. Please install ffmpeg to extract "
+                "audio. See installation instructions in README.md."
+            )
+
+        duration = self.get_duration_seconds()
+        (data,) = self._decode_audio([(DETECTION_SAMPLE_RATE, 1)])
+
+        self._detection_audio_cache = AudioSegment(
+            start_time=0.0,
+            end_time=duration,
+            data=data,
+            sample_rate=DETECTION_SAMPLE_RATE,
+        )
+        return self._detection_audio_cache
+
+    def _decode_audio(self, layouts: List[Tuple[int, int]]) -> List[np.ndarray]:
+        """Decode the first audio stream to float32 PCM in one ffmpeg pass.
+
+        The first output is piped through stdout; each further output gets
+        its own pipe and reader thread so ffmpeg never blocks on a full pipe.
+        Each track is spooled to a scratch file (removed by close()) and
+        returned memory-mapped, so decoded audio is shared through the page
+        cache instead of held in process memory.
+
+        Args:
+            layouts: (sample_rate, channels) of each output track.
+
+        Returns:
+            One read-only PCM array per layout, shaped as by _open_pcm_file().
+
+        Raises:
+            RuntimeError: If ffmpeg exits with an error.
+        """
+        cmd = ["ffmpeg", "-v", "error", "-i", str(self.video_path)]
+        extra_pipes: List[Tuple[int, int]] = []
+        for index, (sample_rate, channels) in enumerate(layouts):
+            if index == 0:
+                target = "pipe:1"
+            else:
+                read_fd, write_fd = os.pipe()
+                extra_pipes.append((read_fd, write_fd))
+                target = f"pipe:{write_fd}"
+            cmd += [
+                "-map", "0:a:0",
+                "-vn",
+                "-f", "f32le",
+                "-acodec", "pcm_f32le",
+                "-ac", str(channels),
+                "-ar", str(sample_rate),
+                target,
+            ]
+        logger.debug(f"Extracting audio: {' '.join(cmd)}")
+
+        # Read ends are wrapped before spawning so they are closed even if
+        # ffmpeg cannot be started
+        extra_streams = [os.fdopen(read_fd, "rb") for read_fd, _ in extra_pipes]
+        stderr_file = tempfile.TemporaryFile()
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                pass_fds=[write_fd for _, write_fd in extra_pipes],
+            )
+        except BaseException:
+            for stream in extra_streams:
+                stream.close()
+            stderr_file.close()
+            raise
+        finally:
+            for _, write_fd in extra_pipes:
+                os.close(write_fd)
+
+        streams = [process.stdout] + extra_streams
+        tracks: List[Optional[np.ndarray]] = [None] * len(layouts)
+        pcm_paths = [self._create_pcm_file() for _ in layouts]
+
+        def read_track(index: int) -> None:
+            with open(pcm_paths[index], "wb") as f:
+                shutil.copyfileobj(streams[index], f, _PCM_COPY_CHUNK)
+            tracks[index] = _open_pcm_file(pcm_paths[index], layouts[index][1])
+
+        readers = [
+            threading.Thread(target=read_track, args=(index,), daemon=True)
+            for index in range(1, len(layouts))
+        ]
+        try:
+            for reader in readers:
+                reader.start()
+            read_track(0)
+            for reader in readers:
+                reader.join()
+            if process.wait() != 0 or any(track is None for track in tracks):
+                raise RuntimeError(
+                    f"Failed to extract audio from {self.video_path} "
+                    f"(ffmpeg exit code {process.returncode}): "
+                    f"{_read_ffmpeg_stderr(stderr_file)}"
+                )
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            for reader in readers:
+                reader.join()
+            for stream in streams:
+                stream.close()
+            stderr_file.close()
+
+        return tracks
+
+    def _create_pcm_file(self) -> Path:
+        """Create a scratch file for decoded PCM, removed by close()."""
+        temp_pcm = tempfile.NamedTemporaryFile(suffix=".f32", delete=False)
+        temp_pcm.close()
+        temp_path = Path(temp_pcm.name)
+        self._temp_files.append(temp_path)
+        return temp_path
 
     def extract_audio_segment(
         self, start_sec: float, end_sec: float
@@ -386,6 +386,49 @@ def _merge_chapters(
     return merged
 
 
+def _pad_mp4_chapters(
+    existing_chapters: Optional[List[Dict[str, Any]]],
+    merged_chapters: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Prepend a padding chapter so MP4 output keeps the first chapter's start.
+
+    ffmpeg's MP4 muxer forces the first chapter to start at 0.0. Padding is
+    only added when merging with existing chapters; for pure skip chapters
+    the ffmpeg behavior of starting at 0 is accepted.
+
+    Args:
+        existing_chapters: Chapters already in the input, or None.
+        merged_chapters: Sorted existing and skip chapters.
+
+    Returns:
+        Chapters to write to an MP4 file.
+    """
+    if existing_chapters and merged_chapters and merged_chapters[0].get("start", 0) > 0:
+        padding_chapter = {
+            "start": 0,
+            "end": merged_chapters[0]["start"],
+            "title": "Start",
+        }
+        logger.debug(
+            f"Added padding chapter (0.0-{merged_chapters[0]['start']}s) "
+            f"for ffmpeg MP4 timing preservation"
+        )
+        return [padding_chapter] + merged_chapters
+    return merged_chapters
+
+
+def _escape_ffmetadata(value: str) -> str:
+    """Escape characters that are special in FFMETADATA values.
+
+    Args:
+        value: Raw metadata value.
+
+    Returns:
+        Value with '=', ';', '#', backslash and newlines backslash-escaped.
+    """
+    return re.sub(r"([=;#\\\n])", r"\\\1", str(value))
+
+
 def _generate_ffmetadata(
     chapters: List[Dict[str, Any]],
 ) -> str:
@@ -395,7 +438,8 @@ def _generate_ffmetadata(
         chapters: List of chapter dictionaries with 'start', 'end', and 'title'.
 
     Returns:
-        FFMETADATA format string.
+        FFMETADATA format string, readable by ffmpeg as an input
+        (-f ffmetadata).
     """
     lines = [";FFMETADATA1"]
     
@@ -424,23 +468,25 @@ def _generate_ffmetadata(
         end_ms = int(float(end) * 1000)
         title = chapter.get("title", f"Chapter {idx}")
         
-        lines.append(f"[CHAPTER{idx:02d}]")
+        # ffmpeg only recognizes the bare [CHAPTER] section header
+        lines.append("[CHAPTER]")
         lines.append(f"TIMEBASE=1/1000")
         lines.append(f"START={start_ms}")
         lines.append(f"END={end_ms}")
-        lines.append(f"title={title}")
+        lines.append(f"title={_escape_ffmetadata(title)}")
     
     return "\n".join(lines)
 
 
-def _check_ffmpeg_version() -> Tuple[int, int, int]:
-    """Check ffmpeg version and ensure it meets minimum requirement (2.0+).
+def get_ffmpeg_version() -> Tuple[int, int, int]:
+    """Return the version of the installed ffmpeg.
 
     Returns:
         Tuple of (major, minor, patch) version numbers.
 
     Raises:
-        VideoMetadataError: If ffmpeg < 2.0 or ffmpeg not found.
+        VideoMetadataError: If ffmpeg is not found or its version cannot be
+            parsed (e.g. git builds).
     """
     try:
         result = subprocess.run(
@@ -459,17 +505,6 @@ def _check_ffmpeg_version() -> Tuple[int, int, int]:
         major = int(match.group(1))
         minor = int(match.group(2))
         patch = int(match.group(3)) if match.group(3) else 0
-        
-        if major < 2:
-            raise VideoMetadataError(
-                f"ffmpeg {major}.{minor}.{patch} is installed, but ffmpeg >= 2.0 is required for MKV to MP4 conversion. "
-                "Please install a newer version:\n"
-                "  macOS: brew install ffmpeg\n"
-                "  Linux: sudo apt install ffmpeg\n"
-                "  Windows: Download from https://ffmpeg.org/download.html"
-            )
-        
-        logger.debug(f"ffmpeg version check: {major}.{minor}.{patch} (OK)")
         return (major, minor, patch)
     
     except subprocess.TimeoutExpired as e:
@@ -485,6 +520,78 @@ def _check_ffmpeg_version() -> Tuple[int, int, int]:
         raise VideoMetadataError(f"Failed to check ffmpeg version: {e}") from e
 
 
+def _check_ffmpeg_version() -> Tuple[int, int, int]:
+    """Check ffmpeg version and ensure it meets minimum requirement (2.0+).
+
+    Returns:
+        Tuple of (major, minor, patch) version numbers.
+
+    Raises:
+        VideoMetadataError: If ffmpeg < 2.0 or ffmpeg not found.
+    """
+    major, minor, patch = get_ffmpeg_version()
+    if major < 2:
+        raise VideoMetadataError(
+            f"ffmpeg {major}.{minor}.{patch} is installed, but ffmpeg >= 2.0 is required for MKV to MP4 conversion. "
+            "Please install a newer version:\n"
+            "  macOS: brew install ffmpeg\n"
+            "  Linux: sudo apt install ffmpeg\n"
+            "  Windows: Download from https://ffmpeg.org/download.html"
+        )
+
+    logger.debug(f"ffmpeg version check: {major}.{minor}.{patch} (OK)")
+    return (major, minor, patch)
+
+
+def build_output_chapters(
+    input_path: str,
+    output_path: str,
+    merged_segments: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Build the chapter list for an output video with skip chapters.
+
+    Merges the input's existing chapters with skip chapters for the
+    segments, so the list can be written by the same ffmpeg pass that
+    produces the output (see write_ffmetadata_chapters).
+
+    Args:
+        input_path: Path to input video file (source of existing chapters).
+        output_path: Path to output video file; MP4 outputs get the padding
+            chapter described in _pad_mp4_chapters.
+        merged_segments: List of merged detection segments.
+
+    Returns:
+        Sorted chapters with numeric 'start', 'end' and 'title'.
+
+    Raises:
+        VideoMetadataError: If existing chapters cannot be read.
+    """
+    skip_chapters = _build_skip_chapters(merged_segments)
+    logger.debug(f"Built {len(skip_chapters)} skip chapters from {len(merged_segments)} segments")
+    
+    existing_ffmetadata = _extract_chapters_from_video(Path(input_path))
+    existing_chapters = (
+        _parse_ffmetadata_chapters(existing_ffmetadata) if existing_ffmetadata else None
+    )
+    if existing_chapters:
+        logger.debug(f"Found {len(existing_chapters)} existing chapters in input video")
+    
+    merged_chapters = _merge_chapters(existing_chapters, skip_chapters)
+    if Path(output_path).suffix.lower() == ".mkv":
+        return merged_chapters
+    return _pad_mp4_chapters(existing_chapters, merged_chapters)
+
+
+def write_ffmetadata_chapters(chapters: List[Dict[str, Any]], path: str) -> None:
+    """Write chapters to an FFMETADATA file for ffmpeg's -map_chapters.
+
+    Args:
+        chapters: Chapter dictionaries with 'start', 'end', and 'title'.
+        path: Path of the FFMETADATA file to write.
+    """
+    Path(path).write_text(_generate_ffmetadata(chapters) + "\n", encoding="utf-8")
+
+
 def write_skip_chapters_to_mkv(
     input_path: str,
     output_path: str,
@@ -713,20 +820,7 @@ def write_skip_chapters_to_mp4_native(
     merged_chapters = _merge_chapters(existing_chapters, skip_chapters)
     logger.debug(f"Merged to {len(merged_chapters)} total chapters")
     
-    # MP4 chapter handling: When converting MKV→MP4, ffmpeg has a quirk where it forces
-    # the first chapter to start at 0.0 if there are no pre-existing chapters.
-    # Solution: Only add padding chapters when merging with existing chapters.
-    # For pure skip chapters with no existing chapters, we accept the ffmpeg behavior of starting at 0.
-    chapters_for_mp4 = merged_chapters
-    if existing_chapters and merged_chapters and merged_chapters[0].get("start", 0) > 0:
-        # Add padding chapter only when merging with existing chapters to preserve all timing
-        padding_chapter = {
-            "start": 0,
-            "end": merged_chapters[0]["start"],
-            "title": "Start",
-        }
-        chapters_for_mp4 = [padding_chapter] + merged_chapters
-        logger.debug(f"Added padding chapter (0.0-{merged_chapters[0]['start']}s) for ffmpeg MKV→MP4 timing preservation")
+    chapters_for_mp4 = _pad_mp4_chapters(existing_chapters, merged_chapters)
     
     # Generate chapter XML for mkvmerge
     chapter_xml = _generate_chapter_xml(chapters_for_mp4)
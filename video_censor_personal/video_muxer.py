@@ -2,14 +2,22 @@
 
 Re-muxes remediated audio back into original video container using ffmpeg.
 Preserves video codec (lossless) and encodes audio as AAC.
-Supports adding metadata tags (title, remediation info) to output.
+Supports adding metadata tags (title, remediation info) and chapters to
+output, so a single pass writes everything remediation adds.
+
+Remediated audio comes either from a WAV file or as a stream of raw PCM
+blocks written straight into ffmpeg's stdin.
 """
 
 import logging
 import subprocess
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from video_censor_personal.audio_remediator import RemediatedAudioStream
 
 logger = logging.getLogger(__name__)
 
@@ -17,47 +25,58 @@ logger = logging.getLogger(__name__)
 class VideoMuxer:
     """Re-muxes remediated audio into video container.
     
-    Uses ffmpeg to combine original video with remediated audio WAV file,
-    writing output as MP4 with video passthrough (no re-encoding) and
-    AAC audio encoding.
+    Uses ffmpeg to combine original video with remediated audio (a WAV file
+    or a RemediatedAudioStream), writing output as MP4 with video
+    passthrough (no re-encoding) and AAC audio encoding.
     
-    Optionally adds metadata tags (title, remediation info) to the output.
+    Optionally adds metadata tags (title, remediation info) and chapters to
+    the output. remux() writes tags and chapters without replacing audio.
     
     Attributes:
         original_video_path: Path to original video file.
-        remediated_audio_path: Path to remediated audio WAV file.
+        remediated_audio_path: Path to remediated audio WAV file, or None
+            when the audio is streamed with mux_audio_stream().
         metadata: Optional dictionary of metadata tags to write.
         title: Optional new title for the output video.
+        chapters_path: Optional FFMETADATA file whose chapters replace the
+            video's chapters.
     """
     
     def __init__(
         self,
         original_video_path: str,
-        remediated_audio_path: str,
+        remediated_audio_path: Optional[str] = None,
         metadata: Optional[Dict[str, str]] = None,
         title: Optional[str] = None,
+        chapters_path: Optional[str] = None,
     ) -> None:
         """Initialize video muxer.
         
         Args:
             original_video_path: Path to original video file.
-            remediated_audio_path: Path to remediated audio WAV file.
+            remediated_audio_path: Path to remediated audio WAV file (omit
+                when streaming audio with mux_audio_stream()).
             metadata: Optional dictionary of metadata tags (key=value).
             title: Optional new title for the output video.
+            chapters_path: Optional FFMETADATA file with chapters for the
+                output (see video_metadata_writer.write_ffmetadata_chapters).
         
         Raises:
             FileNotFoundError: If input files don't exist.
         """
         self.original_video_path = Path(original_video_path)
-        self.remediated_audio_path = Path(remediated_audio_path)
+        self.remediated_audio_path = (
+            Path(remediated_audio_path) if remediated_audio_path is not None else None
+        )
         self.metadata = metadata or {}
         self.title = title
+        self.chapters_path = chapters_path
         
         if not self.original_video_path.exists():
             raise FileNotFoundError(
                 f"Original video not found: {self.original_video_path}"
             )
-        if not self.remediated_audio_path.exists():
+        if self.remediated_audio_path is not None and not self.remediated_audio_path.exists():
             raise FileNotFoundError(
                 f"Remediated audio not found: {self.remediated_audio_path}"
             )
@@ -98,8 +117,140 @@ class VideoMuxer:
         Raises:
             RuntimeError: If ffmpeg not available or muxing fails.
         """
-        output_path = Path(output_video_path)
+        if self.remediated_audio_path is None:
+            raise RuntimeError("No remediated audio file to mux")
+        
+        cmd = self._build_command(
+            ["-i", str(self.remediated_audio_path)], Path(output_video_path)
+        )
+        self._run(cmd)
+        logger.info(f"Video muxing complete with metadata: {output_video_path}")
+    
+    def remux(self, output_video_path: str) -> None:
+        """Rewrite the video with metadata tags and chapters, keeping its streams.
+        
+        Maps every stream of the video (-map 0) and copies it (-c copy), so
+        only the container is rewritten and extra audio tracks, subtitles
+        and data streams are kept.
+        
+        Args:
+            output_video_path: Path where the video will be saved.
+        
+        Raises:
+            RuntimeError: If ffmpeg not available or remuxing fails.
+        """
+        self._run(self._build_command([], Path(output_video_path)))
+        logger.info(f"Video remux complete with metadata: {output_video_path}")
+    
+    def _run(self, cmd: List[str]) -> None:
+        """Run an ffmpeg command built by _build_command().
+        
+        Args:
+            cmd: Command argument list.
+        
+        Raises:
+            RuntimeError: If ffmpeg fails.
+        """
+        try:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=False,
+            )
+            
+            if result.returncode != 0:
+                error_msg = result.stderr or result.stdout
+                raise RuntimeError(
+                    f"ffmpeg muxing failed with exit code {result.returncode}: {error_msg}"
+                )
+        
+        except subprocess.TimeoutExpired:
+            raise RuntimeError("ffmpeg muxing timed out")
+        except Exception as e:
+            raise RuntimeError(f"Video muxing failed: {e}") from e
+    
+    def mux_audio_stream(
+        self,
+        output_video_path: str,
+        audio_stream: "RemediatedAudioStream",
+    ) -> None:
+        """Mux streamed remediated audio into video with optional metadata.
+        
+        Same as mux_video(), but the audio is read by ffmpeg as raw float32
+        PCM from stdin (-f f32le -i pipe:0) while blocks are written to it,
+        so no intermediate WAV file is created.
+        
+        Args:
+            output_video_path: Path where muxed video will be saved.
+            audio_stream: Remediated audio blocks with their sample rate and
+                channel count.
+        
+        Raises:
+            RuntimeError: If ffmpeg not available or muxing fails.
+        """
+        cmd = self._build_command(
+            [
+                "-f", "f32le",
+                "-ar", str(audio_stream.sample_rate),
+                "-ac", str(audio_stream.channels),
+                "-i", "pipe:0",
+            ],
+            Path(output_video_path),
+        )
+        
+        # stderr goes to a file so a chatty ffmpeg cannot block on a full pipe
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr_file,
+            )
+            try:
+                try:
+                    for block in audio_stream.iter_blocks():
+                        process.stdin.write(block.tobytes())
+                except BrokenPipeError:
+                    # ffmpeg exited early; its exit code and stderr explain why
+                    pass
+                finally:
+                    try:
+                        process.stdin.close()
+                    except BrokenPipeError:
+                        pass
+                returncode = process.wait()
+            except BaseException:
+                process.kill()
+                process.wait()
+                raise
+            
+            if returncode != 0:
+                stderr_file.seek(0)
+                error_msg = stderr_file.read().decode(errors="replace")
+                raise RuntimeError(
+                    f"ffmpeg muxing failed with exit code {returncode}: {error_msg}"
+                )
+        
+        logger.info(f"Video muxing complete with streamed audio: {output_video_path}")
+    
+    def _build_command(
+        self, audio_input_args: List[str], output_path: Path
+    ) -> List[str]:
+        """Build the ffmpeg muxing command described in mux_video().
         
+        Args:
+            audio_input_args: ffmpeg arguments declaring the audio input, or
+                an empty list to keep the video's own streams (remux()).
+            output_path: Path where muxed video will be saved.
+        
+        Returns:
+            Command argument list.
+        
+        Raises:
+            RuntimeError: If ffmpeg not available.
+        """
         # Check ffmpeg available
         if not self._check_ffmpeg():
             raise RuntimeError(
@@ -116,13 +267,29 @@ class VideoMuxer:
         cmd = [
             "ffmpeg",
             "-i", str(self.original_video_path),
-            "-i", str(self.remediated_audio_path),
-            "-c:v", "copy",    # Copy video codec (no re-encoding)
-            "-c:a", "aac",     # Encode audio as AAC
-            "-map", "0:v:0",   # Video from first input
-            "-map", "1:a:0",   # Audio from second input
-            "-shortest",       # Stop at shortest stream
+            *audio_input_args,
         ]
+        if self.chapters_path:
+            cmd.extend(["-f", "ffmetadata", "-i", str(self.chapters_path)])
+        
+        if audio_input_args:
+            cmd.extend([
+                "-c:v", "copy",    # Copy video codec (no re-encoding)
+                "-c:a", "aac",     # Encode audio as AAC
+                "-map", "0:v:0",   # Video from first input
+                "-map", "1:a:0",   # Audio from second input
+                "-shortest",       # Stop at shortest stream
+            ])
+        else:
+            cmd.extend([
+                "-map", "0",           # Every stream: extra audio, subtitles, data
+                "-map_metadata", "0",  # Keep the video's own tags
+                "-c", "copy",          # Rewrite the container only
+            ])
+        
+        # Chapters come from the FFMETADATA input, which follows the others
+        if self.chapters_path:
+            cmd.extend(["-map_chapters", "2" if audio_input_args else "1"])
         
         # Add title metadata if provided
         if self.title:
@@ -144,28 +311,7 @@ class VideoMuxer:
         
         logger.debug(f"Muxing video with metadata: {len(self.metadata)} tags")
         logger.debug(f"ffmpeg command: {' '.join(cmd[:15])}... (args truncated)")
-        
-        try:
-            result = subprocess.run(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=False,
-            )
-            
-            if result.returncode != 0:
-                error_msg = result.stderr or result.stdout
-                raise RuntimeError(
-                    f"ffmpeg muxing failed with exit code {result.returncode}: {error_msg}"
-                )
-            
-            logger.info(f"Video muxing complete with metadata: {output_path}")
-        
-        except subprocess.TimeoutExpired:
-            raise RuntimeError("ffmpeg muxing timed out")
-        except Exception as e:
-            raise RuntimeError(f"Video muxing failed: {e}") from e
+        return cmd
     
     @staticmethod
     def _check_ffmpeg() -> bool:
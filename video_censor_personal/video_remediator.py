@@ -1,13 +1,123 @@
 """Video remediation engine for blanking or cutting detected visual content."""
 
+import bisect
+import functools
 import logging
+import math
 import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from video_censor_personal.smart_render import (
+    SMART_RENDER_CODECS,
+    GopPiece,
+    VideoStreamInfo,
+    encoder_args,
+    plan_render_pieces,
+    probe_has_audio,
+    probe_keyframes,
+    probe_video_stream,
+    shift_intervals,
+)
+from video_censor_personal.video_metadata_writer import (
+    VideoMetadataError,
+    get_ffmpeg_version,
+)
 
 logger = logging.getLogger(__name__)
 
+# Linux rejects any single command-line argument longer than this
+# (MAX_ARG_STRLEN, including the terminating NUL)
+_MAX_ARG_BYTES = 128 * 1024
+
+# Options reading a filtergraph from a file before ffmpeg 7.0 added "-/option"
+_LEGACY_SCRIPT_OPTIONS = {
+    "filter_complex": "-filter_complex_script",
+    "filter:v": "-filter_script:v",
+}
+
+
+def _coalesce_intervals(intervals: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """Union time intervals into sorted, disjoint intervals.
+
+    Args:
+        intervals: (start, end) times in seconds, end inclusive, in any order.
+
+    Returns:
+        Sorted intervals, widened to whole milliseconds, with overlapping or
+        touching intervals merged, so each interval ends strictly before the
+        next one starts.
+    """
+    merged: List[Tuple[float, float]] = []
+    for start, end in sorted(intervals):
+        # Widen to whole milliseconds, the precision of filter expressions,
+        # so rounding never drops a frame on an interval boundary
+        start = math.floor(round(start * 1000, 6)) / 1000
+        end = math.ceil(round(end * 1000, 6)) / 1000
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _interval_search_expr(intervals: List[Tuple[float, float]]) -> str:
+    """Build an ffmpeg expression that is 1 while t lies in an interval.
+
+    The expression is a balanced binary search over the interval starts;
+    ffmpeg's if() only evaluates the taken branch, so each frame evaluates
+    O(log n) comparisons regardless of the number of intervals.
+
+    Args:
+        intervals: Sorted, disjoint (start, end) times from _coalesce_intervals.
+
+    Returns:
+        Expression in t, e.g.
+        "if(lt(t,30.000),between(t,10.000,15.000),between(t,30.000,35.000))".
+    """
+    if len(intervals) == 1:
+        start, end = intervals[0]
+        return f"between(t,{start:.3f},{end:.3f})"
+
+    # t before the middle start can only lie in the lower half; from it on,
+    # every lower interval has already ended
+    mid = len(intervals) // 2
+    return (
+        f"if(lt(t,{intervals[mid][0]:.3f}),"
+        f"{_interval_search_expr(intervals[:mid])},"
+        f"{_interval_search_expr(intervals[mid:])})"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_version() -> Optional[Tuple[int, int, int]]:
+    """Return the installed ffmpeg version, checked once per process.
+
+    Returns:
+        (major, minor, patch), or None if the version cannot be parsed
+        (e.g. git builds); callers treat None as a current release.
+    """
+    try:
+        return get_ffmpeg_version()
+    except VideoMetadataError as e:
+        logger.debug(f"Assuming a current ffmpeg release: {e}")
+        return None
+
+
+def _fps_passthrough_args() -> List[str]:
+    """ffmpeg arguments that pass frame timestamps through unchanged.
+
+    -fps_mode replaced -vsync in ffmpeg 5.1; older releases reject it.
+    """
+    version = _ffmpeg_version()
+    if version is not None and version < (5, 1, 0):
+        return ["-vsync", "passthrough"]
+    return ["-fps_mode", "passthrough"]
+
 
 class VideoRemediator:
     """Applies remediation (blank, cut, or none) to detected video segments.
@@ -22,6 +132,8 @@ class VideoRemediator:
         mode: "blank", "cut", or "none".
         blank_color: Hex color for blank mode (e.g., "#000000").
         category_modes: Per-category mode overrides.
+        smart_render: Whether only GOPs touched by remediation are re-encoded.
+        max_workers: Maximum concurrent ffmpeg processes per remediation step.
     """
     
     def __init__(self, config: Dict[str, Any]) -> None:
@@ -33,6 +145,10 @@ class VideoRemediator:
                 - mode: "blank", "cut", or "none" (default: "blank")
                 - blank_color: Hex color string (default: "#000000")
                 - category_modes: Dict mapping categories to modes ("blank", "cut", or "none")
+                - smart_render: bool, stream-copy GOPs that remediation does
+                  not touch (default: True)
+                - max_workers: int, concurrent ffmpeg processes when extracting
+                  or re-encoding pieces (default: 4)
         
         Raises:
             ValueError: If config is invalid.
@@ -41,6 +157,8 @@ class VideoRemediator:
         self.mode = config.get("mode", "blank")
         self.blank_color = config.get("blank_color", "#000000")
         self.category_modes = config.get("category_modes", {})
+        self.smart_render = config.get("smart_render", True)
+        self.max_workers = config.get("max_workers", 4)
         
         # Validate mode
         valid_modes = {"blank", "cut", "none"}
@@ -58,9 +176,22 @@ class VideoRemediator:
         if not self._is_valid_hex_color(self.blank_color):
             raise ValueError(f"Invalid hex color: {self.blank_color}")
         
+        if not isinstance(self.smart_render, bool):
+            raise ValueError(f"smart_render must be a boolean, got {self.smart_render!r}")
+        
+        if (
+            not isinstance(self.max_workers, int)
+            or isinstance(self.max_workers, bool)
+            or self.max_workers < 1
+        ):
+            raise ValueError(
+                f"max_workers must be a positive integer, got {self.max_workers!r}"
+            )
+        
         logger.debug(
             f"Initialized VideoRemediator: enabled={self.enabled}, "
-            f"mode={self.mode}, blank_color={self.blank_color}"
+            f"mode={self.mode}, blank_color={self.blank_color}, "
+            f"smart_render={self.smart_render}"
         )
     
     def _is_valid_hex_color(self, color: str) -> bool:
@@ -109,8 +240,10 @@ class VideoRemediator:
     ) -> str:
         """Build ffmpeg filter chain for blank mode.
         
-        Creates a filter_complex expression that blanks video segments
-        using drawbox with between(t,start,end) expressions.
+        Segments are coalesced into disjoint intervals and blanked by a
+        single drawbox whose enable expression binary-searches them (see
+        _interval_search_expr). Per-frame cost grows only logarithmically
+        with the number of segments, and the filter count stays at one.
         
         Args:
             segments: List of segment dicts with start_time, end_time.
@@ -126,25 +259,20 @@ class VideoRemediator:
         # Convert hex color to ffmpeg format
         color = self._hex_to_ffmpeg_color(self.blank_color)
         
-        # Build filter chain with drawbox for each segment
-        filters = []
-        for segment in segments:
-            start = self._parse_timecode(segment["start_time"])
-            end = self._parse_timecode(segment["end_time"])
-            
-            # Use drawbox with enable expression for time-based blanking
-            # drawbox fills the entire frame with the specified color
-            filter_expr = (
-                f"drawbox=x=0:y=0:w={video_width}:h={video_height}:"
-                f"color={color}:t=fill:enable='between(t,{start},{end})'"
+        intervals = _coalesce_intervals([
+            (
+                self._parse_timecode(segment["start_time"]),
+                self._parse_timecode(segment["end_time"]),
             )
-            filters.append(filter_expr)
-        
-        # Chain all drawbox filters together
-        if filters:
-            return ",".join(filters)
-        
-        return ""
+            for segment in segments
+        ])
+        
+        # drawbox fills the entire frame with the specified color while the
+        # enable expression is true
+        return (
+            f"drawbox=x=0:y=0:w={video_width}:h={video_height}:"
+            f"color={color}:t=fill:enable='{_interval_search_expr(intervals)}'"
+        )
     
     def _parse_timecode(self, timecode: str) -> float:
         """Parse timecode string to seconds.
@@ -269,10 +397,18 @@ class VideoRemediator:
         censored_segments: List[Dict[str, Any]],
         video_duration: float,
         work_dir: Optional[str] = None,
+        blank_segments: Optional[List[Dict[str, Any]]] = None,
+        video_width: int = 0,
+        video_height: int = 0,
     ) -> None:
         """Apply cut mode remediation to video.
         
-        Extracts non-censored segments and concatenates them together.
+        Removes censored segments and concatenates the rest, blanking any
+        blank_segments in the same pass. With smart_render, whole GOPs are
+        stream-copied and only cut edges and blanked GOPs are re-encoded
+        (see _apply_smart_render). Otherwise the video is decoded and
+        encoded once through a single filtergraph (see
+        build_cut_filter_graph).
         
         Args:
             input_video: Path to input video file.
@@ -280,13 +416,14 @@ class VideoRemediator:
             censored_segments: List of censored segment dicts.
             video_duration: Total video duration in seconds.
             work_dir: Working directory for temporary files (default: temp dir).
+            blank_segments: Segments to blank in the kept video, with
+                times on the input timeline.
+            video_width: Video width in pixels (needed for blanking).
+            video_height: Video height in pixels (needed for blanking).
         
         Raises:
             RuntimeError: If ffmpeg fails.
         """
-        import tempfile
-        import shutil
-        
         # Extract non-censored segments
         keep_segments = self.extract_non_censored_segments(
             censored_segments, video_duration
@@ -296,82 +433,105 @@ class VideoRemediator:
             logger.warning("No segments to keep; entire video is censored")
             return
         
-        # Create working directory
-        if work_dir is None:
-            temp_dir = tempfile.mkdtemp(prefix="video_cut_")
-        else:
-            temp_dir = work_dir
-            Path(temp_dir).mkdir(parents=True, exist_ok=True)
-        
-        try:
-            segment_files = []
-            
-            # Extract each non-censored segment
-            for i, segment in enumerate(keep_segments):
-                segment_file = Path(temp_dir) / f"segment_{i}.mp4"
-                
-                cmd = [
-                    "ffmpeg",
-                    "-i", input_video,
-                    "-ss", str(segment["start"]),
-                    "-to", str(segment["end"]),
-                    "-c:v", "libx264",  # Re-encode video
-                    "-c:a", "aac",  # Re-encode audio
-                    "-preset", "ultrafast",
-                    "-avoid_negative_ts", "1",
-                    "-y",
-                    str(segment_file)
-                ]
-                
-                logger.debug(f"Extracting segment {i}: {segment['start']}-{segment['end']}")
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=300
-                )
-                
-                if result.returncode != 0:
-                    raise RuntimeError(f"Failed to extract segment {i}: {result.stderr}")
-                
-                segment_files.append(segment_file)
-            
-            # Create concat file
-            concat_file = Path(temp_dir) / "concat.txt"
-            with open(concat_file, "w") as f:
-                for segment_file in segment_files:
-                    # Use relative paths for concat file
-                    f.write(f"file '{segment_file.name}'\n")
-            
-            # Concatenate segments
+        blank_segments = blank_segments or []
+        if work_dir is not None:
+            Path(work_dir).mkdir(parents=True, exist_ok=True)
+        
+        if self.smart_render:
+            try:
+                if self._apply_smart_render(
+                    input_video, output_video, blank_segments, video_width,
+                    video_height, keep_segments=keep_segments, work_dir=work_dir,
+                ):
+                    logger.info(f"Cut mode applied: kept {len(keep_segments)} segments")
+                    return
+            except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+                logger.warning(f"Smart render failed, re-encoding kept segments: {e}")
+        
+        stream = probe_video_stream(input_video)
+        filter_graph = self.build_cut_filter_graph(
+            keep_segments,
+            blank_segments,
+            video_width,
+            video_height,
+            has_audio=(
+                stream.has_audio if stream is not None else probe_has_audio(input_video)
+            ),
+        )
+        with tempfile.TemporaryDirectory(prefix="cut_", dir=work_dir) as tmp_dir:
             cmd = [
                 "ffmpeg",
-                "-f", "concat",
-                "-safe", "0",
-                "-i", str(concat_file),
-                "-c:v", "copy",  # Copy video stream
-                "-c:a", "copy" if len(segment_files) > 0 else "aac",  # Copy audio if present
+                "-i", input_video,
+                *self._filter_graph_args(
+                    "filter_complex", filter_graph, Path(tmp_dir) / "filter.txt"
+                ),
+                "-map", "[outv]",
+            ]
+            if "[outa]" in filter_graph:
+                cmd.extend(["-map", "[outa]"])
+            cmd.extend([
+                "-c:v", "libx264",
+                "-preset", "ultrafast",
+                "-c:a", "aac",
+                *_fps_passthrough_args(),  # concat output has no fixed frame rate
                 "-y",
                 output_video
-            ]
-            
-            logger.debug(f"Concatenating {len(segment_files)} segments")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-            
-            if result.returncode != 0:
-                raise RuntimeError(f"Failed to concatenate segments: {result.stderr}")
-            
-            logger.info(f"Cut mode applied: kept {len(keep_segments)} segments")
-            
-        finally:
-            # Clean up temporary directory
-            if work_dir is None:
-                shutil.rmtree(temp_dir, ignore_errors=True)
+            ])
+            self._run_ffmpeg(cmd, f"cut of {len(keep_segments)} kept segments")
+        
+        logger.info(f"Cut mode applied: kept {len(keep_segments)} segments")
+    
+    def build_cut_filter_graph(
+        self,
+        keep_segments: List[Dict[str, float]],
+        blank_segments: List[Dict[str, Any]],
+        video_width: int,
+        video_height: int,
+        has_audio: bool = True,
+    ) -> str:
+        """Build one filter_complex that blanks, trims and joins kept segments.
+        
+        Blanking runs on the input timeline before trimming, so blank and
+        cut segments share the original timecodes. Each kept segment is
+        trimmed from a split of the decoded stream and the trims are
+        concatenated with their audio, keeping audio and video in sync.
+        
+        Args:
+            keep_segments: Segment dicts with 'start' and 'end' (in seconds).
+            blank_segments: Segments to blank, with start_time and end_time.
+            video_width: Video width in pixels.
+            video_height: Video height in pixels.
+            has_audio: Whether to trim and join the first audio stream.
+        
+        Returns:
+            filter_complex string with outputs [outv] and [outa] (the latter
+            only if has_audio).
+        """
+        count = len(keep_segments)
+        blank_chain = self.build_blank_filter_chain(blank_segments, video_width, video_height)
+        
+        graph = [
+            f"[0:v]{blank_chain + ',' if blank_chain else ''}split={count}"
+            + "".join(f"[v{i}]" for i in range(count))
+        ]
+        if has_audio:
+            graph.append(f"[0:a]asplit={count}" + "".join(f"[a{i}]" for i in range(count)))
+        
+        concat_inputs = []
+        for i, segment in enumerate(keep_segments):
+            bounds = f"start={segment['start']}:end={segment['end']}"
+            graph.append(f"[v{i}]trim={bounds},setpts=PTS-STARTPTS[cv{i}]")
+            concat_inputs.append(f"[cv{i}]")
+            if has_audio:
+                graph.append(f"[a{i}]atrim={bounds},asetpts=PTS-STARTPTS[ca{i}]")
+                concat_inputs.append(f"[ca{i}]")
+        
+        graph.append(
+            "".join(concat_inputs)
+            + f"concat=n={count}:v=1:a={1 if has_audio else 0}"
+            + ("[outv][outa]" if has_audio else "[outv]")
+        )
+        return ";".join(graph)
     
     def resolve_segment_mode(
         self,
@@ -606,27 +766,14 @@ class VideoRemediator:
         )
         
         try:
-            if has_blank and has_cut:
-                # Mixed modes: apply blank first, then cut
-                logger.debug("Mixed modes detected: applying blank then cut")
-                import tempfile
-                
-                with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
-                    temp_path = tmp.name
-                
-                try:
-                    # Apply blank mode to temp file
-                    self._apply_blank_mode_impl(
-                        input_video, temp_path, grouped["blank"], video_width, video_height
-                    )
-                    
-                    # Apply cut mode to final output (cutting from blanked video)
-                    # Adjust blank segments to account for timeline, but use original timings
-                    self.apply_cut_mode(
-                        temp_path, output_video, grouped["cut"], video_duration
-                    )
-                finally:
-                    Path(temp_path).unlink(missing_ok=True)
+            if has_cut:
+                # Cut mode, blanking any blank segments in the same pass
+                self.apply_cut_mode(
+                    input_video, output_video, grouped["cut"], video_duration,
+                    blank_segments=grouped["blank"],
+                    video_width=video_width,
+                    video_height=video_height,
+                )
             
             elif has_blank:
                 # Only blank mode
@@ -634,12 +781,6 @@ class VideoRemediator:
                     input_video, output_video, grouped["blank"], video_width, video_height
                 )
             
-            elif has_cut:
-                # Only cut mode
-                self.apply_cut_mode(
-                    input_video, output_video, grouped["cut"], video_duration
-                )
-            
             logger.info(f"Video remediation complete: {output_video}")
         
         except Exception as e:
@@ -656,6 +797,11 @@ class VideoRemediator:
     ) -> None:
         """Apply blank mode using ffmpeg filter chain.
         
+        With smart_render enabled, only the GOPs overlapping blanked segments
+        are re-encoded (see _apply_smart_render). Otherwise, or when
+        smart rendering is not possible for the input, the whole video is
+        re-encoded.
+        
         Args:
             input_video: Path to input video.
             output_video: Path to output video.
@@ -666,27 +812,392 @@ class VideoRemediator:
         Raises:
             RuntimeError: If ffmpeg fails.
         """
+        if self.smart_render:
+            try:
+                if self._apply_smart_render(
+                    input_video, output_video, segments, video_width, video_height
+                ):
+                    return
+            except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+                logger.warning(f"Smart render failed, re-encoding whole video: {e}")
+        
         filter_chain = self.build_blank_filter_chain(segments, video_width, video_height)
         
+        with tempfile.TemporaryDirectory(prefix="blank_") as tmp_dir:
+            cmd = [
+                "ffmpeg",
+                "-i", input_video,
+                *self._filter_graph_args(
+                    "filter_complex", filter_chain, Path(tmp_dir) / "filter.txt"
+                ),
+                "-c:v", "libx264",
+                "-preset", "ultrafast",
+                "-c:a", "aac",
+                "-y",
+                output_video
+            ]
+            
+            logger.debug(f"Running ffmpeg blank mode: {' '.join(cmd)}")
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=3600  # 1 hour timeout
+            )
+        
+        if result.returncode != 0:
+            logger.error(f"ffmpeg stderr: {result.stderr}")
+            raise RuntimeError(f"ffmpeg blank mode failed: {result.stderr}")
+    
+    def _apply_smart_render(
+        self,
+        input_video: str,
+        output_video: str,
+        blank_segments: List[Dict[str, Any]],
+        video_width: int,
+        video_height: int,
+        keep_segments: Optional[List[Dict[str, float]]] = None,
+        work_dir: Optional[str] = None,
+    ) -> bool:
+        """Remediate by re-encoding only the GOPs that blanking or cuts touch.
+        
+        Builds a keyframe index of the input and plans pieces with
+        plan_render_pieces: whole GOPs that are kept and not blanked are
+        stream-copied, everything else is re-encoded with the source codec,
+        profile and pixel format.
+        
+        Args:
+            input_video: Path to input video.
+            output_video: Path to output video.
+            blank_segments: Segments to blank.
+            video_width: Video width in pixels.
+            video_height: Video height in pixels.
+            keep_segments: Segment dicts with 'start' and 'end' (in seconds)
+                to keep, or None to keep the whole video.
+            work_dir: Parent directory for temporary files (default: system
+                temp dir).
+        
+        Returns:
+            True if the output was written, False if smart rendering does not
+            apply to this input (the caller re-encodes instead).
+        
+        Raises:
+            RuntimeError: If an ffmpeg step fails.
+        """
+        stream = probe_video_stream(input_video)
+        if stream is None or stream.duration is None:
+            logger.debug("Smart render unavailable: could not probe input video")
+            return False
+        if encoder_args(stream) is None:
+            logger.info(f"Smart render does not support codec '{stream.codec_name}'")
+            return False
+        
+        keyframes = probe_keyframes(input_video, stream.start_time)
+        if not keyframes:
+            logger.debug("Smart render unavailable: no keyframe index")
+            return False
+        
+        # Sorted and disjoint, so planning bisects them per piece
+        intervals = _coalesce_intervals([
+            (self._parse_timecode(s["start_time"]), self._parse_timecode(s["end_time"]))
+            for s in blank_segments
+        ])
+        keep_ranges = (
+            [(s["start"], s["end"]) for s in keep_segments]
+            if keep_segments is not None
+            else [(0.0, stream.duration)]
+        )
+        pieces = plan_render_pieces(keyframes, keep_ranges, intervals, stream.duration)
+        if all(piece.reencode for piece in pieces):
+            logger.debug("Smart render skipped: every GOP needs re-encoding")
+            return False
+        
+        reencode_seconds = sum(p.end - p.start for p in pieces if p.reencode)
+        kept_seconds = sum(end - start for start, end in keep_ranges)
+        logger.info(
+            f"Smart render: re-encoding {reencode_seconds:.1f}s of "
+            f"{kept_seconds:.1f}s in {sum(p.reencode for p in pieces)} "
+            f"of {len(pieces)} pieces"
+        )
+        with tempfile.TemporaryDirectory(prefix="smart_render_", dir=work_dir) as tmp_dir:
+            self._render_pieces(
+                input_video, output_video, pieces, keyframes, intervals, stream,
+                video_width, video_height,
+                keep_ranges if keep_segments is not None else None,
+                Path(tmp_dir),
+            )
+        return True
+    
+    def _render_pieces(
+        self,
+        input_video: str,
+        output_video: str,
+        pieces: List[GopPiece],
+        keyframes: List[float],
+        intervals: List[Tuple[float, float]],
+        stream: VideoStreamInfo,
+        video_width: int,
+        video_height: int,
+        keep_ranges: Optional[List[Tuple[float, float]]],
+        work_dir: Path,
+    ) -> None:
+        """Split, re-encode pieces concurrently, and concatenate.
+        
+        The video stream is split without decoding at every keyframe that
+        starts a piece or ends a copied piece. Re-encoded pieces starting on
+        a keyframe are encoded from their split file; pieces starting at a
+        cut point seek in the input instead.
+        
+        Args:
+            input_video: Path to input video.
+            output_video: Path to output video.
+            pieces: Pieces from plan_render_pieces.
+            keyframes: Sorted keyframe times in seconds.
+            intervals: Sorted, disjoint blanked (start, end) times in seconds.
+            stream: Codec parameters of the input video stream.
+            video_width: Video width in pixels.
+            video_height: Video height in pixels.
+            keep_ranges: Kept (start, end) times, or None if nothing is cut
+                (audio is then copied from the input unchanged).
+            work_dir: Directory for pieces.
+        
+        Raises:
+            RuntimeError: If an ffmpeg step fails or the split does not
+                match the plan.
+        """
+        keyframe_set = set(keyframes)
+        split_points = sorted(
+            {p.start for p in pieces if p.start in keyframe_set}
+            | {p.end for p in pieces if not p.reencode}
+        )
+        split_points = [t for t in split_points if 0.0 < t < stream.duration]
+        split_files = self._split_video_stream(input_video, stream, split_points, work_dir)
+        
+        codec_args = encoder_args(stream)
+        jobs = []
+        video_entries = []
+        for i, piece in enumerate(pieces):
+            on_keyframe = piece.start in keyframe_set or piece.start <= 0.0
+            split_file = split_files[bisect.bisect_right(split_points, piece.start)]
+            if not piece.reencode:
+                video_entries.append((split_file, piece.end - piece.start))
+                continue
+            
+            source = (
+                ["-i", str(split_file)]
+                if on_keyframe
+                else ["-ss", f"{piece.start:.6f}", "-i", input_video]
+            )
+            # Stop just short of a closing keyframe so float error cannot
+            # duplicate it from the next piece
+            duration = piece.end - piece.start
+            if piece.end in keyframe_set:
+                duration -= 0.0005
+            
+            filter_args = []
+            shifted = [
+                {"start_time": start, "end_time": end}
+                for start, end in shift_intervals(intervals, piece)
+            ]
+            if shifted:
+                filter_args = self._filter_graph_args(
+                    "filter:v",
+                    self.build_blank_filter_chain(shifted, video_width, video_height),
+                    work_dir / f"filter_{i:05d}.txt",
+                )
+            
+            rendered = work_dir / f"rendered_{i:05d}.mkv"
+            jobs.append((
+                [
+                    "ffmpeg", "-v", "error",
+                    *source,
+                    "-t", f"{duration:.6f}",
+                    "-map", "0:v:0",
+                    *filter_args,
+                    *codec_args,
+                    *_fps_passthrough_args(),
+                    "-an",
+                    "-y", str(rendered),
+                ],
+                f"re-encode of {piece.start:.3f}-{piece.end:.3f}s",
+            ))
+            video_entries.append((rendered, piece.end - piece.start))
+        
+        audio_entries = []
+        if keep_ranges is not None and stream.has_audio:
+            # Extract each kept range losslessly; AAC is encoded once below
+            for i, (start, end) in enumerate(keep_ranges):
+                audio_file = work_dir / f"audio_{i:05d}.mka"
+                jobs.append((
+                    [
+                        "ffmpeg", "-v", "error",
+                        "-ss", f"{start:.6f}",
+                        "-i", input_video,
+                        "-t", f"{end - start:.6f}",
+                        "-map", "0:a:0",
+                        "-c:a", "flac",
+                        "-y", str(audio_file),
+                    ],
+                    f"audio extraction of {start:.3f}-{end:.3f}s",
+                ))
+                audio_entries.append((audio_file, end - start))
+        self._run_ffmpeg_jobs(jobs)
+        
+        video_list = work_dir / "video.txt"
+        self._write_concat_list(video_list, video_entries)
+        cmd = ["ffmpeg", "-v", "error", "-f", "concat", "-safe", "0", "-i", str(video_list)]
+        if keep_ranges is None:
+            # Nothing cut: take audio and metadata from the input
+            cmd.extend([
+                "-i", input_video,
+                "-map", "0:v:0", "-map", "1:a?",
+                "-map_metadata", "1",
+                "-c", "copy",
+            ])
+        elif audio_entries:
+            audio_list = work_dir / "audio.txt"
+            self._write_concat_list(audio_list, audio_entries)
+            cmd.extend([
+                "-f", "concat", "-safe", "0", "-i", str(audio_list),
+                "-map", "0:v:0", "-map", "1:a:0",
+                "-c:v", "copy", "-c:a", "aac",
+            ])
+        else:
+            cmd.extend(["-c:v", "copy"])
+        cmd.extend(["-y", output_video])
+        self._run_ffmpeg(cmd, "concat")
+    
+    def _split_video_stream(
+        self,
+        input_video: str,
+        stream: VideoStreamInfo,
+        split_points: List[float],
+        work_dir: Path,
+    ) -> List[Path]:
+        """Split the video stream at keyframes without decoding.
+        
+        Args:
+            input_video: Path to input video.
+            stream: Codec parameters of the input video stream.
+            split_points: Sorted keyframe times to split at.
+            work_dir: Directory for the pieces.
+        
+        Returns:
+            Piece files in order; piece i ends at split_points[i].
+        
+        Raises:
+            RuntimeError: If ffmpeg fails or the split does not match.
+        """
+        # The segment muxer cuts at the first keyframe at or after each
+        # time, so split points are nudged back to land on their keyframe
         cmd = [
-            "ffmpeg",
+            "ffmpeg", "-v", "error",
             "-i", input_video,
-            "-filter_complex", filter_chain,
-            "-c:v", "libx264",
-            "-preset", "ultrafast",
-            "-c:a", "aac",
-            "-y",
-            output_video
+            "-map", "0:v:0",
+            "-c", "copy",
+            "-bsf:v", SMART_RENDER_CODECS[stream.codec_name].annexb_filter,
+            "-f", "segment",
+            "-segment_format", "matroska",
+            "-reset_timestamps", "1",
         ]
+        if split_points:
+            cmd.extend([
+                "-segment_times", ",".join(f"{t - 0.001:.6f}" for t in split_points)
+            ])
+        cmd.append(str(work_dir / "piece_%05d.mkv"))
+        self._run_ffmpeg(cmd, "split")
+        
+        piece_files = sorted(work_dir.glob("piece_*.mkv"))
+        if len(piece_files) != len(split_points) + 1:
+            raise RuntimeError(
+                f"keyframe split produced {len(piece_files)} pieces, "
+                f"expected {len(split_points) + 1}"
+            )
+        return piece_files
+    
+    def _write_concat_list(
+        self,
+        concat_file: Path,
+        entries: List[Tuple[Path, float]],
+    ) -> None:
+        """Write an ffmpeg concat demuxer list with explicit durations.
         
-        logger.debug(f"Running ffmpeg blank mode: {' '.join(cmd)}")
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=3600  # 1 hour timeout
-        )
+        Args:
+            concat_file: Path of the list to write.
+            entries: (file, duration in seconds) in playback order. Files
+                must be inside the list's directory.
+        """
+        with open(concat_file, "w") as f:
+            for piece_file, duration in entries:
+                relative = piece_file.relative_to(concat_file.parent).as_posix()
+                f.write(f"file '{relative}'\n")
+                f.write(f"duration {duration:.6f}\n")
+    
+    @staticmethod
+    def _filter_graph_args(option: str, graph: str, script_path: Path) -> List[str]:
+        """Pass a filtergraph to ffmpeg inline or through a script file.
+        
+        Graphs for thousands of segments exceed the kernel's limit on a
+        single command-line argument (MAX_ARG_STRLEN, 128 KiB); those are
+        written to a script file. ffmpeg 7.0+ reads the value of an option
+        prefixed with "/" from a file; older releases have separate
+        -filter_complex_script and -filter_script options.
+        
+        Args:
+            option: ffmpeg option taking the graph ("filter_complex" or
+                "filter:v").
+            graph: Filtergraph description.
+            script_path: File to write a long graph to; it must exist until
+                ffmpeg has run.
+        
+        Returns:
+            ffmpeg arguments, e.g. ["-filter_complex", "<graph>"] or
+            ["-/filter_complex", "<script_path>"].
+        """
+        if len(graph.encode("utf-8")) < _MAX_ARG_BYTES:
+            return [f"-{option}", graph]
+        
+        script_path.write_text(graph, encoding="utf-8")
+        version = _ffmpeg_version()
+        if version is not None and version < (7, 0, 0):
+            return [_LEGACY_SCRIPT_OPTIONS[option], str(script_path)]
+        return [f"-/{option}", str(script_path)]
+    
+    def _run_ffmpeg_jobs(self, jobs: List[Tuple[List[str], str]]) -> None:
+        """Run independent ffmpeg commands concurrently.
+        
+        At most max_workers commands run at a time.
+        
+        Args:
+            jobs: (command, step description) pairs.
         
+        Raises:
+            RuntimeError: If a command fails. Commands not yet started are
+                cancelled.
+        """
+        if not jobs:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+            futures = [executor.submit(self._run_ffmpeg, cmd, step) for cmd, step in jobs]
+            try:
+                for future in futures:
+                    future.result()
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+    
+    def _run_ffmpeg(self, cmd: List[str], step: str) -> None:
+        """Run one ffmpeg step of a multi-step remediation.
+        
+        Args:
+            cmd: ffmpeg command.
+            step: Step description for logs and errors.
+        
+        Raises:
+            RuntimeError: If ffmpeg fails.
+        """
+        logger.debug(f"Running ffmpeg {step}: {' '.join(cmd)}")
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
         if result.returncode != 0:
-            logger.error(f"ffmpeg stderr: {result.stderr}")
-            raise RuntimeError(f"ffmpeg blank mode failed: {result.stderr}")
+            raise RuntimeError(f"ffmpeg {step} failed: {result.stderr}")
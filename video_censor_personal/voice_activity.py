@@ -0,0 +1,420 @@
+"""Lightweight voice-activity detection for audio tracks.
+
+A vectorized energy/spectral voice-activity detector (pure NumPy, no
+model) used to find the parts of a soundtrack that may contain speech, so
+expensive speech recognition can skip music, silence and effects.
+
+Audio is split into short frames. A frame counts as speech-like when its
+energy is well above the track's noise floor and most of that energy lies
+in the speech band. Speech-like frames are then grouped into padded spans.
+
+AudioActivityIndex is a coarser, detector-agnostic summary of the same
+track (RMS and a silence flag per 100 ms frame). It is built once per
+track and shared by all audio detectors so each can skip silent stretches
+without rescanning the samples; given one, the voice-activity detector
+only analyzes frames that overlap non-silent audio.
+"""
+
+import bisect
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Length of one analysis frame in seconds
+VAD_FRAME_SECONDS = 0.03
+
+# Frames analyzed per vectorized block (bounds temporary memory)
+_BLOCK_FRAMES = 4096
+
+# Frequency band holding most speech energy, in Hz
+_SPEECH_BAND_HZ = (300.0, 3400.0)
+
+# Percentile of frame energy taken as the track's noise floor
+_NOISE_FLOOR_PERCENTILE = 10
+
+# Frames must exceed the noise floor by this much (dB) to count as speech
+_ENERGY_MARGIN_DB = 12.0
+
+# Frames quieter than this (dBFS) never count as speech
+_ABSOLUTE_FLOOR_DB = -50.0
+
+# Minimum fraction of frame energy inside the speech band
+_MIN_SPEECH_BAND_RATIO = 0.5
+
+# Length of one activity index frame in seconds
+ACTIVITY_FRAME_SECONDS = 0.1
+
+# Activity index frames quieter than this (dBFS RMS) are flagged silent
+SILENCE_THRESHOLD_DB = -60.0
+
+
+def compute_speech_activity(
+    audio_data: np.ndarray,
+    sample_rate: int,
+    frame_seconds: float = VAD_FRAME_SECONDS,
+    activity_index: Optional["AudioActivityIndex"] = None,
+) -> np.ndarray:
+    """Classify fixed-length frames of a mono track as speech-like or not.
+
+    With an activity index, frames lying entirely in silent index frames
+    are not read: their energy is taken from the index and they are never
+    speech-like.
+
+    Args:
+        audio_data: Mono float32 audio.
+        sample_rate: Sample rate in Hz.
+        frame_seconds: Frame length in seconds.
+        activity_index: Optional index built from the same audio.
+
+    Returns:
+        Boolean array with one entry per complete frame.
+    """
+    frame_length = max(int(sample_rate * frame_seconds), 1)
+    num_frames = len(audio_data) // frame_length
+    if num_frames == 0:
+        return np.zeros(0, dtype=bool)
+
+    window = np.hanning(frame_length).astype(np.float32)
+    freqs = np.fft.rfftfreq(frame_length, d=1.0 / sample_rate)
+    band = (freqs >= _SPEECH_BAND_HZ[0]) & (freqs <= _SPEECH_BAND_HZ[1])
+
+    energy_db = np.empty(num_frames, dtype=np.float32)
+    band_ratio = np.zeros(num_frames, dtype=np.float32)
+
+    if activity_index is not None and len(activity_index):
+        analyze, energy_db[:] = _gate_frames(
+            activity_index, num_frames, frame_length, sample_rate
+        )
+    else:
+        analyze = np.ones(num_frames, dtype=bool)
+
+    edges = np.diff(np.concatenate(([0], analyze.astype(np.int8), [0])))
+    for run_start, run_end in zip(
+        np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    ):
+        for start in range(run_start, run_end, _BLOCK_FRAMES):
+            end = min(start + _BLOCK_FRAMES, run_end)
+            frames = np.asarray(
+                audio_data[start * frame_length:end * frame_length], dtype=np.float32
+            ).reshape(end - start, frame_length)
+
+            energy_db[start:end] = 10.0 * np.log10(
+                np.mean(frames * frames, axis=1) + 1e-10
+            )
+            power = np.abs(np.fft.rfft(frames * window, axis=1)) ** 2
+            band_ratio[start:end] = power[:, band].sum(axis=1) / (
+                power.sum(axis=1) + 1e-10
+            )
+
+    noise_floor = float(np.percentile(energy_db, _NOISE_FLOOR_PERCENTILE))
+    threshold = max(noise_floor + _ENERGY_MARGIN_DB, _ABSOLUTE_FLOOR_DB)
+
+    return (
+        analyze & (energy_db > threshold) & (band_ratio >= _MIN_SPEECH_BAND_RATIO)
+    )
+
+
+def _gate_frames(
+    activity_index: "AudioActivityIndex",
+    num_frames: int,
+    frame_length: int,
+    sample_rate: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Map VAD frames onto an activity index.
+
+    Returns:
+        Tuple of (frames overlapping non-silent index frames, energy in dB
+        of the first index frame each VAD frame overlaps).
+    """
+    index_length = max(int(sample_rate * activity_index.frame_seconds), 1)
+    sample_starts = np.arange(num_frames, dtype=np.int64) * frame_length
+    last = len(activity_index) - 1
+    first_frame = np.minimum(sample_starts // index_length, last)
+    last_frame = np.minimum((sample_starts + frame_length - 1) // index_length, last)
+
+    active_counts = np.concatenate(([0], np.cumsum(~activity_index.silent)))
+    analyze = active_counts[last_frame + 1] > active_counts[first_frame]
+    energy_db = 20.0 * np.log10(activity_index.rms[first_frame] + 1e-10)
+    return analyze, energy_db
+
+
+def activity_to_spans(
+    activity: np.ndarray,
+    frame_seconds: float,
+    duration: float,
+    padding: float = 0.5,
+    min_gap: float = 1.0,
+    min_speech: float = 0.15,
+) -> List[Tuple[float, float]]:
+    """Group speech-like frames into padded time spans.
+
+    Args:
+        activity: Per-frame speech flags from compute_speech_activity().
+        frame_seconds: Frame length in seconds.
+        duration: Track duration in seconds (spans are clamped to it).
+        padding: Context added before and after each span in seconds.
+        min_gap: Runs separated by less than this are merged.
+        min_speech: Runs shorter than this (after merging) are dropped.
+
+    Returns:
+        Sorted, non-overlapping (start, end) spans in seconds.
+    """
+    if not np.any(activity):
+        return []
+
+    edges = np.diff(np.concatenate(([0], activity.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1) * frame_seconds
+    ends = np.flatnonzero(edges == -1) * frame_seconds
+
+    # Bridge short pauses between runs
+    keep = np.concatenate(([True], starts[1:] - ends[:-1] >= min_gap))
+    merged_starts = starts[keep]
+    merged_ends = np.maximum.reduceat(ends, np.flatnonzero(keep))
+
+    long_enough = merged_ends - merged_starts >= min_speech
+    spans: List[Tuple[float, float]] = []
+    for start, end in zip(merged_starts[long_enough], merged_ends[long_enough]):
+        start = max(0.0, float(start) - padding)
+        end = min(duration, float(end) + padding)
+        if spans and start <= spans[-1][1]:
+            spans[-1] = (spans[-1][0], max(spans[-1][1], end))
+        else:
+            spans.append((start, end))
+    return spans
+
+
+def find_speech_spans(
+    audio_data: np.ndarray,
+    sample_rate: int,
+    padding: float = 0.5,
+    activity_index: Optional["AudioActivityIndex"] = None,
+) -> List[Tuple[float, float]]:
+    """Find padded spans of a mono track that may contain speech.
+
+    Args:
+        audio_data: Mono float32 audio.
+        sample_rate: Sample rate in Hz.
+        padding: Context added before and after each span in seconds.
+        activity_index: Optional index built from the same audio; only
+            its non-silent stretches are analyzed.
+
+    Returns:
+        Sorted, non-overlapping (start, end) spans in seconds.
+    """
+    activity = compute_speech_activity(
+        audio_data, sample_rate, activity_index=activity_index
+    )
+    duration = len(audio_data) / sample_rate
+    spans = activity_to_spans(activity, VAD_FRAME_SECONDS, duration, padding=padding)
+    logger.debug(
+        f"Voice activity: {len(spans)} span(s) covering "
+        f"{sum(end - start for start, end in spans):.1f}s of {duration:.1f}s"
+    )
+    return spans
+
+
+class SpanTimeline:
+    """Maps times in concatenated span audio back to the original track.
+
+    Spans are laid end to end with a fixed gap between them; a time in
+    that compacted audio maps to the same offset within its source span.
+
+    Attributes:
+        spans: (start, end) spans in the original track, in seconds.
+        gap: Seconds of silence inserted between consecutive spans.
+    """
+
+    def __init__(self, spans: Sequence[Tuple[float, float]], gap: float) -> None:
+        """Initialize the timeline.
+
+        Args:
+            spans: Sorted, non-overlapping (start, end) spans in seconds.
+            gap: Seconds of silence inserted between consecutive spans.
+        """
+        self.spans = list(spans)
+        self.gap = gap
+        self._compact_starts: List[float] = []
+        position = 0.0
+        for start, end in self.spans:
+            self._compact_starts.append(position)
+            position += (end - start) + gap
+
+    def to_original(self, compact_time: float) -> float:
+        """Map a time in the compacted audio to the original track.
+
+        Times inside a gap are clamped to the end of the preceding span.
+
+        Args:
+            compact_time: Time in seconds within the concatenated audio.
+
+        Returns:
+            Corresponding time in the original track.
+        """
+        return self._map(compact_time, self._span_index(compact_time))
+
+    def range_to_original(
+        self, compact_start: float, compact_end: float
+    ) -> Tuple[float, float]:
+        """Map a time range in the compacted audio to the original track.
+
+        Both ends are mapped through the span containing compact_start, so
+        a word running into the next span cannot stretch across the audio
+        skipped between them.
+
+        Args:
+            compact_start: Range start in the concatenated audio.
+            compact_end: Range end in the concatenated audio.
+
+        Returns:
+            (start, end) in the original track.
+        """
+        index = self._span_index(compact_start)
+        return self._map(compact_start, index), self._map(compact_end, index)
+
+    def _span_index(self, compact_time: float) -> int:
+        """Index of the span whose compacted audio contains compact_time."""
+        return max(bisect.bisect_right(self._compact_starts, compact_time) - 1, 0)
+
+    def _map(self, compact_time: float, index: int) -> float:
+        """Map compact_time through span index, clamped to that span."""
+        start, end = self.spans[index]
+        offset = max(compact_time - self._compact_starts[index], 0.0)
+        return min(start + offset, end)
+
+    def concatenate(self, audio_data: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Build the compacted audio for these spans.
+
+        Args:
+            audio_data: Mono float32 audio of the original track.
+            sample_rate: Sample rate in Hz.
+
+        Returns:
+            Span audio joined with silent gaps, as a new float32 array.
+        """
+        gap = np.zeros(int(round(self.gap * sample_rate)), dtype=np.float32)
+        pieces = []
+        for index, (start, end) in enumerate(self.spans):
+            if index:
+                pieces.append(gap)
+            # Sample offsets follow the same rounding as the compact timeline
+            first = int(round(start * sample_rate))
+            last = first + int(round((end - start) * sample_rate))
+            pieces.append(np.asarray(audio_data[first:last], dtype=np.float32))
+        return np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.float32)
+
+
+class AudioActivityIndex:
+    """Per-frame loudness summary of a mono track.
+
+    Attributes:
+        frame_seconds: Length of one index frame in seconds.
+        rms: Root-mean-square level of each frame.
+        silent: True for frames quieter than SILENCE_THRESHOLD_DB.
+        duration: Track duration in seconds.
+    """
+
+    def __init__(
+        self,
+        rms: np.ndarray,
+        duration: float,
+        frame_seconds: float = ACTIVITY_FRAME_SECONDS,
+    ) -> None:
+        """Initialize the index from per-frame measurements.
+
+        Args:
+            rms: Root-mean-square level of each frame.
+            duration: Track duration in seconds.
+            frame_seconds: Length of one frame in seconds.
+        """
+        self.rms = np.asarray(rms, dtype=np.float32)
+        self.duration = float(duration)
+        self.frame_seconds = frame_seconds
+        self.silent = 20.0 * np.log10(self.rms + 1e-10) < SILENCE_THRESHOLD_DB
+
+    @classmethod
+    def compute(
+        cls,
+        audio_data: np.ndarray,
+        sample_rate: int,
+        frame_seconds: float = ACTIVITY_FRAME_SECONDS,
+    ) -> "AudioActivityIndex":
+        """Build the index for a mono track in one vectorized pass.
+
+        A trailing partial frame is measured over the samples it has.
+
+        Args:
+            audio_data: Mono float32 audio (may be memory-mapped).
+            sample_rate: Sample rate in Hz.
+            frame_seconds: Frame length in seconds.
+
+        Returns:
+            AudioActivityIndex covering the whole track.
+        """
+        frame_length = max(int(sample_rate * frame_seconds), 1)
+        num_samples = len(audio_data)
+        num_frames = -(-num_samples // frame_length)
+
+        rms = np.zeros(num_frames, dtype=np.float32)
+
+        for start in range(0, num_frames, _BLOCK_FRAMES):
+            end = min(start + _BLOCK_FRAMES, num_frames)
+            block = np.asarray(
+                audio_data[start * frame_length:end * frame_length], dtype=np.float32
+            )
+            frame_sizes = np.full(end - start, frame_length)
+            if len(block) < (end - start) * frame_length:
+                frame_sizes[-1] = len(block) - (end - start - 1) * frame_length
+                block = np.pad(block, (0, (end - start) * frame_length - len(block)))
+            frames = block.reshape(end - start, frame_length)
+
+            rms[start:end] = np.sqrt(np.sum(frames * frames, axis=1) / frame_sizes)
+
+        return cls(rms, num_samples / sample_rate, frame_seconds)
+
+    def __len__(self) -> int:
+        """Number of frames in the index."""
+        return len(self.rms)
+
+    def active_fraction(self) -> float:
+        """Fraction of frames that are not silent (0.0 for an empty index)."""
+        return float(np.mean(~self.silent)) if len(self) else 0.0
+
+    def is_active(self, start_time: float, end_time: float) -> bool:
+        """Whether any frame overlapping a time range is not silent.
+
+        Args:
+            start_time: Range start in seconds.
+            end_time: Range end in seconds.
+
+        Returns:
+            True if the range contains non-silent audio.
+        """
+        first = max(int(start_time / self.frame_seconds), 0)
+        last = max(int(np.ceil(end_time / self.frame_seconds)), first + 1)
+        return bool(np.any(~self.silent[first:last]))
+
+    def active_spans(
+        self,
+        padding: float = 0.0,
+        min_gap: float = 1.0,
+    ) -> List[Tuple[float, float]]:
+        """Group non-silent frames into padded time spans.
+
+        Args:
+            padding: Context added before and after each span in seconds.
+            min_gap: Silences shorter than this do not split a span.
+
+        Returns:
+            Sorted, non-overlapping (start, end) spans in seconds.
+        """
+        return activity_to_spans(
+            ~self.silent,
+            self.frame_seconds,
+            self.duration,
+            padding=padding,
+            min_gap=min_gap,
+            min_speech=0.0,
+        )